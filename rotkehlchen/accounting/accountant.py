@@ -1,5 +1,5 @@
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -17,6 +17,7 @@ from rotkehlchen.db.settings import DBSettings
 from rotkehlchen.errors.asset import UnknownAsset, UnprocessableTradePair, UnsupportedAsset
 from rotkehlchen.errors.misc import AccountingError, RemoteError
 from rotkehlchen.errors.price import NoPriceForGivenTimestamp, PriceQueryUnsupportedAsset
+from rotkehlchen.history.price import PriceHistorian, get_events_assets_ranges
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.premium.premium import Premium
 from rotkehlchen.types import EVM_CHAIN_IDS_WITH_TRANSACTIONS, Timestamp
@@ -25,6 +26,7 @@ from rotkehlchen.utils.data_structures import DefaultLRUCache, LRUCacheWithRemov
 
 if TYPE_CHECKING:
     from rotkehlchen.accounting.mixins.event import AccountingEventMixin
+    from rotkehlchen.assets.asset import Asset
     from rotkehlchen.chain.aggregator import ChainsAggregator
     from rotkehlchen.db.dbhandler import DBHandler
 
@@ -64,6 +66,7 @@ class Accountant:
         ]
 
         self.currently_processing_timestamp = Timestamp(-1)
+        self.currently_processing_event: AccountingEventMixin | None = None
         self.first_processed_timestamp = Timestamp(-1)
         self.premium = premium
         # cache to know what events will be processed or not during accounting
@@ -90,11 +93,11 @@ class Accountant:
     def _process_skipping_exception(
             self,
             exception: Exception,
-            events: Sequence['AccountingEventMixin'],
             count: int,
             reason: str,
     ) -> int:
-        event = events[count]
+        event = self.currently_processing_event
+        assert event is not None, 'exceptions are only raised while processing an event'
         ts = event.get_timestamp()
         identifier = event.get_identifier()
         self.msg_aggregator.add_error(
@@ -113,13 +116,21 @@ class Accountant:
             self,
             start_ts: Timestamp,
             end_ts: Timestamp,
-            events: Sequence['AccountingEventMixin'],
+            events: Sequence['AccountingEventMixin'] | Iterator['AccountingEventMixin'],
+            total_events: int | None = None,
+            assets_ranges: dict['Asset', tuple[Timestamp, Timestamp]] | None = None,
     ) -> int:
         """Processes the entire history of cryptoworld actions in order to determine
         the price and time at which every asset was obtained and also
         the general and taxable profit/loss.
 
         The events history is already expected to be sorted when passed to this function.
+        It can also be given as an iterator, in which case total_events should be the number
+        of events it will yield since that is used to report the progress.
+
+        Before processing, the known prices of the events' assets are loaded in memory.
+        assets_ranges gives the time range in which each asset's prices are needed. If
+        not given it is computed from the events when they are a sequence.
 
         start_ts here is the timestamp at which to start taking trades and other
         taxable events into account. Not where processing starts from. Processing
@@ -142,7 +153,8 @@ class Accountant:
             self.ignored_asset_ids = self.db.get_ignored_asset_ids(cursor)
             # Create a new pnl report in the DB to be used to save each generated event
             dbpnl = DBAccountingReports(self.db)
-            first_ts = Timestamp(0) if len(events) == 0 else events[0].get_timestamp()
+            events_iter = peekable(events)
+            first_ts = Timestamp(0) if (first_event := events_iter.peek(None)) is None else first_event.get_timestamp()  # noqa: E501
             report_id = dbpnl.add_report(
                 first_processed_timestamp=first_ts,
                 start_ts=start_ts,
@@ -158,72 +170,87 @@ class Accountant:
             self.first_processed_timestamp = first_ts
 
             count = 0
-            actions_length = len(events)
+            if total_events is not None:
+                actions_length = total_events
+            else:
+                assert isinstance(events, Sequence), 'total_events is needed for an iterator'
+                actions_length = len(events)
             prev_time = last_event_ts = Timestamp(0)
             ignored_ids_mapping = self.db.get_ignored_action_ids(cursor=cursor, action_type=None)
 
-        events_iter = peekable(events)
-        while True:
-            try:
-                (
-                    processed_events_num,
-                    prev_time,
-                ) = self._process_event(
-                    events_iterator=events_iter,
-                    start_ts=start_ts,
-                    end_ts=end_ts,
-                    prev_time=prev_time,
-                    db_settings=db_settings,
-                    ignored_ids_mapping=ignored_ids_mapping,
-                )
-            except PriceQueryUnsupportedAsset as e:
-                count = self._process_skipping_exception(
-                    exception=e,
-                    events=events,
-                    count=count,
-                    reason='not being able to find price for an unsupported asset',
-                )
-                continue
-            except NoPriceForGivenTimestamp as e:
-                self.pots[0].cost_basis.missing_prices.add(
-                    MissingPrice(
-                        from_asset=e.from_asset,
-                        to_asset=e.to_asset,
-                        time=e.time,
-                        rate_limited=e.rate_limited,
-                    ),
-                )
-                continue
-            except RemoteError as e:
-                count = self._process_skipping_exception(
-                    exception=e,
-                    events=events,
-                    count=count,
-                    reason='inability to reach an external service at that point in time',
-                )
-                continue
-            except AccountingError as e:
-                log.error(f'Found critical error {e} when processing history. Stopping.')
-                e.report_id = report_id
-                raise
-
-            if processed_events_num == 0:
-                break  # we reached the period end
-
-            last_event_ts = prev_time
-            if count % 500 == 0:
-                # This loop can take a very long time depending on the amount of events
-                # to process. We need to yield to other greenlets or else calls to the
-                # API may time out
-                gevent.sleep(0.5)
-            count += processed_events_num
-            if not active_premium and count >= FREE_PNL_EVENTS_LIMIT:
-                log.debug(
-                    f'PnL reports event processing has hit the event limit of {events_limit}. '
-                    f'Processing stopped and the results will not '
-                    f'take into account subsequent events. Total events were {len(events)}',
+        if assets_ranges is None and isinstance(events, Sequence):
+            assets_ranges = get_events_assets_ranges(events)
+        try:
+            if assets_ranges is not None:
+                PriceHistorian.prefetch_historical_prices(
+                    to_asset=db_settings.main_currency.resolve_to_asset_with_oracles(),
+                    assets_ranges=assets_ranges,
                 )
-                break
+
+            while True:
+                try:
+                    (
+                        processed_events_num,
+                        prev_time,
+                    ) = self._process_event(
+                        events_iterator=events_iter,
+                        start_ts=start_ts,
+                        end_ts=end_ts,
+                        prev_time=prev_time,
+                        db_settings=db_settings,
+                        ignored_ids_mapping=ignored_ids_mapping,
+                    )
+                except PriceQueryUnsupportedAsset as e:
+                    count = self._process_skipping_exception(
+                        exception=e,
+                        count=count,
+                        reason='not being able to find price for an unsupported asset',
+                    )
+                    continue
+                except NoPriceForGivenTimestamp as e:
+                    self.pots[0].cost_basis.missing_prices.add(
+                        MissingPrice(
+                            from_asset=e.from_asset,
+                            to_asset=e.to_asset,
+                            time=e.time,
+                            rate_limited=e.rate_limited,
+                        ),
+                    )
+                    continue
+                except RemoteError as e:
+                    count = self._process_skipping_exception(
+                        exception=e,
+                        count=count,
+                        reason='inability to reach an external service at that point in time',
+                    )
+                    continue
+                except AccountingError as e:
+                    log.error(f'Found critical error {e} when processing history. Stopping.')
+                    e.report_id = report_id
+                    raise
+
+                if processed_events_num == 0:
+                    break  # we reached the period end
+
+                last_event_ts = prev_time
+                if count % 500 == 0:
+                    # This loop can take a very long time depending on the amount of events
+                    # to process. We need to yield to other greenlets or else calls to the
+                    # API may time out
+                    gevent.sleep(0.5)
+                count += processed_events_num
+                if not active_premium and count >= FREE_PNL_EVENTS_LIMIT:
+                    log.debug(
+                        f'PnL reports event processing has hit the event limit of {events_limit}. '
+                        f'Processing stopped and the results will not '
+                        f'take into account subsequent events. Total events were {actions_length}',
+                    )
+                    break
+        finally:  # keep what was processed even if the processing stopped with an error
+            try:
+                events_db_writes = self.pots[0].flush_processed_events()
+            finally:  # the prefetched prices would otherwise serve later price lookups
+                PriceHistorian.clear_prefetched_prices()
 
         dbpnl.add_report_overview(
             report_id=report_id,
@@ -231,6 +258,7 @@ class Accountant:
             processed_actions=count,
             total_actions=actions_length,
             pnls=self.pots[0].pnls,
+            events_db_writes=events_db_writes,
         )
 
         for pot in self.pots:  # delete rules stored in memory since they won't be needed and can be queried again from the db  # noqa: E501
@@ -263,6 +291,8 @@ class Accountant:
         if event is None:
             return 0, prev_time
 
+        self.currently_processing_event = event
+
         # Assert we are sorted in ascending time order.
         timestamp = event.get_timestamp()
         prev_time = timestamp
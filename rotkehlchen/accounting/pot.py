@@ -15,9 +15,9 @@ from rotkehlchen.assets.asset import Asset
 from rotkehlchen.constants import ONE, ZERO
 from rotkehlchen.constants.assets import A_KFEE
 from rotkehlchen.constants.prices import ZERO_PRICE
-from rotkehlchen.db.reports import DBAccountingReports
+from rotkehlchen.db.reports import DBReportDataWriter
 from rotkehlchen.db.settings import DBSettings
-from rotkehlchen.errors.misc import InputError, RemoteError
+from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.errors.price import NoPriceForGivenTimestamp, PriceQueryUnsupportedAsset
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.fval import FVal
@@ -76,23 +76,28 @@ class AccountingPot(CustomizableDateMixin):
         )
         self.query_start_ts = self.query_end_ts = Timestamp(0)
         self.report_id: int | None = None
+        self.report_writer: DBReportDataWriter | None = None  # initialized at reset()
 
     def _add_processed_event(self, event: ProcessedAccountingEvent) -> None:
-        dbpnl = DBAccountingReports(self.database)
         self.processed_events.append(event)
-        try:
-            dbpnl.add_report_data(
-                report_id=self.report_id,  # type: ignore # report id is initialized by now
-                time=event.timestamp,
-                ts_converter=self.timestamp_to_date,
-                event=event,
-            )
-        except (DeserializationError, InputError) as e:
-            log.error(str(e))
-            return
+        if self.report_writer is not None:
+            try:
+                self.report_writer.add(event)
+            except DeserializationError as e:
+                log.error(str(e))
+                return
 
         log.debug(event.to_string(self.timestamp_to_date))
 
+    def flush_processed_events(self) -> int:
+        """Writes any buffered processed events to the DB and returns how many
+        batch writes happened for the current report so far"""
+        if self.report_writer is None:
+            return 0
+
+        self.report_writer.flush()
+        return self.report_writer.flushes
+
     def get_rate_in_profit_currency(self, asset: Asset, timestamp: Timestamp) -> Price:
         """Get the profit_currency price of asset in the given timestamp
 
@@ -124,6 +129,11 @@ class AccountingPot(CustomizableDateMixin):
         with self.database.conn.read_ctx() as cursor:
             self.ignored_asset_ids = self.database.get_ignored_asset_ids(cursor)
         self.report_id = report_id
+        self.report_writer = DBReportDataWriter(
+            database=self.database,
+            report_id=report_id,
+            ts_converter=self.timestamp_to_date,
+        )
         self.profit_currency = self.settings.main_currency.resolve_to_asset_with_oracles()
         self.query_start_ts = start_ts
         self.query_end_ts = end_ts
@@ -103,6 +103,9 @@ from rotkehlchen.constants.limits import (
 from rotkehlchen.constants.misc import (
     AIRDROPS_TOLERANCE,
     AVATARIMAGESDIR_NAME,
+    DEFAULT_CHAIN_BALANCES_CONCURRENCY,
+    DEFAULT_DB_READ_POOL_SIZE,
+    DEFAULT_HISTORICAL_PRICE_CACHE_SIZE,
     DEFAULT_MAX_LOG_BACKUP_FILES,
     DEFAULT_MAX_LOG_SIZE_IN_MB,
     DEFAULT_SQL_VM_INSTRUCTIONS_CB,
@@ -215,7 +218,11 @@ from rotkehlchen.inquirer import CurrentPriceOracle, Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.premium.premium import PremiumCredentials, has_premium_check
 from rotkehlchen.rotkehlchen import Rotkehlchen
-from rotkehlchen.serialization.serialize import process_result, process_result_list
+from rotkehlchen.serialization.serialize import (
+    iterencode_result,
+    process_result,
+    process_result_list,
+)
 from rotkehlchen.tasks.utils import query_missing_prices_of_base_entries
 from rotkehlchen.types import (
     AVAILABLE_MODULES_MAP,
@@ -328,6 +335,19 @@ def api_response(
     )
 
 
+def api_streamed_response(
+        result: dict[str, Any],
+        status_code: HTTPStatus = HTTPStatus.OK,
+) -> Response:
+    """Like api_response but the result is serialized and sent as chunked JSON while it is
+    encoded. For results with big lists of entries. Streamed results are not logged."""
+    return Response(
+        iterencode_result(result),
+        status=status_code,
+        mimetype='application/json',
+    )
+
+
 def make_response_from_dict(response_data: dict[str, Any]) -> Response:
     result = response_data.get('result')
     message = response_data.get('message', '')
@@ -954,6 +974,7 @@ class RestAPI:
                     entries_table='trades',
                 ),
                 'entries_limit': FREE_TRADES_LIMIT if self.rotkehlchen.premium is None else -1,
+                'continuation_token': filter_query.continuation_token(trades),
             }
 
         return {'result': result, 'message': '', 'status_code': HTTPStatus.OK}
@@ -1637,12 +1658,7 @@ class RestAPI:
                     to_ts=to_timestamp,
                 )
 
-        result = process_result_list(data)
-        return api_response(
-            result=_wrap_in_ok_result(result),
-            status_code=HTTPStatus.OK,
-            log_result=False,
-        )
+        return api_streamed_response(_wrap_in_ok_result(data))
 
     def query_value_distribution_data(self, distribution_by: str) -> Response:
         data: list[DBAssetBalance] | list[LocationData]
@@ -2290,6 +2306,9 @@ class RestAPI:
                 'max_logfiles_num': DEFAULT_MAX_LOG_BACKUP_FILES,
                 'max_size_in_mb_all_logs': DEFAULT_MAX_LOG_SIZE_IN_MB,
                 'sqlite_instructions': DEFAULT_SQL_VM_INSTRUCTIONS_CB,
+                'db_read_pool_size': DEFAULT_DB_READ_POOL_SIZE,
+                'chain_balances_concurrency': DEFAULT_CHAIN_BALANCES_CONCURRENCY,
+                'historical_price_cache_size': DEFAULT_HISTORICAL_PRICE_CACHE_SIZE,
             },
         }
         return api_response(_wrap_in_ok_result(result), status_code=HTTPStatus.OK)
@@ -2507,6 +2526,11 @@ class RestAPI:
         result_dict = _wrap_in_ok_result(process_result_list(list(nodes)))
         return api_response(result_dict, status_code=HTTPStatus.OK)
 
+    def get_rpc_nodes_stats(self, blockchain: SupportedBlockchain) -> Response:
+        manager = self.rotkehlchen.chains_aggregator.get_chain_manager(blockchain)  # type: ignore
+        result_dict = _wrap_in_ok_result(manager.node_inquirer.get_nodes_health())
+        return api_response(result_dict, status_code=HTTPStatus.OK)
+
     def add_rpc_node(self, node: WeightedNode) -> Response:
         try:
             self.rotkehlchen.data.db.add_rpc_node(node)
@@ -3427,6 +3451,7 @@ class RestAPI:
         except UnsupportedAsset as e:
             return wrap_in_fail_result(str(e), status_code=HTTPStatus.CONFLICT)
 
+        PriceHistorian.remove_cached_prices(from_asset=from_asset, to_asset=to_asset)
         return _wrap_in_ok_result(True)
 
     @staticmethod
@@ -3440,6 +3465,7 @@ class RestAPI:
             to_asset=to_asset,
             source=oracle,
         )
+        PriceHistorian.remove_cached_prices(from_asset=from_asset, to_asset=to_asset)
         return api_response(_wrap_in_ok_result(True), status_code=HTTPStatus.OK)
 
     @staticmethod
@@ -3553,6 +3579,7 @@ class RestAPI:
         )
         added = GlobalDBHandler.add_single_historical_price(historical_price)
         if added:
+            PriceHistorian.remove_cached_prices(from_asset=from_asset, to_asset=to_asset)
             return api_response(OK_RESULT, status_code=HTTPStatus.OK)
         return api_response(
             result={'result': False, 'message': 'Failed to store manual price'},
@@ -3575,6 +3602,7 @@ class RestAPI:
         )
         edited = GlobalDBHandler.edit_manual_price(historical_price)
         if edited:
+            PriceHistorian.remove_cached_prices(from_asset=from_asset, to_asset=to_asset)
             return api_response(OK_RESULT, status_code=HTTPStatus.OK)
         return api_response(
             result={'result': False, 'message': 'Failed to edit manual price'},
@@ -3599,6 +3627,7 @@ class RestAPI:
     ) -> Response:
         deleted = GlobalDBHandler.delete_manual_price(from_asset, to_asset, timestamp)
         if deleted:
+            PriceHistorian.remove_cached_prices(from_asset=from_asset, to_asset=to_asset)
             return api_response(OK_RESULT, status_code=HTTPStatus.OK)
         return api_response(
             result={'result': False, 'message': 'Failed to delete manual price'},
@@ -3739,10 +3768,13 @@ class RestAPI:
             },
             'userdb': {},
         }
+        result_dict['globaldb']['read_pool'] = GlobalDBHandler().conn.read_pool_stats()  # type: ignore
         if self.rotkehlchen.user_is_logged_in:
             with self.rotkehlchen.data.db.conn.read_ctx() as cursor:
                 result_dict['userdb']['info'] = self.rotkehlchen.data.db.get_db_info(cursor)  # type: ignore
             result_dict['userdb']['backups'] = self.rotkehlchen.data.db.get_backups()  # type: ignore
+            result_dict['userdb']['read_pool'] = self.rotkehlchen.data.db.conn.read_pool_stats()  # type: ignore
+            result_dict['userdb']['transient_read_pool'] = self.rotkehlchen.data.db.conn_transient.read_pool_stats()  # type: ignore  # noqa: E501
 
         return api_response(_wrap_in_ok_result(result_dict), status_code=HTTPStatus.OK)
 
@@ -3835,8 +3867,7 @@ class RestAPI:
             'entries_found': entries_found,
             'entries_limit': entries_limit,
         }
-        result_dict = _wrap_in_result(result, '')
-        return api_response(result_dict, status_code=HTTPStatus.OK)
+        return api_streamed_response(_wrap_in_result(result, ''))
 
     def get_associated_locations(self) -> Response:
         locations = self.rotkehlchen.data.db.get_associated_locations()
@@ -3957,11 +3988,14 @@ class RestAPI:
             'entries_found': entries_with_limit,
             'entries_limit': entries_limit,
             'entries_total': entries_total,
+            'continuation_token': filter_query.continuation_token(
+                [x for _, x in events_result] if group_by_event_ids else events_result,  # type: ignore[misc]
+            ),
         }
         if has_premium is False:
             result['entries_found_total'] = entries_found
 
-        return api_response(_wrap_in_ok_result(result), status_code=HTTPStatus.OK)
+        return api_streamed_response(_wrap_in_ok_result(result))
 
     @async_api_call()
     def query_kraken_staking_events(
@@ -4322,6 +4356,18 @@ class RestAPI:
                 'value': self.rotkehlchen.args.sqlite_instructions,
                 'is_default': self.rotkehlchen.args.sqlite_instructions == DEFAULT_SQL_VM_INSTRUCTIONS_CB,  # noqa: E501
             },
+            'db_read_pool_size': {
+                'value': self.rotkehlchen.args.db_read_pool_size,
+                'is_default': self.rotkehlchen.args.db_read_pool_size == DEFAULT_DB_READ_POOL_SIZE,
+            },
+            'chain_balances_concurrency': {
+                'value': self.rotkehlchen.args.chain_balances_concurrency,
+                'is_default': self.rotkehlchen.args.chain_balances_concurrency == DEFAULT_CHAIN_BALANCES_CONCURRENCY,  # noqa: E501
+            },
+            'historical_price_cache_size': {
+                'value': self.rotkehlchen.args.historical_price_cache_size,
+                'is_default': self.rotkehlchen.args.historical_price_cache_size == DEFAULT_HISTORICAL_PRICE_CACHE_SIZE,  # noqa: E501
+            },
         }
         return api_response(_wrap_in_ok_result(config), status_code=HTTPStatus.OK)
 
@@ -4534,11 +4580,9 @@ class RestAPI:
                 cursor=cursor,
                 query_filter=table_filter,
             )
-            value_query_filters, value_bindings = value_filter.prepare(with_pagination=False, with_order=False)  # noqa: E501
-            usd_value, amounts = history_events_db.get_value_stats(
+            usd_value, amounts = history_events_db.get_aggregated_value_stats(
                 cursor=cursor,
-                query_filters=value_query_filters,
-                bindings=value_bindings,
+                filter_query=value_filter,
             )
             result = {
                 'entries': events,
@@ -135,6 +135,7 @@ from rotkehlchen.api.v1.resources import (
     RefreshGeneralCacheResource,
     ReverseEnsResource,
     RpcNodesResource,
+    RpcNodesStatsResource,
     SettingsResource,
     SpamEvmTokenResource,
     StakingResource,
@@ -284,6 +285,7 @@ URLS_V1: URLS = [
     ('/blockchains/type/<string:chain_type>/accounts', ChainTypeAccountResource),
     ('/blockchains/<string:blockchain>/accounts', BlockchainsAccountsResource),
     ('/blockchains/<string:blockchain>/nodes', RpcNodesResource),
+    ('/blockchains/<string:blockchain>/nodes/stats', RpcNodesStatsResource),
     ('/blockchains/<string:blockchain>/tokens/detect', DetectTokensResource),
     ('/blockchains/<string:blockchain>/xpub', BTCXpubResource),
     ('/blockchains/evm/transactions/add-hash', EvmTransactionsHashResource),
@@ -451,12 +453,14 @@ class APIServer:
         """Function that runs after each completed request
 
         Logs the response if required. This is determined by the
-        fake header rotki-log-result passed to all responses.
+        fake header rotki-log-result passed to all responses. Streamed
+        responses are not logged since reading them would consume them.
         """
-        if response.headers.pop('rotki-log-result', 'True') == 'True':
+        log_result = response.headers.pop('rotki-log-result', 'True') == 'True'
+        if log_result and not response.is_streamed:
             result = response.json
         else:
-            result = 'redacted'
+            result = 'streamed' if response.is_streamed else 'redacted'
 
         log.debug(
             f'end rotki api {request.method} {request.path}',
@@ -143,6 +143,7 @@ from rotkehlchen.api.v1.schemas import (
     RpcNodeEditSchema,
     RpcNodeListDeleteSchema,
     RpcNodeSchema,
+    RpcNodesStatsSchema,
     SingleAssetIdentifierSchema,
     SingleAssetWithOraclesIdentifierSchema,
     SingleFileSchema,
@@ -816,6 +817,16 @@ class RpcNodesResource(BaseMethodView):
         return self.rest_api.delete_rpc_node(identifier=identifier, blockchain=blockchain)
 
 
+class RpcNodesStatsResource(BaseMethodView):
+
+    get_schema = RpcNodesStatsSchema()
+
+    @require_loggedin_user()
+    @use_kwargs(get_schema, location='view_args')
+    def get(self, blockchain: SupportedBlockchain) -> Response:
+        return self.rest_api.get_rpc_nodes_stats(blockchain=blockchain)
+
+
 class ExternalServicesResource(BaseMethodView):
 
     put_schema = ExternalServicesResourceAddSchema()
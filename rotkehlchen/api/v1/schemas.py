@@ -61,6 +61,8 @@ from rotkehlchen.db.filtering import (
     AddressbookFilterQuery,
     AssetsFilterQuery,
     CustomAssetsFilterQuery,
+    DBFilterKeyset,
+    DBFilterQuery,
     Eth2DailyStatsFilterQuery,
     EthStakingEventFilterQuery,
     EvmEventFilterQuery,
@@ -242,6 +244,22 @@ class DBPaginationSchema(Schema):
     offset = fields.Integer(load_default=None)
 
 
+class DBKeysetPaginationSchema(DBPaginationSchema):
+    """Pagination that can also continue after the last entry of the previous page using
+    the continuation token returned with it instead of an offset"""
+    continuation_token = fields.String(load_default=None)
+
+    @staticmethod
+    def continue_from_token(filter_query: DBFilterQuery, continuation_token: str | None) -> None:
+        if continuation_token is None:
+            return
+
+        try:
+            filter_query.set_keyset(DBFilterKeyset.deserialize(continuation_token))
+        except DeserializationError as e:
+            raise ValidationError(message=str(e), field_name='continuation_token') from e
+
+
 class DBOrderBySchema(Schema):
     order_by_attributes = DelimitedOrNormalList(fields.String(), load_default=None)
     ascending = DelimitedOrNormalList(fields.Boolean(), load_default=None)  # most recent first by default  # noqa: E501
@@ -457,7 +475,7 @@ class TradesQuerySchema(
         AsyncQueryArgumentSchema,
         TimestampRangeSchema,
         OnlyCacheQuerySchema,
-        DBPaginationSchema,
+        DBKeysetPaginationSchema,
         DBOrderBySchema,
 ):
     base_asset = AssetField(expected_type=Asset, load_default=None)
@@ -541,6 +559,7 @@ class TradesQuerySchema(
             trades_idx_to_ignore=trades_idx_to_ignore,
             exclude_ignored_assets=data['exclude_ignored_assets'],
         )
+        self.continue_from_token(filter_query, data['continuation_token'])
 
         return {
             'async_query': data['async_query'],
@@ -682,7 +701,7 @@ class TypesAndCounterpatiesFiltersSchema(Schema):
 class HistoryEventSchema(
     TypesAndCounterpatiesFiltersSchema,
     TimestampRangeSchema,
-    DBPaginationSchema,
+    DBKeysetPaginationSchema,
     DBOrderBySchema,
 ):
     """Schema for querying history events"""
@@ -812,6 +831,7 @@ class HistoryEventSchema(
         else:
             filter_query = HistoryEventFilterQuery.make(**common_arguments)
 
+        self.continue_from_token(filter_query, data['continuation_token'])
         return self.generate_fields_post_validation(data) | {
             'filter_query': filter_query,
         }
@@ -3101,6 +3121,13 @@ class RpcNodeSchema(Schema):
     blockchain = BlockchainField(required=True, exclude_types=(SupportedBlockchain.ETHEREUM_BEACONCHAIN,))  # noqa: E501
 
 
+class RpcNodesStatsSchema(Schema):
+    blockchain = BlockchainField(
+        required=True,
+        exclude_types=tuple(chain for chain in SupportedBlockchain if not chain.is_evm()),
+    )
+
+
 class RpcAddNodeSchema(Schema):
     blockchain = BlockchainField(required=True, exclude_types=(SupportedBlockchain.ETHEREUM_BEACONCHAIN,))  # noqa: E501
     name = fields.String(
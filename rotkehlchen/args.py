@@ -4,6 +4,9 @@ from collections.abc import Sequence
 from typing import Any
 
 from rotkehlchen.constants.misc import (
+    DEFAULT_CHAIN_BALANCES_CONCURRENCY,
+    DEFAULT_DB_READ_POOL_SIZE,
+    DEFAULT_HISTORICAL_PRICE_CACHE_SIZE,
     DEFAULT_MAX_LOG_BACKUP_FILES,
     DEFAULT_MAX_LOG_SIZE_IN_MB,
     DEFAULT_SQL_VM_INSTRUCTIONS_CB,
@@ -47,6 +50,15 @@ def _positive_int_or_zero(value: str) -> int:
     return int_val
 
 
+def _positive_int(value: str) -> int:
+    """Force positive int https://docs.python.org/3/library/argparse.html#type"""
+    int_val = int(value)  # ValueError is caught and shown to user
+    if int_val <= 0:
+        raise ValueError('Int value should be positive')
+
+    return int_val
+
+
 def app_args(prog: str, description: str) -> argparse.ArgumentParser:
     """Add the rotki arguments to the argument parser and return it"""
     p = argparse.ArgumentParser(
@@ -131,6 +143,33 @@ def app_args(prog: str, description: str) -> argparse.ArgumentParser:
         default=DEFAULT_SQL_VM_INSTRUCTIONS_CB,
         type=_positive_int_or_zero,
     )
+    p.add_argument(
+        '--db-read-pool-size',
+        help=(
+            'Number of read only connections per database, used in parallel to the '
+            'connection that writes. Zero disables the read connection pools.'
+        ),
+        default=DEFAULT_DB_READ_POOL_SIZE,
+        type=_positive_int_or_zero,
+    )
+    p.add_argument(
+        '--chain-balances-concurrency',
+        help=(
+            'Max number of chains whose balances are queried at the same time when '
+            'querying all blockchain balances. One queries them one after the other.'
+        ),
+        default=DEFAULT_CHAIN_BALANCES_CONCURRENCY,
+        type=_positive_int,
+    )
+    p.add_argument(
+        '--historical-price-cache-size',
+        help=(
+            'Max number of historical prices, per hour and asset pair, that are kept in '
+            'memory to avoid asking the price oracles again. Zero disables the cache.'
+        ),
+        default=DEFAULT_HISTORICAL_PRICE_CACHE_SIZE,
+        type=_positive_int_or_zero,
+    )
     p.add_argument(
         'version',
         help='Shows the rotki version',
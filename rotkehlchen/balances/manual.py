@@ -47,13 +47,16 @@ def get_manually_tracked_balances(
     with db.conn.read_ctx() as cursor:
         balances = db.get_manually_tracked_balances(cursor, balance_type=balance_type)
     balances_with_value = []
+    price_errors: dict[Asset, RemoteError] = {}
+    usd_prices = Inquirer.find_usd_prices(
+        assets=(entry.asset for entry in balances),
+        errors=price_errors,
+    )
     for entry in balances:
-        try:
-            price = Inquirer.find_usd_price(entry.asset)
-        except RemoteError as e:
+        if (price := usd_prices.get(entry.asset)) is None:
             db.msg_aggregator.add_warning(
                 f'Could not find price for {entry.asset.identifier} during '
-                f'manually tracked balance querying due to {e!s}',
+                f'manually tracked balance querying due to {price_errors.get(entry.asset)!s}',
             )
             price = ZERO_PRICE
 
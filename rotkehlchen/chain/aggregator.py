@@ -1,5 +1,6 @@
 import logging
 import operator
+import time
 from collections import defaultdict
 from collections.abc import Callable, Iterator, Sequence
 from functools import reduce
@@ -10,11 +11,12 @@ from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, cast, get_arg
 
 import requests
 from gevent.lock import Semaphore
+from gevent.pool import Pool
 from web3.exceptions import BadFunctionCallOutput, Web3Exception
 
 from rotkehlchen.accounting.structures.balance import Balance, BalanceSheet
 from rotkehlchen.api.websockets.typedefs import WSMessageType
-from rotkehlchen.assets.asset import CryptoAsset, EvmToken
+from rotkehlchen.assets.asset import Asset, CryptoAsset, EvmToken
 from rotkehlchen.chain.accounts import BlockchainAccountData, BlockchainAccounts
 from rotkehlchen.chain.arbitrum_one.modules.gearbox.balances import (
     GearboxBalances as GearboxBalancesArbitrumOne,
@@ -75,6 +77,7 @@ from rotkehlchen.chain.substrate.manager import wait_until_a_node_is_available
 from rotkehlchen.chain.substrate.utils import SUBSTRATE_NODE_CONNECTION_TIMEOUT
 from rotkehlchen.constants import ONE, ZERO
 from rotkehlchen.constants.assets import A_AVAX, A_BCH, A_BTC, A_DAI, A_DOT, A_ETH, A_ETH2, A_KSM
+from rotkehlchen.constants.misc import DEFAULT_CHAIN_BALANCES_CONCURRENCY
 from rotkehlchen.constants.resolver import ethaddress_to_identifier
 from rotkehlchen.db.cache import DBCacheStatic
 from rotkehlchen.db.eth2 import DBEth2
@@ -298,6 +301,7 @@ class ChainsAggregator(CacheableMixIn, LockableQueryMixIn):
             beaconchain: 'BeaconChain',
             btc_derivation_gap_limit: int,
             eth_modules: Sequence[ModuleName],
+            balances_concurrency: int = DEFAULT_CHAIN_BALANCES_CONCURRENCY,
     ):
         log.debug('Initializing ChainsAggregator')
         super().__init__()
@@ -318,6 +322,10 @@ class ChainsAggregator(CacheableMixIn, LockableQueryMixIn):
         self.data_directory = data_directory
         self.beaconchain = beaconchain
         self.btc_derivation_gap_limit = btc_derivation_gap_limit
+        # max number of chains whose balances are queried at the same time
+        self.balances_concurrency = balances_concurrency
+        # seconds each chain took in the last query of all balances
+        self.balances_query_durations: dict[SupportedBlockchain, float] = {}
         self.defi_balances_last_query_ts = Timestamp(0)
         self.defi_balances: dict[ChecksumEvmAddress, list[DefiProtocolBalances]] = {}
 
@@ -597,18 +605,77 @@ class ChainsAggregator(CacheableMixIn, LockableQueryMixIn):
             if ignore_cache is True and blockchain.is_bitcoin():
                 xpub_manager.check_for_new_xpub_addresses(blockchain=blockchain)  # type: ignore # is checked in the if
         else:  # all chains
-            for chain in SupportedBlockchain:
-                if chain.is_evm() and len(self.accounts.get(chain)) == 0:  # don't check eth2 and bitcoin since we might need to query new addresses  # noqa: E501
-                    continue
-
-                query_method = f'query_{chain.get_key()}_balances'
-                getattr(self, query_method)(ignore_cache=ignore_cache)
-                if ignore_cache is True and chain.is_bitcoin():
-                    xpub_manager.check_for_new_xpub_addresses(blockchain=chain)  # type: ignore # is checked in the if
+            self._query_all_chains_balances(ignore_cache=ignore_cache, xpub_manager=xpub_manager)
 
         self.totals = self.balances.recalculate_totals()
         return self.get_balances_update(blockchain)
 
+    def _query_all_chains_balances(self, ignore_cache: bool, xpub_manager: XpubManager) -> None:
+        """Queries the balances of all chains, up to `balances_concurrency` of them at the
+        same time, and records in `balances_query_durations` how long each chain took.
+
+        All chains are queried even if one of them fails. Then the error of the
+        first failed chain is raised.
+
+        May raise:
+        - Same errors as query_balances
+        """
+        chains = [
+            chain for chain in SupportedBlockchain
+            # don't skip eth2 and bitcoin since we might need to query new addresses
+            if not (chain.is_evm() and len(self.accounts.get(chain)) == 0)
+        ]
+        # get the native asset prices with as few oracle queries as possible
+        # so that each chain's query finds its price in the cache
+        Inquirer.find_usd_prices(Asset(chain.get_native_token_id()) for chain in chains)
+        self.balances_query_durations = {}
+        pool = Pool(size=self.balances_concurrency)
+        greenlets = [
+            pool.spawn(
+                self._query_chain_balances,
+                chain=chain,
+                ignore_cache=ignore_cache,
+                xpub_manager=xpub_manager,
+            ) for chain in chains
+        ]
+        pool.join()
+        durations = ', '.join(
+            f'{chain.get_key()}: {duration:.2f}' for chain, duration in
+            sorted(self.balances_query_durations.items(), key=operator.itemgetter(1), reverse=True)
+        )
+        log.debug(
+            f'Queried balances of {len(chains)} chains with concurrency '
+            f'{self.balances_concurrency}. Seconds per chain: {durations}',
+        )
+        for greenlet in greenlets:
+            if isinstance(greenlet.value, Exception):
+                raise greenlet.value
+
+    def _query_chain_balances(
+            self,
+            chain: SupportedBlockchain,
+            ignore_cache: bool,
+            xpub_manager: XpubManager,
+    ) -> Exception | None:
+        """Queries the balances of a single chain, and for bitcoin chains also checks for
+        new xpub addresses when ignoring the cache. The seconds it took are recorded in
+        balances_query_durations.
+
+        Any error is logged and returned so that query_balances can raise it once the
+        other chains have finished. Returns None on success."""
+        start = time.monotonic()
+        try:
+            getattr(self, f'query_{chain.get_key()}_balances')(ignore_cache=ignore_cache)
+            if ignore_cache is True and chain.is_bitcoin():
+                xpub_manager.check_for_new_xpub_addresses(blockchain=chain)  # type: ignore # is checked in the if
+        except Exception as e:  # pylint: disable=broad-except
+            log.error(f'Querying {chain} balances failed due to {e!s}')
+            return e
+        finally:
+            self.balances_query_durations[chain] = time.monotonic() - start
+
+        return None
+
     @protect_with_lock()
     @cache_response_timewise()
     def query_btc_balances(
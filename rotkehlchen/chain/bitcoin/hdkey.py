@@ -3,6 +3,7 @@
 
 import hashlib
 import hmac
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import auto
 from typing import NamedTuple, Optional, cast
@@ -404,20 +405,56 @@ class HDKey:
         )
         return self._child_from_xpub(index=index, child_xpub=child_xpub)
 
-    def address(self) -> BTCAddress:
+    def _derive_child_pubkey(self, index: int) -> PublicKey:
+        """Derives the public key of the non hardened child at the given index. Same
+        as derive_child(index).pubkey without making the xpub of the child."""
+        data = self.pubkey.format(COMPRESSED_PUBKEY) + index.to_bytes(4, byteorder='big')
+        tweak = hmac.new(cast('bytes', self.chain_code), data, digestmod=hashlib.sha512).digest()[:32]  # noqa: E501
+        try:
+            return self.pubkey.add(tweak)
+        except ValueError:
+            # an "impossible" key. The spec says to derive at the next index
+            return self._derive_child_pubkey(index + 1)
+
+    def derive_child_addresses(self, indices: Iterable[int]) -> list[BTCAddress]:
+        """
+        Derives the addresses of the non hardened children at the given indices.
+        Gives the same addresses as derive_child(idx).address() for each index but
+        skips serializing and parsing an xpub for each child, which is most of the work.
+        Args:
+            indices (iterable(int)): the indices of the children
+        Returns:
+            (list(str)): the addresses of the children in the order of the indices
+        """
+        if not self.chain_code:
+            raise XPUBError('Cannot derive XPUB child without chain_code')
+        if self.privkey:
+            raise NotImplementedError('Privkeys xpub derivation not implemented in rotki')
+
+        addresses = []
+        for index in indices:
+            if index >= BIP32_HARDEN:
+                raise XPUBError('Need private key to derive XPUB hardened children')
+            addresses.append(self._pubkey_to_address(self._derive_child_pubkey(index)))
+        return addresses
+
+    def _pubkey_to_address(self, pubkey: PublicKey) -> BTCAddress:
         if self.hint == 'xpub' and self.xpub_type == XpubType.P2TR:
             return pubkey_to_bech32_address(
-                data=self.pubkey.format(COMPRESSED_PUBKEY),
+                data=pubkey.format(COMPRESSED_PUBKEY),
                 witver=WitnessVersion.BECH32M,
             )
         if self.hint == 'xpub':
-            return pubkey_to_base58_address(self.pubkey.format(COMPRESSED_PUBKEY))
+            return pubkey_to_base58_address(pubkey.format(COMPRESSED_PUBKEY))
         if self.hint == 'ypub':
-            return pubkey_to_p2sh_p2wpkh_address(self.pubkey.format(COMPRESSED_PUBKEY))
+            return pubkey_to_p2sh_p2wpkh_address(pubkey.format(COMPRESSED_PUBKEY))
         if self.hint == 'zpub':
             return pubkey_to_bech32_address(
-                data=self.pubkey.format(COMPRESSED_PUBKEY),
+                data=pubkey.format(COMPRESSED_PUBKEY),
                 witver=WitnessVersion.BECH32,
             )
         # else
         raise AssertionError(f'Unknown hint {self.hint} ended up in an HDKey')
+
+    def address(self) -> BTCAddress:
+        return self._pubkey_to_address(self.pubkey)
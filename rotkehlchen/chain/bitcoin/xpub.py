@@ -1,6 +1,7 @@
 import logging
 from typing import TYPE_CHECKING, Any, Literal, NamedTuple
 
+import gevent
 from gevent.lock import Semaphore
 
 from rotkehlchen.accounting.structures.balance import Balance
@@ -78,23 +79,33 @@ def _derive_addresses_loop(
         root: HDKey,
         gap_limit: int,
         blockchain: Literal[SupportedBlockchain.BITCOIN, SupportedBlockchain.BITCOIN_CASH],
+        derived_addresses: dict[tuple[int, int], BTCAddress],
 ) -> list[XpubDerivedAddressData]:
-    """May raise:
+    """Checks the addresses of the given root in batches of gap_limit until a batch with no
+    transactions. The addresses of each batch are taken from derived_addresses, keyed by
+    account and derived index, and the missing ones are derived and added there.
+
+    May raise:
     - RemoteError: if blockstream/blockchain.info can't be reached
     """
+    have_transactions = have_bitcoin_transactions if blockchain == SupportedBlockchain.BITCOIN else have_bch_transactions  # noqa: E501
+
+    def derive_batch(step_index: int) -> list[tuple[int, BTCAddress]]:
+        indices = range(step_index, step_index + gap_limit)
+        if len(missing := [idx for idx in indices if (account_index, idx) not in derived_addresses]) != 0:  # noqa: E501
+            for idx, address in zip(missing, root.derive_child_addresses(missing), strict=True):
+                derived_addresses[account_index, idx] = address
+        return [(idx, derived_addresses[account_index, idx]) for idx in indices]
+
     step_index = start_index
     addresses: list[XpubDerivedAddressData] = []
     should_continue = True
+    batch_addresses = derive_batch(step_index)
     while should_continue:
-        batch_addresses: list[tuple[int, BTCAddress]] = []
-        for idx in range(step_index, step_index + gap_limit):
-            child = root.derive_child(idx)
-            batch_addresses.append((idx, child.address()))
-
-        if blockchain == SupportedBlockchain.BITCOIN:
-            have_tx_mapping = have_bitcoin_transactions([x[1] for x in batch_addresses])
-        else:
-            have_tx_mapping = have_bch_transactions([x[1] for x in batch_addresses])
+        # derive the next batch while waiting for the activity check of this one
+        next_batch_greenlet = gevent.spawn(derive_batch, step_index + gap_limit)
+        have_tx_mapping = have_transactions([x[1] for x in batch_addresses])
+        next_batch_addresses = next_batch_greenlet.get()
         should_continue = False
         for idx, address in batch_addresses:
             have_tx, balance = have_tx_mapping[address]
@@ -122,6 +133,7 @@ def _derive_addresses_loop(
                     ))
 
         step_index += gap_limit
+        batch_addresses = next_batch_addresses
 
     return addresses
 
@@ -131,11 +143,16 @@ def _derive_addresses_from_xpub_data(
         start_receiving_index: int,
         start_change_index: int,
         gap_limit: int,
+        derived_addresses: dict[tuple[int, int], BTCAddress],
 ) -> list[XpubDerivedAddressData]:
     """Derive all addresses from the xpub that have had transactions. Also includes
     any addresses until the biggest index derived addresses that have had no transactions.
     This is to make it easier to later derive and check more addresses
 
+    The receiving and the change addresses are checked concurrently. derived_addresses
+    has the already known addresses per account and derived index and gets any newly
+    derived ones.
+
     May raise:
     - RemoteError: if blockstream/blockchain.info/haskoin and others can't be reached
     """
@@ -144,27 +161,21 @@ def _derive_addresses_from_xpub_data(
     else:
         account_xpub = xpub_data.xpub
 
-    addresses = []
-    receiving_xpub = account_xpub.derive_child(0)
-    addresses.extend(
-        _derive_addresses_loop(
-            account_index=0,
-            start_index=start_receiving_index,
-            root=receiving_xpub,
-            gap_limit=gap_limit,
-            blockchain=xpub_data.blockchain,
-        ),
-    )
-    change_xpub = account_xpub.derive_child(1)
-    addresses.extend(
-        _derive_addresses_loop(
-            account_index=1,
-            start_index=start_change_index,
-            root=change_xpub,
+    greenlets = [  # receiving addresses are account 0 and change addresses are account 1
+        gevent.spawn(
+            _derive_addresses_loop,
+            account_index=account_index,
+            start_index=start_index,
+            root=account_xpub.derive_child(account_index),
             gap_limit=gap_limit,
             blockchain=xpub_data.blockchain,
-        ),
-    )
+            derived_addresses=derived_addresses,
+        ) for account_index, start_index in ((0, start_receiving_index), (1, start_change_index))
+    ]
+    gevent.joinall(greenlets)  # wait for both so none keeps running after an error is raised
+    addresses = []
+    for greenlet in greenlets:
+        addresses.extend(greenlet.get())  # re-raises any error of the greenlet
     return addresses
 
 
@@ -190,11 +201,19 @@ class XpubManager:
         """
         with self.db.conn.read_ctx() as cursor:
             last_receiving_idx, last_change_idx = self.db.get_last_consecutive_xpub_derived_indices(cursor, xpub_data)  # noqa: E501
+            derived_addresses = self.db.get_xpub_derived_addresses(
+                cursor=cursor,
+                xpub_data=xpub_data,
+                start_receiving_index=last_receiving_idx,
+                start_change_index=last_change_idx,
+            )
+            cached_indices = set(derived_addresses)
             derived_addresses_data = _derive_addresses_from_xpub_data(
                 xpub_data=xpub_data,
                 start_receiving_index=last_receiving_idx,
                 start_change_index=last_change_idx,
                 gap_limit=self.chains_aggregator.btc_derivation_gap_limit,
+                derived_addresses=derived_addresses,
             )
             known_addresses = getattr(self.db.get_blockchain_accounts(cursor), xpub_data.blockchain.get_key())  # noqa: E501
 
@@ -248,6 +267,14 @@ class XpubManager:
                 xpub_data=xpub_data,
                 derived_addresses_data=derived_addresses_data,
             )
+            self.db.add_xpub_derived_addresses(
+                write_cursor=write_cursor,
+                xpub_data=xpub_data,
+                derived_addresses={
+                    indices: address for indices, address in derived_addresses.items()
+                    if indices not in cached_indices
+                },
+            )
 
         # also add queried balances
         if xpub_data.blockchain == SupportedBlockchain.BITCOIN:
@@ -14,6 +14,7 @@ from rotkehlchen.chain.evm.decoding.structures import (
     DecodingOutput,
 )
 from rotkehlchen.chain.evm.decoding.types import CounterpartyDetails
+from rotkehlchen.chain.evm.decoding.utils import decodes_topics
 from rotkehlchen.chain.evm.structures import EvmTxReceiptLog
 from rotkehlchen.chain.evm.types import string_to_evm_address
 from rotkehlchen.constants.assets import A_1INCH, A_ETH, A_GTC
@@ -66,6 +67,14 @@ class EthereumTransactionDecoder(EVMTransactionDecoderWithDSProxy):
             exceptions_mappings=V1_TO_V2_MONERIUM_MAPPINGS,
         )
 
+    @decodes_topics(
+        GTC_CLAIM,
+        MERKLE_CLAIM,
+        addresses=(
+            string_to_evm_address('0xDE3e5a990bCE7fC60a6f017e7c4a95fc4939299E'),
+            string_to_evm_address('0xE295aD71242373C37C5FdA7B57F26f9eA1088AFe'),
+        ),
+    )
     def _maybe_enrich_transfers(
             self,
             token: EvmToken | None,  # pylint: disable=unused-argument
@@ -330,6 +330,7 @@ class EigenlayerDecoder(CliqueAirdropDecoderInterface, ReloadableDecoderMixin):
             event_subtypes=[HistoryEventSubType.REMOVE_ASSET],
         )
         dbevents = DBHistoryEvents(self.base.database)
+        self.base.save_pending_events()  # the withdrawal may be queued earlier in the chunk
         with self.base.database.conn.read_ctx() as cursor:
             events = dbevents.get_history_events(
                 cursor=cursor,
@@ -3,6 +3,7 @@ import logging
 import re
 from collections import defaultdict
 from collections.abc import Sequence
+from itertools import islice
 from typing import TYPE_CHECKING, Any, Literal
 
 import gevent
@@ -47,7 +48,6 @@ from .structures import (
     ValidatorDetailsWithStatus,
     ValidatorID,
 )
-from .utils import create_profit_filter_queries
 
 if TYPE_CHECKING:
     from rotkehlchen.chain.ethereum.node_inquirer import EthereumInquirer
@@ -161,24 +161,21 @@ class Eth2(EthereumModule):
                 (result := self.performance_cache.get(cache_key))
         ):  # return pagination on cached data
             return {
-                'validators': dict(list(result['validators'].items())[offset: offset + limit]),
+                'validators': dict(islice(result['validators'].items(), offset, offset + limit)),
                 'sums': result['sums'],
                 'entries_total': total_validators,
                 'entries_found': len(result['validators']),
             }
 
-        index_to_pubkey, index_to_activation_ts, index_to_withdrawable_ts = {}, {}, {}
+        pubkey_to_index, index_to_activation_ts, index_to_withdrawable_ts = {}, {}, {}
         dbeth2 = DBEth2(self.database)
-        all_validator_indices = set()
         with self.database.conn.read_ctx() as cursor:
             for entry in cursor.execute('SELECT validator_index, public_key, activation_timestamp, withdrawable_timestamp FROM eth2_validators WHERE validator_index IS NOT NULL'):  # noqa: E501
-                index_to_pubkey[entry[0]] = entry[1]
+                pubkey_to_index[entry[1]] = entry[0]
                 if entry[2] is not None:
                     index_to_activation_ts[entry[0]] = entry[2]
                 if entry[3] is not None:
                     index_to_withdrawable_ts[entry[0]] = entry[3]
-                all_validator_indices.add(entry[0])
-            pubkey_to_index = {x[1]: x[0] for x in cursor.execute('SELECT validator_index, public_key FROM eth2_validators WHERE validator_index IS NOT NULL')}  # noqa: E501
 
         to_filter_indices, to_query_indices = None, None
         if validator_indices is not None:
@@ -210,30 +207,19 @@ class Eth2(EthereumModule):
 
         with self.database.conn.read_ctx() as cursor:
             accounts = self.database.get_blockchain_accounts(cursor)
-
-        withdrawals_filter_query, exits_filter_query, execution_filter_query = create_profit_filter_queries(  # noqa: E501
-            from_ts=from_ts,
-            to_ts=to_ts,
-            validator_indices=list(to_filter_indices) if to_filter_indices is not None else None,
-            tracked_addresses=accounts.eth,  # needed to exclude block recipients not tracked
-        )
-
-        with self.database.conn.read_ctx() as cursor:
-            withdrawals_amounts, exits_pnl, execution_rewards_amounts = dbeth2.get_validators_profit(  # noqa: E501
+            validators_profit = dbeth2.get_validators_profit(
                 cursor=cursor,
-                exits_filter_query=exits_filter_query,
-                withdrawals_filter_query=withdrawals_filter_query,
-                execution_filter_query=execution_filter_query,
+                from_ts=from_ts,
+                to_ts=to_ts,
+                validator_indices=to_filter_indices,
+                # needed to exclude block recipients not tracked
+                tracked_addresses=set(accounts.eth),
             )
 
         pnls: defaultdict[int, dict] = defaultdict(dict)
         sums: defaultdict[str, FVal] = defaultdict(FVal)
-        for key_label, mapping in (
-                ('withdrawals', withdrawals_amounts),
-                ('exits', exits_pnl),
-                ('execution', execution_rewards_amounts),
-        ):
-            for vindex, amount in mapping.items():
+        for vindex, amounts in sorted(validators_profit.items()):
+            for key_label, amount in zip(('withdrawals', 'exits', 'execution'), amounts, strict=True):  # noqa: E501
                 if amount == ZERO:
                     continue
 
@@ -246,7 +232,7 @@ class Eth2(EthereumModule):
         # outstanding rewards not yet withdrawn
         now = ts_now()
         if to_query_indices is None:
-            to_query_indices = all_validator_indices
+            to_query_indices = set(pubkey_to_index.values())
 
         if now - to_ts <= DAY_IN_SECONDS:
             balances = self.beacon_inquirer.get_balances(
@@ -285,7 +271,7 @@ class Eth2(EthereumModule):
         self.performance_cache.add(cache_key, result)  # save cache & return pagination on the data
         self.performance_cache_args = (addresses, validator_indices, status)
         return {
-            'validators': dict(list(result['validators'].items())[offset: offset + limit]),
+            'validators': dict(islice(result['validators'].items(), offset, offset + limit)),
             'sums': result['sums'],
             'entries_total': total_validators,
             'entries_found': len(result['validators']),
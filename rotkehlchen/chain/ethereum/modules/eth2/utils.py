@@ -1,18 +1,10 @@
 import logging
 from collections.abc import Sequence
 
-from rotkehlchen.api.v1.types import IncludeExcludeFilterData
 from rotkehlchen.chain.ethereum.modules.eth2.constants import DEFAULT_VALIDATOR_CHUNK_SIZE
-from rotkehlchen.db.filtering import (
-    EthStakingEventFilterQuery,
-    EthWithdrawalFilterQuery,
-    WithdrawalTypesFilter,
-)
 from rotkehlchen.fval import FVal
-from rotkehlchen.history.events.structures.base import HistoryBaseEntryType
-from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
 from rotkehlchen.logging import RotkehlchenLogsAdapter
-from rotkehlchen.types import ChecksumEvmAddress, Eth2PubKey, Timestamp
+from rotkehlchen.types import Eth2PubKey, Timestamp
 from rotkehlchen.utils.misc import get_chunks
 
 logger = logging.getLogger(__name__)
@@ -57,40 +49,3 @@ def calculate_query_chunks(
         return []
 
     return list(get_chunks(indices_or_pubkeys, n=chunk_size))
-
-
-def create_profit_filter_queries(
-        from_ts: Timestamp,
-        to_ts: Timestamp,
-        validator_indices: list[int] | None,
-        tracked_addresses: Sequence[ChecksumEvmAddress],
-) -> tuple[EthWithdrawalFilterQuery, EthWithdrawalFilterQuery, EthStakingEventFilterQuery]:
-    """Create the Filter queries for withdrawal events and execution layer reward events"""
-    withdrawals_filter_query = EthWithdrawalFilterQuery.make(
-        from_ts=from_ts,
-        to_ts=to_ts,
-        validator_indices=validator_indices,
-        event_types=[HistoryEventType.STAKING],
-        event_subtypes=[HistoryEventSubType.REMOVE_ASSET],
-        entry_types=IncludeExcludeFilterData(values=[HistoryBaseEntryType.ETH_WITHDRAWAL_EVENT]),
-        withdrawal_types_filter=WithdrawalTypesFilter.ONLY_PARTIAL,
-    )
-    exits_filter_query = EthWithdrawalFilterQuery.make(
-        from_ts=from_ts,
-        to_ts=to_ts,
-        validator_indices=validator_indices,
-        event_types=[HistoryEventType.STAKING],
-        event_subtypes=[HistoryEventSubType.REMOVE_ASSET],
-        entry_types=IncludeExcludeFilterData(values=[HistoryBaseEntryType.ETH_WITHDRAWAL_EVENT]),
-        withdrawal_types_filter=WithdrawalTypesFilter.ONLY_EXITS,
-    )
-    execution_filter_query = EthStakingEventFilterQuery.make(
-        from_ts=from_ts,
-        to_ts=to_ts,
-        validator_indices=validator_indices,
-        event_types=[HistoryEventType.STAKING],
-        event_subtypes=[HistoryEventSubType.BLOCK_PRODUCTION, HistoryEventSubType.MEV_REWARD],
-        entry_types=IncludeExcludeFilterData(values=[HistoryBaseEntryType.ETH_BLOCK_EVENT]),
-        location_labels=tracked_addresses,  # type: ignore  # addresses are strings
-    )
-    return withdrawals_filter_query, exits_filter_query, execution_filter_query
@@ -50,6 +50,8 @@ class BaseDecoderTools:
         with self.database.conn.read_ctx() as cursor:
             self.tracked_accounts = self.database.get_blockchain_accounts(cursor)
         self.sequence_counter = 0
+        # set while decoding a chunk of transactions whose events are saved at its end
+        self.pending_events_saver: Callable[[], None] | None = None
 
     def reset_sequence_counter(self) -> None:
         self.sequence_counter = 0
@@ -68,6 +70,13 @@ class BaseDecoderTools:
         sequence index and the event's log index"""
         return self.sequence_counter + tx_log.log_index
 
+    def save_pending_events(self) -> None:
+        """Saves the events of the transactions decoded so far that are not yet in the DB.
+        Decoders that look up previously decoded events in the DB call it first so that
+        the events of the earlier transactions of the same chunk are found."""
+        if self.pending_events_saver is not None:
+            self.pending_events_saver()
+
     def refresh_tracked_accounts(self, cursor: 'DBCursor') -> None:
         self.tracked_accounts = self.database.get_blockchain_accounts(cursor)
 
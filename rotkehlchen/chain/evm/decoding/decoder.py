@@ -7,8 +7,9 @@ from abc import ABC, abstractmethod
 from collections.abc import Callable, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
+from functools import partial
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Optional, Protocol, TypeAlias
 
 import gevent
 from gevent.lock import Semaphore
@@ -71,7 +72,12 @@ from .structures import (
     EnricherContext,
     TransferEnrichmentOutput,
 )
-from .utils import maybe_reshuffle_events
+from .utils import (
+    RULE_ADDRESSES_ATTRIBUTE,
+    RULE_TOPICS_ATTRIBUTE,
+    decodes_topics,
+    maybe_reshuffle_events,
+)
 
 if TYPE_CHECKING:
     from rotkehlchen.assets.asset import Asset, AssetWithOracles, EvmToken
@@ -86,6 +92,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 MIN_LOGS_PROCESSED_TO_SLEEP = 1000
+# number of undecoded transactions that are loaded, decoded and saved together
+DECODING_CHUNK_SIZE = 100
 
 
 class EventDecoderFunction(Protocol):
@@ -102,6 +110,10 @@ class EventDecoderFunction(Protocol):
         ...
 
 
+# an event rule and the contract addresses it is restricted to, if any
+RuleCandidate: TypeAlias = tuple[EventDecoderFunction, frozenset[ChecksumEvmAddress] | None]
+
+
 @dataclass(init=True, repr=True, eq=True, order=False, unsafe_hash=False, frozen=True)
 class DecodingRules:
     address_mappings: dict[ChecksumEvmAddress, tuple[Any, ...]]
@@ -135,6 +147,36 @@ class DecodingRules:
         )
 
 
+class EventRulesIndex:
+    """Maps the topic0 of a log to the event rules that may decode it.
+
+    Rules declare what they decode with the decodes_topics decorator. Rules without a
+    declaration are candidates for every log. The candidates of each topic keep the
+    relative order of the given rules since the first rule that decodes a log wins.
+    """
+
+    def __init__(self, event_rules: list[EventDecoderFunction]) -> None:
+        self.fallback_rules: list[RuleCandidate] = []
+        self.topic_rules: dict[bytes, list[RuleCandidate]] = {}
+        declared_rules = []
+        for rule in event_rules:
+            if (topics := getattr(rule, RULE_TOPICS_ATTRIBUTE, None)) is None:
+                self.fallback_rules.append((rule, None))
+            else:
+                declared_rules.append((rule, topics))
+
+        for topic in {topic for _, topics in declared_rules for topic in topics}:
+            self.topic_rules[topic] = [
+                (rule, getattr(rule, RULE_ADDRESSES_ATTRIBUTE, None)) for rule in event_rules
+                if (topics := getattr(rule, RULE_TOPICS_ATTRIBUTE, None)) is None or topic in topics  # noqa: E501
+            ]
+
+    def get_candidates(self, tx_log: EvmTxReceiptLog) -> list[RuleCandidate]:
+        """Returns the rules to try for the log along with the addresses each one is
+        restricted to, if any. The log should not be anonymous."""
+        return self.topic_rules.get(tx_log.topics[0], self.fallback_rules)
+
+
 class EVMTransactionDecoder(ABC):
 
     def __init__(
@@ -180,7 +222,7 @@ class EVMTransactionDecoder(ABC):
         self.dbevmtx = dbevmtx_class(self.database)
         self.dbevents = DBHistoryEvents(self.database)
         self.base = base_tools
-        self.rules = DecodingRules(
+        self.rules: DecodingRules = DecodingRules(
             address_mappings={},
             event_rules=[
                 self._maybe_decode_erc20_approve,
@@ -202,6 +244,7 @@ class EVMTransactionDecoder(ABC):
         self._add_builtin_decoders(self.rules)
         # Recursively check all submodules to get all decoder address mappings and rules
         self.rules += self._recursively_initialize_decoders(self.chain_modules_root)
+        self.event_rules_index = EventRulesIndex(self.rules.event_rules)
         self.undecoded_tx_query_lock = Semaphore()
 
     def _add_builtin_decoders(self, rules: DecodingRules) -> None:
@@ -369,7 +412,6 @@ class EVMTransactionDecoder(ABC):
 
     def try_all_rules(
             self,
-            token: 'EvmToken | None',
             tx_log: EvmTxReceiptLog,
             transaction: EvmTransaction,
             decoded_events: list['EvmEvent'],
@@ -377,12 +419,21 @@ class EVMTransactionDecoder(ABC):
             all_logs: list[EvmTxReceiptLog],
     ) -> DecodingOutput | None:
         """
-        Execute event rules for the current tx log. Returns None when no
+        Execute the event rules that may decode the current tx log. Returns None when no
         new event or actions need to be propagated.
         """
-        for rule in self.rules.event_rules:
-            if len(tx_log.topics) == 0:
-                continue  # ignore anonymous events
+        if len(tx_log.topics) == 0:
+            return None  # ignore anonymous events
+
+        token: EvmToken | None = None
+        token_queried = False
+        for rule, addresses in self.event_rules_index.get_candidates(tx_log):
+            if addresses is not None and tx_log.address not in addresses:
+                continue
+
+            if token_queried is False:  # only look for the token if there are rules to run
+                token = get_token(evm_address=tx_log.address, chain_id=self.evm_inquirer.chain_id)
+                token_queried = True
 
             try:
                 decoding_output = rule(token=token, tx_log=tx_log, transaction=transaction, decoded_events=decoded_events, action_items=action_items, all_logs=all_logs)  # noqa: E501
@@ -473,10 +524,29 @@ class EVMTransactionDecoder(ABC):
         - a flag which is True if balances refresh is needed
         - A list of decoders to reload or None if no need
         """
-        log.debug(f'Starting decoding of transaction {transaction.tx_hash.hex()} logs at {self.evm_inquirer.chain_name}')  # noqa: E501
-        with self.database.conn.read_ctx() as read_cursor:
-            tx_id = transaction.get_or_query_db_id(read_cursor)
+        events, refresh_balances, reload_decoders = self._decode_transaction_events(
+            transaction=transaction,
+            tx_receipt=tx_receipt,
+        )
+        with self.database.user_write() as write_cursor:
+            self._save_decoded_events(
+                write_cursor=write_cursor,
+                transaction=transaction,
+                events=events,
+            )
+
+        events = sorted(events, key=lambda x: x.sequence_index, reverse=False)
+        return events, refresh_balances, reload_decoders  # Propagate for post processing in the caller  # noqa: E501
 
+    def _decode_transaction_events(
+            self,
+            transaction: EvmTransaction,
+            tx_receipt: EvmTxReceipt,
+    ) -> tuple[list['EvmEvent'], bool, set[str] | None]:
+        """Decodes an evm transaction and its receipt without saving the events in the DB.
+        Returns the same as _decode_transaction, apart from the events not being sorted.
+        """
+        log.debug(f'Starting decoding of transaction {transaction.tx_hash.hex()} logs at {self.evm_inquirer.chain_name}')  # noqa: E501
         self.base.reset_sequence_counter()
         # check if any eth transfer happened in the transaction, including in internal transactions
         events = self._maybe_decode_simple_transactions(transaction, tx_receipt)
@@ -539,7 +609,6 @@ class EVMTransactionDecoder(ABC):
                 continue
 
             rules_decoding_output = self.try_all_rules(
-                token=get_token(evm_address=tx_log.address, chain_id=self.evm_inquirer.chain_id),
                 tx_log=tx_log,
                 transaction=transaction,
                 decoded_events=events,
@@ -583,29 +652,34 @@ class EVMTransactionDecoder(ABC):
         if len(events) == 0 and (eth_event := self._get_eth_transfer_event(transaction)) is not None:  # noqa: E501
             events = [eth_event]
 
-        with self.database.user_write() as write_cursor:
-            if len(events) > 0:
-                self.dbevents.add_history_events(
-                    write_cursor=write_cursor,
-                    history=events,
-                )
-            else:
-                # This is probably a phishing zero value token transfer tx.
-                # Details here: https://github.com/rotki/rotki/issues/5749
-                with suppress(InputError):  # We don't care if it's already in the DB
-                    self.database.add_to_ignored_action_ids(
-                        write_cursor=write_cursor,
-                        action_type=ActionType.HISTORY_EVENT,
-                        identifiers=[transaction.identifier],
-                    )
+        return events, refresh_balances, reload_decoders
 
-            write_cursor.execute(
-                'INSERT OR IGNORE INTO evm_tx_mappings(tx_id, value) VALUES(?, ?)',
-                (tx_id, EVMTX_DECODED),
+    def _save_decoded_events(
+            self,
+            write_cursor: 'DBCursor',
+            transaction: EvmTransaction,
+            events: list['EvmEvent'],
+    ) -> None:
+        """Saves the decoded events of a transaction and marks it as decoded"""
+        if len(events) > 0:
+            self.dbevents.add_history_events(
+                write_cursor=write_cursor,
+                history=events,
             )
+        else:
+            # This is probably a phishing zero value token transfer tx.
+            # Details here: https://github.com/rotki/rotki/issues/5749
+            with suppress(InputError):  # We don't care if it's already in the DB
+                self.database.add_to_ignored_action_ids(
+                    write_cursor=write_cursor,
+                    action_type=ActionType.HISTORY_EVENT,
+                    identifiers=[transaction.identifier],
+                )
 
-        events = sorted(events, key=lambda x: x.sequence_index, reverse=False)
-        return events, refresh_balances, reload_decoders  # Propagate for post processing in the caller  # noqa: E501
+        write_cursor.execute(
+            'INSERT OR IGNORE INTO evm_tx_mappings(tx_id, value) VALUES(?, ?)',
+            (transaction.get_or_query_db_id(write_cursor), EVMTX_DECODED),
+        )
 
     def get_and_decode_undecoded_transactions(
             self,
@@ -616,6 +690,9 @@ class EVMTransactionDecoder(ABC):
         If a list of addresses is provided then only the transactions involving those
         addresses are decoded.
 
+        The transactions are decoded in chunks of DECODING_CHUNK_SIZE, with the events
+        of each chunk saved in a single write transaction.
+
         This is protected by concurrent access from a lock"""
         with self.undecoded_tx_query_lock:
             log.debug(f'Starting task to process undecoded transactions for {self.evm_inquirer.chain_name} with {limit=}')  # noqa: E501
@@ -625,8 +702,7 @@ class EVMTransactionDecoder(ABC):
             )
             if len(hashes) != 0:
                 log.debug(f'Will decode {len(hashes)} transactions for {self.evm_inquirer.chain_name}')  # noqa: E501
-                self.decode_transaction_hashes(
-                    ignore_cache=False,
+                self._decode_transaction_hashes_in_chunks(
                     tx_hashes=hashes,
                     send_ws_notifications=send_ws_notifications,
                 )
@@ -708,27 +784,10 @@ class EVMTransactionDecoder(ABC):
         for tx_index, tx_hash in enumerate(tx_hashes):
             log.debug(f'Decoding logic started for {tx_hash.hex()} ({self.evm_inquirer.chain_name})')  # noqa: E501
             if send_ws_notifications and tx_index % 10 == 0:
-                log.debug(f'Processed {tx_index} out of {total_transactions} transactions from {self.evm_inquirer.chain_id}')  # noqa: E501
-                self.msg_aggregator.add_message(
-                    message_type=WSMessageType.EVM_UNDECODED_TRANSACTIONS,
-                    data={
-                        'chain': self.evm_inquirer.chain_name,
-                        'total': total_transactions,
-                        'processed': tx_index,
-                    },
-                )
+                self._notify_decoding_progress(total=total_transactions, processed=tx_index)
 
             # TODO: Change this if transaction filter query can accept multiple hashes
-            with self.database.conn.read_ctx() as cursor:
-                try:
-                    tx, receipt = self.transactions.get_or_create_transaction(
-                        cursor=cursor,
-                        tx_hash=tx_hash,
-                        relevant_address=None,
-                    )
-                except RemoteError as e:
-                    raise InputError(f'{self.evm_inquirer.chain_name} hash {tx_hash.hex()} does not correspond to a transaction. {e}') from e  # noqa: E501
-
+            tx, receipt = self._get_or_create_transaction(tx_hash)
             new_events, new_refresh_balances, reload_decoders = self._get_or_decode_transaction_events(  # noqa: E501
                 transaction=tx,
                 tx_receipt=receipt,
@@ -746,13 +805,142 @@ class EVMTransactionDecoder(ABC):
                 with self.database.conn.read_ctx() as cursor:
                     self.reload_specific_decoders(cursor, decoders=reload_decoders)
 
+        self._finish_decoding(
+            total=total_transactions,
+            refresh_balances=refresh_balances,
+            send_ws_notifications=send_ws_notifications,
+        )
+
+    def _decode_transaction_hashes_in_chunks(
+            self,
+            tx_hashes: list[EVMTxHash],
+            send_ws_notifications: bool = False,
+            chunk_size: int = DECODING_CHUNK_SIZE,
+    ) -> None:
+        """Decodes the given, not yet decoded, transaction hashes in chunks.
+
+        The transactions and receipts of a chunk are loaded from the DB in bulk. Any missing
+        ones are pulled and the chunk is decoded without holding the write lock, so that the
+        remote queries done meanwhile don't block other writers. The events of the chunk are
+        then saved in a single short write transaction. Decoders looking up events of previous
+        transactions in the DB save the pending events of the chunk first. If anything fails
+        the events already saved are kept and the rest of the failing chunk stays undecoded.
+
+        May raise:
+        - DeserializationError if there is a problem with contacting a remote to get receipts
+        - RemoteError if there is a problem with contacting a remote to get receipts
+        - InputError if the transaction hash is not found in the DB
+        """
+        with self.database.conn.read_ctx() as cursor:
+            self.reload_data(cursor)
+
+        refresh_balances = False
+        total_transactions = len(tx_hashes)
+        log.debug(f'Started logic to decode {total_transactions} transactions from {self.evm_inquirer.chain_id} in chunks of {chunk_size}')  # noqa: E501
+        for chunk_start in range(0, total_transactions, chunk_size):
+            chunk = tx_hashes[chunk_start:chunk_start + chunk_size]
+            with self.database.conn.read_ctx() as cursor:
+                loaded = self.dbevmtx.get_transactions_and_receipts(
+                    cursor=cursor,
+                    tx_hashes=chunk,
+                    chain_id=self.evm_inquirer.chain_id,
+                )
+
+            pending: list[tuple[EvmTransaction, list[EvmEvent]]] = []
+            self.base.pending_events_saver = partial(self._save_pending_events, pending)
+            try:
+                for tx_index, tx_hash in enumerate(chunk, start=chunk_start):
+                    if send_ws_notifications and tx_index % 10 == 0:
+                        self._notify_decoding_progress(total=total_transactions, processed=tx_index)  # noqa: E501
+
+                    if (tx_data := loaded.get(tx_hash)) is None:  # missing data, so pull it
+                        tx_data = self._get_or_create_transaction(tx_hash)
+
+                    tx, receipt = tx_data
+                    new_events, new_refresh_balances, reload_decoders = self._decode_transaction_events(  # noqa: E501
+                        transaction=tx,
+                        tx_receipt=receipt,
+                    )
+                    pending.append((tx, new_events))
+                    if new_refresh_balances is True:
+                        refresh_balances = True
+
+                    if reload_decoders is not None:
+                        with self.database.conn.read_ctx() as cursor:
+                            self.reload_specific_decoders(cursor, decoders=reload_decoders)
+
+                self._save_pending_events(pending)
+            finally:
+                self.base.pending_events_saver = None
+
+            log.debug(f'Saved the events of {len(chunk)} decoded transactions from {self.evm_inquirer.chain_id}')  # noqa: E501
+
+        self._finish_decoding(
+            total=total_transactions,
+            refresh_balances=refresh_balances,
+            send_ws_notifications=send_ws_notifications,
+        )
+
+    def _save_pending_events(self, pending: list[tuple[EvmTransaction, list['EvmEvent']]]) -> None:
+        """Saves the events of the given decoded transactions in a single write transaction
+        and empties the list"""
+        if len(pending) == 0:
+            return
+
+        with self.database.user_write() as write_cursor:
+            for transaction, events in pending:
+                self._save_decoded_events(
+                    write_cursor=write_cursor,
+                    transaction=transaction,
+                    events=events,
+                )
+        pending.clear()
+
+    def _get_or_create_transaction(
+            self,
+            tx_hash: EVMTxHash,
+    ) -> tuple[EvmTransaction, EvmTxReceipt]:
+        """Gets the transaction and receipt of the hash, pulling them if not in the DB
+
+        May raise:
+        - DeserializationError if there is a problem with contacting a remote to get receipts
+        - InputError if the transaction hash does not correspond to a transaction
+        """
+        with self.database.conn.read_ctx() as cursor:
+            try:
+                return self.transactions.get_or_create_transaction(
+                    cursor=cursor,
+                    tx_hash=tx_hash,
+                    relevant_address=None,
+                )
+            except RemoteError as e:
+                raise InputError(f'{self.evm_inquirer.chain_name} hash {tx_hash.hex()} does not correspond to a transaction. {e}') from e  # noqa: E501
+
+    def _notify_decoding_progress(self, total: int, processed: int) -> None:
+        log.debug(f'Processed {processed} out of {total} transactions from {self.evm_inquirer.chain_id}')  # noqa: E501
+        self.msg_aggregator.add_message(
+            message_type=WSMessageType.EVM_UNDECODED_TRANSACTIONS,
+            data={
+                'chain': self.evm_inquirer.chain_name,
+                'total': total,
+                'processed': processed,
+            },
+        )
+
+    def _finish_decoding(
+            self,
+            total: int,
+            refresh_balances: bool,
+            send_ws_notifications: bool,
+    ) -> None:
+        """Notifies that all the transactions were decoded and runs the post processing"""
         if send_ws_notifications:
             self.msg_aggregator.add_message(
                 message_type=WSMessageType.EVM_UNDECODED_TRANSACTIONS,
                 data={
                     'chain': self.evm_inquirer.chain_name,
-                    'total': total_transactions,
-                    'processed': total_transactions,
+                    'total': total,
+                    'processed': total,
                 },
             )
 
@@ -878,6 +1066,7 @@ class EVMTransactionDecoder(ABC):
             counterparty=counterparty,
         )
 
+    @decodes_topics(ERC20_APPROVE)
     def _maybe_decode_erc20_approve(
             self,
             token: 'EvmToken | None',
@@ -1013,6 +1202,7 @@ class EVMTransactionDecoder(ABC):
             events.append(eth_event)
         return events
 
+    @decodes_topics(ERC20_OR_ERC721_TRANSFER)
     def _maybe_decode_erc20_721_transfer(
             self,
             token: 'EvmToken | None',
@@ -103,7 +103,8 @@ class DecoderInterface(ABC):
     def decoding_rules(self) -> list[Callable]:
         """
         Subclasses may implement this to add new generic decoding rules to be attempted
-        by the decoding process
+        by the decoding process. Rules should declare the log topics they decode with the
+        decodes_topics decorator so that they are only attempted for those logs.
         """
         return []
 
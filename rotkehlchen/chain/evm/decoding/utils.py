@@ -1,6 +1,6 @@
 import logging
-from collections.abc import Callable, Iterable, Sequence
-from typing import TYPE_CHECKING, Any, Literal, Optional
+from collections.abc import Callable, Collection, Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar
 
 from eth_typing import ABI
 
@@ -32,6 +32,31 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+T_Callable = TypeVar('T_Callable', bound=Callable)
+# attributes set by decodes_topics to the event rules
+RULE_TOPICS_ATTRIBUTE = 'rule_topics'
+RULE_ADDRESSES_ATTRIBUTE = 'rule_addresses'
+
+
+def decodes_topics(
+        *topics: bytes,
+        addresses: Collection[ChecksumEvmAddress] | None = None,
+) -> Callable[[T_Callable], T_Callable]:
+    """Decorator for the event rules returned by DecoderInterface.decoding_rules() that
+    declares the topic0 values of the logs the rule can decode and, optionally, the
+    addresses of the contracts that emit them.
+
+    The transaction decoder only calls the rule for logs matching them, so a decorated
+    rule must return the default output for any other log. Rules without a declaration
+    are tried for all logs.
+    """
+    def wrapper(rule: T_Callable) -> T_Callable:
+        setattr(rule, RULE_TOPICS_ATTRIBUTE, frozenset(topics))
+        setattr(rule, RULE_ADDRESSES_ATTRIBUTE, None if addresses is None else frozenset(addresses))  # noqa: E501
+        return rule
+
+    return wrapper
+
 
 def maybe_reshuffle_events(
         ordered_events: Sequence[Optional['EvmEvent']],
@@ -0,0 +1,132 @@
+import math
+import random
+import time
+from collections.abc import Sequence
+from typing import Any
+
+from rotkehlchen.chain.evm.types import WeightedNode
+
+# Weight of a new sample in the rolling latency and error rate of a node
+HEALTH_SAMPLE_WEIGHT = 0.2
+# Seconds after which half of the error rate of a node is forgotten. This is what
+# makes a deprioritized node move up in the call order again so that it is probed.
+ERROR_RATE_HALF_LIFE = 300
+# Latency in seconds for which the weight of a node in the call order is halved
+REFERENCE_LATENCY = 1.0
+# Nodes with a higher error rate are only tried after all the healthier ones
+UNHEALTHY_ERROR_RATE = 0.5
+# Lowest health score so that no node gets a zero weight in the call order
+MIN_HEALTH = 0.01
+
+
+class NodeHealth:
+    """Rolling latency and error rate of a single node"""
+
+    __slots__ = ('_error_rate', 'calls', 'errors', 'last_update', 'latency')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.latency: float | None = None  # seconds, of the successful calls only
+        self._error_rate = 0.0
+        self.last_update = time.monotonic()
+
+    def error_rate(self, now: float) -> float:
+        """The error rate decayed by the time since the last call to the node"""
+        return self._error_rate * 0.5 ** ((now - self.last_update) / ERROR_RATE_HALF_LIFE)
+
+    def health(self, now: float) -> float:
+        """Score in (0, 1] by which the user given weight of the node is multiplied"""
+        latency_factor = 1.0 if self.latency is None else 1 / (1 + self.latency / REFERENCE_LATENCY)  # noqa: E501
+        return max(MIN_HEALTH, (1 - self.error_rate(now)) * latency_factor)
+
+    def record(self, success: bool, latency: float | None, now: float) -> None:
+        self._error_rate = (
+            self.error_rate(now) * (1 - HEALTH_SAMPLE_WEIGHT) +
+            (0 if success else HEALTH_SAMPLE_WEIGHT)
+        )
+        self.last_update = now
+        self.calls += 1
+        if success is False:
+            self.errors += 1
+        elif latency is not None:
+            self.latency = latency if self.latency is None else (
+                self.latency * (1 - HEALTH_SAMPLE_WEIGHT) + latency * HEALTH_SAMPLE_WEIGHT
+            )
+
+    def serialize(self, now: float) -> dict[str, Any]:
+        error_rate = self.error_rate(now)
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'error_rate': round(error_rate, 4),
+            'latency_ms': None if self.latency is None else round(self.latency * 1000, 2),
+            'health': round(self.health(now), 4),
+            'deprioritized': error_rate > UNHEALTHY_ERROR_RATE,
+        }
+
+
+class WeightedNodesSampler:
+    """The nodes to order along with their user given weights as floats. Built once for a set
+    of nodes so that ordering them for every call does not convert the weights again."""
+
+    __slots__ = ('names', 'nodes', 'weights')
+
+    def __init__(self, nodes: Sequence[WeightedNode]) -> None:
+        self.nodes = tuple(nodes)
+        self.names = tuple(node.node_info.name for node in self.nodes)
+        self.weights = tuple(float(node.weight) for node in self.nodes)
+
+
+class NodesHealthTracker:
+    """Keeps in memory the health of the nodes of a chain and uses it to order them"""
+
+    def __init__(self) -> None:
+        self.nodes: dict[str, NodeHealth] = {}
+
+    def record_success(self, node_name: str, latency: float) -> None:
+        self._get(node_name).record(success=True, latency=latency, now=time.monotonic())
+
+    def record_failure(self, node_name: str) -> None:
+        self._get(node_name).record(success=False, latency=None, now=time.monotonic())
+
+    def order(self, nodes: 'Sequence[WeightedNode] | WeightedNodesSampler') -> list[WeightedNode]:
+        """Orders the nodes randomly with a probability of the user given weight times the
+        health of each node. Nodes with a high error rate go after all the others, in the
+        same way, until their error rate decays enough for them to be probed again.
+
+        Each node gets an exponentially distributed random key with its weight as rate and
+        the nodes are sorted by it. That is the same as repeatedly picking one of the
+        remaining nodes with a probability proportional to its weight but in O(n log n).
+        Nodes with zero weight go after the others in a uniformly random order."""
+        if not isinstance(nodes, WeightedNodesSampler):
+            nodes = WeightedNodesSampler(nodes)
+        now = time.monotonic()
+        keys = []
+        for idx, (name, user_weight) in enumerate(zip(nodes.names, nodes.weights, strict=True)):
+            weight, unhealthy = user_weight, False
+            if (health := self.nodes.get(name)) is not None:
+                unhealthy = health.error_rate(now) > UNHEALTHY_ERROR_RATE
+                weight *= health.health(now)
+            keys.append((
+                unhealthy,
+                random.expovariate(weight) if weight > 0 else math.inf,
+                random.random(),  # random order of the zero weight nodes
+                idx,
+            ))
+
+        keys.sort()
+        return [nodes.nodes[key[3]] for key in keys]
+
+    def calls(self) -> dict[str, tuple[int, int]]:
+        """The number of calls and of failed calls made so far to each node"""
+        return {name: (health.calls, health.errors) for name, health in self.nodes.items()}
+
+    def serialize(self, node_names: Sequence[str]) -> dict[str, dict[str, Any]]:
+        now = time.monotonic()
+        return {name: self.nodes.get(name, NodeHealth()).serialize(now) for name in node_names}
+
+    def _get(self, node_name: str) -> NodeHealth:
+        if (health := self.nodes.get(node_name)) is None:
+            health = self.nodes[node_name] = NodeHealth()
+        return health
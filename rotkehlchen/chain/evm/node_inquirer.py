@@ -1,6 +1,6 @@
 import json
 import logging
-import random
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Sequence
 from contextlib import suppress
@@ -35,6 +35,11 @@ from rotkehlchen.chain.evm.constants import (
     GENESIS_HASH,
 )
 from rotkehlchen.chain.evm.contracts import EvmContract, EvmContracts
+from rotkehlchen.chain.evm.node_health import (
+    ERROR_RATE_HALF_LIFE,
+    NodesHealthTracker,
+    WeightedNodesSampler,
+)
 from rotkehlchen.chain.evm.proxies_inquirer import EvmProxiesInquirer
 from rotkehlchen.chain.evm.types import NodeName, Web3Node, WeightedNode
 from rotkehlchen.constants import ONE
@@ -235,10 +240,14 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
         self.contract_info_erc20_cache: LRUCacheWithRemove[ChecksumEvmAddress, dict[str, Any]] = LRUCacheWithRemove(maxsize=1024)  # noqa: E501
         self.contract_info_erc721_cache: LRUCacheWithRemove[ChecksumEvmAddress, dict[str, Any]] = LRUCacheWithRemove(maxsize=512)  # noqa: E501
         # failed_to_connect_nodes keeps the nodes that we couldn't connect while
-        # doing remote queries so they aren't tried again if they get chosen. At the
-        # moment of writing this we don't remove entries from the set after some time.
-        # To force the app to retry a node a restart is needed.
-        self.failed_to_connect_nodes: set[str] = set()
+        # doing remote queries, mapped to the time of the failure, so they aren't
+        # tried again if they get chosen until ERROR_RATE_HALF_LIFE seconds pass.
+        self.failed_to_connect_nodes: dict[str, float] = {}
+        # rolling latency and error rate of the nodes, used to order them
+        self.nodes_health = NodesHealthTracker()
+        # the nodes that default_call_order orders and the owned nodes that go first, per
+        # value of skip_etherscan, along with the version of the DB nodes they come from
+        self._call_order_nodes: dict[bool, tuple[int, WeightedNodesSampler, list[WeightedNode]]] = {}  # noqa: E501
         LockableQueryMixIn.__init__(self)
 
     def maybe_connect_to_nodes(self, when_tracked_accounts: bool) -> None:
@@ -261,8 +270,7 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
             (tracked_accounts_num != 0 and when_tracked_accounts) or
             (tracked_accounts_num == 0 and (when_tracked_accounts is False or self.chain_id == ChainID.ETHEREUM))  # noqa: E501
         ):
-            rpc_nodes = self.database.get_rpc_nodes(blockchain=self.blockchain, only_active=True)
-            self.connect_to_multiple_nodes(rpc_nodes)
+            self.connect_to_multiple_nodes(self.get_active_nodes())
 
     def connected_to_any_web3(self) -> bool:
         return len(self.web3_mapping) != 0
@@ -282,11 +290,19 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
     def get_connected_nodes(self) -> list[NodeName]:
         return list(self.web3_mapping.keys())
 
+    def get_active_nodes(self) -> Sequence[WeightedNode]:
+        return self.database.get_rpc_nodes(blockchain=self.blockchain, only_active=True)
+
+    def get_nodes_health(self) -> dict[str, dict[str, Any]]:
+        """Returns the rolling latency and error rate stats of the active nodes"""
+        return self.nodes_health.serialize([x.node_info.name for x in self.get_active_nodes()])
+
     def default_call_order(self, skip_etherscan: bool = False) -> list[WeightedNode]:
         """Default call order for evm nodes
 
         Own node always has preference. Then all other node types are randomly queried
-        in sequence depending on a weighted probability.
+        in sequence depending on a weighted probability. The user given weight of each
+        node is scaled by its health, so slow or erroring nodes are deprioritized.
 
 
         Some benchmarks on weighted probability based random selection when compared
@@ -300,26 +316,21 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
         ===> Runs: 66, 82, 72, 58, 72 seconds
         ---> Average: 70 seconds
         """
-        open_nodes = self.database.get_rpc_nodes(blockchain=self.blockchain, only_active=True)
-        if skip_etherscan:
-            selection = [wnode for wnode in open_nodes if wnode.node_info.name != self.etherscan_node_name and wnode.node_info.owned is False]  # noqa: E501
-        else:
-            selection = [wnode for wnode in open_nodes if wnode.node_info.owned is False]
-
-        ordered_list = []
-        while len(selection) != 0:
-            weights = [float(entry.weight) for entry in selection]
-            node = random.choices(selection, weights, k=1)
-            ordered_list.append(node[0])
-            selection.remove(node[0])
+        version = self.database.get_rpc_nodes_version(self.blockchain)
+        if (cached := self._call_order_nodes.get(skip_etherscan)) is None or cached[0] != version:
+            open_nodes = self.get_active_nodes()
+            if skip_etherscan:
+                selection = [wnode for wnode in open_nodes if wnode.node_info.name != self.etherscan_node_name and wnode.node_info.owned is False]  # noqa: E501
+            else:
+                selection = [wnode for wnode in open_nodes if wnode.node_info.owned is False]
 
-        owned_nodes = [node.node_info for node in open_nodes if node.node_info.owned]
-        if len(owned_nodes) != 0:
             # Assigning one is just a default since we always use it.
             # The weight is only important for the other nodes since they
             # are selected using this parameter
-            ordered_list = [WeightedNode(node_info=node, weight=ONE, active=True) for node in owned_nodes] + ordered_list  # noqa: E501
-        return ordered_list
+            owned_nodes = [WeightedNode(node_info=node.node_info, weight=ONE, active=True) for node in open_nodes if node.node_info.owned]  # noqa: E501
+            cached = self._call_order_nodes[skip_etherscan] = (version, WeightedNodesSampler(selection), owned_nodes)  # noqa: E501
+
+        return cached[2] + self.nodes_health.order(cached[1])
 
     def get_multi_balance(
             self,
@@ -501,6 +512,7 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
 
     def connect_to_multiple_nodes(self, nodes: Sequence[WeightedNode]) -> None:
         self.web3_mapping = {}
+        self.failed_to_connect_nodes = {}
 
         # Remove etherscan nodes and return if all nodes use etherscan,
         # so we don't query the highest block unnecessarily.
@@ -523,7 +535,8 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
         """Queries evm related data by performing a query of the provided method to all given nodes
 
         The first node in the call order that gets a successful response returns.
-        If none get a result then RemoteError is raised
+        If none get a result then RemoteError is raised. The latency and errors of
+        each node are recorded in its health stats.
         """
         for weighted_node in call_order:
             node_info = weighted_node.node_info
@@ -531,11 +544,12 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
             if (
                 web3node is None and
                 node_info.name != self.etherscan_node_name and
-                node_info.name not in self.failed_to_connect_nodes
+                time.monotonic() - self.failed_to_connect_nodes.get(node_info.name, float('-inf')) >= ERROR_RATE_HALF_LIFE  # noqa: E501
             ):
                 success, _ = self.attempt_connect(node=node_info)
                 if success is False:
-                    self.failed_to_connect_nodes.add(node_info.name)
+                    self.failed_to_connect_nodes[node_info.name] = time.monotonic()
+                    self.nodes_health.record_failure(node_info.name)
                     continue
 
                 if (web3node := self.web3_mapping.get(node_info, None)) is None:
@@ -549,10 +563,12 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
             ):
                 continue
 
+            start = time.monotonic()
             try:
                 web3 = web3node.web3_instance if web3node is not None else None
                 result = method(web3, **kwargs)
             except TransactionNotFound:
+                self.nodes_health.record_success(node_info.name, latency=time.monotonic() - start)
                 if kwargs.get('must_exist', False) is True:
                     continue  # try other nodes, as transaction has to exist
                 return None
@@ -570,9 +586,11 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
                     ValueError,  # not removing yet due to possibility of raising from missing trie error  # noqa: E501
             ) as e:
                 log.warning(f'Failed to query {node_info.name} for {method!s} due to {e!s}')
+                self.nodes_health.record_failure(node_info.name)
                 # Catch all possible errors here and just try next node call
                 continue
 
+            self.nodes_health.record_success(node_info.name, latency=time.monotonic() - start)
             return result
 
         # no node in the call order list was successfully queried
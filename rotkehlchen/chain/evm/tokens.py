@@ -11,6 +11,7 @@ from rotkehlchen.chain.ethereum.utils import (
 )
 from rotkehlchen.chain.evm.types import WeightedNode, asset_id_is_evm_token
 from rotkehlchen.chain.structures import EvmTokenDetectionData
+from rotkehlchen.constants.prices import ZERO_PRICE
 from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.handler import GlobalDBHandler
@@ -395,7 +396,17 @@ class EvmTokens(ABC):
             for address, balances in new_balances.items():
                 addresses_to_balances[address].update(balances)
 
-        token_usd_price: dict[EvmToken, Price] = {token: Inquirer.find_usd_price(asset=token) for token in all_tokens}  # noqa: E501
+        usd_prices = Inquirer.find_usd_prices(all_tokens)
+        token_usd_price: dict[EvmToken, Price] = {}
+        for token in all_tokens:
+            if (usd_price := usd_prices.get(token)) is None:
+                self.db.msg_aggregator.add_warning(
+                    f'Could not query the USD price of {self.evm_inquirer.chain_name} token '
+                    f'{token.identifier}. Its balances are valued at zero',
+                )
+                usd_price = ZERO_PRICE
+
+            token_usd_price[token] = usd_price
 
         return dict(addresses_to_balances), token_usd_price
 
@@ -1,4 +1,5 @@
 import logging
+import time
 from abc import ABC
 from collections import defaultdict
 from collections.abc import Iterator, Sequence
@@ -6,6 +7,7 @@ from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Optional
 
 from gevent.lock import Semaphore
+from gevent.pool import Pool
 
 from rotkehlchen.api.websockets.typedefs import TransactionStatusStep, WSMessageType
 from rotkehlchen.assets.asset import EvmToken
@@ -47,6 +49,11 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+# Max number of transaction receipts queried at the same time
+RECEIPTS_QUERY_CONCURRENCY = 8
+# Number of queried transaction receipts saved to the DB in a single write
+RECEIPTS_WRITE_CHUNK_SIZE = 100
+
 
 class EvmTransactions(ABC):  # noqa: B024
 
@@ -742,7 +749,9 @@ class EvmTransactions(ABC):  # noqa: B024
     ) -> None:
         """
         Searches the database for up to `limit` transactions that have no corresponding receipt
-        and for each one of them queries the receipt and saves it in the DB.
+        and for each one of them queries the receipt and saves it in the DB. Up to
+        RECEIPTS_QUERY_CONCURRENCY receipts are queried at the same time and they are
+        saved in chunks of RECEIPTS_WRITE_CHUNK_SIZE.
 
         It's protected by a lock to not enter the same code twice
         (i.e. from periodic tasks and from pnl report history events gathering)
@@ -769,19 +778,74 @@ class EvmTransactions(ABC):  # noqa: B024
             if len(hash_results) == 0:
                 return  # nothing to do
 
-            for entry in hash_results:
-                try:
-                    tx_receipt_data = self.evm_inquirer.get_transaction_receipt(tx_hash=entry)
-                except RemoteError as e:
-                    log.warning(f'Failed to query information for {self.evm_inquirer.chain_name} transaction {entry.hex()} due to {e!s}. Skipping...')  # noqa: E501
-                    continue
+            start, calls_before = time.monotonic(), self.evm_inquirer.nodes_health.calls()
+            pool, saved = Pool(size=RECEIPTS_QUERY_CONCURRENCY), 0
+            receipts: list[dict[str, Any]] = []
+            try:
+                for tx_receipt_data in pool.imap_unordered(self._maybe_query_receipt, hash_results):  # noqa: E501
+                    if tx_receipt_data is None:
+                        continue
+
+                    receipts.append(tx_receipt_data)
+                    if len(receipts) == RECEIPTS_WRITE_CHUNK_SIZE:
+                        chunk, receipts = receipts, []
+                        self._save_receipts(chunk)
+                        saved += len(chunk)
+            finally:
+                # Save what was already queried even if interrupted. Since only transactions
+                # without a receipt are queried, the next call resumes from where this stopped
+                pool.kill()
+                if len(receipts) != 0:
+                    self._save_receipts(receipts)
+                    saved += len(receipts)
+
+                self._log_receipts_throughput(
+                    saved=saved,
+                    duration=time.monotonic() - start,
+                    calls_before=calls_before,
+                )
 
-                with self.database.user_write() as write_cursor:
-                    self.dbevmtx.add_or_ignore_receipt_data(
-                        write_cursor=write_cursor,
-                        chain_id=self.evm_inquirer.chain_id,
-                        data=tx_receipt_data,
-                    )
+    def _maybe_query_receipt(self, tx_hash: EVMTxHash) -> dict[str, Any] | None:
+        """Queries the receipt of a transaction. Returns None if it could not be queried"""
+        try:
+            return self.evm_inquirer.get_transaction_receipt(tx_hash=tx_hash)
+        except RemoteError as e:
+            log.warning(f'Failed to query information for {self.evm_inquirer.chain_name} transaction {tx_hash.hex()} due to {e!s}. Skipping...')  # noqa: E501
+            return None
+
+    def _save_receipts(self, receipts: list[dict[str, Any]]) -> None:
+        """Saves the given receipts to the DB in a single write"""
+        with self.database.user_write() as write_cursor:
+            for tx_receipt_data in receipts:
+                self.dbevmtx.add_or_ignore_receipt_data(
+                    write_cursor=write_cursor,
+                    chain_id=self.evm_inquirer.chain_id,
+                    data=tx_receipt_data,
+                )
+
+    def _log_receipts_throughput(
+            self,
+            saved: int,
+            duration: float,
+            calls_before: dict[str, tuple[int, int]],
+    ) -> None:
+        """Logs how many receipts were saved and how many calls each node got meanwhile"""
+        nodes_stats = []
+        for name, (calls, errors) in self.evm_inquirer.nodes_health.calls().items():
+            calls_prev, errors_prev = calls_before.get(name, (0, 0))
+            if (node_calls := calls - calls_prev) == 0:
+                continue
+
+            node_errors = errors - errors_prev
+            nodes_stats.append(
+                f'{name}: {node_calls - node_errors} ok, {node_errors} failed, '
+                f'{node_calls / max(duration, 0.001):.2f} calls/s',
+            )
+
+        log.debug(
+            f'Saved {saved} {self.evm_inquirer.chain_name} transaction receipts in '
+            f'{duration:.2f} seconds. Node calls: {"; ".join(nodes_stats)}',
+        )
 
     def add_transaction_by_hash(
             self,
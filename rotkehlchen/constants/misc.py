@@ -26,6 +26,9 @@ KRAKEN_API_VERSION = '0'
 DEFAULT_MAX_LOG_SIZE_IN_MB = 300
 DEFAULT_MAX_LOG_BACKUP_FILES = 3
 DEFAULT_SQL_VM_INSTRUCTIONS_CB = 5000
+DEFAULT_DB_READ_POOL_SIZE = 0
+DEFAULT_CHAIN_BALANCES_CONCURRENCY = 4
+DEFAULT_HISTORICAL_PRICE_CACHE_SIZE = 20000
 
 GLOBALDIR_NAME: Final = 'global'
 GLOBALDB_NAME: Final = 'global.db'
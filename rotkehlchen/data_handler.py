@@ -31,12 +31,14 @@ class DataHandler:
             data_directory: Path,
             msg_aggregator: MessagesAggregator,
             sql_vm_instructions_cb: int,
+            read_pool_size: int = 0,
     ):
         self.logged_in = False
         self.data_directory = data_directory
         self.username = 'no_user'
         self.msg_aggregator = msg_aggregator
         self.sql_vm_instructions_cb = sql_vm_instructions_cb
+        self.read_pool_size = read_pool_size
 
     def logout(self) -> None:
         if self.logged_in:
@@ -116,6 +118,7 @@ class DataHandler:
             initial_settings=initial_settings,
             sql_vm_instructions_cb=self.sql_vm_instructions_cb,
             resume_from_backup=resume_from_backup,
+            read_pool_size=self.read_pool_size,
         )
         self.user_data_dir = user_data_dir
         self.logged_in = True
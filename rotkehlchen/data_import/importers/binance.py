@@ -83,7 +83,7 @@ class BinanceSingleEntry(BinanceEntry, abc.ABC):
     @abc.abstractmethod
     def process_entry(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             importer: BaseExchangeImporter,
             timestamp: Timestamp,
             data: BinanceCsvRow,
@@ -101,7 +101,7 @@ class BinanceMultipleEntry(BinanceEntry, abc.ABC):
     @abc.abstractmethod
     def process_entries(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             importer: BaseExchangeImporter,
             timestamp: Timestamp,
             data: list[BinanceCsvRow],
@@ -148,7 +148,7 @@ class BinanceTransferEntry(BinanceMultipleEntry):
 
     def process_entries(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             importer: BaseExchangeImporter,
             timestamp: Timestamp,
             data: list[BinanceCsvRow],
@@ -160,7 +160,7 @@ class BinanceTransferEntry(BinanceMultipleEntry):
         - DeserializationError: if the event is malformed when being stored in the db
         """
         history_events = self.process_transfers(timestamp=timestamp, data=data)
-        importer.add_history_events(write_cursor=write_cursor, history_events=history_events)
+        importer.add_history_events(cursor=cursor, history_events=history_events)
         return len(history_events)
 
 
@@ -353,14 +353,14 @@ class BinanceTradeEntry(BinanceMultipleEntry):
 
     def process_entries(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             importer: BaseExchangeImporter,
             timestamp: Timestamp,
             data: list[BinanceCsvRow],
     ) -> int:
         trades = self.process_trades(importer=importer, timestamp=timestamp, data=data)
         for trade in trades:
-            importer.add_trade(write_cursor=write_cursor, trade=trade)
+            importer.add_trade(cursor=cursor, trade=trade)
         return len(trades)
 
 
@@ -377,13 +377,13 @@ class BinanceDepositWithdrawEntry(BinanceSingleEntry):
 
     def process_entry(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             importer: BaseExchangeImporter,
             timestamp: Timestamp,
             data: BinanceCsvRow,
     ) -> None:
         asset = data['Coin']
-        importer.add_history_events(write_cursor, [AssetMovement(
+        importer.add_history_events(cursor, [AssetMovement(
             location=Location.BINANCE,
             event_type=HistoryEventType.WITHDRAWAL if data['Operation'] == 'Withdraw' else HistoryEventType.DEPOSIT,  # else clause also covers 'Buy Crypto' & 'Fiat Deposit'  # noqa: E501
             timestamp=ts_sec_to_ms(timestamp),
@@ -401,7 +401,7 @@ class BinanceDistributionEntry(BinanceSingleEntry):
 
     def process_entry(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             importer: BaseExchangeImporter,
             timestamp: Timestamp,
             data: BinanceCsvRow,
@@ -412,7 +412,7 @@ class BinanceDistributionEntry(BinanceSingleEntry):
         - KeyError
         - DeserializationError: if the event is malformed when being stored in the db
         """
-        importer.add_history_events(write_cursor, history_events=[
+        importer.add_history_events(cursor, history_events=[
             HistoryEvent(
                 event_identifier=f'{EVENT_IDENTIFIER_PREFIX}{hash_binance_csv_row(data)}',
                 sequence_index=0,
@@ -442,7 +442,7 @@ class BinanceStakingRewardsEntry(BinanceSingleEntry):
 
     def process_entry(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             importer: BaseExchangeImporter,
             timestamp: Timestamp,
             data: BinanceCsvRow,
@@ -458,7 +458,7 @@ class BinanceStakingRewardsEntry(BinanceSingleEntry):
             asset=data['Coin'],
             notes=f'Imported from binance CSV file. Binance operation: {data["Operation"]}',
         )
-        importer.add_history_events(write_cursor=write_cursor, history_events=[event])
+        importer.add_history_events(cursor=cursor, history_events=[event])
 
 
 class BinanceEarnProgram(BinanceSingleEntry):
@@ -477,7 +477,7 @@ class BinanceEarnProgram(BinanceSingleEntry):
 
     def process_entry(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             importer: BaseExchangeImporter,
             timestamp: Timestamp,
             data: BinanceCsvRow,
@@ -547,7 +547,7 @@ class BinanceEarnProgram(BinanceSingleEntry):
             )
         if staking_event is None:
             raise UnsupportedCSVEntry(f'Unknown staking event operation: {data["Operation"]}.')
-        importer.add_history_events(write_cursor=write_cursor, history_events=[staking_event])
+        importer.add_history_events(cursor=cursor, history_events=[staking_event])
 
 
 class BinanceUSDMProgram(BinanceSingleEntry):
@@ -596,7 +596,7 @@ class BinanceUSDMProgram(BinanceSingleEntry):
 
     def process_entry(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             importer: BaseExchangeImporter,
             timestamp: Timestamp,
             data: BinanceCsvRow,
@@ -608,7 +608,7 @@ class BinanceUSDMProgram(BinanceSingleEntry):
         - DeserializationError: if the event is malformed when being stored in the db
         """
         history_event = self._get_event(timestamp, data)
-        importer.add_history_events(write_cursor=write_cursor, history_events=[history_event])
+        importer.add_history_events(cursor=cursor, history_events=[history_event])
 
 
 class BinancePOSEntry(BinanceSingleEntry):
@@ -622,7 +622,7 @@ class BinancePOSEntry(BinanceSingleEntry):
 
     def process_entry(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             importer: BaseExchangeImporter,
             timestamp: Timestamp,
             data: BinanceCsvRow,
@@ -645,7 +645,7 @@ class BinancePOSEntry(BinanceSingleEntry):
             asset=data['Coin'],
             notes=f'Imported from binance CSV file. Binance operation: {data["Operation"]}',
         )
-        importer.add_history_events(write_cursor=write_cursor, history_events=[event])
+        importer.add_history_events(cursor=cursor, history_events=[event])
 
 
 SINGLE_BINANCE_ENTRIES: list[BinanceSingleEntry] = [
@@ -665,6 +665,7 @@ MULTIPLE_BINANCE_ENTRIES: list[BinanceMultipleEntry] = [
 
 class BinanceImporter(BaseExchangeImporter):
     """Binance CSV importer"""
+    resumable = False  # entries are grouped over the whole file
 
     def __init__(self, db: 'DBHandler') -> None:
         super().__init__(db=db, name='Binance')
@@ -711,7 +712,7 @@ class BinanceImporter(BaseExchangeImporter):
 
     def _process_single_binance_entries(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             timestamp: Timestamp,
             rows: list[BinanceCsvRow],
     ) -> tuple[int, dict[BinanceSingleEntry, int], list[BinanceCsvRow]]:
@@ -732,7 +733,7 @@ class BinanceImporter(BaseExchangeImporter):
                         change=row['Change'],
                     ):
                         single_entry_class.process_entry(
-                            write_cursor=write_cursor,
+                            cursor=cursor,
                             importer=self,
                             timestamp=timestamp,
                             data=row,
@@ -760,7 +761,7 @@ class BinanceImporter(BaseExchangeImporter):
 
     def _process_multiple_binance_entries(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             timestamp: Timestamp,
             rows: list[BinanceCsvRow],
     ) -> tuple[BinanceEntry | None, int]:
@@ -771,7 +772,7 @@ class BinanceImporter(BaseExchangeImporter):
         for multiple_entry_class in MULTIPLE_BINANCE_ENTRIES:
             if multiple_entry_class.are_entries(operations):
                 processed_count = multiple_entry_class.process_entries(
-                    write_cursor=write_cursor,
+                    cursor=cursor,
                     importer=self,
                     timestamp=timestamp,
                     data=rows,
@@ -789,7 +790,7 @@ class BinanceImporter(BaseExchangeImporter):
 
     def _process_binance_rows(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             multi: dict[Timestamp, list[BinanceCsvRow]],
     ) -> int:
         """Process binance entries grouped by timestamp
@@ -800,7 +801,7 @@ class BinanceImporter(BaseExchangeImporter):
         skipped_count: int = 0
         for timestamp, rows in multi.items():
             skipped_count_single, single_processed, rows_without_single = self._process_single_binance_entries(  # noqa: E501
-                write_cursor=write_cursor,
+                cursor=cursor,
                 timestamp=timestamp,
                 rows=rows,
             )
@@ -809,7 +810,7 @@ class BinanceImporter(BaseExchangeImporter):
                 stats[entry_type] += amount
 
             multiple_type, multiple_count = self._process_multiple_binance_entries(
-                write_cursor=write_cursor,
+                cursor=cursor,
                 timestamp=timestamp,
                 rows=rows_without_single,
             )
@@ -843,7 +844,7 @@ class BinanceImporter(BaseExchangeImporter):
 
         return skipped_count
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
         """
         Group and process binance CSV entries. May raise:
         - InputError
@@ -852,5 +853,5 @@ class BinanceImporter(BaseExchangeImporter):
             input_rows = list(csv.DictReader(csvfile))
             self.total_entries = len(input_rows)
             skipped_count, multirows = self._group_binance_rows(rows=input_rows, **kwargs)
-            skipped_count += self._process_binance_rows(write_cursor=write_cursor, multi=multirows)
+            skipped_count += self._process_binance_rows(cursor=cursor, multi=multirows)
             self.imported_entries = self.total_entries - skipped_count
@@ -29,7 +29,7 @@ class BisqTradesImporter(BaseExchangeImporter):
 
     def _consume_bisq_trade(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             csv_row: dict[str, Any],
             timestamp_format: str = '%d %b %Y %H:%M:%S',
     ) -> None:
@@ -92,9 +92,9 @@ class BisqTradesImporter(BaseExchangeImporter):
             link='',
             notes=f'ID: {csv_row["Trade ID"]}',
         )
-        self.add_trade(write_cursor, trade)
+        self.add_trade(cursor, trade)
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
         """
         Import trades from bisq. The information and comments about this importer were addressed
         at the issue https://github.com/rotki/rotki/issues/824
@@ -105,7 +105,7 @@ class BisqTradesImporter(BaseExchangeImporter):
             for index, row in enumerate(csv.DictReader(csvfile), start=1):
                 try:
                     self.total_entries += 1
-                    self._consume_bisq_trade(write_cursor, row, **kwargs)
+                    self._consume_bisq_trade(cursor, row, **kwargs)
                     self.imported_entries += 1
                 except UnknownAsset as e:
                     self.send_message(
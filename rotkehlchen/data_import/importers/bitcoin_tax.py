@@ -66,7 +66,7 @@ class BitcoinTaxImporter(BaseExchangeImporter):
 
     def _consume_trade_event(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             csv_row: dict[str, Any],
             event_identifier: str,
             timestamp: TimestampMS,
@@ -120,7 +120,7 @@ class BitcoinTaxImporter(BaseExchangeImporter):
             event_type=HistoryEventType.TRADE,
             event_subtype=HistoryEventSubType.RECEIVE,
         )
-        self.add_history_events(write_cursor, [spend_event, receive_event])
+        self.add_history_events(cursor, [spend_event, receive_event])
         if fee_asset_balance is not None:
             fee_event = HistoryEvent(
                 event_identifier=event_identifier,
@@ -133,11 +133,11 @@ class BitcoinTaxImporter(BaseExchangeImporter):
                 event_type=HistoryEventType.TRADE,
                 event_subtype=HistoryEventSubType.FEE,
             )
-            self.add_history_events(write_cursor, [fee_event])
+            self.add_history_events(cursor, [fee_event])
 
     def _consume_income_spending_event(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             csv_row: dict[str, Any],
             event_identifier: str,
             timestamp: TimestampMS,
@@ -170,7 +170,7 @@ class BitcoinTaxImporter(BaseExchangeImporter):
             event_type=event_type,
             event_subtype=event_subtype,
         )
-        self.add_history_events(write_cursor, [event])
+        self.add_history_events(cursor, [event])
         if fee_asset_balance is not None:
             fee_event = HistoryEvent(
                 event_identifier=event_identifier,
@@ -183,11 +183,11 @@ class BitcoinTaxImporter(BaseExchangeImporter):
                 event_type=HistoryEventType.SPEND,
                 event_subtype=HistoryEventSubType.FEE,
             )
-            self.add_history_events(write_cursor, [fee_event])
+            self.add_history_events(cursor, [fee_event])
 
     def _consume_event(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             csv_row: dict[str, Any],
             csv_type: CSVType,
             timestamp_format: str = '%Y-%m-%d %H:%M:%S %z',
@@ -241,7 +241,7 @@ class BitcoinTaxImporter(BaseExchangeImporter):
             quote_asset_amount = deserialize_asset_amount(csv_row['Cost/Proceeds'])
             quote_asset_balance = AssetBalance(quote_asset, Balance(quote_asset_amount, ZERO))
             self._consume_trade_event(
-                write_cursor=write_cursor,
+                cursor=cursor,
                 csv_row=csv_row,
                 event_identifier=event_identifier,
                 timestamp=timestamp,
@@ -255,7 +255,7 @@ class BitcoinTaxImporter(BaseExchangeImporter):
             return
         # else
         self._consume_income_spending_event(
-            write_cursor=write_cursor,
+            cursor=cursor,
             csv_row=csv_row,
             event_identifier=event_identifier,
             timestamp=timestamp,
@@ -266,7 +266,7 @@ class BitcoinTaxImporter(BaseExchangeImporter):
             memo=memo,
         )
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
         """
         May raise:
         - InputError if one of the rows is malformed
@@ -277,7 +277,7 @@ class BitcoinTaxImporter(BaseExchangeImporter):
             for index, row in enumerate(data, start=1):
                 try:
                     self.total_entries += 1
-                    self._consume_event(write_cursor, row, csv_type, **kwargs)
+                    self._consume_event(cursor, row, csv_type, **kwargs)
                     self.imported_entries += 1
                 except UnknownAsset as e:
                     self.send_message(
@@ -129,7 +129,7 @@ class BitMEXImporter(BaseExchangeImporter):
             ))
         return events
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
         """
         Import deposits, withdrawals and realised pnl events from BitMEX.
         May raise:
@@ -142,11 +142,11 @@ class BitMEXImporter(BaseExchangeImporter):
                     self.total_entries += 1
                     if row['transactType'] == 'RealisedPNL':
                         margin_position = self._consume_realised_pnl(row, **kwargs)
-                        self.add_margin_trade(write_cursor, margin_position)
+                        self.add_margin_trade(cursor, margin_position)
                     elif row['transactType'] in {'Deposit', 'Withdrawal'}:
                         if row['transactStatus'] == 'Completed':
                             self.add_history_events(
-                                write_cursor, self._consume_deposits_or_withdrawals(row, **kwargs),
+                                cursor, self._consume_deposits_or_withdrawals(row, **kwargs),
                             )
                     else:
                         raise UnsupportedCSVEntry(
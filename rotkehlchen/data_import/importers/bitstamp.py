@@ -34,7 +34,7 @@ class BitstampTransactionsImporter(BaseExchangeImporter):
 
     def _consume_bitstamp_transaction(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             csv_row: dict[str, Any],
             timestamp_format: str = '%b. %d, %Y, %I:%M %p',
     ) -> None:
@@ -113,7 +113,7 @@ class BitstampTransactionsImporter(BaseExchangeImporter):
                 event_type=HistoryEventType.TRADE,
                 event_subtype=HistoryEventSubType.FEE,
             )
-            self.add_history_events(write_cursor, [
+            self.add_history_events(cursor, [
                 spend_trade_event,
                 receive_trade_event,
                 fee_event,
@@ -142,9 +142,9 @@ class BitstampTransactionsImporter(BaseExchangeImporter):
                 event_type=event_type,
                 event_subtype=event_subtype,
             )
-            self.add_history_events(write_cursor, [movement_event])
+            self.add_history_events(cursor, [movement_event])
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
         """
         Import trades from bitstamp.
         """
@@ -152,7 +152,7 @@ class BitstampTransactionsImporter(BaseExchangeImporter):
             for index, row in enumerate(csv.DictReader(csvfile), start=1):
                 try:
                     self.total_entries += 1
-                    self._consume_bitstamp_transaction(write_cursor, row, **kwargs)
+                    self._consume_bitstamp_transaction(cursor, row, **kwargs)
                     self.imported_entries += 1
                 except UnknownAsset as e:
                     self.send_message(
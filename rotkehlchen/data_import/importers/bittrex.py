@@ -170,7 +170,7 @@ class BittrexImporter(BaseExchangeImporter):
             ),
         )]
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
         """
         Import deposits, withdrawals and trades from Bittrex. Find out which file
         we are parsing depending on its format.
@@ -229,7 +229,7 @@ class BittrexImporter(BaseExchangeImporter):
                 try:
                     self.total_entries += 1
                     event = consumer_fn(row, file_type, **kwargs)
-                    save_fn(write_cursor, event)  # type: ignore  # checked by if above
+                    save_fn(cursor, event)  # type: ignore  # checked by if above
                     self.imported_entries += 1
                 except DeserializationError as e:
                     self.send_message(
@@ -33,7 +33,7 @@ class BlockfiTradesImporter(BaseExchangeImporter):
 
     def _consume_blockfi_trade(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             csv_row: dict[str, Any],
             timestamp_format: str = '%Y-%m-%d %H:%M:%S',
     ) -> None:
@@ -69,9 +69,9 @@ class BlockfiTradesImporter(BaseExchangeImporter):
             link='',
             notes=csv_row['Type'],
         )
-        self.add_trade(write_cursor, trade)
+        self.add_trade(cursor, trade)
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
         """
         Information for the values that the columns can have has been obtained from
         the issue in github #1674
@@ -82,7 +82,7 @@ class BlockfiTradesImporter(BaseExchangeImporter):
             for index, row in enumerate(csv.DictReader(csvfile), start=1):
                 try:
                     self.total_entries += 1
-                    self._consume_blockfi_trade(write_cursor, row, **kwargs)
+                    self._consume_blockfi_trade(cursor, row, **kwargs)
                     self.imported_entries += 1
                 except UnknownAsset as e:
                     self.send_message(
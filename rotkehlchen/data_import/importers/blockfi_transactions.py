@@ -44,7 +44,7 @@ class BlockfiTransactionsImporter(BaseExchangeImporter):
 
     def _consume_blockfi_entry(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             csv_row: dict[str, Any],
             timestamp_format: str = '%Y-%m-%d %H:%M:%S',
     ) -> None:
@@ -71,7 +71,7 @@ class BlockfiTransactionsImporter(BaseExchangeImporter):
         entry_type = csv_row['Transaction Type']
 
         if entry_type in {'Deposit', 'Wire Deposit', 'ACH Deposit'}:
-            self.add_history_events(write_cursor, [AssetMovement(
+            self.add_history_events(cursor, [AssetMovement(
                 location=Location.BLOCKFI,
                 event_type=HistoryEventType.DEPOSIT,
                 timestamp=ts_sec_to_ms(timestamp),
@@ -79,7 +79,7 @@ class BlockfiTransactionsImporter(BaseExchangeImporter):
                 balance=Balance(abs_amount),
             )])
         elif entry_type in {'Withdrawal', 'Wire Withdrawal', 'ACH Withdrawal'}:
-            self.add_history_events(write_cursor, [AssetMovement(
+            self.add_history_events(cursor, [AssetMovement(
                 location=Location.BLOCKFI,
                 event_type=HistoryEventType.WITHDRAWAL,
                 timestamp=ts_sec_to_ms(timestamp),
@@ -87,7 +87,7 @@ class BlockfiTransactionsImporter(BaseExchangeImporter):
                 balance=Balance(abs_amount),
             )])
         elif entry_type == 'Withdrawal Fee':
-            self.add_history_events(write_cursor, [AssetMovement(
+            self.add_history_events(cursor, [AssetMovement(
                 location=Location.BLOCKFI,
                 event_type=HistoryEventType.WITHDRAWAL,
                 timestamp=ts_sec_to_ms(timestamp),
@@ -107,9 +107,9 @@ class BlockfiTransactionsImporter(BaseExchangeImporter):
                 asset=asset,
                 notes=f'{entry_type} from BlockFi',
             )
-            self.add_history_events(write_cursor, [event])
+            self.add_history_events(cursor, [event])
         elif entry_type == 'Crypto Transfer':
-            self.add_history_events(write_cursor, [AssetMovement(
+            self.add_history_events(cursor, [AssetMovement(
                 location=Location.BLOCKFI,
                 event_type=HistoryEventType.WITHDRAWAL if raw_amount < ZERO else HistoryEventType.DEPOSIT,  # noqa: E501
                 timestamp=ts_sec_to_ms(timestamp),
@@ -121,7 +121,7 @@ class BlockfiTransactionsImporter(BaseExchangeImporter):
         else:
             raise UnsupportedCSVEntry(f'Unsupported entry {entry_type}. Data: {csv_row}')
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
         """
         Information for the values that the columns can have has been obtained from
         https://github.com/BittyTax/BittyTax/blob/06794f51223398759852d6853bc7112ffb96129a/bittytax/conv/parsers/blockfi.py#L67
@@ -132,7 +132,7 @@ class BlockfiTransactionsImporter(BaseExchangeImporter):
             for index, row in enumerate(csv.DictReader(csvfile), start=1):
                 try:
                     self.total_entries += 1
-                    self._consume_blockfi_entry(write_cursor, row, **kwargs)
+                    self._consume_blockfi_entry(cursor, row, **kwargs)
                     self.imported_entries += 1
                 except UnknownAsset as e:
                     self.send_message(
@@ -57,7 +57,7 @@ class BlockpitImporter(BaseExchangeImporter):
 
     def _consume_blockpit_transaction(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             csv_row: dict[str, Any],
             fee_currency: AssetWithOracles,
             timestamp_format: str = '%d.%m.%Y %H:%M',
@@ -105,7 +105,7 @@ class BlockpitImporter(BaseExchangeImporter):
                 fee_currency=fee_currency,
                 notes=notes,
             )
-            self.add_trade(write_cursor, trade)
+            self.add_trade(cursor, trade)
 
         elif transaction_type in {'Deposit', 'Withdrawal', 'NonTaxableIn', 'NonTaxableOut'}:
             if transaction_type in {'Deposit', 'NonTaxableIn'}:
@@ -132,7 +132,7 @@ class BlockpitImporter(BaseExchangeImporter):
                     balance=Balance(fee_amount),
                     is_fee=True,
                 ))
-            self.add_history_events(write_cursor, events)
+            self.add_history_events(cursor, events)
 
         elif transaction_type in {
             'Airdrop',
@@ -191,16 +191,16 @@ class BlockpitImporter(BaseExchangeImporter):
                     balance=Balance(fee_amount),
                     notes=f'Fee of {fee_amount} {fee_currency.symbol} in {location!s}',
                 )
-                self.add_history_events(write_cursor, [fee_event, event])
+                self.add_history_events(cursor, [fee_event, event])
             else:
-                self.add_history_events(write_cursor, [event])
+                self.add_history_events(cursor, [event])
         else:
             raise UnsupportedCSVEntry(
                 f'Unknown entry type "{transaction_type}" encountered during blockpit '
                 f'data import. Ignoring entry',
             )
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
         """Import transactions from blockpit."""
         usd = A_USD.resolve_to_asset_with_oracles()
         with open(filepath, encoding='utf-8-sig') as csvfile:
@@ -208,7 +208,7 @@ class BlockpitImporter(BaseExchangeImporter):
             for index, row in enumerate(data, start=1):
                 try:
                     self.total_entries += 1
-                    self._consume_blockpit_transaction(write_cursor, row, usd, **kwargs)
+                    self._consume_blockpit_transaction(cursor, row, usd, **kwargs)
                     self.imported_entries += 1
                 except UnknownAsset as e:
                     self.send_message(
@@ -94,7 +94,7 @@ class CointrackingImporter(BaseExchangeImporter):
 
     def _consume_cointracking_entry(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             csv_row: dict[str, Any],
             timestamp_format: str = '%d.%m.%Y %H:%M:%S',
     ) -> None:
@@ -157,7 +157,7 @@ class CointrackingImporter(BaseExchangeImporter):
                 link='',
                 notes=notes,
             )
-            self.add_trade(write_cursor, trade)
+            self.add_trade(cursor, trade)
         elif row_type in {'Deposit', 'Withdrawal'}:
             if row_type == 'Deposit':
                 amount = deserialize_asset_amount(csv_row['Buy'])
@@ -185,7 +185,7 @@ class CointrackingImporter(BaseExchangeImporter):
                     balance=Balance(fee),
                     is_fee=True,
                 ))
-            self.add_history_events(write_cursor, events)
+            self.add_history_events(cursor, events)
         elif row_type == 'Staking':
             amount = deserialize_asset_amount(csv_row['Buy'])
             asset = asset_resolver(csv_row['Cur.Buy'])
@@ -202,7 +202,7 @@ class CointrackingImporter(BaseExchangeImporter):
                 location=location,
                 event_prefix=COINTRACKING_EVENT_PREFIX,
                 importer=self,
-                write_cursor=write_cursor,
+                cursor=cursor,
             ):
                 raise SkippedCSVEntry(f'Staking event for {asset} at {timestamp} already exists in the DB')  # noqa: E501
 
@@ -217,7 +217,7 @@ class CointrackingImporter(BaseExchangeImporter):
                 balance=Balance(amount),
                 notes=f'Stake reward of {amount} {asset.symbol} in {location!s}',
             )
-            self.add_history_events(write_cursor, [event])
+            self.add_history_events(cursor, [event])
         else:
             raise UnsupportedCSVEntry(
                 f'Unknown entry type "{row_type}" encountered during cointracking '
@@ -226,7 +226,7 @@ class CointrackingImporter(BaseExchangeImporter):
 
     def _import_csv(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             filepath: Path,
             **kwargs: Any,
     ) -> None:
@@ -240,7 +240,7 @@ class CointrackingImporter(BaseExchangeImporter):
                 row = dict(zip(header, row_values, strict=True))
                 try:
                     self.total_entries += 1
-                    self._consume_cointracking_entry(write_cursor, row, **kwargs)
+                    self._consume_cointracking_entry(cursor, row, **kwargs)
                     self.imported_entries += 1
                 except UnknownAsset as e:
                     self.send_message(
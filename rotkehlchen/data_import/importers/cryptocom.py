@@ -58,13 +58,14 @@ def hash_csv_row_without_index(csv_row: Any) -> str:
 
 class CryptocomImporter(BaseExchangeImporter):
     """Crypto.com CSV importer"""
+    resumable = False  # associated entries are imported in separate passes over the file
 
     def __init__(self, db: 'DBHandler') -> None:
         super().__init__(db=db, name='Crypto.com')
 
     def _consume_cryptocom_entry(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             csv_row: dict[str, Any],
             timestamp_format: str = '%Y-%m-%d %H:%M:%S',
     ) -> None:
@@ -145,7 +146,7 @@ class CryptocomImporter(BaseExchangeImporter):
                 link='',
                 notes=notes,
             )
-            self.add_trade(write_cursor, trade)
+            self.add_trade(cursor, trade)
 
         elif row_type in {
             'crypto_withdrawal',
@@ -161,7 +162,7 @@ class CryptocomImporter(BaseExchangeImporter):
                 amount = deserialize_asset_amount(csv_row['Amount'])
 
             asset = asset_from_cryptocom(csv_row['Currency'])
-            self.add_history_events(write_cursor, [AssetMovement(
+            self.add_history_events(cursor, [AssetMovement(
                 location=Location.CRYPTOCOM,
                 event_type=movement_type,
                 timestamp=ts_sec_to_ms(timestamp),
@@ -197,7 +198,7 @@ class CryptocomImporter(BaseExchangeImporter):
                 asset=asset,
                 notes=notes,
             )
-            self.add_history_events(write_cursor, [event])
+            self.add_history_events(cursor, [event])
         elif row_type in {'crypto_payment', 'reimbursement_reverted', 'card_cashback_reverted'}:
             asset = asset_from_cryptocom(csv_row['Currency'])
             amount = abs(deserialize_asset_amount(csv_row['Amount']))
@@ -212,11 +213,11 @@ class CryptocomImporter(BaseExchangeImporter):
                 asset=asset,
                 notes=notes,
             )
-            self.add_history_events(write_cursor, [event])
+            self.add_history_events(cursor, [event])
         elif row_type == 'invest_deposit':
             asset = asset_from_cryptocom(csv_row['Currency'])
             amount = abs(deserialize_asset_amount(csv_row['Amount']))
-            self.add_history_events(write_cursor, [AssetMovement(
+            self.add_history_events(cursor, [AssetMovement(
                 location=Location.CRYPTOCOM,
                 event_type=HistoryEventType.DEPOSIT,
                 timestamp=ts_sec_to_ms(timestamp),
@@ -226,7 +227,7 @@ class CryptocomImporter(BaseExchangeImporter):
         elif row_type == 'invest_withdrawal':
             asset = asset_from_cryptocom(csv_row['Currency'])
             amount = deserialize_asset_amount(csv_row['Amount'])
-            self.add_history_events(write_cursor, [AssetMovement(
+            self.add_history_events(cursor, [AssetMovement(
                 location=Location.CRYPTOCOM,
                 event_type=HistoryEventType.WITHDRAWAL,
                 timestamp=ts_sec_to_ms(timestamp),
@@ -253,7 +254,7 @@ class CryptocomImporter(BaseExchangeImporter):
                 asset=asset,
                 notes=notes,
             )
-            self.add_history_events(write_cursor, [event])
+            self.add_history_events(cursor, [event])
         elif row_type in {
             'crypto_earn_program_created',
             'crypto_earn_program_withdrawn',
@@ -293,7 +294,7 @@ class CryptocomImporter(BaseExchangeImporter):
 
     def _import_cryptocom_associated_entries(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             data: Any,
             tx_kind: str,
             timestamp_format: str = '%Y-%m-%d %H:%M:%S',
@@ -461,7 +462,7 @@ class CryptocomImporter(BaseExchangeImporter):
                         link='',
                         notes=notes,
                     )
-                    self.add_trade(write_cursor, trade)
+                    self.add_trade(cursor, trade)
 
                 # Add total number of rows associated with trade (1 credited_row and 1 or more debited_rows)  # noqa: E501
                 self.imported_entries += 1 + len(debited_rows)
@@ -526,9 +527,9 @@ class CryptocomImporter(BaseExchangeImporter):
                             asset=asset_object,
                             notes=f'Staking profit for {asset}',
                         )
-                        self.add_history_events(write_cursor, [event])
+                        self.add_history_events(cursor, [event])
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
         """May raise:
         - InputError if one of the rows is malformed
         """
@@ -538,7 +539,7 @@ class CryptocomImporter(BaseExchangeImporter):
                 #  Notice: Crypto.com csv export gathers all swapping entries (`lockup_swap_*`,
                 # `crypto_wallet_swap_*`, ...) into one entry named `dynamic_coin_swap_*`.
                 self._import_cryptocom_associated_entries(
-                    write_cursor=write_cursor,
+                    cursor=cursor,
                     data=data,
                     tx_kind='dynamic_coin_swap',
                     **kwargs,
@@ -549,7 +550,7 @@ class CryptocomImporter(BaseExchangeImporter):
                 next(data)
 
                 self._import_cryptocom_associated_entries(
-                    write_cursor=write_cursor,
+                    cursor=cursor,
                     data=data,
                     tx_kind='dust_conversion',
                     **kwargs,
@@ -557,11 +558,11 @@ class CryptocomImporter(BaseExchangeImporter):
                 csvfile.seek(0)
                 next(data)
 
-                self._import_cryptocom_associated_entries(write_cursor, data, 'interest_swap', **kwargs)  # noqa: E501
+                self._import_cryptocom_associated_entries(cursor, data, 'interest_swap', **kwargs)
                 csvfile.seek(0)
                 next(data)
 
-                self._import_cryptocom_associated_entries(write_cursor, data, 'invest', **kwargs)
+                self._import_cryptocom_associated_entries(cursor, data, 'invest', **kwargs)
                 csvfile.seek(0)
                 next(data)
             except KeyError as e:
@@ -572,7 +573,7 @@ class CryptocomImporter(BaseExchangeImporter):
             for index, row in enumerate(data, start=1):
                 try:
                     self.total_entries += 1
-                    self._consume_cryptocom_entry(write_cursor, row, **kwargs)
+                    self._consume_cryptocom_entry(cursor, row, **kwargs)
                     self.imported_entries += 1
                 except UnknownAsset as e:
                     self.send_message(
@@ -29,7 +29,7 @@ class KucoinImporter(BaseExchangeImporter):
 
     def _import_csv(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             filepath: Path,
             **kwargs: Any,
     ) -> None:
@@ -70,7 +70,7 @@ class KucoinImporter(BaseExchangeImporter):
                     base, quote = row[tokens_key].split(splitter)
                     fee_currency = get_key_if_has_val(row, fee_currency_key)
                     self.add_trade(
-                        write_cursor=write_cursor,
+                        cursor=cursor,
                         trade=Trade(
                             timestamp=deserialize_timestamp_from_date(
                                 date=row[date_key],
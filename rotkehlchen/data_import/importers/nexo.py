@@ -45,7 +45,7 @@ class NexoImporter(BaseExchangeImporter):
 
     def _consume_nexo(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             csv_row: dict[str, Any],
             timestamp_format: str = '%Y-%m-%d %H:%M:%S',
     ) -> None:
@@ -86,7 +86,7 @@ class NexoImporter(BaseExchangeImporter):
                 'will be ignored since not enough information is provided about the trade.',
             )
         if entry_type in {'Deposit', 'ExchangeDepositedOn'}:
-            self.add_history_events(write_cursor, [AssetMovement(
+            self.add_history_events(cursor, [AssetMovement(
                 timestamp=ts_sec_to_ms(timestamp),
                 location=Location.NEXO,
                 event_type=HistoryEventType.DEPOSIT,
@@ -95,7 +95,7 @@ class NexoImporter(BaseExchangeImporter):
                 unique_id=transaction,
             )])
         elif entry_type in {'Withdrawal', 'WithdrawExchanged'}:
-            self.add_history_events(write_cursor, [AssetMovement(
+            self.add_history_events(cursor, [AssetMovement(
                 timestamp=ts_sec_to_ms(timestamp),
                 location=Location.NEXO,
                 event_type=HistoryEventType.WITHDRAWAL,
@@ -104,7 +104,7 @@ class NexoImporter(BaseExchangeImporter):
                 unique_id=transaction,
             )])
         elif entry_type == 'Withdrawal Fee':
-            self.add_history_events(write_cursor, [AssetMovement(
+            self.add_history_events(cursor, [AssetMovement(
                 timestamp=ts_sec_to_ms(timestamp),
                 location=Location.NEXO,
                 event_type=HistoryEventType.WITHDRAWAL,
@@ -135,7 +135,7 @@ class NexoImporter(BaseExchangeImporter):
                 location_label=transaction,
                 notes=f'{entry_type} from Nexo',
             )
-            self.add_history_events(write_cursor, [event])
+            self.add_history_events(cursor, [event])
         elif entry_type == 'Liquidation':
             input_asset = asset_from_nexo(csv_row['Input Currency'])
             input_amount = deserialize_asset_amount_force_positive(csv_row['Input Amount'])
@@ -151,13 +151,13 @@ class NexoImporter(BaseExchangeImporter):
                 location_label=transaction,
                 notes=f'{entry_type} from Nexo',
             )
-            self.add_history_events(write_cursor, [event])
+            self.add_history_events(cursor, [event])
         elif entry_type in ignored_entries:
             pass
         else:
             raise UnsupportedCSVEntry(f'Unsupported entry {entry_type}. Data: {csv_row}')
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
         """
         Information for the values that the columns can have has been obtained from
         https://github.com/BittyTax/BittyTax/blob/06794f51223398759852d6853bc7112ffb96129a/bittytax/conv/parsers/nexo.py
@@ -168,7 +168,7 @@ class NexoImporter(BaseExchangeImporter):
             for index, row in enumerate(csv.DictReader(csvfile), start=1):
                 try:
                     self.total_entries += 1
-                    self._consume_nexo(write_cursor, row, **kwargs)
+                    self._consume_nexo(cursor, row, **kwargs)
                     self.imported_entries += 1
                 except UnknownAsset as e:
                     self.send_message(
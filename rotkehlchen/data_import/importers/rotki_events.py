@@ -41,7 +41,7 @@ class RotkiGenericEventsImporter(BaseExchangeImporter):
 
     def _consume_rotki_event(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             csv_row: dict[str, Any],
             sequence_index: int,
     ) -> None:
@@ -90,9 +90,9 @@ class RotkiGenericEventsImporter(BaseExchangeImporter):
                 notes=csv_row['Description'],
             )
             events.append(fee_event)
-        self.add_history_events(write_cursor, events)  # event assets are always resolved here
+        self.add_history_events(cursor, events)  # event assets are always resolved here
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
         """May raise:
         - InputError if one of the rows is malformed
         """
@@ -101,7 +101,7 @@ class RotkiGenericEventsImporter(BaseExchangeImporter):
                 try:
                     self.total_entries += 1
                     kwargs['sequence_index'] = index - 1
-                    self._consume_rotki_event(write_cursor, row, **kwargs)
+                    self._consume_rotki_event(cursor, row, **kwargs)
                     self.imported_entries += 1
                 except UnknownAsset as e:
                     self.send_message(
@@ -29,7 +29,7 @@ class RotkiGenericTradesImporter(BaseExchangeImporter):
 
     def _consume_rotki_trades(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             csv_row: dict[str, Any],
     ) -> None:
         """Consume rotki generic trades import CSV file.
@@ -60,9 +60,9 @@ class RotkiGenericTradesImporter(BaseExchangeImporter):
             amount=amount,
             notes=csv_row['Description'],
         )
-        self.add_trade(write_cursor, trade)
+        self.add_trade(cursor, trade)
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
         """May raise:
         - InputError if one of the rows is malformed
         """
@@ -70,7 +70,7 @@ class RotkiGenericTradesImporter(BaseExchangeImporter):
             for index, row in enumerate(csv.DictReader(csvfile), start=1):
                 try:
                     self.total_entries += 1
-                    self._consume_rotki_trades(write_cursor, row)
+                    self._consume_rotki_trades(cursor, row)
                     self.imported_entries += 1
                 except UnknownAsset as e:
                     self.send_message(
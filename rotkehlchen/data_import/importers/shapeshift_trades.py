@@ -33,7 +33,7 @@ class ShapeshiftTradesImporter(BaseExchangeImporter):
 
     def _consume_shapeshift_trade(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             csv_row: dict[str, Any],
             timestamp_format: str = 'iso8601',
     ) -> None:
@@ -95,9 +95,9 @@ Trade from ShapeShift with ShapeShift Deposit Address:
             link='',
             notes=notes,
         )
-        self.add_trade(write_cursor, trade)
+        self.add_trade(cursor, trade)
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
         """
         Information for the values that the columns can have has been obtained from sample CSVs
         May raise:
@@ -107,7 +107,7 @@ Trade from ShapeShift with ShapeShift Deposit Address:
             for index, row in enumerate(csv.DictReader(csvfile), start=1):
                 try:
                     self.total_entries += 1
-                    self._consume_shapeshift_trade(write_cursor, row, **kwargs)
+                    self._consume_shapeshift_trade(cursor, row, **kwargs)
                     self.imported_entries += 1
                 except UnknownAsset as e:
                     self.send_message(
@@ -38,7 +38,7 @@ class UpholdTransactionsImporter(BaseExchangeImporter):
 
     def _consume_uphold_transaction(
             self,
-            write_cursor: DBCursor,
+            cursor: DBCursor,
             csv_row: dict[str, Any],
             timestamp_format: str = '%a %b %d %Y %H:%M:%S %Z%z',
     ) -> None:
@@ -92,7 +92,7 @@ Activity from uphold with uphold transaction id:
                     asset=destination_asset,
                     notes=notes,
                 )
-                self.add_history_events(write_cursor, [event])
+                self.add_history_events(cursor, [event])
             else:  # Assets or amounts differ (Trades)
                 # in uphold UI the exchanged amount includes the fee.
                 if fee_asset == destination_asset:
@@ -111,7 +111,7 @@ Activity from uphold with uphold transaction id:
                         link='',
                         notes=notes,
                     )
-                    self.add_trade(write_cursor, trade)
+                    self.add_trade(cursor, trade)
                 else:
                     raise SkippedCSVEntry(f'Trade destination amount is {destination_amount}.')
         elif origin == 'uphold' and transaction_type == 'out':
@@ -133,7 +133,7 @@ Activity from uphold with uphold transaction id:
                         balance=Balance(fee),
                         is_fee=True,
                     ))
-                self.add_history_events(write_cursor, events)
+                self.add_history_events(cursor, events)
             elif origin_amount > 0:  # Trades (sell)
                 trade = Trade(
                     timestamp=timestamp,
@@ -148,7 +148,7 @@ Activity from uphold with uphold transaction id:
                     link='',
                     notes=notes,
                 )
-                self.add_trade(write_cursor, trade)
+                self.add_trade(cursor, trade)
             else:
                 raise SkippedCSVEntry(f'Trade origin amount is {origin_amount}.')
 
@@ -171,7 +171,7 @@ Activity from uphold with uphold transaction id:
                         balance=Balance(fee),
                         is_fee=True,
                     ))
-                self.add_history_events(write_cursor, events)
+                self.add_history_events(cursor, events)
             elif destination_amount > 0:  # Trades (buy)
                 trade = Trade(
                     timestamp=timestamp,
@@ -186,11 +186,11 @@ Activity from uphold with uphold transaction id:
                     link='',
                     notes=notes,
                 )
-                self.add_trade(write_cursor, trade)
+                self.add_trade(cursor, trade)
             else:
                 raise SkippedCSVEntry(f'Trade destination amount is {destination_amount}.')
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
         """
         Information for the values that the columns can have has been obtained from sample CSVs
         """
@@ -198,7 +198,7 @@ Activity from uphold with uphold transaction id:
             for index, row in enumerate(csv.DictReader(csvfile), start=1):
                 try:
                     self.total_entries += 1
-                    self._consume_uphold_transaction(write_cursor, row, **kwargs)
+                    self._consume_uphold_transaction(cursor, row, **kwargs)
                     self.imported_entries += 1
                 except UnknownAsset as e:
                     self.send_message(
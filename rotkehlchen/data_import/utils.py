@@ -6,12 +6,14 @@ from typing import TYPE_CHECKING, Any
 
 from rotkehlchen.api.websockets.typedefs import WSMessageType
 from rotkehlchen.assets.converters import LOCATION_TO_ASSET_MAPPING, asset_from_common_identifier
+from rotkehlchen.db.cache import DBCacheDynamic
 from rotkehlchen.db.history_events import DBHistoryEvents
-from rotkehlchen.errors.misc import InputError
+from rotkehlchen.errors.misc import InputError, SystemPermissionError
 from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import deserialize_asset_amount, deserialize_timestamp
 from rotkehlchen.types import AssetAmount, Fee, Location, TimestampMS
+from rotkehlchen.utils.hashing import file_md5
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -25,6 +27,8 @@ if TYPE_CHECKING:
 
 
 ITEMS_PER_DB_WRITE = 400
+# asset, amount, timestamp, location, type and subtype of an event as they are saved in the DB
+EventFingerprint = tuple[str, str, TimestampMS, str, str, str]
 MAX_ERROR_PERCENT = 0.2  # max percent of messages to total entries
 MIN_ENTRIES = 50  # mininmum number of entries before checking MAX_ERROR_PERCENT
 
@@ -33,12 +37,13 @@ log = RotkehlchenLogsAdapter(logger)
 
 
 class BaseExchangeImporter(ABC):
+    # Whether an interrupted import of the same file can continue from the last committed row.
+    # Only true for importers that buffer each row's entries while iterating over the file.
+    resumable: bool = True
+
     def __init__(self, db: 'DBHandler', name: str) -> None:
         self.db = db
         self.history_db = DBHistoryEvents(self.db)
-        self._trades: list[Trade] = []
-        self._margin_trades: list[MarginPosition] = []
-        self._history_events: list[HistoryBaseEntry] = []
         self.name = name
         self.reset()
 
@@ -48,14 +53,40 @@ class BaseExchangeImporter(ABC):
         self.imported_entries: int = 0
         self.import_msgs: list[dict] = []
         self.max_msgs: bool = False
+        # entries of an interrupted import that were not committed are discarded
+        self._trades: list[Trade] = []
+        self._margin_trades: list[MarginPosition] = []
+        self._history_events: list[HistoryBaseEntry] = []
+        # fingerprints of the saved and buffered events per event identifier prefix and location
+        self._event_fingerprints: dict[tuple[str, Location], set[EventFingerprint]] = {}
+        self._file_hash: str | None = None
+        self._checkpoint: int = 0  # number of rows whose entries are already saved in the DB
+        self._buffered_row: int = 0  # last row whose entries have been buffered
 
     def import_csv(self, filepath: 'Path', **kwargs: Any) -> tuple[bool, str]:
+        """Import the given csv file committing the entries in chunks of ITEMS_PER_DB_WRITE
+        so that the DB is not locked for the whole import. The number of rows committed is
+        saved with each chunk so if the import of the same file is interrupted it continues
+        after the last committed row the next time."""
         self.reset()
 
         try:
-            with self.db.user_write() as write_cursor:
-                self._import_csv(write_cursor, filepath=filepath, **kwargs)
-                self.flush_all(write_cursor)
+            if self.resumable:
+                self._file_hash = file_md5(filepath)
+
+            with self.db.conn.read_ctx() as cursor:
+                if self._file_hash is not None and (checkpoint := self.db.get_dynamic_cache(
+                    cursor=cursor,
+                    name=DBCacheDynamic.CSV_IMPORT_CHECKPOINT,
+                    source=self.name,
+                    file_hash=self._file_hash,
+                )) is not None:
+                    log.debug(f'Resuming {self.name} CSV import after row {checkpoint}')
+                    self._checkpoint = checkpoint
+
+                self._import_csv(cursor, filepath=filepath, **kwargs)
+
+            self.flush_all(completed_rows=None)
 
             # Group by msg. Assume warning will be the same for all identical msgs.
             grouped_msgs = {}
@@ -81,39 +112,123 @@ class BaseExchangeImporter(ABC):
 
         except InputError as e:
             return False, str(e)
+        except SystemPermissionError as e:
+            return False, f'Could not read {filepath.name}: {e!s}'
         else:
             return True, ''
 
     @abstractmethod
-    def _import_csv(self, write_cursor: 'DBCursor', filepath: 'Path', **kwargs: Any) -> None:
+    def _import_csv(self, cursor: 'DBCursor', filepath: 'Path', **kwargs: Any) -> None:
         """The method that processes csv. Should be implemented by subclasses.
+        The cursor is only for reading. Entries should be given to the add_* methods
+        which buffer them and commit them in chunks in their own write transactions.
         May raise:
         - InputError if one of the rows is malformed
         """
 
-    def add_trade(self, write_cursor: 'DBCursor', trade: 'Trade') -> None:
-        self._trades.append(trade)
-        self.maybe_flush_all(write_cursor)
+    def _should_buffer(self) -> bool:
+        """Flush the buffered entries if needed and return whether the entries of the
+        current row should be buffered. They are not if they were committed by a previous
+        interrupted import of the same file."""
+        if self.resumable and 0 < self.total_entries <= self._checkpoint:
+            return False
+
+        self.maybe_flush_all()
+        self._buffered_row = self.total_entries
+        return True
+
+    def add_trade(self, cursor: 'DBCursor', trade: 'Trade') -> None:
+        if self._should_buffer():
+            self._trades.append(trade)
+
+    def add_margin_trade(self, cursor: 'DBCursor', margin_trade: 'MarginPosition') -> None:
+        if self._should_buffer():
+            self._margin_trades.append(margin_trade)
 
-    def add_margin_trade(self, write_cursor: 'DBCursor', margin_trade: 'MarginPosition') -> None:
-        self._margin_trades.append(margin_trade)
-        self.maybe_flush_all(write_cursor)
+    def add_history_events(self, cursor: 'DBCursor', history_events: Sequence['HistoryBaseEntry']) -> None:  # noqa: E501
+        if not self._should_buffer():
+            return
 
-    def add_history_events(self, write_cursor: 'DBCursor', history_events: Sequence['HistoryBaseEntry']) -> None:  # noqa: E501
         self._history_events.extend(history_events)
-        self.maybe_flush_all(write_cursor)
+        for (event_prefix, location), fingerprints in self._event_fingerprints.items():
+            fingerprints.update(
+                event_fingerprint(event) for event in history_events
+                if event.location == location and event.event_identifier.startswith(event_prefix)
+            )
+
+    def event_fingerprints(
+            self,
+            cursor: 'DBCursor',
+            event_prefix: str,
+            location: Location,
+    ) -> set['EventFingerprint']:
+        """Fingerprints of the events of the location whose identifier starts with the prefix.
+        They are read from the DB once per import, including the buffered events, and then
+        kept up to date as events are buffered so that duplicates can be detected without
+        flushing and querying the DB for every row."""
+        if (fingerprints := self._event_fingerprints.get((event_prefix, location))) is not None:
+            return fingerprints
+
+        fingerprints = set(cursor.execute(
+            'SELECT asset, amount, timestamp, location, type, subtype FROM history_events '
+            'WHERE location=? AND event_identifier LIKE ?',
+            (location.serialize_for_db(), f'{event_prefix}%'),
+        ))
+        fingerprints.update(
+            event_fingerprint(event) for event in self._history_events
+            if event.location == location and event.event_identifier.startswith(event_prefix)
+        )
+        self._event_fingerprints[event_prefix, location] = fingerprints
+        return fingerprints
 
-    def maybe_flush_all(self, cursor: 'DBCursor') -> None:
-        if len(self._trades) + len(self._margin_trades) + len(self._history_events) >= ITEMS_PER_DB_WRITE:  # noqa: E501
-            self.flush_all(cursor)
+    def maybe_flush_all(self) -> None:
+        """Flush the buffer if it is full. For resumable importers this only happens once all
+        the entries of a row are buffered, so that each commit contains only whole rows."""
+        if (
+            len(self._trades) + len(self._margin_trades) + len(self._history_events) >= ITEMS_PER_DB_WRITE and  # noqa: E501
+            (self.resumable is False or self.total_entries != self._buffered_row)
+        ):
+            self.flush_all(completed_rows=self.total_entries - 1)
+
+    def flush_all(self, completed_rows: int | None) -> None:
+        """Commit the buffered entries in their own transaction along with the number of
+        rows of the file that have been processed and notify the frontend of the progress.
+        If completed_rows is None the whole file has been processed and the checkpoint of
+        the import is removed instead."""
+        with self.db.user_write() as write_cursor:
+            self.db.add_trades(write_cursor, trades=self._trades)
+            self.db.add_margin_positions(write_cursor, margin_positions=self._margin_trades)
+            self.history_db.add_history_events(write_cursor, history=self._history_events)
+            if self.resumable and self._file_hash is not None:
+                if completed_rows is None:
+                    write_cursor.execute(
+                        'DELETE FROM key_value_cache WHERE name=?',
+                        (DBCacheDynamic.CSV_IMPORT_CHECKPOINT.get_db_key(
+                            source=self.name,
+                            file_hash=self._file_hash,
+                        ),),
+                    )
+                else:
+                    self.db.set_dynamic_cache(
+                        write_cursor=write_cursor,
+                        name=DBCacheDynamic.CSV_IMPORT_CHECKPOINT,
+                        value=max(completed_rows, self._checkpoint),
+                        source=self.name,
+                        file_hash=self._file_hash,
+                    )
 
-    def flush_all(self, write_cursor: 'DBCursor') -> None:
-        self.db.add_trades(write_cursor, trades=self._trades)
-        self.db.add_margin_positions(write_cursor, margin_positions=self._margin_trades)
-        self.history_db.add_history_events(write_cursor, history=self._history_events)
         self._trades = []
         self._margin_trades = []
         self._history_events = []
+        if completed_rows is None:
+            return
+
+        self.db.msg_aggregator.add_message(WSMessageType.CSV_IMPORT_RESULT, {
+            'source_name': self.name,
+            'total_entries': self.total_entries,
+            'imported_entries': self.imported_entries,
+            'in_progress': True,
+        })
 
     def append_msg(self, row_index: int, msg: str, is_error: bool) -> None:
         """Append message to queue to be sent to frontend.
@@ -189,6 +304,17 @@ def hash_csv_row(csv_row: Mapping[str, Any]) -> str:
     return hashlib.sha256(row_str).hexdigest()
 
 
+def event_fingerprint(event: 'HistoryBaseEntry') -> EventFingerprint:
+    return (
+        event.asset.identifier,
+        str(event.balance.amount),
+        event.timestamp,
+        event.location.serialize_for_db(),
+        event.event_type.serialize(),
+        event.event_subtype.serialize(),
+    )
+
+
 def detect_duplicate_event(
         event_type: HistoryEventType,
         event_subtype: HistoryEventSubType,
@@ -198,22 +324,23 @@ def detect_duplicate_event(
         location: Location,
         event_prefix: str,
         importer: BaseExchangeImporter,
-        write_cursor: 'DBCursor',
+        cursor: 'DBCursor',
 ) -> bool:
-    """Detect if an event with these attributes is already in the database.
-    Returns True if the event is found, and False if not found.
+    """Detect if an event with these attributes is already in the database or has already
+    been buffered by the importer. Returns True if the event is found, and False if not found.
     """
-    importer.flush_all(write_cursor)  # flush so that the DB check later can work and not miss unwritten events  # noqa: E501
-    with importer.db.conn.read_ctx() as read_cursor:
-        read_cursor.execute(
-            f"SELECT COUNT(*) FROM history_events WHERE "
-            f"event_identifier LIKE '{event_prefix}%' "
-            "AND asset=? AND amount=? AND timestamp=? AND location=? "
-            "AND type=? AND subtype=?",
-            (asset.identifier, str(amount), timestamp_ms, location.serialize_for_db(),
-             event_type.serialize(), event_subtype.serialize()),
-        )
-        return read_cursor.fetchone()[0] != 0
+    return (
+        asset.identifier,
+        str(amount),
+        timestamp_ms,
+        location.serialize_for_db(),
+        event_type.serialize(),
+        event_subtype.serialize(),
+    ) in importer.event_fingerprints(
+        cursor=cursor,
+        event_prefix=event_prefix,
+        location=location,
+    )
 
 
 def maybe_set_transaction_extra_data(
@@ -50,6 +50,12 @@ class ExtraTxArgType(TypedDict):
     receiver: ChecksumEvmAddress
 
 
+class CSVImportArgType(TypedDict):
+    """Type of kwargs, used to get the value of `DBCacheDynamic.CSV_IMPORT_CHECKPOINT`"""
+    source: str
+    file_hash: str
+
+
 def _deserialize_int_from_str(value: str) -> int | None:
     return int(value)
 
@@ -68,6 +74,7 @@ class DBCacheDynamic(Enum):
     WITHDRAWALS_TS: Final = 'ethwithdrawalsts_{address}', _deserialize_timestamp_from_str
     WITHDRAWALS_IDX: Final = 'ethwithdrawalsidx_{address}', _deserialize_int_from_str
     EXTRA_INTERNAL_TX: Final = f'{EXTRAINTERNALTXPREFIX}_{{tx_hash}}_{{receiver}}', string_to_evm_address  # noqa: E501
+    CSV_IMPORT_CHECKPOINT: Final = 'csv_import_checkpoint_{source}_{file_hash}', _deserialize_int_from_str  # noqa: E501
 
     @overload
     def get_db_key(self, **kwargs: Unpack[LabeledLocationArgsType]) -> str:
@@ -85,6 +92,10 @@ class DBCacheDynamic(Enum):
     def get_db_key(self, **kwargs: Unpack[ExtraTxArgType]) -> str:
         ...
 
+    @overload
+    def get_db_key(self, **kwargs: Unpack[CSVImportArgType]) -> str:
+        ...
+
     def get_db_key(self, **kwargs: str) -> str:
         """Get the key that is used in the DB schema for the given kwargs.
 
@@ -1,5 +1,6 @@
 import logging
 import re
+from collections.abc import Collection
 from typing import TYPE_CHECKING, Any
 
 from rotkehlchen.errors.misc import DBSchemaError
@@ -40,8 +41,12 @@ def sanity_check_impl(
         cursor: 'DBCursor',
         db_name: str,
         minimized_schema: dict[str, str],
+        triggers: Collection[str] = (),
 ) -> None:
-    """The implementation of the DB sanity check. Out of DBConnection to keep things cleaner"""
+    """The implementation of the DB sanity check. Out of DBConnection to keep things cleaner
+
+    `triggers` are the names of the triggers that the DB is expected to have.
+    """
     cursor.execute("SELECT name, sql FROM sqlite_master WHERE type='table'")
     tables_data_from_db: dict[str, tuple[str, str]] = {}
     for (name, raw_script) in cursor:
@@ -54,9 +59,16 @@ def sanity_check_impl(
         tables_data_from_db[name] = (table_properties, raw_script)
 
     # Check that there are no extra structures such as views
-    extra_db_structures = cursor.execute(
+    extra_db_structures: list[tuple[str, str, str]] = []
+    db_triggers: set[str] = set()
+    for structure_type, name, sql in cursor.execute(
         "SELECT type, name, sql FROM sqlite_master WHERE type NOT IN ('table', 'index')",
-    ).fetchall()
+    ):
+        if structure_type == 'trigger' and name in triggers:
+            db_triggers.add(name)
+        else:
+            extra_db_structures.append((structure_type, name, sql))
+
     if len(extra_db_structures) > 0:
         logger.critical(
             f'Unexpected structures in {db_name} database: {extra_db_structures}',
@@ -66,6 +78,12 @@ def sanity_check_impl(
             f'Check the logs for more details. ' + DEFAULT_SANITY_CHECK_MESSAGE,
         )
 
+    if len(missing_triggers := set(triggers) - db_triggers) > 0:
+        raise DBSchemaError(
+            f'Triggers {missing_triggers} are missing from your {db_name} '
+            f'database. ' + DEFAULT_SANITY_CHECK_MESSAGE,
+        )
+
     # Check what tables are missing from the db
     missing_tables = minimized_schema.keys() - tables_data_from_db.keys()
     if len(missing_tables) > 0:
@@ -42,6 +42,7 @@ from rotkehlchen.constants.misc import NFT_DIRECTIVE, USERDB_NAME
 from rotkehlchen.constants.timing import HOUR_IN_SECONDS
 from rotkehlchen.db.cache import (
     AddressArgType,
+    CSVImportArgType,
     DBCacheDynamic,
     DBCacheStatic,
     ExtraTxArgType,
@@ -62,6 +63,7 @@ from rotkehlchen.db.filtering import (
     TradesFilterQuery,
     UserNotesFilterQuery,
 )
+from rotkehlchen.db.index_advisor import INDEX_ADVISOR
 from rotkehlchen.db.loopring import DBLoopring
 from rotkehlchen.db.misc import detect_sqlcipher_version
 from rotkehlchen.db.schema import DB_SCRIPT_CREATE_TABLES
@@ -81,6 +83,7 @@ from rotkehlchen.db.settings import (
 from rotkehlchen.db.upgrade_manager import DBUpgradeManager
 from rotkehlchen.db.utils import (
     DBAssetBalance,
+    DBCountCache,
     DBTupleType,
     LocationData,
     SingleDBAssetBalance,
@@ -185,9 +188,13 @@ class DBHandler:
             initial_settings: ModifiableDBSettings | None,
             sql_vm_instructions_cb: int,
             resume_from_backup: bool,
+            read_pool_size: int = 0,
     ):
         """Database constructor
 
+        read_pool_size is the number of read only connections to use for the user and
+        transient DBs in addition to the writer connection. Zero disables the pools.
+
         May raise:
         - DBUpgradeError if the rotki DB version is newer than the software or
         there is a DB upgrade and there is an error or if the version is older
@@ -199,6 +206,7 @@ class DBHandler:
         self.msg_aggregator = msg_aggregator
         self.user_data_dir = user_data_dir
         self.sql_vm_instructions_cb = sql_vm_instructions_cb
+        self.read_pool_size = read_pool_size
         self.sqlcipher_version = detect_sqlcipher_version()
         self.setting_to_default_type = {
             'version': (int, ROTKEHLCHEN_DB_VERSION),
@@ -215,6 +223,12 @@ class DBHandler:
         self.conn_transient: DBConnection = None  # type: ignore
         # Lock to make sure that 2 callers of get_or_create_evm_token do not go in at the same time
         self.get_or_create_evm_token_lock = Semaphore()
+        self.count_cache = DBCountCache()
+        # In memory registry of the rpc nodes per blockchain as (all nodes, active nodes). The
+        # version of a blockchain changes whenever its nodes are edited so that callers can
+        # reuse anything they compute from the nodes until then.
+        self._rpc_nodes: dict[SupportedBlockchain, tuple[tuple[WeightedNode, ...], tuple[WeightedNode, ...]]] = {}  # noqa: E501
+        self._rpc_nodes_version: defaultdict[SupportedBlockchain, int] = defaultdict(int)
         self.password = password
         self._connect()
         self._check_unfinished_upgrades(resume_from_backup=resume_from_backup)
@@ -224,6 +238,7 @@ class DBHandler:
                 self.set_settings(cursor, initial_settings)
             self.update_owned_assets_in_globaldb(cursor)
             self.sync_globaldb_assets(cursor)
+        self._enable_read_pools()
 
     def _check_unfinished_upgrades(self, resume_from_backup: bool) -> None:
         """
@@ -279,6 +294,8 @@ class DBHandler:
 
     def logout(self) -> None:
         self.password = ''
+        if __debug__:
+            INDEX_ADVISOR.log_slowest()
         if self.conn is not None:
             self.disconnect(conn_attribute='conn')
         if self.conn_transient is not None:
@@ -484,12 +501,8 @@ class DBHandler:
                 f'Could not open database file: {fullpath}. Permission errors?',
             ) from e
 
-        password_for_sqlcipher = protect_password_sqlcipher(self.password)
-        script = f"PRAGMA key='{password_for_sqlcipher}';"
-        if self.sqlcipher_version == 3:
-            script += f'PRAGMA kdf_iter={KDF_ITER};'
         try:
-            conn.executescript(script)
+            conn.executescript(self._sqlcipher_key_script(self.password))
             conn.execute('PRAGMA foreign_keys=ON')
             # Optimizations for the combined trades view
             # the following will fail with DatabaseError in case of wrong password.
@@ -506,6 +519,22 @@ class DBHandler:
 
         setattr(self, conn_attribute, conn)
 
+    def _sqlcipher_key_script(self, password: str, pragma: Literal['key', 'rekey'] = 'key') -> str:
+        script = f"PRAGMA {pragma}='{protect_password_sqlcipher(password)}';"
+        if self.sqlcipher_version == 3:
+            script += f'PRAGMA kdf_iter={KDF_ITER};'
+        return script
+
+    def _enable_read_pools(self) -> None:
+        """Sets up the pools of read only connections of the user and transient DBs.
+        Needs to be called again when the password changes so that new connections
+        of the pools use the new key."""
+        for conn in (self.conn, self.conn_transient):
+            conn.enable_read_pool(
+                size=self.read_pool_size,
+                setup_script=self._sqlcipher_key_script(self.password),
+            )
+
     def _change_password(
             self,
             new_password: str,
@@ -518,12 +547,8 @@ class DBHandler:
                 f'database but no such DB connection exists',
             )
             return False
-        new_password_for_sqlcipher = protect_password_sqlcipher(new_password)
-        script = f"PRAGMA rekey='{new_password_for_sqlcipher}';"
-        if self.sqlcipher_version == 3:
-            script += f'PRAGMA kdf_iter={KDF_ITER};'
         try:
-            conn.executescript(script)
+            conn.executescript(self._sqlcipher_key_script(new_password, pragma='rekey'))
         except sqlcipher.OperationalError as e:  # pylint: disable=no-member
             log.error(
                 f'At change password could not re-key the open {conn_attribute} '
@@ -540,6 +565,7 @@ class DBHandler:
         )
         if result is True:
             self.password = new_password
+            self._enable_read_pools()
         return result
 
     def disconnect(self, conn_attribute: Literal['conn', 'conn_transient'] = 'conn') -> None:
@@ -612,6 +638,8 @@ class DBHandler:
                 f'Permission error when reopening the DB. {e!s}. Should never happen here',
             ) from e
         self._run_actions_after_first_connection()
+        self.invalidate_rpc_nodes()  # the imported DB may have other nodes
+        self._enable_read_pools()
         # all went okay, remove the original temp backup
         (self.user_data_dir / 'rotkehlchen_temp_backup.db').unlink()
 
@@ -752,6 +780,15 @@ class DBHandler:
     ) -> ChecksumEvmAddress | None:
         ...
 
+    @overload
+    def get_dynamic_cache(
+            self,
+            cursor: 'DBCursor',
+            name: Literal[DBCacheDynamic.CSV_IMPORT_CHECKPOINT],
+            **kwargs: Unpack[CSVImportArgType],
+    ) -> int | None:
+        ...
+
     def get_dynamic_cache(
             self,
             cursor: 'DBCursor',
@@ -835,6 +872,16 @@ class DBHandler:
     ) -> None:
         ...
 
+    @overload
+    def set_dynamic_cache(
+            self,
+            write_cursor: 'DBCursor',
+            name: Literal[DBCacheDynamic.CSV_IMPORT_CHECKPOINT],
+            value: int,
+            **kwargs: Unpack[CSVImportArgType],
+    ) -> None:
+        ...
+
     def set_dynamic_cache(
             self,
             write_cursor: 'DBCursor',
@@ -1583,12 +1630,19 @@ class DBHandler:
                 f'manually tracked balance ids that do not exist',
             )
 
-    def save_balances_data(self, write_cursor: 'DBCursor', data: dict[str, Any], timestamp: Timestamp) -> None:  # noqa: E501
+    def save_balances_data(
+            self,
+            write_cursor: 'DBCursor',
+            data: dict[str, Any],
+            timestamp: Timestamp,
+            query_durations: dict[str, float] | None = None,
+    ) -> None:
         """The keys of the data dictionary can be any kind of asset plus 'location'
         and 'net_usd'. This gives us the balance data per assets, the balance data
         per location and finally the total balance
 
-        The balances are saved in the DB at the given timestamp
+        The balances are saved in the DB at the given timestamp along with the
+        seconds each source of the balances took to be queried, if given.
         """
         balances = []
         locations = []
@@ -1632,6 +1686,14 @@ class DBHandler:
             self.add_multiple_location_data(write_cursor, locations)
         except InputError as err:
             self.msg_aggregator.add_warning(str(err))
+            return
+
+        if query_durations is not None:
+            write_cursor.executemany(
+                'INSERT OR REPLACE INTO balances_query_durations(timestamp, source, seconds) '
+                'VALUES(?, ?, ?)',
+                [(timestamp, source, seconds) for source, seconds in query_durations.items()],
+            )
 
     def add_exchange(
             self,
@@ -2058,12 +2120,11 @@ class DBHandler:
             cursorstr += f' GROUP BY {group_by}'
 
         cursorstr += ';'
-        cursor.execute(cursorstr)
+        if group_by is None:
+            return self.count_cache.count(cursor, cursorstr)
 
-        if group_by is not None:
-            return len(cursor.fetchall())
-        # else
-        return cursor.fetchone()[0]
+        cursor.execute(cursorstr)
+        return len(cursor.fetchall())
 
     def delete_data_for_evm_address(
             self,
@@ -2226,8 +2287,7 @@ class DBHandler:
         trades = self.get_trades(cursor, filter_query=filter_query, has_premium=has_premium)
         query, bindings = filter_query.prepare(with_pagination=False)
         query = 'SELECT COUNT(*) from trades ' + query
-        total_found_result = cursor.execute(query, bindings)
-        return trades, total_found_result.fetchone()[0]
+        return trades, self.count_cache.count(cursor, query, bindings)
 
     def get_trades(self, cursor: 'DBCursor', filter_query: TradesFilterQuery, has_premium: bool) -> list[Trade]:  # noqa: E501
         """Returns a list of trades optionally filtered by various filters.
@@ -3131,6 +3191,51 @@ class DBHandler:
 
         return tuple(returned_indices)  # type: ignore
 
+    def get_xpub_derived_addresses(
+            self,
+            cursor: 'DBCursor',
+            xpub_data: XpubData,
+            start_receiving_index: int,
+            start_change_index: int,
+    ) -> dict[tuple[int, int], BTCAddress]:
+        """Get the cached derived addresses of the xpub from the given receiving and change
+        indices onwards, keyed by account index and derived index"""
+        cursor.execute(
+            'SELECT account_index, derived_index, address FROM xpub_derived_addresses WHERE '
+            'xpub=? AND derivation_path=? AND blockchain=? AND '
+            '((account_index=0 AND derived_index>=?) OR (account_index=1 AND derived_index>=?))',
+            (
+                xpub_data.xpub.xpub,
+                xpub_data.serialize_derivation_path_for_db(),
+                xpub_data.blockchain.value,
+                start_receiving_index,
+                start_change_index,
+            ),
+        )
+        return {(entry[0], entry[1]): BTCAddress(entry[2]) for entry in cursor}
+
+    def add_xpub_derived_addresses(
+            self,
+            write_cursor: 'DBCursor',
+            xpub_data: XpubData,
+            derived_addresses: dict[tuple[int, int], BTCAddress],
+    ) -> None:
+        """Cache the given derived addresses of the xpub, keyed by account index and
+        derived index, so that they don't need to be derived again"""
+        write_cursor.executemany(
+            'INSERT OR IGNORE INTO xpub_derived_addresses'
+            '(xpub, derivation_path, blockchain, account_index, derived_index, address) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            [(
+                xpub_data.xpub.xpub,
+                xpub_data.serialize_derivation_path_for_db(),
+                xpub_data.blockchain.value,
+                account_index,
+                derived_index,
+                address,
+            ) for (account_index, derived_index), address in derived_addresses.items()],
+        )
+
     def get_addresses_to_xpub_mapping(
             self,
             cursor: 'DBCursor',
@@ -3305,28 +3410,51 @@ class DBHandler:
         """
         Get all the nodes in the database. If only_active is set to true only the nodes that
         have the column active set to True will be returned.
-        """
-        with self.conn.read_ctx() as cursor:
-            if only_active:
-                cursor.execute('SELECT identifier, name, endpoint, owned, weight, active, blockchain FROM rpc_nodes WHERE blockchain=? AND active=1 AND (CAST(weight as decimal) != 0 OR owned == 1) ORDER BY name;', (blockchain.value,))  # noqa: E501
-            else:
-                cursor.execute(
-                    'SELECT identifier, name, endpoint, owned, weight, active, blockchain FROM rpc_nodes WHERE blockchain=? ORDER BY name;', (blockchain.value,),  # noqa: E501
-                )
-            return [
-                WeightedNode(
-                    identifier=entry[0],
-                    node_info=NodeName(
-                        name=entry[1],
-                        endpoint=entry[2],
-                        owned=bool(entry[3]),
-                        blockchain=SupportedBlockchain.deserialize(entry[6]),  # type: ignore
-                    ),
-                    weight=FVal(entry[4]),
-                    active=bool(entry[5]),
+
+        The nodes are read from the DB only the first time after they are edited.
+        """
+        if (nodes := self._rpc_nodes.get(blockchain)) is None:
+            version = self._rpc_nodes_version[blockchain]
+            with self.conn.read_ctx() as cursor:
+                all_nodes = tuple(
+                    WeightedNode(
+                        identifier=entry[0],
+                        node_info=NodeName(
+                            name=entry[1],
+                            endpoint=entry[2],
+                            owned=bool(entry[3]),
+                            blockchain=SupportedBlockchain.deserialize(entry[6]),  # type: ignore
+                        ),
+                        weight=FVal(entry[4]),
+                        active=bool(entry[5]),
+                    )
+                    for entry in cursor.execute(
+                        'SELECT identifier, name, endpoint, owned, weight, active, blockchain FROM rpc_nodes WHERE blockchain=? ORDER BY name;', (blockchain.value,),  # noqa: E501
+                    )
                 )
-                for entry in cursor
-            ]
+            nodes = (all_nodes, tuple(
+                node for node in all_nodes
+                if node.active and (node.weight != ZERO or node.node_info.owned)
+            ))
+            if version == self._rpc_nodes_version[blockchain]:  # not edited while reading
+                self._rpc_nodes[blockchain] = nodes
+
+        return nodes[1] if only_active else nodes[0]
+
+    def get_rpc_nodes_version(self, blockchain: SupportedBlockchain) -> int:
+        """Returns a counter that changes every time the nodes of the blockchain are edited"""
+        return self._rpc_nodes_version[blockchain]
+
+    def invalidate_rpc_nodes(self, blockchain: SupportedBlockchain | None = None) -> None:
+        """Makes the next get_rpc_nodes read the nodes of the given blockchain, or of all
+        of them if None, from the DB. Has to be called after every write to rpc_nodes."""
+        if blockchain is None:  # all the read blockchains have a version
+            blockchains = list(self._rpc_nodes_version)
+        else:
+            blockchains = [blockchain]
+        for entry in blockchains:
+            self._rpc_nodes.pop(entry, None)
+            self._rpc_nodes_version[entry] += 1
 
     def rebalance_rpc_nodes_weights(
             self,
@@ -3394,6 +3522,7 @@ class DBHandler:
                 exclude_identifier=write_cursor.lastrowid,
                 blockchain=node.node_info.blockchain,
             )
+        self.invalidate_rpc_nodes(node.node_info.blockchain)
 
     def update_rpc_node(self, node: WeightedNode) -> None:
         """
@@ -3431,6 +3560,7 @@ class DBHandler:
                 exclude_identifier=node.identifier,
                 blockchain=node.node_info.blockchain,
             )
+        self.invalidate_rpc_nodes(node.node_info.blockchain)
 
     def delete_rpc_node(self, identifier: int, blockchain: SupportedBlockchain) -> None:
         """Delete a rpc node by identifier and blockchain.
@@ -3447,6 +3577,7 @@ class DBHandler:
                 exclude_identifier=None,
                 blockchain=blockchain,
             )
+        self.invalidate_rpc_nodes(blockchain)
 
     def get_user_notes(
             self,
@@ -4,6 +4,7 @@ but heavily modified"""
 
 import random
 import sqlite3
+import time
 from collections.abc import Generator, Sequence
 from contextlib import contextmanager
 from enum import Enum, auto
@@ -17,6 +18,7 @@ from pysqlcipher3 import dbapi2 as sqlcipher
 
 from rotkehlchen.db.checks import sanity_check_impl
 from rotkehlchen.db.minimized_schema import MINIMIZED_USER_DB_SCHEMA
+from rotkehlchen.db.schema import DB_TRIGGERS as USER_DB_TRIGGERS
 from rotkehlchen.globaldb.minimized_schema import MINIMIZED_GLOBAL_DB_SCHEMA
 from rotkehlchen.greenlets.utils import get_greenlet_name
 from rotkehlchen.utils.misc import ts_now
@@ -232,6 +234,116 @@ CALLBACK_MAP = {
 }
 
 
+class DBReadPool:
+    """A pool of read only connections to the database of a DBConnection.
+
+    The database needs to be in WAL mode so that the readers neither block nor get blocked
+    by the single writer connection. A greenlet holds at most one connection of the pool,
+    so nested read contexts of the same greenlet share it instead of waiting for each other.
+    """
+
+    def __init__(
+            self,
+            path: str | Path,
+            connection_type: DBConnectionType,
+            size: int,
+            sql_vm_instructions_cb: int,
+            setup_script: str | None,
+    ) -> None:
+        self.path = path
+        self.connection_type = connection_type
+        self.size = size
+        self.sql_vm_instructions_cb = sql_vm_instructions_cb
+        self.setup_script = setup_script
+        self.slots = gevent.lock.BoundedSemaphore(size)
+        self.idle: list[UnderlyingConnection] = []
+        self.greenlet_connections: dict[gevent.Greenlet, UnderlyingConnection] = {}
+        self.opened = 0
+        self.closed = False
+        # metrics to be able to size the pool
+        self.acquisitions = self.waits = 0
+        self.total_wait = self.max_wait = 0.0
+
+    def _open(self) -> UnderlyingConnection:
+        conn: UnderlyingConnection
+        if self.connection_type == DBConnectionType.GLOBAL:
+            conn = sqlite3.connect(
+                database=self.path,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+        else:
+            conn = sqlcipher.connect(  # pylint: disable=no-member
+                database=str(self.path),
+                check_same_thread=False,
+                isolation_level=None,
+            )
+        try:
+            if self.setup_script is not None:
+                conn.executescript(self.setup_script)
+            conn.execute('PRAGMA query_only=ON')
+        except (sqlite3.DatabaseError, sqlcipher.DatabaseError):  # pylint: disable=no-member
+            conn.close()
+            raise
+
+        conn.set_progress_handler(CALLBACK_MAP.get(self.connection_type), self.sql_vm_instructions_cb)  # noqa: E501
+        self.opened += 1
+        return conn
+
+    @contextmanager
+    def connection(self) -> Generator[UnderlyingConnection, None, None]:
+        current = gevent.getcurrent()
+        if (conn := self.greenlet_connections.get(current)) is not None:
+            yield conn  # nested read context of the same greenlet
+            return
+
+        if self.slots.locked():  # all connections are in use
+            start = time.monotonic()
+            self.slots.acquire()
+            wait = time.monotonic() - start
+            self.waits += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+        else:
+            self.slots.acquire()
+
+        try:
+            conn = self.idle.pop() if len(self.idle) != 0 else self._open()
+        except BaseException:
+            self.slots.release()
+            raise
+
+        self.acquisitions += 1
+        self.greenlet_connections[current] = conn
+        try:
+            yield conn
+        finally:
+            del self.greenlet_connections[current]
+            if self.closed:
+                conn.close()
+            else:
+                self.idle.append(conn)
+            self.slots.release()
+
+    def close(self) -> None:
+        """Closes the idle connections. The ones in use are closed when released"""
+        self.closed = True
+        for conn in self.idle:
+            conn.close()
+        self.idle = []
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            'size': self.size,
+            'open_connections': self.opened if self.closed is False else 0,
+            'in_use': len(self.greenlet_connections),
+            'acquisitions': self.acquisitions,
+            'waits': self.waits,
+            'total_wait_ms': round(self.total_wait * 1000, 3),
+            'max_wait_ms': round(self.max_wait * 1000, 3),
+        }
+
+
 class DBConnection:
 
     def _set_progress_handler(self) -> None:
@@ -245,7 +357,9 @@ class DBConnection:
             sql_vm_instructions_cb: int,
     ) -> None:
         CONNECTION_MAP[connection_type] = self
+        self.path = path
         self._conn: UnderlyingConnection
+        self.read_pool: DBReadPool | None = None
         self.in_callback = gevent.lock.Semaphore()
         self.transaction_lock = gevent.lock.Semaphore()
         self.connection_type = connection_type
@@ -327,16 +441,65 @@ class DBConnection:
         return DBCursor(connection=self, cursor=self._conn.cursor())
 
     def close(self) -> None:
+        if self.read_pool is not None:
+            self.read_pool.close()
         self._conn.close()
         CONNECTION_MAP.pop(self.connection_type, None)
 
+    def enable_read_pool(self, size: int, setup_script: str | None = None) -> None:
+        """Makes read_ctx use a pool of up to `size` read only connections, switching the
+        database to WAL mode. Writes keep going through this connection. A size of zero
+        disables the pool. Calling it again replaces the existing pool, which is needed
+        whenever the setup_script (e.g. the key of the database) changes.
+
+        setup_script is executed on each new connection of the pool before it's used.
+        """
+        if self.read_pool is not None:
+            self.read_pool.close()
+            self.read_pool = None
+
+        if size == 0:
+            return
+
+        self._conn.execute('PRAGMA journal_mode=WAL;')
+        self.read_pool = DBReadPool(
+            path=self.path,
+            connection_type=self.connection_type,
+            size=size,
+            sql_vm_instructions_cb=self.sql_vm_instructions_cb,
+            setup_script=setup_script,
+        )
+
+    def read_pool_stats(self) -> dict[str, int | float] | None:
+        """Returns the usage metrics of the read pool or None if there is no pool"""
+        return None if self.read_pool is None else self.read_pool.stats()
+
     @contextmanager
-    def read_ctx(self) -> Generator['DBCursor', None, None]:
-        cursor = self.cursor()
-        try:
-            yield cursor
-        finally:
-            cursor.close()
+    def read_ctx(self, pooled: bool = True) -> Generator['DBCursor', None, None]:
+        """Gives a cursor to read from the database. If there is a read pool the cursor
+        is from one of its connections, unless `pooled` is False or the current greenlet
+        has a write transaction or savepoint open, in which case it's from this connection
+        so that the uncommitted changes are visible. `pooled` should be False when the
+        cursor is used to modify the connection's state, for example to ATTACH a database.
+        """
+        if (
+                pooled is False or
+                self.read_pool is None or
+                get_greenlet_name(gevent.getcurrent()) in (self.write_greenlet_id, self.savepoint_greenlet_id)  # noqa: E501
+        ):
+            cursor = self.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+            return
+
+        with self.read_pool.connection() as conn:
+            cursor = DBCursor(connection=self, cursor=conn.cursor())
+            try:
+                yield cursor
+            finally:
+                cursor.close()
 
     @contextmanager
     def write_ctx(self, commit_ts: bool = False) -> Generator['DBCursor', None, None]:
@@ -504,6 +667,11 @@ class DBConnection:
         or deleted since the database connection was opened"""
         return self._conn.total_changes
 
+    @property
+    def in_transaction(self) -> bool:
+        """True if there is an open transaction with uncommitted changes"""
+        return self._conn.in_transaction
+
     def schema_sanity_check(self) -> None:
         """Ensures that database schema is not broken.
 
@@ -522,4 +690,5 @@ class DBConnection:
                 cursor=cursor,
                 db_name=self.connection_type.name.lower(),
                 minimized_schema=self.minimized_schema,
+                triggers=USER_DB_TRIGGERS if self.connection_type == DBConnectionType.USER else (),
             )
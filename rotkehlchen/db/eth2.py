@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Collection, Iterator
 from typing import TYPE_CHECKING, Literal
 
 from pysqlcipher3 import dbapi2 as sqlcipher
@@ -11,17 +12,14 @@ from rotkehlchen.chain.ethereum.modules.eth2.structures import (
 from rotkehlchen.chain.ethereum.modules.eth2.utils import form_withdrawal_notes
 from rotkehlchen.constants import ONE, ZERO
 from rotkehlchen.constants.timing import DAY_IN_SECONDS, HOUR_IN_SECONDS
-from rotkehlchen.db.filtering import (
-    ETH_STAKING_EVENT_JOIN,
-    EthStakingEventFilterQuery,
-    EthWithdrawalFilterQuery,
-)
+from rotkehlchen.db.history_events import DAY_IN_MS
 from rotkehlchen.errors.misc import InputError
 from rotkehlchen.fval import FVal
 from rotkehlchen.history.events.structures.base import HistoryBaseEntryType
+from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.types import ChecksumEvmAddress, Eth2PubKey, Timestamp
-from rotkehlchen.utils.misc import ts_ms_to_sec
+from rotkehlchen.utils.misc import ts_ms_to_sec, ts_sec_to_ms
 
 if TYPE_CHECKING:
     from rotkehlchen.db.dbhandler import DBHandler
@@ -30,6 +28,7 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
+DAILY_PERFORMANCE_REFRESH_DAYS = 100  # max dirty days of the daily performance refreshed at once
 
 
 class DBEth2:
@@ -336,46 +335,172 @@ class DBEth2:
                 (*validator_indices, HistoryBaseEntryType.ETH_DEPOSIT_EVENT.serialize_for_db()),
             )
 
-    @staticmethod
-    def _validator_stats_process_queries(
-            cursor: 'DBCursor',
-            amount_querystr: str,
-            filter_query: EthStakingEventFilterQuery,
-    ) -> dict[int, FVal]:
-        """Execute DB query and extract numerical value per validator after using filter_query
+    def refresh_daily_performance(
+            self,
+            write_cursor: 'DBCursor',
+            max_days: int | None = None,
+    ) -> None:
+        """Recomputes the daily performance of the validator days that were marked as dirty
+        by the writes to the staking events, up to `max_days` days starting from the oldest.
 
-        Return a dict of validator index to sum of amounts per validator in the filter
+        The reads are exact without it since the dirty validator days are summed from the
+        staking events. Refreshing only makes them cheaper.
         """
-        base_query = f'SELECT validator_index, {amount_querystr} ' + ETH_STAKING_EVENT_JOIN
-        query, bindings = filter_query.prepare(with_pagination=False, with_order=False)
-        cursor.execute(base_query + query + ' GROUP BY eth_staking_events_info.validator_index', bindings)  # noqa: E501
+        dirty = write_cursor.execute(
+            'SELECT validator_index, timestamp FROM eth2_validators_daily_performance_dirty '
+            'WHERE timestamp IN (SELECT DISTINCT timestamp FROM '
+            'eth2_validators_daily_performance_dirty ORDER BY timestamp LIMIT ?)',
+            (-1 if max_days is None else max_days,),
+        ).fetchall()
+        if len(dirty) == 0:
+            return
+
+        totals: dict[tuple[int, int, str], list[FVal]] = {}
+        for validator_index, day_ts, location_label, column, amount in self._query_dirty_performance_events(  # noqa: E501
+                cursor=write_cursor,
+                dirty=dirty,
+        ):
+            if (key_totals := totals.get(key := (validator_index, day_ts, location_label))) is None:  # noqa: E501
+                totals[key] = key_totals = [ZERO, ZERO, ZERO]
+            key_totals[column] += amount
+
+        for table in ('eth2_validators_daily_performance', 'eth2_validators_daily_performance_dirty'):  # noqa: E501
+            write_cursor.executemany(
+                f'DELETE FROM {table} WHERE validator_index=? AND timestamp=?',
+                dirty,
+            )
+        write_cursor.executemany(
+            'INSERT INTO eth2_validators_daily_performance(validator_index, timestamp, '
+            'location_label, withdrawals, exits, execution) VALUES (?, ?, ?, ?, ?, ?)',
+            [(*key, *(str(x) for x in key_totals)) for key, key_totals in totals.items()],
+        )
+
+    def _query_dirty_performance_events(
+            self,
+            cursor: 'DBCursor',
+            dirty: list[tuple[int, int]],
+    ) -> Iterator[tuple[int, int, str, int, FVal]]:
+        """Same as _query_performance_events but only for the given dirty
+        (validator index, day start) pairs"""
+        dirty_keys = set(dirty)
+        for day in sorted({x[1] for x in dirty}):
+            for entry in self._query_performance_events(
+                    cursor=cursor,
+                    from_ms=day,
+                    to_ms=day + DAY_IN_MS - 1,
+            ):
+                if (entry[0], entry[1]) in dirty_keys:  # the other validators of the day are up to date  # noqa: E501
+                    yield entry
 
-        return {entry[0]: FVal(entry[1]) for entry in cursor}
+    @staticmethod
+    def _query_performance_events(
+            cursor: 'DBCursor',
+            from_ms: int,
+            to_ms: int,
+    ) -> Iterator[tuple[int, int, str, int, FVal]]:
+        """Yields the partial withdrawals, exits and execution layer rewards in the inclusive
+        range as (validator index, day start, location label, column, amount) where column is
+        the index of the amount in the (withdrawals, exits, execution) totals. The amount of
+        exits is the exited amount minus 32."""
+        for validator_index, day_ts, location_label, entry_type, is_exit, raw_amount in cursor.execute(  # noqa: E501
+                'SELECT S.validator_index, E.timestamp - E.timestamp % 86400000, '
+                "COALESCE(E.location_label, ''), E.entry_type, S.is_exit_or_blocknumber, E.amount "
+                'FROM history_events E INNER JOIN eth_staking_events_info S '
+                'ON E.identifier=S.identifier WHERE E.timestamp >= ? AND E.timestamp <= ? AND '
+                'E.type=? AND ((E.entry_type=? AND E.subtype=?) OR '
+                '(E.entry_type=? AND E.subtype IN (?, ?)))',
+                (
+                    from_ms,
+                    to_ms,
+                    HistoryEventType.STAKING.serialize(),
+                    HistoryBaseEntryType.ETH_WITHDRAWAL_EVENT.serialize_for_db(),
+                    HistoryEventSubType.REMOVE_ASSET.serialize(),
+                    HistoryBaseEntryType.ETH_BLOCK_EVENT.serialize_for_db(),
+                    HistoryEventSubType.BLOCK_PRODUCTION.serialize(),
+                    HistoryEventSubType.MEV_REWARD.serialize(),
+                ),
+        ):
+            try:
+                amount = FVal(raw_amount)
+            except ValueError as e:
+                log.error(f'Skipping staking event with invalid amount {raw_amount} from the validators performance. {e!s}')  # noqa: E501
+                continue
+
+            if entry_type == HistoryBaseEntryType.ETH_BLOCK_EVENT.serialize_for_db():
+                yield validator_index, day_ts, location_label, 2, amount
+            elif is_exit == 1:
+                yield validator_index, day_ts, location_label, 1, amount - 32
+            else:
+                yield validator_index, day_ts, location_label, 0, amount
 
     def get_validators_profit(
             self,
             cursor: 'DBCursor',
-            withdrawals_filter_query: EthWithdrawalFilterQuery,
-            exits_filter_query: EthWithdrawalFilterQuery,
-            execution_filter_query: EthStakingEventFilterQuery,
-    ) -> tuple[dict[int, FVal], dict[int, FVal], dict[int, FVal]]:
-        """Query withdrawals, exits, EL rewards amounts for the given filter.
+            from_ts: Timestamp,
+            to_ts: Timestamp,
+            validator_indices: set[int] | None,
+            tracked_addresses: Collection[str],
+    ) -> dict[int, list[FVal]]:
+        """Query the withdrawals, exits pnl and execution layer rewards of the validators in
+        the given range. Only the execution layer rewards received by the tracked addresses
+        are counted.
 
-        Returns each of the different amount sums for the period per validator
+        The whole days of the range are summed from the daily performance and only the
+        partial days at the edges of the range and the validator days whose performance is
+        not yet refreshed are summed from the staking events.
+
+        Returns the exact (withdrawals, exits, execution) sums per validator index
         """
-        withdrawals_amounts = self._validator_stats_process_queries(
-            cursor=cursor,
-            amount_querystr='SUM(CAST(amount AS REAL))',
-            filter_query=withdrawals_filter_query,
-        )
-        exits_pnl = self._validator_stats_process_queries(
-            cursor=cursor,
-            amount_querystr='CAST(amount AS REAL) - 32',
-            filter_query=exits_filter_query,
-        )
-        execution_rewards_amounts = self._validator_stats_process_queries(
-            cursor=cursor,
-            amount_querystr='SUM(CAST(amount AS REAL))',
-            filter_query=execution_filter_query,
-        )
-        return withdrawals_amounts, exits_pnl, execution_rewards_amounts
+        totals: dict[int, list[FVal]] = {}
+
+        def add_amount(validator_index: int, location_label: str, column: int, amount: FVal) -> None:  # noqa: E501
+            if validator_indices is not None and validator_index not in validator_indices:
+                return
+            if column == 2 and location_label not in tracked_addresses:
+                return  # block recipients that are not tracked, such as mev builders
+
+            if (validator_totals := totals.get(validator_index)) is None:
+                totals[validator_index] = validator_totals = [ZERO, ZERO, ZERO]
+            validator_totals[column] += amount
+
+        # the whole days of the inclusive [from_ms, to_ms] range are [first_day, end_day)
+        from_ms: int = ts_sec_to_ms(from_ts)
+        to_ms: int = ts_sec_to_ms(to_ts)
+        first_day = -(-from_ms // DAY_IN_MS) * DAY_IN_MS
+        end_day = (to_ms + 1) // DAY_IN_MS * DAY_IN_MS
+        if first_day >= end_day:  # no whole day in the range
+            edges = [(from_ms, to_ms)]
+        else:
+            edges = [(from_ms, first_day - 1), (end_day, to_ms)]
+            for validator_index, location_label, *amounts in cursor.execute(
+                'SELECT validator_index, location_label, withdrawals, exits, execution '
+                'FROM eth2_validators_daily_performance WHERE timestamp >= ? AND timestamp < ? '
+                'AND (validator_index, timestamp) NOT IN (SELECT validator_index, timestamp '
+                'FROM eth2_validators_daily_performance_dirty)',
+                (first_day, end_day),
+            ):
+                for column, amount in enumerate(amounts):
+                    add_amount(validator_index, location_label, column, FVal(amount))
+
+            for validator_index, _, location_label, column, amount in self._query_dirty_performance_events(  # noqa: E501
+                    cursor=cursor,
+                    dirty=cursor.execute(
+                        'SELECT validator_index, timestamp FROM '
+                        'eth2_validators_daily_performance_dirty WHERE timestamp >= ? AND '
+                        'timestamp < ?',
+                        (first_day, end_day),
+                    ).fetchall(),
+            ):
+                add_amount(validator_index, location_label, column, amount)
+
+        for edge_from_ms, edge_to_ms in edges:
+            if edge_from_ms > edge_to_ms:
+                continue
+            for validator_index, _, location_label, column, amount in self._query_performance_events(  # noqa: E501
+                    cursor=cursor,
+                    from_ms=edge_from_ms,
+                    to_ms=edge_to_ms,
+            ):
+                add_amount(validator_index, location_label, column, amount)
+
+        return totals
@@ -1,4 +1,5 @@
 import logging
+import time
 from typing import TYPE_CHECKING, Any, get_args
 
 from pysqlcipher3 import dbapi2 as sqlcipher
@@ -20,6 +21,7 @@ from rotkehlchen.db.constants import (
 )
 from rotkehlchen.db.filtering import EvmTransactionsFilterQuery, TransactionsNotDecodedFilterQuery
 from rotkehlchen.db.history_events import DBHistoryEvents
+from rotkehlchen.db.index_advisor import INDEX_ADVISOR
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
@@ -41,6 +43,7 @@ from rotkehlchen.types import (
     deserialize_evm_tx_hash,
 )
 from rotkehlchen.utils.hexbytes import hexstring_to_bytes
+from rotkehlchen.utils.misc import get_chunks
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
@@ -59,6 +62,8 @@ TRANSACTIONS_MISSING_DECODING_QUERY = (
     'evmtx_receipts AS A LEFT OUTER JOIN evm_tx_mappings AS B ON A.tx_id=B.tx_id '
     'LEFT JOIN evm_transactions AS C ON A.tx_id=C.identifier '
 )
+# max number of transactions to put in a single IN clause when bulk loading them
+TX_DATA_LOAD_CHUNK_SIZE = 500
 
 
 class DBEvmTx:
@@ -197,6 +202,7 @@ class DBEvmTx:
         """
         query, bindings = filter_.prepare()
         query, bindings = self._form_evm_transaction_dbquery(query, bindings, has_premium)
+        start = time.perf_counter()
         results = cursor.execute(query, bindings)
 
         evm_transactions = []
@@ -212,6 +218,14 @@ class DBEvmTx:
 
             evm_transactions.append(tx)
 
+        if __debug__:
+            INDEX_ADVISOR.record(
+                cursor=cursor,
+                query=query,
+                bindings=bindings,
+                duration=time.perf_counter() - start,
+            )
+
         return evm_transactions
 
     def delete_evm_transaction_data(
@@ -439,6 +453,80 @@ class DBEvmTx:
 
         return tx_receipt
 
+    def get_transactions_and_receipts(
+            self,
+            cursor: 'DBCursor',
+            tx_hashes: list[EVMTxHash],
+            chain_id: ChainID,
+    ) -> dict[EVMTxHash, tuple[EvmTransaction, EvmTxReceipt]]:
+        """Bulk version of get_receipt that also returns the transactions. Loads the
+        given transactions, their receipts, logs and topics with one query per table.
+
+        Only the transactions that have all their data in the DB are returned. The
+        caller should take care of the missing ones.
+
+        May raise:
+        - DeserializationError if a transaction can't be deserialized from the DB
+        """
+        transactions: dict[int, EvmTransaction] = {}
+        receipts: dict[int, EvmTxReceipt] = {}
+        for chunk in get_chunks(tx_hashes, n=TX_DATA_LOAD_CHUNK_SIZE):
+            placeholders = ','.join(['?'] * len(chunk))
+            query, bindings = self._form_evm_transaction_dbquery(
+                query=f'WHERE evm_transactions.tx_hash IN ({placeholders}) AND evm_transactions.chain_id=?',  # noqa: E501
+                bindings=[*chunk, chain_id.serialize_for_db()],
+                has_premium=True,
+            )
+            tx_ids = []
+            for result in cursor.execute(query, bindings).fetchall():
+                if self._has_all_transaction_data(result):
+                    tx = self._build_evm_transaction(result)
+                    transactions[tx.db_id] = tx
+                    tx_ids.append(tx.db_id)
+
+            if len(tx_ids) == 0:
+                continue
+
+            ids_placeholders = ','.join(['?'] * len(tx_ids))
+            cursor.execute(
+                f'SELECT tx_id, contract_address, status, type FROM evmtx_receipts '
+                f'WHERE tx_id IN ({ids_placeholders})',
+                tx_ids,
+            )
+            for tx_id, contract_address, status, tx_type in cursor:
+                receipts[tx_id] = EvmTxReceipt(
+                    tx_hash=transactions[tx_id].tx_hash,
+                    chain_id=chain_id,
+                    contract_address=contract_address,
+                    status=bool(status),  # works since value is either 0 or 1
+                    tx_type=tx_type,
+                )
+
+            logs: dict[int, EvmTxReceiptLog] = {}
+            cursor.execute(
+                f'SELECT identifier, tx_id, log_index, data, address FROM evmtx_receipt_logs '
+                f'WHERE tx_id IN ({ids_placeholders}) ORDER BY identifier',
+                tx_ids,
+            )
+            for log_id, tx_id, log_index, data, address in cursor:
+                logs[log_id] = EvmTxReceiptLog(log_index=log_index, data=data, address=address)
+                if (receipt := receipts.get(tx_id)) is not None:
+                    receipt.logs.append(logs[log_id])
+
+            cursor.execute(
+                f'SELECT T.log, T.topic FROM evmtx_receipt_log_topics AS T '
+                f'JOIN evmtx_receipt_logs AS L ON T.log=L.identifier '
+                f'WHERE L.tx_id IN ({ids_placeholders}) ORDER BY T.log, T.topic_index',
+                tx_ids,
+            )
+            for log_id, topic in cursor:
+                logs[log_id].topics.append(topic)
+
+        return {
+            tx.tx_hash: (tx, receipts[tx_id])
+            for tx_id, tx in transactions.items() if tx_id in receipts
+        }
+
     def delete_transactions(
             self,
             write_cursor: 'DBCursor',
@@ -631,6 +719,11 @@ class DBEvmTx:
             [FREE_ETH_TX_LIMIT] + bindings,
         )
 
+    def _has_all_transaction_data(self, result: tuple[Any, ...]) -> bool:
+        """Whether a row of _form_evm_transaction_dbquery has all the data
+        the chain needs for the transaction, apart from the receipt"""
+        return True
+
     def _build_evm_transaction(self, result: tuple[Any, ...]) -> EvmTransaction:
         """Build a transaction object from queried data
 
@@ -1,9 +1,11 @@
+import base64
+import json
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Collection, Sequence
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Generic, Literal, NamedTuple, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Literal, NamedTuple, TypeVar
 
 from rotkehlchen.accounting.types import SchemaEventType
 from rotkehlchen.api.v1.types import IncludeExcludeFilterData
@@ -42,6 +44,10 @@ from rotkehlchen.types import (
 )
 from rotkehlchen.utils.misc import ts_now
 
+if TYPE_CHECKING:
+    from rotkehlchen.exchanges.data_structures import Trade
+    from rotkehlchen.history.events.structures.base import HistoryBaseEntry
+
 
 class InvalidFilter(Exception):
     """Raised if an invalid filter combination has been given"""
@@ -88,11 +94,59 @@ class DBFilterOrder(NamedTuple):
         return querystr
 
 
+class DBFilterKeyset(NamedTuple):
+    """Seek based pagination. Selects the rows that come after the row with the given values
+    of the order by columns. The last column has to be unique so that the order is total."""
+    rules: list[tuple[str, bool]]
+    values: list[Any]
+
+    def prepare(self) -> tuple[str, list[Any]]:
+        if len({ascending for _, ascending in self.rules}) == 1:  # compare all as a row value
+            columns = ', '.join(attribute for attribute, _ in self.rules)
+            placeholders = ', '.join(['?'] * len(self.rules))
+            operator = '>' if self.rules[0][1] else '<'
+            return f'({columns}) {operator} ({placeholders})', list(self.values)
+
+        # mixed directions. The first column is bounded on its own so that an index can be used
+        (attribute, ascending), value = self.rules[0], self.values[0]
+        operator = '>' if ascending else '<'
+        rest, rest_bindings = DBFilterKeyset(rules=self.rules[1:], values=self.values[1:]).prepare()  # noqa: E501
+        return (
+            f'{attribute} {operator}= ? AND ({attribute} {operator} ? OR ({rest}))',
+            [value, value, *rest_bindings],
+        )
+
+    def serialize(self) -> str:
+        """Opaque continuation token that is given to the API consumers"""
+        data = json.dumps({'order': self.rules, 'after': self.values}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    @classmethod
+    def deserialize(cls, token: str) -> 'DBFilterKeyset':
+        """May raise:
+        - DeserializationError if the token is not one created by serialize
+        """
+        try:
+            data = json.loads(base64.urlsafe_b64decode(token.encode()))
+            rules = [(str(attribute), bool(ascending)) for attribute, ascending in data['order']]
+            values = data['after']
+        except (ValueError, TypeError, KeyError) as e:
+            raise DeserializationError(f'Invalid continuation token {token}') from e
+
+        if len(rules) == 0 or not isinstance(values, list) or len(values) != len(rules):
+            raise DeserializationError(f'Invalid continuation token {token}')
+
+        return cls(rules=rules, values=values)
+
+
 class DBFilterPagination(NamedTuple):
     limit: int | None
     offset: int | None
+    keyset: DBFilterKeyset | None = None
 
     def prepare(self) -> str:
+        if self.keyset is not None:  # the keyset condition replaces the offset
+            return f'LIMIT {self.limit or -1}'
         return f'LIMIT {self.limit or -1}' + (f' OFFSET {self.offset}' if self.offset else '')
 
 
@@ -309,6 +363,10 @@ class DBFilterQuery(ABC):
     group_by: DBFilterGroupBy | None = None
     order_by: DBFilterOrder | None = None
     pagination: DBFilterPagination | None = None
+    # Unique column appended to the order of the paginated queries so that the order is total,
+    # and the order by attributes for which keyset pagination is supported.
+    keyset_tiebreaker: ClassVar[str | None] = None
+    keyset_attributes: ClassVar[frozenset[str]] = frozenset()
 
     def prepare(
             self,
@@ -316,13 +374,17 @@ class DBFilterQuery(ABC):
             with_order: bool = True,
             with_group_by: bool = False,
             without_ignored_asset_filter: bool = False,
+            with_keyset_order: bool = False,
     ) -> tuple[str, list[Any]]:
         """Prepares a filter by converting the filters to a query string
 
         Can be configured to:
-        - with_pagination: Use or not the pagination filters
+        - with_pagination: Use or not the pagination filters. With keyset pagination this adds
+        its condition to the filters.
         - with_order: Use or not the order by filters
         - with_group_by: Use or not the group by filters
+        - with_keyset_order: Order by the keyset pagination rules, which append the tiebreaker
+        column, if the query is paginated. This is always done if with_pagination is True.
         - without_ignored_asset_filter: This is only for history events query and since we have
         quite a complicated query in the backend to count the limited grouped history events, there
         is no need to rerun the ignored assets filter as it's already part of the inner
@@ -350,8 +412,16 @@ class DBFilterQuery(ABC):
             filterstrings.append(f'({operator.join(filters)})')
             bindings.extend(single_bindings)
 
+        operator = ' AND ' if self.and_op else ' OR '
+        if with_pagination and self.pagination is not None and self.pagination.keyset is not None:
+            keyset_query, keyset_bindings = self.pagination.keyset.prepare()
+            if len(filterstrings) != 0:  # the keyset condition applies to all the filters
+                filterstrings = [f'({operator.join(filterstrings)})']
+            filterstrings.append(f'({keyset_query})')
+            bindings.extend(keyset_bindings)
+            operator = ' AND '
+
         if len(filterstrings) != 0:
-            operator = ' AND ' if self.and_op else ' OR '
             filter_query = f'{"WHERE " if self.join_clause is None else "AND ("}{operator.join(filterstrings)}{"" if self.join_clause is None else ")"}'  # noqa: E501
             query_parts.append(filter_query)
 
@@ -360,8 +430,14 @@ class DBFilterQuery(ABC):
             query_parts.append(groupby_query)
 
         if with_order and self.order_by is not None:
-            orderby_query = self.order_by.prepare()
-            query_parts.append(orderby_query)
+            order_by = self.order_by
+            if (
+                    (with_pagination or with_keyset_order) and
+                    self.pagination is not None and
+                    (keyset_rules := self.keyset_rules()) is not None
+            ):
+                order_by = DBFilterOrder(rules=keyset_rules, case_sensitive=True)
+            query_parts.append(order_by.prepare())
 
         if with_pagination and self.pagination is not None:
             pagination_query = self.pagination.prepare()
@@ -400,6 +476,58 @@ class DBFilterQuery(ABC):
             pagination=pagination,
         )
 
+    def keyset_rules(self) -> list[tuple[str, bool]] | None:
+        """The order of the keyset paginated queries. That is the order by rules with the
+        tiebreaker column at the end. None if keyset pagination is not supported for the order"""
+        if (
+                self.keyset_tiebreaker is None or
+                self.order_by is None or
+                len(self.order_by.rules) == 0 or
+                any(attribute not in self.keyset_attributes for attribute, _ in self.order_by.rules)  # noqa: E501
+        ):
+            return None
+
+        return [*self.order_by.rules, (self.keyset_tiebreaker, self.order_by.rules[-1][1])]
+
+    def set_keyset(self, keyset: DBFilterKeyset) -> None:
+        """Makes the query continue after the row of the given keyset instead of at an offset
+
+        May raise:
+        - DeserializationError if the keyset is not for the order of this query or
+        the query has no limit
+        """
+        if keyset.rules != self.keyset_rules():
+            raise DeserializationError(
+                'The continuation token does not match the order of the query',
+            )
+        if self.pagination is None or self.pagination.limit is None:
+            raise DeserializationError('A continuation token can only be used with a limit')
+
+        self.pagination = DBFilterPagination(
+            limit=self.pagination.limit,
+            offset=None,
+            keyset=keyset,
+        )
+
+    def keyset_key(self, entry: Any) -> dict[str, Any] | None:
+        """Values of the keyset columns for an entry returned by the query. None for the
+        queries without a keyset_tiebreaker, which are paginated with an offset"""
+        return None
+
+    def continuation_token(self, entries: Sequence[Any]) -> str | None:
+        """The token with which the page after the given entries can be queried. None if
+        there are no more entries or keyset pagination is not supported for the query."""
+        if (
+                self.pagination is None or
+                self.pagination.limit is None or
+                len(entries) < self.pagination.limit or
+                (rules := self.keyset_rules()) is None or
+                (key := self.keyset_key(entries[-1])) is None
+        ):
+            return None
+
+        return DBFilterKeyset(rules=rules, values=[key[x] for x, _ in rules]).serialize()
+
 
 class FilterWithTimestamp:
 
@@ -649,6 +777,11 @@ class DBOptionalChainAddressesFilter(DBFilter):
 
 
 class TradesFilterQuery(DBFilterQuery, FilterWithTimestamp, FilterWithLocation):
+    keyset_tiebreaker = 'id'
+    keyset_attributes = frozenset(('timestamp',))
+
+    def keyset_key(self, entry: 'Trade') -> dict[str, Any]:
+        return {'timestamp': entry.timestamp, 'id': entry.identifier}
 
     @classmethod
     def make(
@@ -861,6 +994,15 @@ class HistoryEventCustomizedOnlyJoinsFilter(DBFilter):
 
 
 class HistoryBaseEntryFilterQuery(DBFilterQuery, FilterWithTimestamp, FilterWithLocation, ABC):
+    keyset_tiebreaker = 'history_events_identifier'
+    keyset_attributes = frozenset(('timestamp', 'sequence_index'))
+
+    def keyset_key(self, entry: 'HistoryBaseEntry') -> dict[str, Any]:
+        return {
+            'timestamp': entry.timestamp,
+            'sequence_index': entry.sequence_index,
+            'history_events_identifier': entry.identifier,
+        }
 
     @classmethod
     def make(
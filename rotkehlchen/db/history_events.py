@@ -1,6 +1,7 @@
 import copy
 import json
 import logging
+import time
 from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, Literal, Optional, overload
 
@@ -9,6 +10,7 @@ from pysqlcipher3 import dbapi2 as sqlcipher
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.constants import ZERO
 from rotkehlchen.constants.limits import FREE_HISTORY_EVENTS_LIMIT
+from rotkehlchen.constants.timing import DAY_IN_SECONDS
 from rotkehlchen.db.constants import (
     ETH_STAKING_EVENT_FIELDS,
     ETH_STAKING_FIELD_LENGTH,
@@ -23,9 +25,14 @@ from rotkehlchen.db.constants import (
 from rotkehlchen.db.filtering import (
     ALL_EVENTS_DATA_JOIN,
     EVM_EVENT_JOIN,
+    DBAssetFilter,
     DBEqualsFilter,
+    DBFilter,
     DBIgnoredAssetsFilter,
     DBIgnoreValuesFilter,
+    DBLocationFilter,
+    DBMultiIntegerFilter,
+    DBMultiStringFilter,
     DBNotEqualFilter,
     EthDepositEventFilterQuery,
     EthWithdrawalFilterQuery,
@@ -33,6 +40,7 @@ from rotkehlchen.db.filtering import (
     HistoryBaseEntryFilterQuery,
     HistoryEventFilterQuery,
 )
+from rotkehlchen.db.index_advisor import INDEX_ADVISOR
 from rotkehlchen.errors.asset import UnknownAsset
 from rotkehlchen.errors.misc import InputError
 from rotkehlchen.errors.serialization import DeserializationError
@@ -60,7 +68,7 @@ from rotkehlchen.types import (
     Timestamp,
     TimestampMS,
 )
-from rotkehlchen.utils.misc import ts_ms_to_sec, ts_sec_to_ms
+from rotkehlchen.utils.misc import get_chunks, ts_ms_to_sec, ts_sec_to_ms
 
 if TYPE_CHECKING:
     from rotkehlchen.db.dbhandler import DBHandler
@@ -69,6 +77,32 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+EVENTS_INSERT_CHUNK_SIZE = 500  # events per multi-row insert, each binds 13 variables
+DAY_IN_MS = DAY_IN_SECONDS * 1000  # the granularity of the history events value stats
+VALUE_STATS_REFRESH_DAYS = 100  # max dirty days of the value stats refreshed at once
+
+
+def _is_value_stats_filter(entry: DBFilter) -> bool:
+    """Whether the filter only uses columns of the history events value stats"""
+    if isinstance(entry, DBLocationFilter):
+        return True
+    if isinstance(entry, DBAssetFilter | DBIgnoredAssetsFilter):
+        return entry.asset_key == 'asset'
+    if isinstance(entry, DBMultiStringFilter | DBMultiIntegerFilter):
+        return entry.column in {'asset', 'type', 'subtype', 'location', 'entry_type'}
+    return False
+
+
+def _merge_days(days: list[int]) -> list[tuple[int, int]]:
+    """Merges the given day starts in milliseconds to [start, end) ranges of consecutive days"""
+    ranges: list[tuple[int, int]] = []
+    for day in sorted(days):
+        if len(ranges) != 0 and ranges[-1][1] == day:
+            ranges[-1] = (ranges[-1][0], day + DAY_IN_MS)
+        else:
+            ranges.append((day, day + DAY_IN_MS))
+    return ranges
+
 
 def filter_ignore_asset_query(include_ignored_assets: bool = False) -> str:
     """Create and return the subquery to filter ignored assets. If `include_ignored_assets`
@@ -142,13 +176,37 @@ class DBHistoryEvents:
     ) -> None:
         """Insert a list of history events in the database.
 
+        The base rows are written with one multi-row insert per chunk of events that returns
+        the identifiers of the inserted rows. Those are then used to write the rows of the
+        tables that extend history_events with one executemany per table. As in
+        add_history_event() an event that already exists, or repeats the event_identifier
+        and sequence_index of an earlier event of the list, is ignored along with its
+        extra rows.
+
         Check add_history_event() to see possible Exceptions
         """
-        for event in history:
-            self.add_history_event(
-                write_cursor=write_cursor,
-                event=event,
-            )
+        for chunk in get_chunks(history, n=EVENTS_INSERT_CHUNK_SIZE):
+            serialized = [event.serialize_for_db() for event in chunk]
+            base_query, values = serialized[0][0][0].split(' VALUES ')
+            inserted = {
+                (event_identifier, sequence_index): identifier
+                for identifier, event_identifier, sequence_index in write_cursor.execute(
+                    f'INSERT OR IGNORE INTO {base_query} VALUES {",".join([values] * len(chunk))} '
+                    'RETURNING identifier, event_identifier, sequence_index',
+                    [binding for entries in serialized for binding in entries[0][2]],
+                )
+            }
+            extra_rows: dict[str, list[tuple]] = {}
+            for event, entries in zip(chunk, serialized, strict=True):
+                # pop so that only the first event of a repeated key gets the extra rows
+                if (identifier := inserted.pop((event.event_identifier, event.sequence_index), None)) is None:  # noqa: E501
+                    continue
+
+                for insertquery, _, bindings in entries[1:]:
+                    extra_rows.setdefault(insertquery, []).append((identifier, *bindings))
+
+            for insertquery, rows in extra_rows.items():
+                write_cursor.executemany(f'INSERT OR IGNORE INTO {insertquery}', rows)
 
     def edit_history_event(self, write_cursor: 'DBCursor', event: HistoryBaseEntry) -> None:
         """
@@ -331,6 +389,7 @@ class DBHistoryEvents:
             entries_limit: int,
             has_premium: bool,
             group_by_event_ids: bool = False,
+            with_keyset_order: bool = False,
     ) -> tuple[str, list]:
         """Returns the sql queries and bindings for the history events without pagination."""
         base_suffix = f'{HISTORY_BASE_ENTRY_FIELDS}, {EVM_EVENT_FIELDS}, {ETH_STAKING_EVENT_FIELDS} {ALL_EVENTS_DATA_JOIN}'  # noqa: E501
@@ -357,10 +416,14 @@ class DBHistoryEvents:
                 with_group_by=True,
                 with_pagination=False,
                 without_ignored_asset_filter=True,
+                with_keyset_order=with_keyset_order,
             )
             prefix = 'SELECT COUNT(*), *'
         else:
-            filters, query_bindings = filter_query.prepare(with_pagination=False)
+            filters, query_bindings = filter_query.prepare(
+                with_pagination=False,
+                with_keyset_order=with_keyset_order,
+            )
             prefix = 'SELECT *'
 
         return f'{prefix} FROM (SELECT {suffix}) {filters}', limit + query_bindings
@@ -457,11 +520,18 @@ class DBHistoryEvents:
             filter_query=filter_query,
             group_by_event_ids=group_by_event_ids,
             entries_limit=FREE_HISTORY_EVENTS_LIMIT,
+            with_keyset_order=True,
         )
 
-        if filter_query.pagination is not None:
-            base_query = f'SELECT * FROM ({base_query}) {filter_query.pagination.prepare()}'
+        if (pagination := filter_query.pagination) is not None:
+            keyset_query = ''
+            if pagination.keyset is not None:  # applied outside so that it works on the groups
+                keyset_query, keyset_bindings = pagination.keyset.prepare()
+                keyset_query = f'WHERE {keyset_query} '
+                filters_bindings += keyset_bindings
+            base_query = f'SELECT * FROM ({base_query}) {keyset_query}{pagination.prepare()}'
 
+        start = time.perf_counter()
         cursor.execute(base_query, filters_bindings)
         output: list[HistoryBaseEntry] | list[tuple[int, HistoryBaseEntry]] = []
         type_idx = 1 if group_by_event_ids else 0
@@ -520,6 +590,14 @@ class DBHistoryEvents:
             else:
                 output.append(deserialized_event)  # type: ignore
 
+        if __debug__:
+            INDEX_ADVISOR.record(
+                cursor=cursor,
+                query=base_query,
+                bindings=filters_bindings,
+                duration=time.perf_counter() - start,
+            )
+
         if failed_to_deserialize:
             self.db.msg_aggregator.add_error(
                 'Could not deserialize one or more history event(s). '
@@ -701,10 +779,11 @@ class DBHistoryEvents:
             group_by_event_ids=group_by_event_ids,
             entries_limit=free_limit,
         )
-        count_without_limit = cursor.execute(
-            f'SELECT COUNT(*) FROM ({premium_query})',
-            premium_bindings,
-        ).fetchone()[0]
+        count_without_limit = self.db.count_cache.count(
+            cursor=cursor,
+            query=f'SELECT COUNT(*) FROM ({premium_query})',
+            bindings=premium_bindings,
+        )
 
         if entries_limit is None:
             return count_without_limit, count_without_limit
@@ -715,60 +794,217 @@ class DBHistoryEvents:
             group_by_event_ids=group_by_event_ids,
             entries_limit=free_limit,
         )
-        count_with_limit = cursor.execute(
-            f'SELECT COUNT(*) FROM ({free_query})',
-            free_bindings,
-        ).fetchone()[0]
+        count_with_limit = self.db.count_cache.count(
+            cursor=cursor,
+            query=f'SELECT COUNT(*) FROM ({free_query})',
+            bindings=free_bindings,
+        )
         return count_without_limit, count_with_limit
 
     def get_value_stats(
             self,
             cursor: 'DBCursor',
             query_filters: str,
-            bindings: list[Any],
+            bindings: Sequence[Any],
     ) -> tuple[FVal, list[tuple[str, FVal, FVal]]]:
         """Returns the sum of the USD value at the time of acquisition and the amount received
-        by asset
-        TODO: At the moment this function is used by liquity and kraken. Change it to use a filter
-        instead of query string and bindings when the refactor of the history events is made.
+        by asset. The values are summed as exact decimals.
+
+        Used for queries that filter on more than the columns of the daily value stats,
+        such as the liquity ones that join with the evm events. Filters that the daily stats
+        can serve should use get_aggregated_value_stats.
         """
-        usd_value = ZERO
-        try:
-            query = 'SELECT SUM(CAST(usd_value AS REAL)) FROM history_events ' + query_filters
-            result = cursor.execute(query, bindings).fetchone()[0]  # count(*) always returns
-            if result is not None:
-                usd_value = deserialize_fval(
-                    value=result,
-                    name='usd value in history events stats',
-                    location='get_value_stats',
+        totals: dict[str, list[FVal]] = {}
+        self._sum_values(
+            cursor=cursor,
+            query=f'SELECT asset, amount, usd_value FROM history_events {query_filters}',
+            bindings=bindings,
+            totals=totals,
+        )
+        return self._process_value_totals(totals)
+
+    def get_aggregated_value_stats(
+            self,
+            cursor: 'DBCursor',
+            filter_query: HistoryBaseEntryFilterQuery,
+    ) -> tuple[FVal, list[tuple[str, FVal, FVal]]]:
+        """Same as get_value_stats but for the events matching the filter query.
+
+        The whole days of the queried range are summed from the daily value stats and only
+        the partial days at the edges of the range and the days whose stats are not yet
+        refreshed are summed from the events. Filters on columns that are not in the daily
+        stats fall back to summing all the matching events.
+        """
+        timestamp_filter = filter_query.timestamp_filter
+        other_filters = [x for x in filter_query.filters if x is not timestamp_filter]
+        if (
+                filter_query.join_clause is not None or
+                filter_query.and_op is False or
+                any(not _is_value_stats_filter(x) for x in other_filters)
+        ):
+            query_filters, bindings = filter_query.prepare(with_pagination=False, with_order=False)
+            return self.get_value_stats(cursor=cursor, query_filters=query_filters, bindings=bindings)  # noqa: E501
+
+        conditions, bindings = [], []
+        for entry in other_filters:
+            filters, single_bindings = entry.prepare()
+            if len(filters) != 0:
+                operator = ' AND ' if entry.and_op else ' OR '
+                conditions.append(f'({operator.join(filters)})')
+                bindings.extend(single_bindings)
+
+        from_ms = to_ms = None  # inclusive range of the queried timestamps
+        if timestamp_filter is not None:
+            if timestamp_filter.from_ts is not None:
+                from_ms = ts_sec_to_ms(timestamp_filter.from_ts)
+            if timestamp_filter.to_ts is not None:
+                to_ms = ts_sec_to_ms(timestamp_filter.to_ts)
+
+        # the whole days of the range are [first_day, end_day)
+        first_day = 0 if from_ms is None else -(-from_ms // DAY_IN_MS) * DAY_IN_MS
+        end_day = None if to_ms is None else (to_ms + 1) // DAY_IN_MS * DAY_IN_MS
+        totals: dict[str, list[FVal]] = {}
+        if end_day is not None and first_day >= end_day:  # no whole day in the range
+            self._sum_event_values(cursor, conditions, bindings, from_ms, to_ms, totals)
+            return self._process_value_totals(totals)
+
+        day_conditions, day_bindings = ['timestamp >= ?'], [first_day]
+        if end_day is not None:
+            day_conditions.append('timestamp < ?')
+            day_bindings.append(end_day)
+        self._sum_values(
+            cursor=cursor,
+            query=(
+                'SELECT asset, amount, usd_value FROM history_events_value_stats WHERE ' +
+                ' AND '.join([*conditions, *day_conditions, 'timestamp NOT IN (SELECT timestamp FROM history_events_value_stats_dirty)'])  # noqa: E501
+            ),
+            bindings=[*bindings, *day_bindings],
+            totals=totals,
+        )
+        dirty_days = [x[0] for x in cursor.execute(
+            f'SELECT timestamp FROM history_events_value_stats_dirty WHERE {" AND ".join(day_conditions)}',  # noqa: E501
+            day_bindings,
+        )]
+        for range_start, range_end in _merge_days(dirty_days):
+            self._sum_event_values(cursor, conditions, bindings, range_start, range_end - 1, totals)  # noqa: E501
+        if from_ms is not None and from_ms < first_day:
+            self._sum_event_values(cursor, conditions, bindings, from_ms, first_day - 1, totals)
+        if end_day is not None and to_ms is not None and end_day <= to_ms:
+            self._sum_event_values(cursor, conditions, bindings, end_day, to_ms, totals)
+
+        return self._process_value_totals(totals)
+
+    def refresh_value_stats(
+            self,
+            write_cursor: 'DBCursor',
+            max_days: int | None = None,
+    ) -> None:
+        """Recomputes the daily value stats of the days that were marked as dirty by the
+        writes to the history events, up to `max_days` of them starting from the oldest.
+
+        The reads are exact without it since the dirty days are summed from the events.
+        Refreshing only makes them cheaper.
+        """
+        dirty_days = [x[0] for x in write_cursor.execute(
+            'SELECT timestamp FROM history_events_value_stats_dirty ORDER BY timestamp LIMIT ?',
+            (-1 if max_days is None else max_days,),
+        )]
+        totals: dict[tuple[str, str, str, str, int, int], list[FVal]] = {}
+        for range_start, range_end in _merge_days(dirty_days):
+            for entry in write_cursor.execute(
+                'SELECT asset, type, subtype, location, entry_type, '
+                'timestamp - timestamp % 86400000, amount, usd_value FROM history_events '
+                'WHERE timestamp >= ? AND timestamp < ?',
+                (range_start, range_end),
+            ):
+                try:
+                    amount, usd_value = FVal(entry[6]), FVal(entry[7])
+                except ValueError as e:
+                    log.error(f'Skipping history event with invalid values {entry} from the value stats. {e!s}')  # noqa: E501
+                    continue
+
+                if (key_totals := totals.get(entry[:6])) is None:
+                    totals[entry[:6]] = [amount, usd_value]
+                else:
+                    key_totals[0] += amount
+                    key_totals[1] += usd_value
+
+            for table in ('history_events_value_stats', 'history_events_value_stats_dirty'):
+                write_cursor.execute(
+                    f'DELETE FROM {table} WHERE timestamp >= ? AND timestamp < ?',
+                    (range_start, range_end),
                 )
-        except DeserializationError as e:
-            log.error(f'Didnt get correct valid usd_value for history_events query. {e!s}')
 
-        query = (
-            f'SELECT asset, SUM(CAST(amount AS REAL)), SUM(CAST(usd_value AS REAL)) '
-            f'FROM history_events {query_filters}'
-            f' GROUP BY asset;'
+        write_cursor.executemany(
+            'INSERT INTO history_events_value_stats(asset, type, subtype, location, '
+            'entry_type, timestamp, amount, usd_value) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            [(*key, str(amount), str(usd_value)) for key, (amount, usd_value) in totals.items()],
         )
-        cursor.execute(query, bindings)
-        assets_amounts = []
-        for row in cursor:
+
+    def _sum_event_values(
+            self,
+            cursor: 'DBCursor',
+            conditions: list[str],
+            bindings: list[Any],
+            from_ms: int | None,
+            to_ms: int | None,
+            totals: dict[str, list[FVal]],
+    ) -> None:
+        """Adds the values of the events in the inclusive range that match the conditions
+        to the totals per asset"""
+        conditions, bindings = conditions.copy(), bindings.copy()
+        if from_ms is not None:
+            conditions.append('timestamp >= ?')
+            bindings.append(from_ms)
+        if to_ms is not None:
+            conditions.append('timestamp <= ?')
+            bindings.append(to_ms)
+        self._sum_values(
+            cursor=cursor,
+            query='SELECT asset, amount, usd_value FROM history_events' + (
+                f' WHERE {" AND ".join(conditions)}' if len(conditions) != 0 else ''
+            ),
+            bindings=bindings,
+            totals=totals,
+        )
+
+    @staticmethod
+    def _sum_values(
+            cursor: 'DBCursor',
+            query: str,
+            bindings: Sequence[Any],
+            totals: dict[str, list[FVal]],
+    ) -> None:
+        """Adds the (asset, amount, usd_value) rows of the query to the totals per asset"""
+        for asset, raw_amount, raw_usd_value in cursor.execute(query, bindings):
             try:
-                asset = row[0]  # existence is guaranteed due the foreign key relation
                 amount = deserialize_fval(
-                    value=row[1],
-                    name='total amount in history events stats',
+                    value=raw_amount,
+                    name='amount in history events stats',
                     location='get_value_stats',
                 )
-                sum_of_usd_values = deserialize_fval(
-                    value=row[2],
-                    name='total usd value in history events stats',
+                usd_value = deserialize_fval(
+                    value=raw_usd_value,
+                    name='usd value in history events stats',
                     location='get_value_stats',
                 )
-                assets_amounts.append((asset, amount, sum_of_usd_values))
             except DeserializationError as e:
-                log.debug(f'Failed to deserialize amount {row[1]}. {e!s}')
-        return usd_value, assets_amounts
+                log.error(f'Didnt get correct valid values for history_events stats. {e!s}')
+                continue
+
+            if (asset_totals := totals.get(asset)) is None:
+                totals[asset] = [amount, usd_value]
+            else:
+                asset_totals[0] += amount
+                asset_totals[1] += usd_value
+
+    @staticmethod
+    def _process_value_totals(
+            totals: dict[str, list[FVal]],
+    ) -> tuple[FVal, list[tuple[str, FVal, FVal]]]:
+        """Turns the totals per asset to the total usd value and the sorted assets amounts"""
+        assets_amounts = [(asset, amount, usd_value) for asset, (amount, usd_value) in sorted(totals.items())]  # noqa: E501
+        return sum((x[2] for x in assets_amounts), start=ZERO), assets_amounts
 
     def get_hidden_event_ids(self, cursor: 'DBCursor') -> list[int]:
         """Returns all event identifiers that should be hidden in the UI
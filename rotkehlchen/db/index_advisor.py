@@ -0,0 +1,106 @@
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from rotkehlchen.logging import RotkehlchenLogsAdapter
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from rotkehlchen.db.drivers.gevent import DBCursor
+
+logger = logging.getLogger(__name__)
+log = RotkehlchenLogsAdapter(logger)
+
+# Max number of different filter shapes whose stats are kept
+MAX_FILTER_SHAPES = 200
+# A query plan step that reads all the rows of a table, either directly or in the order of
+# an index. Index lookups are SEARCH steps and scans of subqueries have parentheses.
+FULL_SCAN_RE = re.compile(r'^SCAN (\w+)(?: AS \w+)?(?: USING (?:COVERING )?INDEX \w+)?$')
+PLACEHOLDERS_RE = re.compile(r'\?(?:\s*,\s*\?)+')
+
+
+@dataclass(init=True, repr=True, eq=True, order=False, unsafe_hash=False, frozen=False)
+class FilterShapeStats:
+    """Stats of all the queries that differ only in their bindings"""
+    query: str
+    full_scans: list[str]
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    plan: list[str] = field(default_factory=list)
+
+    def serialize(self) -> dict[str, Any]:
+        return {
+            'query': self.query,
+            'full_scans': self.full_scans,
+            'count': self.count,
+            'total_seconds': round(self.total_seconds, 4),
+            'max_seconds': round(self.max_seconds, 4),
+        }
+
+
+class IndexAdvisor:
+    """Debug only helper that checks with EXPLAIN QUERY PLAN how the DB runs the queries
+    built from the DB filters. It flags the ones that need a full table scan and keeps
+    the timings of each filter shape so we can tell when a new filter needs an index."""
+
+    def __init__(self) -> None:
+        self.shapes: dict[str, FilterShapeStats] = {}
+
+    @staticmethod
+    def query_shape(query: str) -> str:
+        """The query with normalized whitespace and with any list of placeholders, as
+        created for IN clauses with a different number of values, collapsed to one"""
+        return PLACEHOLDERS_RE.sub('?', ' '.join(query.split()))
+
+    @staticmethod
+    def explain(cursor: 'DBCursor', query: str, bindings: 'Sequence[Any]') -> list[str]:
+        """Returns the detail of each step of the query plan"""
+        return [row[3] for row in cursor.execute(f'EXPLAIN QUERY PLAN {query}', bindings)]
+
+    def record(
+            self,
+            cursor: 'DBCursor',
+            query: str,
+            bindings: 'Sequence[Any]',
+            duration: float,
+    ) -> None:
+        """Records how long a query took. The first time a filter shape is seen its query
+        plan is checked for full table scans. The cursor should not be iterated at the
+        moment since it's used to run the EXPLAIN QUERY PLAN."""
+        shape = self.query_shape(query)
+        if (stats := self.shapes.get(shape)) is None:
+            if len(self.shapes) >= MAX_FILTER_SHAPES:
+                return
+
+            plan = self.explain(cursor=cursor, query=query, bindings=bindings)
+            full_scans = [
+                match.group(1) for step in plan if (match := FULL_SCAN_RE.match(step)) is not None
+            ]
+            stats = self.shapes[shape] = FilterShapeStats(
+                query=shape,
+                full_scans=full_scans,
+                plan=plan,
+            )
+            if len(full_scans) != 0:
+                log.warning(
+                    f'Filter query does a full scan of {",".join(full_scans)}. '
+                    f'It may need an index. Query: {shape}. Plan: {plan}',
+                )
+
+        stats.count += 1
+        stats.total_seconds += duration
+        stats.max_seconds = max(stats.max_seconds, duration)
+
+    def slowest(self, limit: int = 10) -> list[FilterShapeStats]:
+        """The filter shapes that took the longest in a single query"""
+        return sorted(self.shapes.values(), key=lambda x: x.max_seconds, reverse=True)[:limit]
+
+    def log_slowest(self, limit: int = 10) -> None:
+        for stats in self.slowest(limit):
+            log.debug(f'Slow filter query shape: {stats.serialize()}')
+
+
+INDEX_ADVISOR = IndexAdvisor()
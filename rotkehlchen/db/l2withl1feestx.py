@@ -54,6 +54,10 @@ class DBL2WithL1FeesTx(DBEvmTx):
             [FREE_ETH_TX_LIMIT] + bindings,
         )
 
+    def _has_all_transaction_data(self, result: tuple[Any, ...]) -> bool:
+        """The l1 fee also needs to be in the DB. Otherwise it has to be pulled first"""
+        return result[12] is not None
+
     def _build_evm_transaction(self, result: tuple[Any, ...]) -> L2WithL1FeesTransaction:
         return L2WithL1FeesTransaction(
             tx_hash=deserialize_evm_tx_hash(result[0]),
@@ -7,6 +7,7 @@ MINIMIZED_USER_DB_SCHEMA = {
     "assets": "identifiertextnotnullprimarykey",
     "timed_balances": "categorychar(1)notnulldefault('a')referencesbalance_category(category),timestampinteger,currencytext,amounttext,usd_valuetext,foreignkey(currency)referencesassets(identifier)onupdatecascade,primarykey(timestamp,currency,category)",
     "timed_location_data": "timestampinteger,locationchar(1)notnulldefault('a')referenceslocation(location),usd_valuetext,primarykey(timestamp,location)",
+    "balances_query_durations": "timestampintegernotnull,sourcetextnotnull,secondsrealnotnull,primarykey(timestamp,source)",
     "user_credentials": "nametextnotnull,locationchar(1)notnulldefault('a')referenceslocation(location),api_keytext,api_secrettext,passphrasetext,primarykey(name,location)",
     "user_credentials_mappings": "credential_nametextnotnull,credential_locationchar(1)notnulldefault('a')referenceslocation(location),setting_nametextnotnull,setting_valuetextnotnull,foreignkey(credential_name,credential_location)referencesuser_credentials(name,location)ondeletecascadeonupdatecascade,primarykey(credential_name,credential_location,setting_name)",
     "external_service_credentials": "namevarchar[30]notnullprimarykey,api_keytextnotnull,api_secrettext",
@@ -33,12 +34,17 @@ MINIMIZED_USER_DB_SCHEMA = {
     "tag_mappings": "object_referencetext,tag_nametext,foreignkey(tag_name)referencestags(name)primarykey(object_reference,tag_name)",
     "xpubs": "xpubtextnotnull,derivation_pathtextnotnull,labeltext,blockchaintextnotnull,primarykey(xpub,derivation_path,blockchain)",
     "xpub_mappings": "addresstextnotnull,xpubtextnotnull,derivation_pathtextnotnull,account_indexinteger,derived_indexinteger,blockchaintextnotnull,foreignkey(blockchain,address)referencesblockchain_accounts(blockchain,account)ondeletecascadeforeignkey(xpub,derivation_path,blockchain)referencesxpubs(xpub,derivation_path,blockchain)ondeletecascadeprimarykey(address,xpub,derivation_path,blockchain)",
+    "xpub_derived_addresses": "xpubtextnotnull,derivation_pathtextnotnull,blockchaintextnotnull,account_indexintegernotnull,derived_indexintegernotnull,addresstextnotnull,foreignkey(xpub,derivation_path,blockchain)referencesxpubs(xpub,derivation_path,blockchain)ondeletecascade,primarykey(xpub,derivation_path,blockchain,account_index,derived_index)",
     "eth2_validators": "identifierintegernotnullprimarykey,validator_indexintegerunique,public_keytextnotnullunique,ownership_proportiontextnotnull,withdrawal_addresstext,activation_timestampinteger,withdrawable_timestampinteger,exited_timestampinteger",
     "eth2_daily_staking_details": "validator_indexintegernotnull,timestampintegernotnull,pnltextnotnull,foreignkey(validator_index)referenceseth2_validators(validator_index)onupdatecascadeondeletecascade,primarykey(validator_index,timestamp)",
     "history_events": "identifierintegernotnullprimarykey,entry_typeintegernotnull,event_identifiertextnotnull,sequence_indexintegernotnull,timestampintegernotnull,locationchar(1)notnulldefault('a')referenceslocation(location),location_labeltext,assettextnotnull,amounttextnotnull,usd_valuetextnotnull,notestext,typetextnotnull,subtypetextnotnull,extra_datatext,foreignkey(asset)referencesassets(identifier)onupdatecascade,unique(event_identifier,sequence_index)",
     "evm_events_info": "identifierintegerprimarykey,tx_hashblobnotnull,counterpartytext,producttext,addresstext,foreignkey(identifier)referenceshistory_events(identifier)onupdatecascadeondeletecascade",
     "eth_staking_events_info": "identifierintegerprimarykey,validator_indexintegernotnull,is_exit_or_blocknumberintegernotnull,foreignkey(identifier)referenceshistory_events(identifier)onupdatecascadeondeletecascade",
     "history_events_mappings": "parent_identifierintegernotnull,nametextnotnull,valueintegernotnull,foreignkey(parent_identifier)referenceshistory_events(identifier)onupdatecascadeondeletecascade,primarykey(parent_identifier,name,value)",
+    "history_events_value_stats": "assettextnotnull,typetextnotnull,subtypetextnotnull,locationchar(1)notnull,entry_typeintegernotnull,timestampintegernotnull,amounttextnotnull,usd_valuetextnotnull,primarykey(asset,type,subtype,location,entry_type,timestamp)",
+    "history_events_value_stats_dirty": "timestampintegernotnullprimarykey",
+    "eth2_validators_daily_performance": "validator_indexintegernotnull,timestampintegernotnull,location_labeltextnotnull,withdrawalstextnotnull,exitstextnotnull,executiontextnotnull,primarykey(validator_index,timestamp,location_label)",
+    "eth2_validators_daily_performance_dirty": "validator_indexintegernotnull,timestampintegernotnull,primarykey(validator_index,timestamp)",
     "action_type": "typechar(1)primarykeynotnull,seqintegerunique",
     "ignored_actions": "typechar(1)notnulldefault('a')referencesaction_type(type),identifiertext,primarykey(type,identifier)",
     "nfts": "identifiertextnotnullprimarykey,nametext,last_pricetextnotnull,last_price_assettextnotnull,manual_priceintegernotnullcheck(manual_pricein(0,1)),owner_addresstext,blockchaintextgeneratedalwaysas('eth')virtual,is_lpintegernotnullcheck(is_lpin(0,1)),image_urltext,collection_nametext,usd_pricerealnotnulldefault0,foreignkey(blockchain,owner_address)referencesblockchain_accounts(blockchain,account)ondeletecascade,foreignkey(identifier)referencesassets(identifier)onupdatecascade,foreignkey(last_price_asset)referencesassets(identifier)onupdatecascade",
@@ -1,7 +1,7 @@
 import logging
 from collections.abc import Callable
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, Literal, overload
+from typing import TYPE_CHECKING, Any, Final, Literal, overload
 
 from pysqlcipher3 import dbapi2 as sqlcipher
 
@@ -22,6 +22,9 @@ if TYPE_CHECKING:
     from rotkehlchen.db.dbhandler import DBHandler
     from rotkehlchen.db.filtering import ReportDataFilterQuery
 
+# How many processed events to buffer in memory before writing them to the transient DB
+PNL_EVENTS_PER_DB_WRITE: Final = 1000
+
 
 @overload
 def _get_reports_or_events_maybe_limit(
@@ -111,6 +114,7 @@ class DBAccountingReports:
             processed_actions: int,
             total_actions: int,
             pnls: PnlTotals,
+            events_db_writes: int = 0,
     ) -> None:
         """Inserts the report overview data
 
@@ -120,8 +124,8 @@ class DBAccountingReports:
         with self.db.transient_write() as cursor:
             cursor.execute(
                 'UPDATE pnl_reports SET last_processed_timestamp=?,'
-                ' processed_actions=?, total_actions=? WHERE identifier=?',
-                (last_processed_timestamp, processed_actions, total_actions, report_id),
+                ' processed_actions=?, total_actions=?, events_db_writes=? WHERE identifier=?',
+                (last_processed_timestamp, processed_actions, total_actions, events_db_writes, report_id),  # noqa: E501
             )
             if cursor.rowcount != 1:
                 raise InputError(
@@ -184,6 +188,7 @@ class DBAccountingReports:
                         'last_processed_timestamp': report[5],
                         'processed_actions': report[6],
                         'total_actions': report[7],
+                        'events_db_writes': report[8],
                         'overview': overview,
                         'settings': settings,
                     })
@@ -216,16 +221,14 @@ class DBAccountingReports:
     def add_report_data(
             self,
             report_id: int,
-            time: Timestamp,
-            ts_converter: Callable[[Timestamp], str],
-            event: ProcessedAccountingEvent,
+            entries: list[tuple[Timestamp, str]],
     ) -> None:
-        """Adds a new entry to a transient report for the PnL history in a given time range
+        """Adds a batch of serialized events to a transient report for the PnL history.
+        Each entry is a tuple of the event's timestamp and its serialized db data.
+
         May raise:
-        - DeserializationError if there is a conflict at serialization of the event
-        - InputError if the event can not be written to the DB. Probably report id does not exist.
+        - InputError if the events can not be written to the DB. Probably report id does not exist.
         """
-        data = event.serialize_for_db(ts_converter)
         query = """
         INSERT INTO pnl_events(
             report_id, timestamp, data
@@ -233,10 +236,10 @@ class DBAccountingReports:
         VALUES(?, ?, ?);"""
         with self.db.transient_write() as cursor:
             try:
-                cursor.execute(query, (report_id, time, data))
+                cursor.executemany(query, [(report_id, time, data) for time, data in entries])
             except sqlcipher.IntegrityError as e:  # pylint: disable=no-member
                 raise InputError(
-                    f'Could not write {event} data to the DB due to {e!s}. '
+                    f'Could not write {len(entries)} events to the DB due to {e!s}. '
                     f'Probably report {report_id} does not exist?',
                 ) from e
 
@@ -294,3 +297,47 @@ class DBAccountingReports:
             entries=records,
             with_limit=with_limit,
         )
+
+
+class DBReportDataWriter:
+    """Buffers the processed events of a PnL report in memory and writes them
+    to the transient DB in batches, so that we don't open one write transaction per event"""
+
+    def __init__(
+            self,
+            database: 'DBHandler',
+            report_id: int,
+            ts_converter: Callable[[Timestamp], str],
+            batch_size: int = PNL_EVENTS_PER_DB_WRITE,
+    ) -> None:
+        self.dbpnl = DBAccountingReports(database)
+        self.report_id = report_id
+        self.ts_converter = ts_converter
+        self.batch_size = batch_size
+        self.pending: list[tuple[Timestamp, str]] = []
+        self.flushes = 0  # number of batches written to the DB
+
+    def add(self, event: ProcessedAccountingEvent) -> None:
+        """Serializes the event and buffers it. Flushes if the buffer is full
+
+        May raise:
+        - DeserializationError if there is a conflict at serialization of the event
+        """
+        self.pending.append((event.timestamp, event.serialize_for_db(self.ts_converter)))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes all the buffered events to the DB. Errors are logged and the
+        events of the failed batch are dropped, same as if they failed one by one"""
+        if len(self.pending) == 0:
+            return
+
+        entries, self.pending = self.pending, []
+        try:
+            self.dbpnl.add_report_data(report_id=self.report_id, entries=entries)
+        except InputError as e:
+            log.error(str(e))
+            return
+
+        self.flushes += 1
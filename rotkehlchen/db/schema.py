@@ -189,6 +189,17 @@ CREATE TABLE IF NOT EXISTS timed_location_data (
 );
 """
 
+# Seconds each source of a balance snapshot (an exchange, blockchain, loopring or nfts)
+# took to be queried. timestamp is the one of the snapshot.
+DB_CREATE_BALANCES_QUERY_DURATIONS = """
+CREATE TABLE IF NOT EXISTS balances_query_durations (
+    timestamp INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    PRIMARY KEY (timestamp, source)
+);
+"""
+
 DB_CREATE_USER_CREDENTIALS = """
 CREATE TABLE IF NOT EXISTS user_credentials (
     name TEXT NOT NULL,
@@ -265,6 +276,25 @@ CREATE TABLE IF NOT EXISTS xpub_mappings (
 );
 """
 
+# Addresses derived from the tracked xpubs, including the ones that have no transactions
+# and are not tracked, so that checking an xpub for new addresses does not derive them again
+DB_CREATE_XPUB_DERIVED_ADDRESSES = """
+CREATE TABLE IF NOT EXISTS xpub_derived_addresses (
+    xpub TEXT NOT NULL,
+    derivation_path TEXT NOT NULL,
+    blockchain TEXT NOT NULL,
+    account_index INTEGER NOT NULL,
+    derived_index INTEGER NOT NULL,
+    address TEXT NOT NULL,
+    FOREIGN KEY(xpub, derivation_path, blockchain) REFERENCES xpubs(
+        xpub,
+        derivation_path,
+        blockchain
+    ) ON DELETE CASCADE,
+    PRIMARY KEY (xpub, derivation_path, blockchain, account_index, derived_index)
+);
+"""
+
 
 # Store information about the tokens queried for each combination of account and blockchain.
 # The table is designed to have a key-value structure where we use the key `token` to
@@ -606,6 +636,94 @@ CREATE TABLE IF NOT EXISTS history_events_mappings (
 );
 """  # noqa: E501
 
+# Exact daily totals of the amount and usd_value of history events per asset, type,
+# subtype, location and entry type. timestamp is the start of the day in milliseconds.
+# The triggers mark the days that any write to history_events touched as dirty and the
+# totals of the dirty days are recomputed by DBHistoryEvents.refresh_value_stats
+DB_CREATE_HISTORY_EVENTS_VALUE_STATS = """
+CREATE TABLE IF NOT EXISTS history_events_value_stats (
+    asset TEXT NOT NULL,
+    type TEXT NOT NULL,
+    subtype TEXT NOT NULL,
+    location CHAR(1) NOT NULL,
+    entry_type INTEGER NOT NULL,
+    timestamp INTEGER NOT NULL,
+    amount TEXT NOT NULL,
+    usd_value TEXT NOT NULL,
+    PRIMARY KEY (asset, type, subtype, location, entry_type, timestamp)
+);
+CREATE TABLE IF NOT EXISTS history_events_value_stats_dirty (
+    timestamp INTEGER NOT NULL PRIMARY KEY
+);
+CREATE TRIGGER IF NOT EXISTS history_events_value_stats_insert AFTER INSERT ON history_events
+BEGIN
+    INSERT OR IGNORE INTO history_events_value_stats_dirty(timestamp) VALUES (NEW.timestamp - NEW.timestamp % 86400000);
+END;
+CREATE TRIGGER IF NOT EXISTS history_events_value_stats_delete AFTER DELETE ON history_events
+BEGIN
+    INSERT OR IGNORE INTO history_events_value_stats_dirty(timestamp) VALUES (OLD.timestamp - OLD.timestamp % 86400000);
+END;
+CREATE TRIGGER IF NOT EXISTS history_events_value_stats_update AFTER UPDATE OF entry_type, timestamp, location, asset, amount, usd_value, type, subtype ON history_events
+BEGIN
+    INSERT OR IGNORE INTO history_events_value_stats_dirty(timestamp) VALUES (OLD.timestamp - OLD.timestamp % 86400000), (NEW.timestamp - NEW.timestamp % 86400000);
+END;
+"""  # noqa: E501
+
+# Exact daily totals of the partial withdrawals, exits and execution layer rewards of each
+# validator per location label, which is the withdrawal address or the fee recipient.
+# timestamp is the start of the day in milliseconds and exits hold the exited amount minus 32.
+# The triggers mark the validator days that any write to the staking events touched as dirty
+# and the totals of the dirty validator days are recomputed by DBEth2.refresh_daily_performance
+# in a background task. Until then they are summed from the staking events when read.
+DB_CREATE_ETH2_VALIDATORS_DAILY_PERFORMANCE = """
+CREATE TABLE IF NOT EXISTS eth2_validators_daily_performance (
+    validator_index INTEGER NOT NULL,
+    timestamp INTEGER NOT NULL,
+    location_label TEXT NOT NULL,
+    withdrawals TEXT NOT NULL,
+    exits TEXT NOT NULL,
+    execution TEXT NOT NULL,
+    PRIMARY KEY (validator_index, timestamp, location_label)
+);
+CREATE TABLE IF NOT EXISTS eth2_validators_daily_performance_dirty (
+    validator_index INTEGER NOT NULL,
+    timestamp INTEGER NOT NULL,
+    PRIMARY KEY (validator_index, timestamp)
+);
+CREATE TRIGGER IF NOT EXISTS eth2_validators_daily_performance_staking_insert AFTER INSERT ON eth_staking_events_info
+BEGIN
+    INSERT OR IGNORE INTO eth2_validators_daily_performance_dirty(validator_index, timestamp) SELECT NEW.validator_index, timestamp - timestamp % 86400000 FROM history_events WHERE identifier=NEW.identifier;
+END;
+CREATE TRIGGER IF NOT EXISTS eth2_validators_daily_performance_staking_delete AFTER DELETE ON eth_staking_events_info
+BEGIN
+    INSERT OR IGNORE INTO eth2_validators_daily_performance_dirty(validator_index, timestamp) SELECT OLD.validator_index, timestamp - timestamp % 86400000 FROM history_events WHERE identifier=OLD.identifier;
+END;
+CREATE TRIGGER IF NOT EXISTS eth2_validators_daily_performance_staking_update AFTER UPDATE OF validator_index, is_exit_or_blocknumber ON eth_staking_events_info
+BEGIN
+    INSERT OR IGNORE INTO eth2_validators_daily_performance_dirty(validator_index, timestamp) SELECT OLD.validator_index, timestamp - timestamp % 86400000 FROM history_events WHERE identifier=OLD.identifier UNION SELECT NEW.validator_index, timestamp - timestamp % 86400000 FROM history_events WHERE identifier=NEW.identifier;
+END;
+CREATE TRIGGER IF NOT EXISTS eth2_validators_daily_performance_event_delete BEFORE DELETE ON history_events
+BEGIN
+    INSERT OR IGNORE INTO eth2_validators_daily_performance_dirty(validator_index, timestamp) SELECT validator_index, OLD.timestamp - OLD.timestamp % 86400000 FROM eth_staking_events_info WHERE identifier=OLD.identifier;
+END;
+CREATE TRIGGER IF NOT EXISTS eth2_validators_daily_performance_event_update AFTER UPDATE OF entry_type, timestamp, location_label, amount, type, subtype ON history_events
+BEGIN
+    INSERT OR IGNORE INTO eth2_validators_daily_performance_dirty(validator_index, timestamp) SELECT validator_index, OLD.timestamp - OLD.timestamp % 86400000 FROM eth_staking_events_info WHERE identifier=OLD.identifier UNION SELECT validator_index, NEW.timestamp - NEW.timestamp % 86400000 FROM eth_staking_events_info WHERE identifier=NEW.identifier;
+END;
+"""  # noqa: E501
+
+# Triggers of the user DB. The sanity check rejects any other trigger.
+DB_TRIGGERS = {
+    'history_events_value_stats_insert',
+    'history_events_value_stats_delete',
+    'history_events_value_stats_update',
+    'eth2_validators_daily_performance_staking_insert',
+    'eth2_validators_daily_performance_staking_delete',
+    'eth2_validators_daily_performance_staking_update',
+    'eth2_validators_daily_performance_event_delete',
+    'eth2_validators_daily_performance_event_update',
+}
+
 
 # usd_price is a column of the table because we sort by price in the fiat currency and that price
 # needs to be calculated from last_price and the price of last_price_asset. If we don't sort using
@@ -764,6 +882,20 @@ CREATE TABLE IF NOT EXISTS gnosispay_data (
 """
 
 
+# Secondary indexes for the columns that the history events and evm transactions
+# filters of rotkehlchen/db/filtering.py filter and order by
+DB_CREATE_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_history_events_timestamp ON history_events(timestamp, sequence_index);
+CREATE INDEX IF NOT EXISTS idx_history_events_location ON history_events(location, timestamp);
+CREATE INDEX IF NOT EXISTS idx_history_events_asset ON history_events(asset, timestamp);
+CREATE INDEX IF NOT EXISTS idx_history_events_type ON history_events(type, subtype);
+CREATE INDEX IF NOT EXISTS idx_history_events_location_label ON history_events(location_label);
+CREATE INDEX IF NOT EXISTS idx_evm_events_info_tx_hash ON evm_events_info(tx_hash);
+CREATE INDEX IF NOT EXISTS idx_evm_events_info_counterparty ON evm_events_info(counterparty);
+CREATE INDEX IF NOT EXISTS idx_evm_transactions_timestamp ON evm_transactions(chain_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_evmtx_address_mappings_address ON evmtx_address_mappings(address);
+"""  # noqa: E501
+
 DB_SCRIPT_CREATE_TABLES = f"""
 PRAGMA foreign_keys=off;
 BEGIN TRANSACTION;
@@ -773,6 +905,7 @@ BEGIN TRANSACTION;
 {DB_CREATE_ASSETS}
 {DB_CREATE_TIMED_BALANCES}
 {DB_CREATE_TIMED_LOCATION_DATA}
+{DB_CREATE_BALANCES_QUERY_DURATIONS}
 {DB_CREATE_USER_CREDENTIALS}
 {DB_CREATE_USER_CREDENTIALS_MAPPINGS}
 {DB_CREATE_EXTERNAL_SERVICE_CREDENTIALS}
@@ -799,12 +932,15 @@ BEGIN TRANSACTION;
 {DB_CREATE_TAG_MAPPINGS}
 {DB_CREATE_XPUBS}
 {DB_CREATE_XPUB_MAPPINGS}
+{DB_CREATE_XPUB_DERIVED_ADDRESSES}
 {DB_CREATE_ETH2_VALIDATORS}
 {DB_CREATE_ETH2_DAILY_STAKING_DETAILS}
 {DB_CREATE_HISTORY_EVENTS}
 {DB_CREATE_EVM_EVENTS_INFO}
 {DB_CREATE_ETH_STAKING_EVENTS_INFO}
 {DB_CREATE_HISTORY_EVENTS_MAPPINGS}
+{DB_CREATE_HISTORY_EVENTS_VALUE_STATS}
+{DB_CREATE_ETH2_VALIDATORS_DAILY_PERFORMANCE}
 {DB_CREATE_ACTION_TYPE}
 {DB_CREATE_IGNORED_ACTIONS}
 {DB_CREATE_NFTS}
@@ -821,6 +957,7 @@ BEGIN TRANSACTION;
 {DB_CREATE_CALENDAR_REMINDERS}
 {DB_CREATE_COWSWAP_ORDERS}
 {DB_CREATE_GNOSISPAY_DATA}
+{DB_CREATE_INDEXES}
 COMMIT;
 PRAGMA foreign_keys=on;
 """
@@ -10,7 +10,8 @@ CREATE TABLE IF NOT EXISTS pnl_reports (
     first_processed_timestamp INTEGER,
     last_processed_timestamp INTEGER NOT NULL,
     processed_actions INTEGER NOT NULL,
-    total_actions INTEGER NOT NULL
+    total_actions INTEGER NOT NULL,
+    events_db_writes INTEGER NOT NULL DEFAULT 0
 );
 """
 
@@ -45,6 +46,7 @@ CREATE TABLE IF NOT EXISTS pnl_events (
     data TEXT NOT NULL,
     FOREIGN KEY (report_id) REFERENCES pnl_reports(identifier) ON DELETE CASCADE ON UPDATE CASCADE
 );
+CREATE INDEX IF NOT EXISTS idx_pnl_events_report_timestamp ON pnl_events(report_id, timestamp);
 """
 
 DB_CREATE_SETTINGS = """
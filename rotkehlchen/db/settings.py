@@ -28,8 +28,8 @@ from rotkehlchen.types import (
 if TYPE_CHECKING:
     from rotkehlchen.user_messages import MessagesAggregator
 
-ROTKEHLCHEN_DB_VERSION = 46
-ROTKEHLCHEN_TRANSIENT_DB_VERSION = 1
+ROTKEHLCHEN_DB_VERSION = 47
+ROTKEHLCHEN_TRANSIENT_DB_VERSION = 2
 DEFAULT_TAXFREE_AFTER_PERIOD = YEAR_IN_SECONDS
 DEFAULT_INCLUDE_CRYPTO2CRYPTO = True
 DEFAULT_INCLUDE_GAS_COSTS = True
@@ -272,6 +272,7 @@ class DBSnapshot:
         write_cursor.execute('DELETE FROM timed_location_data WHERE timestamp=?', (timestamp,))
         if write_cursor.rowcount == 0:
             raise InputError('No snapshot found for the specified timestamp')
+        write_cursor.execute('DELETE FROM balances_query_durations WHERE timestamp=?', (timestamp,))  # noqa: E501
 
     def add_nft_asset_ids(self, write_cursor: 'DBCursor', entries: list[str]) -> None:
         """Add NFT identifiers to the DB to prevent unknown asset error."""
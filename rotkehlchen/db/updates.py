@@ -481,3 +481,4 @@ class RotkiDataUpdater:
                 'VALUES(?, ?, ?, ?, ?, ?)',
                 nodes_to_add,
             )
+        self.user_db.invalidate_rpc_nodes()
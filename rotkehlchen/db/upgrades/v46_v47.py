@@ -0,0 +1,180 @@
+import logging
+from typing import TYPE_CHECKING
+
+from rotkehlchen.logging import RotkehlchenLogsAdapter, enter_exit_debug_log
+from rotkehlchen.utils.progress import perform_userdb_upgrade_steps, progress_step
+
+if TYPE_CHECKING:
+    from rotkehlchen.db.dbhandler import DBHandler
+    from rotkehlchen.db.drivers.gevent import DBCursor
+    from rotkehlchen.db.upgrade_manager import DBUpgradeProgressHandler
+
+logger = logging.getLogger(__name__)
+log = RotkehlchenLogsAdapter(logger)
+
+
+@enter_exit_debug_log(name='UserDB v46->v47 upgrade')
+def upgrade_v46_to_v47(db: 'DBHandler', progress_handler: 'DBUpgradeProgressHandler') -> None:
+    """Upgrades the DB from v46 to v47. This was in v1.38 release.
+
+    - Add secondary indexes for the history events and evm transactions filters
+    - Add the daily value stats of history events, maintained by triggers
+    - Add the table of the query durations of balance snapshots
+    - Add the cache of the addresses derived from xpubs
+    - Add the daily performance of the eth2 validators, maintained by triggers
+    """
+    @progress_step(description='Adding indexes for history events and transactions.')
+    def _add_indexes(write_cursor: 'DBCursor') -> None:
+        for index_statement in (
+            'CREATE INDEX IF NOT EXISTS idx_history_events_timestamp ON history_events(timestamp, sequence_index);',  # noqa: E501
+            'CREATE INDEX IF NOT EXISTS idx_history_events_location ON history_events(location, timestamp);',  # noqa: E501
+            'CREATE INDEX IF NOT EXISTS idx_history_events_asset ON history_events(asset, timestamp);',  # noqa: E501
+            'CREATE INDEX IF NOT EXISTS idx_history_events_type ON history_events(type, subtype);',
+            'CREATE INDEX IF NOT EXISTS idx_history_events_location_label ON history_events(location_label);',  # noqa: E501
+            'CREATE INDEX IF NOT EXISTS idx_evm_events_info_tx_hash ON evm_events_info(tx_hash);',
+            'CREATE INDEX IF NOT EXISTS idx_evm_events_info_counterparty ON evm_events_info(counterparty);',  # noqa: E501
+            'CREATE INDEX IF NOT EXISTS idx_evm_transactions_timestamp ON evm_transactions(chain_id, timestamp);',  # noqa: E501
+            'CREATE INDEX IF NOT EXISTS idx_evmtx_address_mappings_address ON evmtx_address_mappings(address);',  # noqa: E501
+        ):  # executed one by one since executescript would commit the upgrade's transaction
+            write_cursor.execute(index_statement)
+
+    @progress_step(description='Adding the history events value stats.')
+    def _add_history_events_value_stats(write_cursor: 'DBCursor') -> None:
+        write_cursor.execute("""
+        CREATE TABLE IF NOT EXISTS history_events_value_stats (
+            asset TEXT NOT NULL,
+            type TEXT NOT NULL,
+            subtype TEXT NOT NULL,
+            location CHAR(1) NOT NULL,
+            entry_type INTEGER NOT NULL,
+            timestamp INTEGER NOT NULL,
+            amount TEXT NOT NULL,
+            usd_value TEXT NOT NULL,
+            PRIMARY KEY (asset, type, subtype, location, entry_type, timestamp)
+        );
+        """)
+        write_cursor.execute("""
+        CREATE TABLE IF NOT EXISTS history_events_value_stats_dirty (
+            timestamp INTEGER NOT NULL PRIMARY KEY
+        );
+        """)
+        write_cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS history_events_value_stats_insert AFTER INSERT ON history_events
+        BEGIN
+            INSERT OR IGNORE INTO history_events_value_stats_dirty(timestamp) VALUES (NEW.timestamp - NEW.timestamp % 86400000);
+        END;
+        """)  # noqa: E501
+        write_cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS history_events_value_stats_delete AFTER DELETE ON history_events
+        BEGIN
+            INSERT OR IGNORE INTO history_events_value_stats_dirty(timestamp) VALUES (OLD.timestamp - OLD.timestamp % 86400000);
+        END;
+        """)  # noqa: E501
+        write_cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS history_events_value_stats_update AFTER UPDATE OF entry_type, timestamp, location, asset, amount, usd_value, type, subtype ON history_events
+        BEGIN
+            INSERT OR IGNORE INTO history_events_value_stats_dirty(timestamp) VALUES (OLD.timestamp - OLD.timestamp % 86400000), (NEW.timestamp - NEW.timestamp % 86400000);
+        END;
+        """)  # noqa: E501
+        # mark all the days with events as dirty so that their stats get computed at first use
+        write_cursor.execute(
+            'INSERT OR IGNORE INTO history_events_value_stats_dirty(timestamp) '
+            'SELECT DISTINCT timestamp - timestamp % 86400000 FROM history_events',
+        )
+
+    @progress_step(description='Adding the balances query durations.')
+    def _add_balances_query_durations(write_cursor: 'DBCursor') -> None:
+        write_cursor.execute("""
+        CREATE TABLE IF NOT EXISTS balances_query_durations (
+            timestamp INTEGER NOT NULL,
+            source TEXT NOT NULL,
+            seconds REAL NOT NULL,
+            PRIMARY KEY (timestamp, source)
+        );
+        """)
+
+    @progress_step(description='Adding the cache of xpub derived addresses.')
+    def _add_xpub_derived_addresses(write_cursor: 'DBCursor') -> None:
+        write_cursor.execute("""
+        CREATE TABLE IF NOT EXISTS xpub_derived_addresses (
+            xpub TEXT NOT NULL,
+            derivation_path TEXT NOT NULL,
+            blockchain TEXT NOT NULL,
+            account_index INTEGER NOT NULL,
+            derived_index INTEGER NOT NULL,
+            address TEXT NOT NULL,
+            FOREIGN KEY(xpub, derivation_path, blockchain) REFERENCES xpubs(
+                xpub,
+                derivation_path,
+                blockchain
+            ) ON DELETE CASCADE,
+            PRIMARY KEY (xpub, derivation_path, blockchain, account_index, derived_index)
+        );
+        """)
+        # the addresses already derived from the xpubs are in the mappings
+        write_cursor.execute(
+            'INSERT OR IGNORE INTO xpub_derived_addresses'
+            '(xpub, derivation_path, blockchain, account_index, derived_index, address) '
+            'SELECT xpub, derivation_path, blockchain, account_index, derived_index, address '
+            'FROM xpub_mappings WHERE account_index IS NOT NULL AND derived_index IS NOT NULL',
+        )
+
+    @progress_step(description='Adding the daily performance of eth2 validators.')
+    def _add_eth2_validators_daily_performance(write_cursor: 'DBCursor') -> None:
+        write_cursor.execute("""
+        CREATE TABLE IF NOT EXISTS eth2_validators_daily_performance (
+            validator_index INTEGER NOT NULL,
+            timestamp INTEGER NOT NULL,
+            location_label TEXT NOT NULL,
+            withdrawals TEXT NOT NULL,
+            exits TEXT NOT NULL,
+            execution TEXT NOT NULL,
+            PRIMARY KEY (validator_index, timestamp, location_label)
+        );
+        """)
+        write_cursor.execute("""
+        CREATE TABLE IF NOT EXISTS eth2_validators_daily_performance_dirty (
+            validator_index INTEGER NOT NULL,
+            timestamp INTEGER NOT NULL,
+            PRIMARY KEY (validator_index, timestamp)
+        );
+        """)
+        write_cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS eth2_validators_daily_performance_staking_insert AFTER INSERT ON eth_staking_events_info
+        BEGIN
+            INSERT OR IGNORE INTO eth2_validators_daily_performance_dirty(validator_index, timestamp) SELECT NEW.validator_index, timestamp - timestamp % 86400000 FROM history_events WHERE identifier=NEW.identifier;
+        END;
+        """)  # noqa: E501
+        write_cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS eth2_validators_daily_performance_staking_delete AFTER DELETE ON eth_staking_events_info
+        BEGIN
+            INSERT OR IGNORE INTO eth2_validators_daily_performance_dirty(validator_index, timestamp) SELECT OLD.validator_index, timestamp - timestamp % 86400000 FROM history_events WHERE identifier=OLD.identifier;
+        END;
+        """)  # noqa: E501
+        write_cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS eth2_validators_daily_performance_staking_update AFTER UPDATE OF validator_index, is_exit_or_blocknumber ON eth_staking_events_info
+        BEGIN
+            INSERT OR IGNORE INTO eth2_validators_daily_performance_dirty(validator_index, timestamp) SELECT OLD.validator_index, timestamp - timestamp % 86400000 FROM history_events WHERE identifier=OLD.identifier UNION SELECT NEW.validator_index, timestamp - timestamp % 86400000 FROM history_events WHERE identifier=NEW.identifier;
+        END;
+        """)  # noqa: E501
+        write_cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS eth2_validators_daily_performance_event_delete BEFORE DELETE ON history_events
+        BEGIN
+            INSERT OR IGNORE INTO eth2_validators_daily_performance_dirty(validator_index, timestamp) SELECT validator_index, OLD.timestamp - OLD.timestamp % 86400000 FROM eth_staking_events_info WHERE identifier=OLD.identifier;
+        END;
+        """)  # noqa: E501
+        write_cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS eth2_validators_daily_performance_event_update AFTER UPDATE OF entry_type, timestamp, location_label, amount, type, subtype ON history_events
+        BEGIN
+            INSERT OR IGNORE INTO eth2_validators_daily_performance_dirty(validator_index, timestamp) SELECT validator_index, OLD.timestamp - OLD.timestamp % 86400000 FROM eth_staking_events_info WHERE identifier=OLD.identifier UNION SELECT validator_index, NEW.timestamp - NEW.timestamp % 86400000 FROM eth_staking_events_info WHERE identifier=NEW.identifier;
+        END;
+        """)  # noqa: E501
+        # mark all the validator days with staking events as dirty so that their
+        # performance gets computed by the background refresh task
+        write_cursor.execute(
+            'INSERT OR IGNORE INTO eth2_validators_daily_performance_dirty(validator_index, timestamp) '  # noqa: E501
+            'SELECT DISTINCT S.validator_index, E.timestamp - E.timestamp % 86400000 '
+            'FROM history_events E INNER JOIN eth_staking_events_info S ON E.identifier=S.identifier',  # noqa: E501
+        )
+
+    perform_userdb_upgrade_steps(db=db, progress_handler=progress_handler)
@@ -1,4 +1,5 @@
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal, NamedTuple, Union
 
@@ -325,6 +326,41 @@ def table_exists(cursor: 'DBCursor', name: str, schema: str | None = None) -> bo
     return exists
 
 
+# Max number of different COUNT queries whose result is kept
+MAX_CACHED_COUNTS = 128
+
+
+class DBCountCache:
+    """Keeps the result of COUNT queries so that paginating over the same filter does not
+    count all the matching rows again for every page. A result stays valid only as long as
+    no row is changed through the writer connection of the DB, which all the writes use."""
+
+    def __init__(self) -> None:
+        self.counts: dict[tuple[str, tuple[Any, ...]], tuple[int, int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def count(self, cursor: 'DBCursor', query: str, bindings: Sequence[Any] = ()) -> int:
+        """Returns the first column of the first row of the given COUNT query"""
+        key = (query, tuple(bindings))
+        changes = cursor.connection.total_changes
+        if (cached := self.counts.pop(key, None)) is not None and cached[0] == changes:
+            self.hits += 1
+            self.counts[key] = cached  # move it to the end as the most recently used
+            return cached[1]
+
+        self.misses += 1
+        result = cursor.execute(query, bindings).fetchone()[0]
+        # with a transaction open the changes may still be rolled back or not be visible
+        # to the read connections so the result can't be kept
+        if cursor.connection.in_transaction is False:
+            if len(self.counts) >= MAX_CACHED_COUNTS:
+                del self.counts[next(iter(self.counts))]
+            self.counts[key] = (changes, result)
+
+        return result
+
+
 DBTupleType = Literal[
     'trade',
     'margin_position',
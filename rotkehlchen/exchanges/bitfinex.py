@@ -15,7 +15,6 @@ import requests
 from gevent.lock import Semaphore
 from requests.adapters import Response
 
-from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.assets.converters import BITFINEX_EXCHANGE_TEST_ASSETS, asset_from_bitfinex
 from rotkehlchen.assets.utils import symbol_to_asset_or_token
 from rotkehlchen.constants import ZERO
@@ -25,6 +24,7 @@ from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.exchanges.data_structures import MarginPosition, Trade
 from rotkehlchen.exchanges.exchange import ExchangeInterface, ExchangeQueryBalances
+from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.history.deserialization import deserialize_price
 from rotkehlchen.history.events.structures.asset_movement import (
@@ -33,7 +33,6 @@ from rotkehlchen.history.events.structures.asset_movement import (
 )
 from rotkehlchen.history.events.structures.base import HistoryBaseEntry
 from rotkehlchen.history.events.structures.types import HistoryEventType
-from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_asset_amount,
@@ -905,7 +904,7 @@ class Bitfinex(ExchangeInterface):
         # Wallet items indices
         currency_index = 1
         balance_index = 2
-        assets_balance: defaultdict[AssetWithOracles, Balance] = defaultdict(Balance)
+        assets_amount: defaultdict[AssetWithOracles, FVal] = defaultdict(FVal)
         for wallet in response_list:
             if len(wallet) < API_WALLET_MIN_RESULT_LENGTH:
                 log.error(
@@ -937,15 +936,6 @@ class Bitfinex(ExchangeInterface):
                 )
                 continue
 
-            try:
-                usd_price = Inquirer.find_usd_price(asset=asset)
-            except RemoteError as e:
-                self.msg_aggregator.add_error(
-                    f'Error processing {self.name} {asset.name} balance result due to inability '
-                    f'to query USD price: {e!s}. Skipping balance result.',
-                )
-                continue
-
             try:
                 amount = deserialize_asset_amount(wallet[balance_index])
             except DeserializationError as e:
@@ -955,12 +945,9 @@ class Bitfinex(ExchangeInterface):
                 )
                 continue
 
-            assets_balance[asset] += Balance(
-                amount=amount,
-                usd_value=amount * usd_price,
-            )
+            assets_amount[asset] += amount
 
-        return dict(assets_balance), ''
+        return self._balances_from_amounts(assets_amount), ''
 
     def query_online_history_events(
             self,
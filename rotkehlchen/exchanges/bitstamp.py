@@ -23,13 +23,13 @@ from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.exchanges.data_structures import MarginPosition, Trade, TradeType
 from rotkehlchen.exchanges.exchange import ExchangeInterface, ExchangeQueryBalances
+from rotkehlchen.fval import FVal
 from rotkehlchen.history.deserialization import deserialize_price
 from rotkehlchen.history.events.structures.asset_movement import (
     AssetMovement,
     create_asset_movement_with_fee,
 )
 from rotkehlchen.history.events.structures.types import HistoryEventType
-from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_asset_amount,
@@ -178,7 +178,7 @@ class Bitstamp(ExchangeInterface):
             log.error(msg)
             raise RemoteError(msg) from e
 
-        assets_balance: dict[AssetWithOracles, Balance] = {}
+        assets_amount: dict[AssetWithOracles, FVal] = {}
         for entry, raw_amount in response_dict.items():
             if not entry.endswith('_balance'):
                 continue
@@ -212,22 +212,10 @@ class Bitstamp(ExchangeInterface):
                     details='balance query',
                 )
                 continue
-            try:
-                usd_price = Inquirer.find_usd_price(asset=asset)
-            except RemoteError as e:
-                log.error(str(e))
-                self.msg_aggregator.add_error(
-                    f'Error processing Bitstamp balance result due to inability to '
-                    f'query USD price: {e!s}. Skipping balance entry.',
-                )
-                continue
 
-            assets_balance[asset] = Balance(
-                amount=amount,
-                usd_value=amount * usd_price,
-            )
+            assets_amount[asset] = amount
 
-        return assets_balance, ''
+        return self._balances_from_amounts(assets_amount), ''
 
     def query_online_history_events(
             self,
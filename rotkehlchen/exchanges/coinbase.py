@@ -30,13 +30,13 @@ from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.exchanges.data_structures import MarginPosition, Trade
 from rotkehlchen.exchanges.exchange import ExchangeInterface, ExchangeQueryBalances
 from rotkehlchen.exchanges.utils import deserialize_asset_movement_address, get_key_if_has_val
+from rotkehlchen.fval import FVal
 from rotkehlchen.history.events.structures.asset_movement import (
     AssetMovement,
     create_asset_movement_with_fee,
 )
 from rotkehlchen.history.events.structures.base import HistoryEvent
 from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
-from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_asset_amount,
@@ -486,7 +486,7 @@ class Coinbase(ExchangeInterface):
             log.error(f'{msg_prefix} Could not reach coinbase due to {e}')
             return None, f'{msg_prefix} Check logs for more details'
 
-        returned_balances: defaultdict[AssetWithOracles, Balance] = defaultdict(Balance)
+        assets_amount: defaultdict[AssetWithOracles, FVal] = defaultdict(FVal)
         for account in resp:
             try:
                 if (balance := account.get('balance')) is None:
@@ -506,19 +506,7 @@ class Coinbase(ExchangeInterface):
                     continue
 
                 asset = asset_from_coinbase(account['balance']['currency'])
-                try:
-                    usd_price = Inquirer.find_usd_price(asset=asset)
-                except RemoteError as e:
-                    self.msg_aggregator.add_error(
-                        f'Error processing coinbase balance entry due to inability to '
-                        f'query USD price: {e!s}. Skipping balance entry',
-                    )
-                    continue
-
-                returned_balances[asset] += Balance(
-                    amount=amount,
-                    usd_value=amount * usd_price,
-                )
+                assets_amount[asset] += amount
             except UnknownAsset as e:
                 self.send_unknown_asset_message(
                     asset_identifier=e.identifier,
@@ -542,7 +530,7 @@ class Coinbase(ExchangeInterface):
                 )
                 continue
 
-        return dict(returned_balances), ''
+        return self._balances_from_amounts(assets_amount), ''
 
     @protect_with_lock()
     def _query_transactions(self) -> None:
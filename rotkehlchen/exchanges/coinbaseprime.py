@@ -20,6 +20,7 @@ from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.exchanges.data_structures import Fee, MarginPosition, Trade
 from rotkehlchen.exchanges.exchange import ExchangeInterface, ExchangeQueryBalances
+from rotkehlchen.fval import FVal
 from rotkehlchen.history.events.structures.asset_movement import (
     AssetMovement,
     create_asset_movement_with_fee,
@@ -29,7 +30,7 @@ from rotkehlchen.history.events.structures.base import (
     HistoryEventSubType,
     HistoryEventType,
 )
-from rotkehlchen.inquirer import Inquirer, Price
+from rotkehlchen.inquirer import Price
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_asset_amount,
@@ -473,7 +474,7 @@ class Coinbaseprime(ExchangeInterface):
             log.error(f'{msg_prefix} Could not reach coinbase due to {e}')
             return None, f'{msg_prefix} Check logs for more details'
 
-        returned_balances: defaultdict[AssetWithOracles, Balance] = defaultdict(Balance)
+        assets_amount: defaultdict[AssetWithOracles, FVal] = defaultdict(FVal)
         for account_id in portfolio_ids:
             try:
                 balances_query: dict[str, list[dict[str, Any]]] = self._api_query(
@@ -505,19 +506,7 @@ class Coinbaseprime(ExchangeInterface):
                         continue
 
                     asset = asset_from_coinbase(balance_entry['symbol'])
-                    try:
-                        usd_price = Inquirer.find_usd_price(asset=asset)
-                    except RemoteError as e:
-                        log.error(
-                            f'Error processing coinbase balance entry due to inability to '
-                            f'query USD price: {e!s}. Skipping balance entry',
-                        )
-                        continue
-
-                    returned_balances[asset] += Balance(
-                        amount=total_balance,
-                        usd_value=total_balance * usd_price,
-                    )
+                    assets_amount[asset] += total_balance
                 except UnknownAsset as e:
                     self.send_unknown_asset_message(
                         asset_identifier=e.identifier,
@@ -538,7 +527,7 @@ class Coinbaseprime(ExchangeInterface):
                         error=msg,
                     )
 
-        return dict(returned_balances), ''
+        return self._balances_from_amounts(assets_amount), ''
 
     def query_history_events(self) -> None:
         """Query history events from the current exchange
@@ -1,6 +1,6 @@
 import logging
 from abc import abstractmethod
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from typing import TYPE_CHECKING, Any
 
 import requests
@@ -13,6 +13,8 @@ from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.db.ranges import DBQueryRanges
 from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.exchanges.data_structures import MarginPosition, Trade
+from rotkehlchen.fval import FVal
+from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.types import (
     ApiKey,
@@ -147,6 +149,27 @@ class ExchangeInterface(CacheableMixIn, LockableQueryMixIn):
         """
         raise NotImplementedError('query_balances should only be implemented by subclasses')
 
+    def _balances_from_amounts(
+            self,
+            assets_amount: Mapping[AssetWithOracles, FVal],
+    ) -> dict[AssetWithOracles, Balance]:
+        """Values the given asset amounts with the current usd prices of all the assets,
+        queried together. The balances of assets whose usd price could not be queried
+        are skipped."""
+        usd_prices = Inquirer.find_usd_prices(assets_amount)
+        assets_balance = {}
+        for asset, amount in assets_amount.items():
+            if (usd_price := usd_prices.get(asset)) is None:
+                self.msg_aggregator.add_error(
+                    f'Error processing {self.name} {asset.identifier} balance due to '
+                    'inability to query its USD price. Skipping balance entry',
+                )
+                continue
+
+            assets_balance[asset] = Balance(amount=amount, usd_value=amount * usd_price)
+
+        return assets_balance
+
     def query_exchange_specific_history(
             self,
             start_ts: Timestamp,  # pylint: disable=unused-argument
@@ -41,6 +41,7 @@ from rotkehlchen.exchanges.exchange import (
     ExchangeQueryBalances,
     ExchangeWithExtras,
 )
+from rotkehlchen.fval import FVal
 from rotkehlchen.history.events.structures.asset_movement import (
     AssetMovement,
     create_asset_movement_with_fee,
@@ -51,7 +52,6 @@ from rotkehlchen.history.events.structures.base import (
     HistoryEventSubType,
     HistoryEventType,
 )
-from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_asset_amount,
@@ -401,7 +401,7 @@ class Kraken(ExchangeInterface, ExchangeWithExtras):
                 log.error(msg)
                 return None, msg
 
-        assets_balance: defaultdict[AssetWithOracles, Balance] = defaultdict(Balance)
+        assets_amount: defaultdict[AssetWithOracles, FVal] = defaultdict(FVal)
         for kraken_name, amount_ in kraken_balances.items():
             try:
                 amount = deserialize_asset_amount(amount_)
@@ -429,29 +429,24 @@ class Kraken(ExchangeInterface, ExchangeWithExtras):
                 )
                 continue
 
-            balance = Balance(amount=amount)
-            if our_asset.identifier != 'KFEE':
-                # There is no price value for KFEE
-                try:
-                    usd_price = Inquirer.find_usd_price(our_asset)
-                except RemoteError as e:
-                    self.msg_aggregator.add_error(
-                        f'Error processing kraken balance entry due to inability to '
-                        f'query USD price: {e!s}. Skipping balance entry',
-                    )
-                    continue
+            assets_amount[our_asset] += amount
 
-                balance.usd_value = balance.amount * usd_price
+        # There is no price value for KFEE
+        kfee = A_KFEE.resolve_to_asset_with_oracles()
+        kfee_amount = assets_amount.pop(kfee, None)
+        assets_balance = self._balances_from_amounts(assets_amount)
+        if kfee_amount is not None:
+            assets_balance[kfee] = Balance(amount=kfee_amount)
 
-            assets_balance[our_asset] += balance
+        for asset, balance in assets_balance.items():
             log.debug(
                 'kraken balance query result',
-                currency=our_asset,
+                currency=asset,
                 amount=balance.amount,
                 usd_value=balance.usd_value,
             )
 
-        return dict(assets_balance), ''
+        return assets_balance, ''
 
     def query_until_finished(
             self,
@@ -12,7 +12,6 @@ from urllib.parse import urlencode
 import gevent
 import requests
 
-from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.assets.converters import asset_from_poloniex
 from rotkehlchen.constants import ZERO
 from rotkehlchen.constants.assets import A_LEND
@@ -31,7 +30,6 @@ from rotkehlchen.history.events.structures.asset_movement import (
 )
 from rotkehlchen.history.events.structures.base import HistoryBaseEntry
 from rotkehlchen.history.events.structures.types import HistoryEventType
-from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
     deserialize_asset_amount,
@@ -58,6 +56,7 @@ from rotkehlchen.utils.mixins.lockable import protect_with_lock
 if TYPE_CHECKING:
     from rotkehlchen.assets.asset import AssetWithOracles
     from rotkehlchen.db.dbhandler import DBHandler
+    from rotkehlchen.fval import FVal
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
@@ -369,7 +368,7 @@ class Poloniex(ExchangeInterface):
             log.error(msg)
             return None, msg
 
-        assets_balance: dict[AssetWithOracles, Balance] = {}
+        assets_amount: dict[AssetWithOracles, FVal] = {}
         for account_info in resp:
             try:
                 balances = account_info['balances']
@@ -421,29 +420,14 @@ class Poloniex(ExchangeInterface):
                     if asset == A_LEND:  # poloniex mistakenly returns LEND balances
                         continue  # https://github.com/rotki/rotki/issues/2530
 
-                    try:
-                        usd_price = Inquirer.find_usd_price(asset=asset)
-                    except RemoteError as e:
-                        self.msg_aggregator.add_error(
-                            f'Error processing poloniex balance entry due to inability to '
-                            f'query USD price: {e!s}. Skipping balance entry',
-                        )
-                        continue
-
-                    amount = available + on_orders
-                    usd_value = amount * usd_price
-                    assets_balance[asset] = Balance(
-                        amount=amount,
-                        usd_value=usd_value,
-                    )
+                    assets_amount[asset] = available + on_orders
                     log.debug(
                         'Poloniex balance query',
                         currency=asset,
-                        amount=amount,
-                        usd_value=usd_value,
+                        amount=assets_amount[asset],
                     )
 
-        return assets_balance, ''
+        return self._balances_from_amounts(assets_amount), ''
 
     def query_online_trade_history(
             self,
@@ -1,5 +1,7 @@
 import json
 import logging
+from collections import defaultdict
+from collections.abc import Sequence
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any, Literal, NamedTuple, overload
 
@@ -17,10 +19,19 @@ from rotkehlchen.externalapis.interface import ExternalServiceWithApiKeyOptional
 from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.history.types import HistoricalPrice, HistoricalPriceOracle
-from rotkehlchen.interfaces import HistoricalPriceOracleWithCoinListInterface
+from rotkehlchen.interfaces import (
+    HistoricalPriceOracleWithCoinListInterface,
+    MultipleCurrentPriceOracleInterface,
+)
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.types import ChainID, EvmTokenKind, ExternalService, Price, Timestamp
-from rotkehlchen.utils.misc import create_timestamp, set_user_agent, timestamp_to_date, ts_now
+from rotkehlchen.utils.misc import (
+    create_timestamp,
+    get_chunks,
+    set_user_agent,
+    timestamp_to_date,
+    ts_now,
+)
 from rotkehlchen.utils.mixins.penalizable_oracle import PenalizablePriceOracleMixin
 
 if TYPE_CHECKING:
@@ -28,6 +39,7 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
+SIMPLE_PRICE_IDS_PER_QUERY = 100  # keep the query url at a sane length
 
 
 class CoingeckoAssetData(NamedTuple):
@@ -519,6 +531,7 @@ COINGECKO_SIMPLE_VS_CURRENCIES = {
 class Coingecko(
         ExternalServiceWithApiKeyOptionalDB,
         HistoricalPriceOracleWithCoinListInterface,
+        MultipleCurrentPriceOracleInterface,
         PenalizablePriceOracleMixin,
 ):
 
@@ -736,6 +749,53 @@ class Coingecko(
             )
             return ZERO_PRICE
 
+    def query_multiple_current_prices(
+            self,
+            from_assets: Sequence[AssetWithOracles],
+            to_asset: AssetWithOracles,
+    ) -> dict[AssetWithOracles, Price]:
+        """Returns the simple price of each of the from_assets in to_asset in coingecko.
+
+        Uses the simple/price endpoint of coingecko asking for many ids at once. Assets
+        not supported by coingecko or for which no price was returned are skipped.
+
+        May raise:
+        - RemoteError if there is a problem querying coingecko
+        """
+        if len(from_assets) == 0 or (vs_currency := Coingecko.check_vs_currencies(
+            from_asset=from_assets[0],
+            to_asset=to_asset,
+            location='simple price',
+        )) is None:
+            return {}
+
+        assets_by_id: defaultdict[str, list[AssetWithOracles]] = defaultdict(list)
+        for from_asset in from_assets:
+            try:
+                assets_by_id[from_asset.to_coingecko()].append(from_asset)
+            except UnsupportedAsset:
+                continue
+
+        prices: dict[AssetWithOracles, Price] = {}
+        for ids_chunk in get_chunks(list(assets_by_id), n=SIMPLE_PRICE_IDS_PER_QUERY):
+            result = self._query(
+                module='simple/price',
+                options={
+                    'ids': ','.join(ids_chunk),
+                    'vs_currencies': vs_currency,
+                })
+            for coingecko_id in ids_chunk:
+                try:
+                    price = Price(FVal(result[coingecko_id][vs_currency]))
+                except KeyError:
+                    log.debug(f'Coingecko simple price for {coingecko_id} was not returned')
+                    continue
+
+                for from_asset in assets_by_id[coingecko_id]:
+                    prices[from_asset] = price
+
+        return prices
+
     def can_query_history(
             self,
             from_asset: Asset,  # pylint: disable=unused-argument
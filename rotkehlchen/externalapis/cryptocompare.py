@@ -1,5 +1,6 @@
 import logging
-from collections import deque
+from collections import defaultdict, deque
+from collections.abc import Sequence
 from json.decoder import JSONDecodeError
 from typing import TYPE_CHECKING, Any, Final, Literal, Optional, overload
 
@@ -48,7 +49,10 @@ from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.history.deserialization import deserialize_price
 from rotkehlchen.history.types import HistoricalPrice, HistoricalPriceOracle
-from rotkehlchen.interfaces import HistoricalPriceOracleWithCoinListInterface
+from rotkehlchen.interfaces import (
+    HistoricalPriceOracleWithCoinListInterface,
+    MultipleCurrentPriceOracleInterface,
+)
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.types import ExternalService, Price, Timestamp
 from rotkehlchen.utils.misc import pairwise, set_user_agent, ts_now
@@ -67,6 +71,7 @@ CRYPTOCOMPARE_STARKNET_HISTORICAL_PRICE_CHANGE_TS: Final = Timestamp(1715212800)
 RATE_LIMIT_MSG = 'You are over your rate limit please upgrade your account!'
 CRYPTOCOMPARE_QUERY_RETRY_TIMES = 3
 CRYPTOCOMPARE_RATE_LIMIT_WAIT_TIME = 60
+CRYPTOCOMPARE_PRICEMULTI_FSYMS_MAX_LENGTH = 300  # limit of the fsyms parameter of pricemulti
 CRYPTOCOMPARE_SPECIAL_CASES_MAPPING = {
     'ADADOWN': A_USDT,
     'ADAUP': A_USDT,
@@ -194,6 +199,7 @@ def _check_hourly_data_sanity(
 class Cryptocompare(
         ExternalServiceWithApiKeyOptionalDB,
         HistoricalPriceOracleWithCoinListInterface,
+        MultipleCurrentPriceOracleInterface,
         PenalizablePriceOracleMixin,
 ):
     def __init__(self, database: Optional['DBHandler']) -> None:
@@ -264,7 +270,7 @@ class Cryptocompare(
     @overload
     def _api_query(
             self,
-            url: Literal['https://min-api.cryptocompare.com/data/price', 'https://min-api.cryptocompare.com/data/all/coinlist'],
+            url: Literal['https://min-api.cryptocompare.com/data/price', 'https://min-api.cryptocompare.com/data/pricemulti', 'https://min-api.cryptocompare.com/data/all/coinlist'],  # noqa: E501
             params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         ...
@@ -495,6 +501,65 @@ class Cryptocompare(
 
         return Price(FVal(result[cc_to_asset_symbol]))
 
+    def query_multiple_current_prices(
+            self,
+            from_assets: Sequence[AssetWithOracles],
+            to_asset: AssetWithOracles,
+    ) -> dict[AssetWithOracles, Price]:
+        """Returns the current price of each of the from_assets in to_asset using the
+        pricemulti endpoint that accepts many symbols at once.
+
+        Assets not known to cryptocompare, the special cases that need more than one
+        query and assets for which no price was returned are skipped.
+
+        - May raise RemoteError if there is a problem reaching the cryptocompare server
+        or with reading the response returned by the server
+        """
+        if to_asset.identifier in CRYPTOCOMPARE_SPECIAL_CASES:
+            return {}
+
+        try:
+            cc_to_asset_symbol = to_asset.to_cryptocompare()
+        except UnsupportedAsset:
+            return {}
+
+        assets_by_symbol: defaultdict[str, list[AssetWithOracles]] = defaultdict(list)
+        for from_asset in from_assets:
+            if from_asset.identifier in CRYPTOCOMPARE_SPECIAL_CASES:
+                continue
+            try:
+                assets_by_symbol[from_asset.to_cryptocompare()].append(from_asset)
+            except UnsupportedAsset:
+                continue
+
+        symbol_chunks: list[list[str]] = []
+        chunk_length = CRYPTOCOMPARE_PRICEMULTI_FSYMS_MAX_LENGTH
+        for symbol in assets_by_symbol:
+            if chunk_length + len(symbol) + 1 > CRYPTOCOMPARE_PRICEMULTI_FSYMS_MAX_LENGTH:
+                symbol_chunks.append([])
+                chunk_length = -1  # the first symbol of a chunk has no separating comma
+            symbol_chunks[-1].append(symbol)
+            chunk_length += len(symbol) + 1
+
+        prices: dict[AssetWithOracles, Price] = {}
+        for symbols in symbol_chunks:
+            result = self._api_query(
+                url='https://min-api.cryptocompare.com/data/pricemulti',
+                params={
+                    'fsyms': ','.join(symbols),
+                    'tsyms': cc_to_asset_symbol,
+                },
+            )
+            for symbol in symbols:
+                if (symbol_result := result.get(symbol)) is None or cc_to_asset_symbol not in symbol_result:  # noqa: E501
+                    continue
+
+                price = Price(FVal(symbol_result[cc_to_asset_symbol]))
+                for from_asset in assets_by_symbol[symbol]:
+                    prices[from_asset] = price
+
+        return prices
+
     def query_endpoint_pricehistorical(
             self,
             from_asset: AssetWithOracles,
@@ -1,12 +1,14 @@
 import json
 import logging
+from collections import defaultdict
+from collections.abc import Sequence
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
 
 import requests
 
 from rotkehlchen.assets.asset import Asset, AssetWithOracles
-from rotkehlchen.constants import ZERO
+from rotkehlchen.constants import ONE, ZERO
 from rotkehlchen.constants.assets import A_USD
 from rotkehlchen.constants.prices import ZERO_PRICE
 from rotkehlchen.constants.timing import DAY_IN_SECONDS
@@ -22,10 +24,13 @@ from rotkehlchen.history.deserialization import deserialize_price
 from rotkehlchen.history.price import PriceHistorian
 from rotkehlchen.history.types import HistoricalPrice, HistoricalPriceOracle
 from rotkehlchen.inquirer import Inquirer
-from rotkehlchen.interfaces import HistoricalPriceOracleInterface
+from rotkehlchen.interfaces import (
+    HistoricalPriceOracleInterface,
+    MultipleCurrentPriceOracleInterface,
+)
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.types import ChainID, ExternalService, Price, Timestamp
-from rotkehlchen.utils.misc import create_timestamp, timestamp_to_date, ts_now
+from rotkehlchen.utils.misc import create_timestamp, get_chunks, timestamp_to_date, ts_now
 from rotkehlchen.utils.mixins.penalizable_oracle import PenalizablePriceOracleMixin
 
 if TYPE_CHECKING:
@@ -34,11 +39,13 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 MIN_DEFILLAMA_CONFIDENCE = FVal('0.20')
+CURRENT_PRICE_COINS_PER_QUERY = 100  # keep the query url at a sane length
 
 
 class Defillama(
         ExternalServiceWithApiKeyOptionalDB,
         HistoricalPriceOracleInterface,
+        MultipleCurrentPriceOracleInterface,
         PenalizablePriceOracleMixin,
 ):
 
@@ -211,6 +218,50 @@ class Defillama(
         rate_price = Inquirer.find_price(from_asset=A_USD, to_asset=to_asset)
         return Price(usd_price * rate_price)
 
+    def query_multiple_current_prices(
+            self,
+            from_assets: Sequence[AssetWithOracles],
+            to_asset: AssetWithOracles,
+    ) -> dict[AssetWithOracles, Price]:
+        """
+        Returns the current price of each of the from_assets in to_asset in Defillama
+        by asking for many coins in each query. Unsupported assets and assets for which
+        no price was returned are skipped.
+
+        May raise:
+        - RemoteError if there is a problem querying defillama
+        """
+        assets_by_id: defaultdict[str, list[AssetWithOracles]] = defaultdict(list)
+        for from_asset in from_assets:
+            try:
+                assets_by_id[self._get_asset_id(from_asset)].append(from_asset)
+            except UnsupportedAsset:
+                continue
+
+        if len(assets_by_id) == 0:
+            return {}
+
+        rate_price = ONE if to_asset == A_USD else Inquirer.find_price(from_asset=A_USD, to_asset=to_asset)  # noqa: E501
+        prices: dict[AssetWithOracles, Price] = {}
+        for coin_ids in get_chunks(list(assets_by_id), n=CURRENT_PRICE_COINS_PER_QUERY):
+            result = self._query(
+                module='prices',
+                subpath=f'current/{",".join(coin_ids)}',
+            )
+            returned_coins = result.get('coins', {})
+            for coin_id in coin_ids:
+                if coin_id not in returned_coins:
+                    continue
+
+                from_asset = assets_by_id[coin_id][0]
+                if (usd_price := self._deserialize_price(result, coin_id, from_asset, to_asset)) == ZERO:  # noqa: E501
+                    continue
+
+                for from_asset in assets_by_id[coin_id]:
+                    prices[from_asset] = Price(usd_price * rate_price)
+
+        return prices
+
     def can_query_history(
             self,
             from_asset: Asset,  # pylint: disable=unused-argument
@@ -54,6 +54,7 @@ from rotkehlchen.utils.serialization import (
     deserialize_generic_asset_from_db,
 )
 
+from .price_index import HistoricalPriceIndex
 from .upgrades.manager import configure_globaldb
 from .utils import GLOBAL_DB_VERSION, globaldb_get_setting_value, initialize_globaldb
 
@@ -65,6 +66,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+# Max number of historical price lookups resolved by a single query. Each one takes 4 bound
+# parameters so that the query stays well below SQLite's limit of bound parameters.
+PRICE_QUERIES_CHUNK_SIZE = 1000
 
 _ALL_ASSETS_TABLES_JOINS = """
 FROM assets LEFT JOIN common_asset_details on assets.identifier=common_asset_details.identifier
@@ -93,6 +97,8 @@ class GlobalDBHandler:
     used_backup: bool  # specifies if the global DB was restored from a backup
     packaged_db_lock: Semaphore
     msg_aggregator: 'MessagesAggregator | None' = None
+    # in memory prices preloaded for accounting runs. Used by get_historical_price if set
+    _historical_price_index: HistoricalPriceIndex | None = None
 
     def __new__(
             cls,
@@ -100,6 +106,7 @@ class GlobalDBHandler:
             sql_vm_instructions_cb: int | None = None,
             perform_assets_updates: bool | None = None,
             msg_aggregator: 'MessagesAggregator | None' = None,
+            read_pool_size: int = 0,
     ) -> 'GlobalDBHandler':
         """
         Initializes the GlobalDB.
@@ -110,6 +117,8 @@ class GlobalDBHandler:
         If perform_assets_updates is True any assets data will be updated before applying
         schema-breaking changes.
 
+        If read_pool_size is not zero, reads use a pool of that many read only connections.
+
         May raise:
         - DBSchemaError if GlobalDB's schema is malformed
         """
@@ -148,6 +157,7 @@ class GlobalDBHandler:
             globaldb=GlobalDBHandler.__instance if perform_assets_updates else None,
             connection=GlobalDBHandler.__instance.conn,
         )
+        GlobalDBHandler.__instance.conn.enable_read_pool(size=read_pool_size)
         return GlobalDBHandler.__instance
 
     def filepath(self) -> Path:
@@ -1200,6 +1210,24 @@ class GlobalDBHandler:
 
         If no price can be found returns None
         """
+        if (
+            source is not None and
+            (price_index := GlobalDBHandler._historical_price_index) is not None and
+            price_index.covers(
+                from_asset=from_asset,
+                to_asset=to_asset,
+                start_ts=timestamp - max_seconds_distance,
+                end_ts=timestamp + max_seconds_distance,
+            )
+        ):
+            return price_index.get_closest(
+                from_asset=from_asset,
+                to_asset=to_asset,
+                timestamp=timestamp,
+                max_seconds_distance=max_seconds_distance,
+                source=source,
+            )
+
         querystr = (
             'SELECT from_asset, to_asset, source_type, timestamp, '
             'price, MIN(ABS(timestamp - ?)) FROM price_history '
@@ -1227,36 +1255,79 @@ class GlobalDBHandler:
     ) -> list[Optional['HistoricalPrice']]:
         """Given a list of from/to/timestamp data to query returns all values
         that could be found in the DB and None for those that could not be found.
+
+        The requested entries are given as a VALUES common table expression and joined with
+        price_history so that each chunk of the batch is resolved by a single query.
         """
-        querystr = (
-            'SELECT from_asset, to_asset, source_type, timestamp, price, MIN(ABS(timestamp - ?)) '
-            'FROM price_history WHERE from_asset=? AND to_asset=? AND timestamp BETWEEN ? AND ?'
-        )
-        querylist: list[tuple] = []
+        prices_results: list[HistoricalPrice | None] = [None] * len(query_data)
+        source_filter = ''
+        filter_bindings: list[str | int] = [max_seconds_distance, max_seconds_distance]
         if source is not None:
-            querystr += ' AND source_type=? '
-            serialized_source = source.serialize_for_db()
-            for from_asset, to_asset, timestamp in query_data:
-                querylist.append((timestamp, from_asset.identifier, to_asset.identifier, timestamp - max_seconds_distance, timestamp + max_seconds_distance, serialized_source))  # noqa: E501
+            source_filter = ' AND P.source_type=?'
+            filter_bindings.append(source.serialize_for_db())
 
-        else:
-            for from_asset, to_asset, timestamp in query_data:
-                querylist.append((timestamp, from_asset.identifier, to_asset.identifier, timestamp - max_seconds_distance, timestamp + max_seconds_distance))  # noqa: E501
-
-        prices_results = []
+        sources = {x.serialize_for_db(): x for x in HistoricalPriceOracle}
         with GlobalDBHandler().conn.read_ctx() as cursor:
-            for entry in querylist:
-                result = cursor.execute(querystr, entry).fetchone()  # below last index of the result tuple is ignored in deserialize  # noqa: E501
-                prices_results.append(None if result[0] is None else HistoricalPrice.deserialize_from_db(result))  # noqa: E501
+            for chunk_start in range(0, len(query_data), PRICE_QUERIES_CHUNK_SIZE):
+                chunk = query_data[chunk_start:chunk_start + PRICE_QUERIES_CHUNK_SIZE]
+                values_bindings: list[str | int] = []
+                for idx, (from_asset, to_asset, timestamp) in enumerate(chunk, start=chunk_start):
+                    values_bindings.extend((idx, from_asset.identifier, to_asset.identifier, timestamp))  # noqa: E501
+
+                for idx, source_type, timestamp, price, _ in cursor.execute(
+                    'WITH Q(idx, from_asset, to_asset, timestamp) AS '
+                    f'(VALUES {",".join(["(?, ?, ?, ?)"] * len(chunk))}) '
+                    'SELECT Q.idx, P.source_type, P.timestamp, P.price, '
+                    'MIN(ABS(P.timestamp - Q.timestamp)) FROM Q INNER JOIN price_history AS P '
+                    'ON P.from_asset=Q.from_asset AND P.to_asset=Q.to_asset AND '
+                    f'P.timestamp BETWEEN Q.timestamp - ? AND Q.timestamp + ?{source_filter} '
+                    'GROUP BY Q.idx',
+                    values_bindings + filter_bindings,
+                ):
+                    from_asset, to_asset, _ = query_data[idx]
+                    prices_results[idx] = HistoricalPrice(
+                        from_asset=from_asset,
+                        to_asset=to_asset,
+                        source=sources[source_type],
+                        timestamp=Timestamp(timestamp),
+                        price=deserialize_price(price),
+                    )
 
         return prices_results
 
+    @staticmethod
+    def load_historical_price_index(
+            to_asset: 'Asset',
+            assets_ranges: dict['Asset', tuple[Timestamp, Timestamp]],
+    ) -> HistoricalPriceIndex:
+        """Loads in memory all the historical prices of the given assets to `to_asset`
+        in the given time ranges. Until clear_historical_price_index is called, lookups
+        that fall in these ranges are answered from memory without querying the DB."""
+        price_index = HistoricalPriceIndex()
+        with GlobalDBHandler().conn.read_ctx() as cursor:
+            price_index.load(cursor=cursor, to_asset=to_asset, assets_ranges=assets_ranges)
+
+        GlobalDBHandler._historical_price_index = price_index
+        return price_index
+
+    @staticmethod
+    def clear_historical_price_index() -> None:
+        """Drops the in memory historical prices. Also called when prices in the DB are
+        modified in a way that the index does not follow"""
+        if (price_index := GlobalDBHandler._historical_price_index) is not None:
+            log.debug(
+                f'Clearing historical price index after {price_index.hits} hits '
+                f'and {price_index.misses} misses',
+            )
+        GlobalDBHandler._historical_price_index = None
+
     @staticmethod
     def add_historical_prices(entries: list['HistoricalPrice']) -> None:
         """Adds the given historical price entries in the DB
 
         If any addition causes a DB error it's skipped and an error is logged
         """
+        added_entries = entries
         try:
             with GlobalDBHandler().conn.write_ctx() as write_cursor:
                 write_cursor.executemany(
@@ -1272,6 +1343,7 @@ class GlobalDBHandler:
                 f'Will attempt to input them one by one',
             )
 
+            added_entries = []
             with GlobalDBHandler().conn.write_ctx() as write_cursor:
                 for entry in entries:
                     try:
@@ -1285,6 +1357,12 @@ class GlobalDBHandler:
                         log.error(
                             f'Failed to add {entry!s} due to {entry_error!s}. Skipping entry addition',  # noqa: E501
                         )
+                    else:
+                        added_entries.append(entry)
+
+        # only index the prices once they are in the DB
+        if (price_index := GlobalDBHandler._historical_price_index) is not None:
+            price_index.add(entries=added_entries, replace=False)
 
     @staticmethod
     def add_single_historical_price(entry: HistoricalPrice) -> bool:
@@ -1310,6 +1388,9 @@ class GlobalDBHandler:
             )
             return False
 
+        if (price_index := GlobalDBHandler._historical_price_index) is not None:
+            price_index.add(entries=[entry], replace=True)
+
         return True
 
     @staticmethod
@@ -1323,6 +1404,7 @@ class GlobalDBHandler:
         May raise:
         - InputError if some db constraint was hit. Probably means manual price duplication.
         """
+        GlobalDBHandler.clear_historical_price_index()
         with GlobalDBHandler().conn.write_ctx() as write_cursor:
             try:
                 write_cursor.execute(
@@ -1414,6 +1496,7 @@ class GlobalDBHandler:
         May raise:
         - InputError if asset was not found in the price_history table
         """
+        GlobalDBHandler.clear_historical_price_index()
         with GlobalDBHandler().conn.write_ctx() as write_cursor:
             # get asset pairs to invalidate their prices from cache after deletion
             write_cursor.execute(
@@ -1471,6 +1554,7 @@ class GlobalDBHandler:
         """Edits a manually inserted historical price. Returns false if no row
         was updated and true otherwise.
         """
+        GlobalDBHandler.clear_historical_price_index()
         querystr = (
             'UPDATE price_history SET price=? WHERE from_asset=? AND to_asset=? '
             'AND source_type=? AND timestamp=? '
@@ -1504,6 +1588,7 @@ class GlobalDBHandler:
         Deletes a manually inserted historical price given by its primary key.
         Returns True if one row was deleted and False otherwise
         """
+        GlobalDBHandler.clear_historical_price_index()
         querystr = (
             'DELETE FROM price_history WHERE from_asset=? AND to_asset=? '
             'AND timestamp=? AND source_type=?'
@@ -1531,6 +1616,7 @@ class GlobalDBHandler:
             to_asset: 'Asset',
             source: HistoricalPriceOracle | None = None,
     ) -> None:
+        GlobalDBHandler.clear_historical_price_index()
         querystr = 'DELETE FROM price_history WHERE from_asset=? AND to_asset=?'
         query_list = [from_asset.identifier, to_asset.identifier]
         if source is not None:
@@ -1598,7 +1684,7 @@ class GlobalDBHandler:
         with user_db.conn.read_ctx() as cursor:
             user_db.update_owned_assets_in_globaldb(cursor)
 
-        with self.conn.read_ctx() as read_cursor:
+        with self.conn.read_ctx(pooled=False) as read_cursor:
             # First check that the operation can be made. If the difference is not the
             # empty set the operation is dangerous and the user should be notified.
             with user_db.user_write() as user_db_cursor:
@@ -1673,7 +1759,7 @@ class GlobalDBHandler:
 
         with self.packaged_db_lock:
             try:
-                with self.conn.read_ctx() as read_cursor:
+                with self.conn.read_ctx(pooled=False) as read_cursor:
                     read_cursor.execute(f"ATTACH DATABASE '{builtin_database}' AS clean_db;")
                     # Check that versions match
                     query = read_cursor.execute("SELECT value from clean_db.settings WHERE name='version';")  # noqa: E501
@@ -1715,7 +1801,7 @@ class GlobalDBHandler:
                 log.error(f'Failed to restore assets in globaldb due to {e!s}')
                 return False, 'Failed to restore assets. Read logs to get more information.'
             finally:  # on the way out always detach the DB. Make sure no transaction is active
-                with self.conn.transaction_lock, self.conn.read_ctx() as read_cursor:
+                with self.conn.transaction_lock, self.conn.read_ctx(pooled=False) as read_cursor:
                     read_cursor.execute("DETACH DATABASE 'clean_db';")
 
         return True, ''
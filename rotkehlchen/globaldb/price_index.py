@@ -0,0 +1,144 @@
+import logging
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from rotkehlchen.history.deserialization import deserialize_price
+from rotkehlchen.history.types import HistoricalPrice, HistoricalPriceOracle
+from rotkehlchen.logging import RotkehlchenLogsAdapter
+from rotkehlchen.types import Timestamp
+from rotkehlchen.utils.misc import get_chunks
+
+if TYPE_CHECKING:
+    from rotkehlchen.assets.asset import Asset
+    from rotkehlchen.db.drivers.gevent import DBCursor
+
+logger = logging.getLogger(__name__)
+log = RotkehlchenLogsAdapter(logger)
+
+# max number of assets to put in a single IN clause when loading the index
+INDEX_LOAD_CHUNK_SIZE = 500
+
+
+class _PriceSeries:
+    """The prices of a single (from_asset, to_asset, source) ordered by timestamp"""
+
+    __slots__ = ('prices', 'timestamps')
+
+    def __init__(self) -> None:
+        self.timestamps: array[int] = array('q')
+        self.prices: list[str] = []
+
+    def insert(self, timestamp: Timestamp, price: str, replace: bool) -> None:
+        idx = bisect_left(self.timestamps, timestamp)
+        if idx < len(self.timestamps) and self.timestamps[idx] == timestamp:
+            if replace:
+                self.prices[idx] = price
+            return
+
+        self.timestamps.insert(idx, timestamp)
+        self.prices.insert(idx, price)
+
+    def closest(self, timestamp: Timestamp, max_seconds_distance: int) -> int | None:
+        """Returns the position of the entry closest to timestamp within the distance.
+        Same as MIN(ABS(timestamp - ?)) in the DB, on a tie the earliest entry wins."""
+        idx = bisect_left(self.timestamps, timestamp)
+        candidates = []
+        if idx > 0:
+            candidates.append((timestamp - self.timestamps[idx - 1], idx - 1))
+        if idx < len(self.timestamps):
+            candidates.append((self.timestamps[idx] - timestamp, idx))
+        if len(candidates) == 0:
+            return None
+
+        distance, best = min(candidates)
+        return best if distance <= max_seconds_distance else None
+
+
+class HistoricalPriceIndex:
+    """In memory copy of the price_history rows of a set of asset pairs and time ranges.
+
+    It is loaded in bulk before accounting runs so that the price lookups of the oracles
+    don't need to query the DB for each single event. For a pair and time range that was
+    loaded, a lookup answers exactly as the DB would, including with no price at all.
+    """
+
+    def __init__(self) -> None:
+        self.series: dict[tuple[str, str, str], _PriceSeries] = defaultdict(_PriceSeries)
+        self.loaded_ranges: dict[tuple[str, str], tuple[Timestamp, Timestamp]] = {}
+        self.hits = self.misses = 0
+
+    def load(
+            self,
+            cursor: 'DBCursor',
+            to_asset: 'Asset',
+            assets_ranges: dict['Asset', tuple[Timestamp, Timestamp]],
+    ) -> None:
+        """Loads all prices of the given assets to `to_asset` in the given ranges"""
+        ranges = {asset.identifier: ts_range for asset, ts_range in assets_ranges.items()}
+        for chunk in get_chunks(list(ranges), n=INDEX_LOAD_CHUNK_SIZE):
+            cursor.execute(
+                f'SELECT from_asset, source_type, timestamp, price FROM price_history '
+                f'WHERE to_asset=? AND from_asset IN ({",".join(["?"] * len(chunk))}) '
+                f'AND timestamp BETWEEN ? AND ? ORDER BY timestamp',
+                (
+                    to_asset.identifier,
+                    *chunk,
+                    min(ranges[x][0] for x in chunk),
+                    max(ranges[x][1] for x in chunk),
+                ),
+            )
+            for from_asset, source_type, timestamp, price in cursor:
+                start_ts, end_ts = ranges[from_asset]
+                if start_ts <= timestamp <= end_ts:
+                    series = self.series[from_asset, to_asset.identifier, source_type]
+                    series.timestamps.append(timestamp)
+                    series.prices.append(price)
+
+            for from_asset in chunk:
+                self.loaded_ranges[from_asset, to_asset.identifier] = ranges[from_asset]
+
+        log.debug(f'Loaded historical price index for {len(ranges)} assets to {to_asset}')
+
+    def covers(self, from_asset: 'Asset', to_asset: 'Asset', start_ts: int, end_ts: int) -> bool:
+        """Whether all prices of the pair in the given range are in the index"""
+        if (loaded := self.loaded_ranges.get((from_asset.identifier, to_asset.identifier))) is None:  # noqa: E501
+            return False
+
+        return loaded[0] <= start_ts and end_ts <= loaded[1]
+
+    def get_closest(
+            self,
+            from_asset: 'Asset',
+            to_asset: 'Asset',
+            timestamp: Timestamp,
+            max_seconds_distance: int,
+            source: HistoricalPriceOracle,
+    ) -> HistoricalPrice | None:
+        """Should only be called for a range that the index covers"""
+        series = self.series.get((from_asset.identifier, to_asset.identifier, source.serialize_for_db()))  # noqa: E501
+        if series is None or (idx := series.closest(timestamp, max_seconds_distance)) is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return HistoricalPrice(
+            from_asset=from_asset,
+            to_asset=to_asset,
+            source=source,
+            timestamp=Timestamp(series.timestamps[idx]),
+            price=deserialize_price(series.prices[idx]),
+        )
+
+    def add(self, entries: list[HistoricalPrice], replace: bool) -> None:
+        """Keeps the index in sync with prices written to the DB"""
+        for entry in entries:
+            if (loaded := self.loaded_ranges.get((entry.from_asset.identifier, entry.to_asset.identifier))) is None or not loaded[0] <= entry.timestamp <= loaded[1]:  # noqa: E501
+                continue
+
+            self.series[
+                entry.from_asset.identifier,
+                entry.to_asset.identifier,
+                entry.source.serialize_for_db(),
+            ].insert(timestamp=entry.timestamp, price=str(entry.price), replace=replace)
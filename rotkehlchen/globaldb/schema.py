@@ -233,6 +233,13 @@ CREATE TABLE IF NOT EXISTS price_history (
 );
 """
 
+# The primary key only serves lookups of a single source. This index serves the closest price
+# lookups of a pair around a timestamp when the source does not matter.
+DB_CREATE_PRICE_HISTORY_TIMESTAMP_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_price_history_pair_timestamp
+ON price_history(from_asset, to_asset, timestamp);
+"""
+
 DB_CREATE_BINANCE_PAIRS = """
 CREATE TABLE IF NOT EXISTS binance_pairs (
     pair TEXT NOT NULL,
@@ -344,6 +351,7 @@ BEGIN TRANSACTION;
 {DB_CREATE_USER_OWNED_ASSETS}
 {DB_CREATE_PRICE_HISTORY_SOURCE_TYPES}
 {DB_CREATE_PRICE_HISTORY}
+{DB_CREATE_PRICE_HISTORY_TIMESTAMP_INDEX}
 {DB_CREATE_BINANCE_PAIRS}
 {DB_CREATE_ADDRESS_BOOK}
 {DB_CREATE_CUSTOM_ASSET}
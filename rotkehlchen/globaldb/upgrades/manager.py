@@ -29,6 +29,7 @@ from .v3_v4 import migrate_to_v4
 from .v4_v5 import migrate_to_v5
 from .v5_v6 import migrate_to_v6
 from .v9_v10 import migrate_to_v10
+from .v10_v11 import migrate_to_v11
 
 if TYPE_CHECKING:
     from rotkehlchen.db.drivers.gevent import DBConnection
@@ -73,6 +74,10 @@ UPGRADES_LIST = [
         from_version=9,
         function=migrate_to_v10,
     ),
+    UpgradeRecord(
+        from_version=10,
+        function=migrate_to_v11,
+    ),
 ]
 
 
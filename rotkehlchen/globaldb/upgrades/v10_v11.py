@@ -0,0 +1,30 @@
+from typing import TYPE_CHECKING
+
+from rotkehlchen.logging import enter_exit_debug_log
+from rotkehlchen.utils.progress import perform_globaldb_upgrade_steps, progress_step
+
+if TYPE_CHECKING:
+    from rotkehlchen.db.drivers.gevent import DBConnection, DBCursor
+    from rotkehlchen.db.upgrade_manager import DBUpgradeProgressHandler
+
+
+@enter_exit_debug_log(name='globaldb v10->v11 upgrade')
+def migrate_to_v11(connection: 'DBConnection', progress_handler: 'DBUpgradeProgressHandler') -> None:  # noqa: E501
+    """This globalDB upgrade does the following:
+
+    1. Adds an index of price_history by pair and timestamp.
+
+    This upgrade takes place in v1.38
+    """
+
+    @progress_step('Adding price history index by pair and timestamp')
+    def add_price_history_pair_timestamp_index(write_cursor: 'DBCursor') -> None:
+        write_cursor.execute(
+            'CREATE INDEX IF NOT EXISTS idx_price_history_pair_timestamp '
+            'ON price_history(from_asset, to_asset, timestamp);',
+        )
+
+    perform_globaldb_upgrade_steps(
+        connection=connection,
+        progress_handler=progress_handler,
+    )
@@ -1,8 +1,13 @@
+import heapq
 import logging
 from collections import defaultdict
+from collections.abc import Callable, Iterator, Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, NamedTuple, TypeVar
 
+from gevent.pool import Pool
+
+from rotkehlchen.assets.asset import Asset
 from rotkehlchen.constants import ZERO
 from rotkehlchen.db.filtering import (
     EvmTransactionsFilterQuery,
@@ -12,9 +17,11 @@ from rotkehlchen.db.filtering import (
 from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.exchanges.data_structures import Trade
+from rotkehlchen.exchanges.exchange import ExchangeInterface
 from rotkehlchen.exchanges.manager import SUPPORTED_EXCHANGES, ExchangeManager
 from rotkehlchen.fval import FVal
 from rotkehlchen.history.events.structures.base import HistoryBaseEntry, HistoryEvent
+from rotkehlchen.history.price import get_events_assets_ranges, update_assets_ranges
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.premium.premium import has_premium_check
 from rotkehlchen.tasks.manager import TaskManager
@@ -45,6 +52,108 @@ log = RotkehlchenLogsAdapter(logger)
 # Please, update this number each time a history query step is either added or removed
 NUM_HISTORY_QUERY_STEPS_EXCL_EXCHANGES = 3 + 3 * len(EVM_CHAINS_WITH_TRANSACTIONS)
 STEPS_PER_CEX = 5
+# Max number of exchange locations whose history is queried at the same time
+EXCHANGES_HISTORY_CONCURRENCY = 4
+# Max number of entries read from the DB at once per history source when streaming history
+HISTORY_STREAM_WINDOW = 2000
+
+T_Event = TypeVar('T_Event', bound='AccountingEventMixin')
+
+
+class HistoryStream(NamedTuple):
+    error_or_empty: str
+    total_events: int  # number of events that `events` will yield, counted in the DB
+    events: Iterator['AccountingEventMixin']
+    # time range in which the prices of each asset in the events will be needed
+    assets_ranges: dict[Asset, tuple[Timestamp, Timestamp]]
+
+
+def history_sort_key(event: 'AccountingEventMixin') -> tuple[int, int]:
+    """Sort events first by timestamp and if history base entry by sequence index"""
+    return (
+        event.get_timestamp(),
+        event.sequence_index if isinstance(event, HistoryBaseEntry) else 1,
+    )
+
+
+def count_window_rows(
+        cursor: 'DBCursor',
+        table: Literal['trades', 'history_events'],
+        filter_query: TradesFilterQuery | HistoryEventFilterQuery,
+        entries_num: int,
+) -> int:
+    """Returns how many DB rows the paginated `filter_query` read from `table`.
+
+    If fewer entries than the limit were deserialized either the window reached the end
+    of the history or some rows failed to deserialize, so only then the rows are counted.
+    """
+    assert filter_query.pagination is not None, 'window queries should be paginated'
+    if entries_num == filter_query.pagination.limit:
+        return entries_num
+
+    query, bindings = filter_query.prepare()
+    return cursor.execute(f'SELECT COUNT(*) FROM (SELECT 1 FROM {table} {query})', bindings).fetchone()[0]  # noqa: E501
+
+
+def windowed_db_source(
+        query_window: Callable[[Timestamp, int, int], tuple[Sequence[T_Event], int]],
+        window: int,
+) -> Iterator[T_Event]:
+    """Iterates over a timestamp ordered DB source reading at most `window` entries at a time.
+
+    `query_window` is called with (from_ts, offset, limit) and should return the entries with
+    timestamp >= from_ts in a deterministic order along with the number of DB rows read for
+    them. Each new window starts at the timestamp of the last seen entry and the offset skips
+    only the entries of that timestamp that have already been returned, so no window needs to
+    walk over the entire history again.
+
+    Entries that fail to deserialize are skipped by the DB methods, so the offset may end up
+    smaller than the rows actually read. To never return an entry twice the identifiers
+    returned at the current window timestamp are also remembered. The end of the source is
+    detected by the rows read and not by the entries returned so that a window full of rows
+    that can't be deserialized is skipped instead of ending the iteration.
+    """
+    from_ts, offset = Timestamp(0), 0
+    seen_at_ts: set[str] = set()
+    while True:
+        entries, rows_read = query_window(from_ts, offset, window)
+        new_entries = 0
+        for entry in entries:
+            if (timestamp := entry.get_timestamp()) != from_ts:
+                from_ts, offset, seen_at_ts = timestamp, 0, set()
+            elif entry.get_identifier() in seen_at_ts:
+                continue
+
+            offset += 1
+            new_entries += 1
+            seen_at_ts.add(entry.get_identifier())
+            yield entry
+
+        if rows_read > len(entries):
+            log.error(
+                f'Skipped {rows_read - len(entries)} history entries after timestamp '
+                f'{from_ts} that could not be read from the DB',
+            )
+
+        if rows_read < window:  # reached the end of the source
+            return
+
+        if new_entries == 0:  # none of the window's rows is new so skip all of them
+            offset += rows_read
+
+
+def sort_within_timestamp(events: Iterator[T_Event]) -> Iterator[T_Event]:
+    """Takes an iterator of events ordered by timestamp and makes sure that events of the
+    same timestamp (in seconds) are returned ordered by `history_sort_key`. History events
+    are saved with millisecond timestamps so the DB order may not match the key order."""
+    same_ts: list[T_Event] = []
+    for event in events:
+        if len(same_ts) != 0 and same_ts[0].get_timestamp() != event.get_timestamp():
+            yield from sorted(same_ts, key=history_sort_key)
+            same_ts = []
+        same_ts.append(event)
+
+    yield from sorted(same_ts, key=history_sort_key)
 
 
 class HistoryQueryingManager:
@@ -234,71 +343,45 @@ class HistoryQueryingManager:
         )
         return events, filter_total_found  # type: ignore  # event is guaranteed HistoryEvent
 
-    def get_history(
+    def _sync_history(
             self,
-            start_ts: Timestamp,
             end_ts: Timestamp,
             has_premium: bool,
-    ) -> tuple[str, list['AccountingEventMixin']]:
-        """
-        Creates all events history from start_ts to end_ts. Returns it
-        sorted by ascending timestamp.
-        """
-        self._reset_variables()
+            total_steps: int,
+    ) -> tuple[str, int, list['AccountingEventMixin']]:
+        """Queries all exchanges and chains and saves the new history in the DB so that it
+        can be read for accounting. Returns a tuple of the errors found, the number of steps
+        done and the eth2 daily stats events which are not read from the DB later"""
         step = 0
-        total_steps = (
-            self.exchange_manager.connected_and_syncing_exchanges_num() * STEPS_PER_CEX +
-            NUM_HISTORY_QUERY_STEPS_EXCL_EXCHANGES
-        )
-        log.info(
-            'Get/create trade history',
-            start_ts=start_ts,
-            end_ts=end_ts,
-        )
-        # start creating the all trades history list
-        history: list[AccountingEventMixin] = []
         empty_or_error = ''
+        eth2_events: list[AccountingEventMixin] = []
 
         def fail_history_cb(error_msg: str) -> None:
             """This callback will run for failure in exchange history query"""
             nonlocal empty_or_error
             empty_or_error += '\n' + error_msg
 
-        def new_step_cb(state_name: str) -> None:
-            """This callback will run for each new step in exchange history query"""
+        def increase_steps_cb(step_by: int) -> None:
+            """This callback will run for the steps done in exchange history query"""
             nonlocal step
-            step = self._increase_progress(step, total_steps)
-            self.processing_state_name = state_name
+            step = self._increase_progress(step, total_steps, step_by=step_by)
 
+        # Instances of the same location are queried one after the other since they can
+        # share the rate limits of the exchange. Different locations are queried concurrently.
+        location_exchanges: defaultdict[Location, list[ExchangeInterface]] = defaultdict(list)
         for exchange in self.exchange_manager.iterate_exchanges():
-            self.processing_state_name = f'Querying {exchange.name} exchange history'
-            exchange.query_history_with_callbacks(
-                # We need to have history of exchanges since before the range
-                start_ts=Timestamp(0),
+            location_exchanges[exchange.location].append(exchange)
+
+        pool = Pool(size=EXCHANGES_HISTORY_CONCURRENCY)
+        for exchanges in location_exchanges.values():
+            pool.spawn(
+                self._query_exchanges_history,
+                exchanges=exchanges,
                 end_ts=end_ts,
                 fail_callback=fail_history_cb,
-                new_step_data=(new_step_cb, exchange.name),
-            )
-            # each exchange instance executes STEPS_PER_CEX steps out of the total_steps
-            step = self._increase_progress(step, total_steps, step_by=STEPS_PER_CEX)
-
-        # Query all trades, asset movements and margin positions from the DB for all
-        # possible locations.
-        self.processing_state_name = 'Reading trades, asset movements and margin positions from the DB'  # noqa: E501
-        with self.db.conn.read_ctx() as cursor:
-            # Include all trades
-            trades = self.db.get_trades(
-                cursor,
-                filter_query=TradesFilterQuery.make(to_ts=end_ts),
-                has_premium=True,  # we need all trades for accounting -- limit happens later
+                increase_steps_cb=increase_steps_cb,
             )
-            history.extend(trades)
-
-            # Include all margin positions
-            margin_positions = self.db.get_margin_positions(cursor, to_ts=end_ts)
-            history.extend(margin_positions)
-
-        step = self._increase_progress(step, total_steps)
+        pool.join()
 
         for blockchain in EVM_CHAINS_WITH_TRANSACTIONS:
             str_blockchain = str(blockchain)
@@ -337,11 +420,10 @@ class HistoryQueryingManager:
             self.processing_state_name = 'Querying ETH2 staking history'
             if self.should_query_eth2_daily_stats:
                 try:
-                    eth2_events = self.chains_aggregator.refresh_eth2_get_daily_stats(
+                    eth2_events.extend(self.chains_aggregator.refresh_eth2_get_daily_stats(
                         from_timestamp=Timestamp(0),
                         to_timestamp=end_ts,
-                    )
-                    history.extend(eth2_events)
+                    ))
                 except RemoteError as e:
                     self.msg_aggregator.add_error(
                         f'Eth2 daily stats are not included in the PnL report due to {e!s}',
@@ -349,6 +431,97 @@ class HistoryQueryingManager:
             # make sure that eth2 events and history events are combined
             eth2.combine_block_with_tx_events()
 
+        step = self._increase_progress(step, total_steps)
+        return empty_or_error, step, eth2_events
+
+    def _query_exchanges_history(
+            self,
+            exchanges: list[ExchangeInterface],
+            end_ts: Timestamp,
+            fail_callback: Callable[[str], None],
+            increase_steps_cb: Callable[[int], None],
+    ) -> None:
+        """Queries and saves in the DB the history of the given exchanges one after the other.
+        Runs in its own greenlet so an error of an exchange is passed to the fail callback
+        and does not stop the history query of any other exchange.
+
+        Each exchange instance executes exactly STEPS_PER_CEX steps out of the total steps,
+        no matter at which point its query stopped."""
+        for exchange in exchanges:
+            steps_done = 0
+
+            def new_step_cb(state_name: str) -> None:
+                """This callback will run for each new step in exchange history query"""
+                nonlocal steps_done
+                self.processing_state_name = state_name
+                if steps_done < STEPS_PER_CEX:
+                    steps_done += 1
+                    increase_steps_cb(1)
+
+            self.processing_state_name = f'Querying {exchange.name} exchange history'
+            try:
+                exchange.query_history_with_callbacks(
+                    # We need to have history of exchanges since before the range
+                    start_ts=Timestamp(0),
+                    end_ts=end_ts,
+                    fail_callback=fail_callback,
+                    new_step_data=(new_step_cb, exchange.name),
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                msg = f'Failed to query {exchange.name} history due to {e!s}'
+                log.error(msg)
+                fail_callback(msg)
+
+            increase_steps_cb(STEPS_PER_CEX - steps_done)
+
+    def _history_total_steps(self) -> int:
+        return (
+            self.exchange_manager.connected_and_syncing_exchanges_num() * STEPS_PER_CEX +
+            NUM_HISTORY_QUERY_STEPS_EXCL_EXCHANGES
+        )
+
+    def get_history(
+            self,
+            start_ts: Timestamp,
+            end_ts: Timestamp,
+            has_premium: bool,
+    ) -> tuple[str, list['AccountingEventMixin']]:
+        """
+        Creates all events history from start_ts to end_ts. Returns it
+        sorted by ascending timestamp.
+        """
+        self._reset_variables()
+        total_steps = self._history_total_steps()
+        log.info(
+            'Get/create trade history',
+            start_ts=start_ts,
+            end_ts=end_ts,
+        )
+        empty_or_error, step, eth2_events = self._sync_history(
+            end_ts=end_ts,
+            has_premium=has_premium,
+            total_steps=total_steps,
+        )
+        # start creating the all trades history list
+        history: list[AccountingEventMixin] = []
+
+        # Query all trades, asset movements and margin positions from the DB for all
+        # possible locations.
+        self.processing_state_name = 'Reading trades, asset movements and margin positions from the DB'  # noqa: E501
+        with self.db.conn.read_ctx() as cursor:
+            # Include all trades
+            trades = self.db.get_trades(
+                cursor,
+                filter_query=TradesFilterQuery.make(to_ts=end_ts),
+                has_premium=True,  # we need all trades for accounting -- limit happens later
+            )
+            history.extend(trades)
+
+            # Include all margin positions
+            margin_positions = self.db.get_margin_positions(cursor, to_ts=end_ts)
+            history.extend(margin_positions)
+
+        history.extend(eth2_events)
         step = self._increase_progress(step, total_steps)
         self.processing_state_name = 'Querying base history events'
         # Include all base history entries
@@ -367,10 +540,144 @@ class HistoryQueryingManager:
         history.extend(base_entries)
         self._increase_progress(step, total_steps)
 
-        history.sort(  # sort events first by timestamp and if history base by sequence index
-            key=lambda x: (
-                x.get_timestamp(),
-                x.sequence_index if isinstance(x, HistoryBaseEntry) else 1,
-            ),
-        )
+        history.sort(key=history_sort_key)
         return empty_or_error, history
+
+    def get_history_stream(
+            self,
+            start_ts: Timestamp,
+            end_ts: Timestamp,
+            has_premium: bool,
+            window: int = HISTORY_STREAM_WINDOW,
+    ) -> HistoryStream:
+        """Same as get_history but instead of reading the entire history in memory it returns
+        an iterator that merges the timestamp ordered history sources of the DB, reading at
+        most `window` entries of each source at a time.
+
+        The order of the events is the same as the one of get_history. Together with the
+        events the number of them and the time ranges of their assets are computed in the DB.
+        """
+        self._reset_variables()
+        total_steps = self._history_total_steps()
+        log.info(
+            'Get/create streamed trade history',
+            start_ts=start_ts,
+            end_ts=end_ts,
+            window=window,
+        )
+        empty_or_error, step, eth2_events = self._sync_history(
+            end_ts=end_ts,
+            has_premium=has_premium,
+            total_steps=total_steps,
+        )
+        self.processing_state_name = 'Counting history entries in the DB'
+        history_events_db = DBHistoryEvents(self.db)
+        trades_count_filter = TradesFilterQuery.make(to_ts=end_ts)
+        events_count_filter = HistoryEventFilterQuery.make(from_ts=Timestamp(0), to_ts=end_ts)
+        with self.db.conn.read_ctx() as cursor:
+            query, bindings = trades_count_filter.prepare(with_pagination=False, with_order=False)
+            total_events = cursor.execute(f'SELECT COUNT(*) FROM trades {query}', bindings).fetchone()[0]  # noqa: E501
+            total_events += history_events_db.get_history_events_count(
+                cursor=cursor,
+                query_filter=events_count_filter,
+            )[0]
+            # margin positions are a legacy, small table so they are kept in memory
+            margin_positions = self.db.get_margin_positions(cursor, to_ts=end_ts)
+            assets_ranges = self._get_db_assets_ranges(cursor=cursor, end_ts=end_ts)
+
+        total_events += len(margin_positions) + len(eth2_events)
+        for asset, (start, end) in get_events_assets_ranges(margin_positions + eth2_events).items():  # noqa: E501
+            update_assets_ranges(assets_ranges, asset, start, end)
+        step = self._increase_progress(step, total_steps)
+
+        def query_trades(
+                from_ts: Timestamp,
+                offset: int,
+                limit: int,
+        ) -> tuple[list[Trade], int]:
+            filter_query = TradesFilterQuery.make(
+                order_by_rules=[('timestamp', True), ('id', True)],
+                limit=limit,
+                offset=offset,
+                from_ts=from_ts,
+                to_ts=end_ts,
+            )
+            with self.db.conn.read_ctx() as cursor:
+                trades = self.db.get_trades(
+                    cursor,
+                    filter_query=filter_query,
+                    has_premium=True,  # we need all trades for accounting
+                )
+                return trades, count_window_rows(cursor, 'trades', filter_query, len(trades))
+
+        def query_history_events(
+                from_ts: Timestamp,
+                offset: int,
+                limit: int,
+        ) -> tuple[list[HistoryBaseEntry], int]:
+            filter_query = HistoryEventFilterQuery.make(
+                order_by_rules=[('timestamp', True), ('sequence_index', True), ('identifier', True)],  # noqa: E501
+                limit=limit,
+                offset=offset,
+                from_ts=from_ts,
+                to_ts=end_ts,
+            )
+            with self.db.conn.read_ctx() as cursor:
+                events = history_events_db.get_history_events(
+                    cursor=cursor,
+                    filter_query=filter_query,
+                    has_premium=True,  # ignore limits here. Limit applied at processing
+                    group_by_event_ids=False,
+                )
+                return events, count_window_rows(
+                    cursor=cursor,
+                    table='history_events',
+                    filter_query=filter_query,
+                    entries_num=len(events),
+                )
+
+        self._increase_progress(step, total_steps)
+        # the order of the sources matches the one in which get_history extends its list
+        # since heapq.merge keeps the sources order for equal keys
+        events = iter(heapq.merge(
+            windowed_db_source(query_window=query_trades, window=window),
+            iter(margin_positions),
+            iter(sorted(eth2_events, key=history_sort_key)),
+            sort_within_timestamp(windowed_db_source(query_window=query_history_events, window=window)),  # noqa: E501
+            key=history_sort_key,
+        ))
+        return HistoryStream(
+            error_or_empty=empty_or_error,
+            total_events=total_events,
+            events=events,
+            assets_ranges=assets_ranges,
+        )
+
+    def _get_db_assets_ranges(
+            self,
+            cursor: 'DBCursor',
+            end_ts: Timestamp,
+    ) -> dict[Asset, tuple[Timestamp, Timestamp]]:
+        """Returns the first and last timestamp until end_ts at which each asset appears
+        in the trades and history events of the DB"""
+        assets_ranges: dict[Asset, tuple[Timestamp, Timestamp]] = {}
+        cursor.execute(
+            'SELECT asset, MIN(timestamp), MAX(timestamp) FROM ('
+            'SELECT base_asset AS asset, timestamp FROM trades UNION ALL '
+            'SELECT quote_asset, timestamp FROM trades UNION ALL '
+            'SELECT fee_currency, timestamp FROM trades WHERE fee_currency IS NOT NULL'
+            ') WHERE timestamp <= ? GROUP BY asset',
+            (end_ts,),
+        )
+        for asset, start, end in cursor.fetchall():
+            update_assets_ranges(assets_ranges, Asset(asset), start, end)
+
+        cursor.execute(
+            'SELECT asset, MIN(timestamp) / 1000, MAX(timestamp) / 1000 FROM history_events '
+            'WHERE timestamp <= ? GROUP BY asset',
+            (end_ts * 1000,),
+        )
+        for asset, start, end in cursor.fetchall():
+            update_assets_ranges(assets_ranges, Asset(asset), start, end)
+
+        return assets_ranges
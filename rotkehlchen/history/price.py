@@ -1,5 +1,5 @@
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from contextlib import suppress
 from http import HTTPStatus
 from pathlib import Path
@@ -16,8 +16,15 @@ from rotkehlchen.constants.assets import (
     A_POLYGON_POS_MATIC,
     A_USD,
 )
+from rotkehlchen.constants.misc import DEFAULT_HISTORICAL_PRICE_CACHE_SIZE
 from rotkehlchen.constants.prices import ZERO_PRICE
-from rotkehlchen.errors.asset import UnknownAsset, WrongAssetType
+from rotkehlchen.constants.timing import DAY_IN_SECONDS, HOUR_IN_SECONDS
+from rotkehlchen.errors.asset import (
+    UnknownAsset,
+    UnprocessableTradePair,
+    UnsupportedAsset,
+    WrongAssetType,
+)
 from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.errors.price import NoPriceForGivenTimestamp, PriceQueryUnsupportedAsset
 from rotkehlchen.fval import FVal
@@ -26,10 +33,13 @@ from rotkehlchen.globaldb.manual_price_oracles import ManualPriceOracle
 from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.types import Price, Timestamp
+from rotkehlchen.utils.data_structures import LRUCacheWithRemove
+from rotkehlchen.utils.misc import ts_now
 
 from .types import HistoricalPriceOracle, HistoricalPriceOracleInstance
 
 if TYPE_CHECKING:
+    from rotkehlchen.accounting.mixins.event import AccountingEventMixin
     from rotkehlchen.chain.ethereum.oracles.uniswap import UniswapV2Oracle, UniswapV3Oracle
     from rotkehlchen.externalapis.coingecko import Coingecko
     from rotkehlchen.externalapis.cryptocompare import Cryptocompare
@@ -39,6 +49,10 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+MISSING_PRICE_CACHE_SECS = 600  # 10 mins
+# from asset, to asset and the hour of the timestamp of a historical price
+PriceCacheKey = tuple[Asset, Asset, int]
+
 
 def query_usd_price_or_use_default(
         asset: Asset,
@@ -84,6 +98,36 @@ def query_usd_price_zero_if_error(
     return usd_price
 
 
+def update_assets_ranges(
+        assets_ranges: dict[Asset, tuple[Timestamp, Timestamp]],
+        asset: Asset,
+        start_ts: Timestamp,
+        end_ts: Timestamp,
+) -> None:
+    """Extends the time range of the asset in assets_ranges to include start_ts to end_ts"""
+    if (current := assets_ranges.get(asset)) is not None:
+        start_ts, end_ts = min(current[0], start_ts), max(current[1], end_ts)
+    assets_ranges[asset] = (start_ts, end_ts)
+
+
+def get_events_assets_ranges(
+        events: Iterable['AccountingEventMixin'],
+) -> dict[Asset, tuple[Timestamp, Timestamp]]:
+    """Returns the time range in which prices of each asset of the events will be needed"""
+    assets_ranges: dict[Asset, tuple[Timestamp, Timestamp]] = {}
+    for event in events:
+        try:
+            assets = event.get_assets()
+        except (UnknownAsset, UnsupportedAsset, UnprocessableTradePair):
+            continue  # will be reported during processing
+
+        timestamp = event.get_timestamp()
+        for asset in assets:
+            update_assets_ranges(assets_ranges, asset, timestamp, timestamp)
+
+    return assets_ranges
+
+
 class PriceHistorian:
     __instance: Optional['PriceHistorian'] = None
     _cryptocompare: 'Cryptocompare'
@@ -94,6 +138,9 @@ class PriceHistorian:
     _manual: ManualPriceOracle  # This is used when iterating through all oracles
     _oracles: Sequence[HistoricalPriceOracle] | None = None
     _oracle_instances: list[HistoricalPriceOracleInstance] | None = None
+    # prices found and the time when a price could not be found, per hour of the timestamp
+    _cached_prices: LRUCacheWithRemove[PriceCacheKey, Price]
+    _cached_missing_prices: LRUCacheWithRemove[PriceCacheKey, Timestamp]
 
     def __new__(
             cls,
@@ -103,6 +150,7 @@ class PriceHistorian:
             defillama: Optional['Defillama'] = None,
             uniswapv2: Optional['UniswapV2Oracle'] = None,
             uniswapv3: Optional['UniswapV3Oracle'] = None,
+            cache_size: int = DEFAULT_HISTORICAL_PRICE_CACHE_SIZE,
     ) -> 'PriceHistorian':
         if PriceHistorian.__instance is not None:
             return PriceHistorian.__instance
@@ -122,6 +170,8 @@ class PriceHistorian:
         PriceHistorian._uniswapv2 = uniswapv2
         PriceHistorian._uniswapv3 = uniswapv3
         PriceHistorian._manual = ManualPriceOracle()
+        PriceHistorian._cached_prices = LRUCacheWithRemove(maxsize=cache_size)
+        PriceHistorian._cached_missing_prices = LRUCacheWithRemove(maxsize=cache_size)
 
         return PriceHistorian.__instance
 
@@ -133,6 +183,47 @@ class PriceHistorian:
         instance = PriceHistorian()
         instance._oracles = oracles
         instance._oracle_instances = [getattr(instance, f'_{oracle!s}') for oracle in oracles]
+        PriceHistorian.clear_cached_prices()
+
+    @staticmethod
+    def clear_cached_prices() -> None:
+        PriceHistorian._cached_prices.clear()
+        PriceHistorian._cached_missing_prices.clear()
+
+    @staticmethod
+    def remove_cached_prices(from_asset: Asset, to_asset: Asset) -> None:
+        """Deletes the cached prices, found or not, of the given pair in both directions.
+        Should be called when the stored prices of the pair are modified."""
+        for cache in (PriceHistorian._cached_prices, PriceHistorian._cached_missing_prices):
+            for cache_key in list(cache.cache):  # create a list to avoid mutating the map while iterating it  # noqa: E501
+                if {cache_key[0], cache_key[1]} == {from_asset, to_asset}:
+                    cache.remove(cache_key)
+
+    @staticmethod
+    def prefetch_historical_prices(
+            to_asset: Asset,
+            assets_ranges: dict[Asset, tuple[Timestamp, Timestamp]],
+    ) -> None:
+        """Loads in memory, with a few bulk queries, all the known historical prices of the
+        given assets to `to_asset` for the given time ranges. This way the oracles only need
+        to reach the DB or a remote service for the prices that are missing.
+
+        The ranges are extended by a day on each side since that is the max distance at
+        which the oracles accept a price from the DB.
+        Should be followed by a call to clear_prefetched_prices once the prices are not needed.
+        """
+        GlobalDBHandler.load_historical_price_index(
+            to_asset=to_asset,
+            assets_ranges={
+                asset: (Timestamp(max(0, start_ts - DAY_IN_SECONDS)), Timestamp(end_ts + DAY_IN_SECONDS))  # noqa: E501
+                for asset, (start_ts, end_ts) in assets_ranges.items()
+                if asset != to_asset
+            },
+        )
+
+    @staticmethod
+    def clear_prefetched_prices() -> None:
+        GlobalDBHandler.clear_historical_price_index()
 
     @staticmethod
     def get_price_for_special_asset(
@@ -223,6 +314,48 @@ class PriceHistorian:
         if from_asset == to_asset:
             return Price(ONE)
 
+        # Prices are cached per hour since no oracle has a finer granularity than that and
+        # accounting asks for the same prices at many different seconds of the same hour.
+        cache_key = (from_asset, to_asset, timestamp // HOUR_IN_SECONDS)
+        if (price := PriceHistorian._cached_prices.get(cache_key)) is not None:
+            return price
+
+        if (missing_since := PriceHistorian._cached_missing_prices.get(cache_key)) is not None:
+            if ts_now() - missing_since < MISSING_PRICE_CACHE_SECS:
+                raise NoPriceForGivenTimestamp(
+                    from_asset=from_asset,
+                    to_asset=to_asset,
+                    time=timestamp,
+                )
+
+            PriceHistorian._cached_missing_prices.remove(cache_key)
+
+        try:
+            price = PriceHistorian._query_historical_price(
+                from_asset=from_asset,
+                to_asset=to_asset,
+                timestamp=timestamp,
+            )
+        except NoPriceForGivenTimestamp as e:
+            if e.rate_limited is False:  # rate limits are temporary so try again next time
+                PriceHistorian._cached_missing_prices.add(cache_key, ts_now())
+            raise
+
+        PriceHistorian._cached_prices.add(cache_key, price)
+        return price
+
+    @staticmethod
+    def _query_historical_price(
+            from_asset: Asset,
+            to_asset: Asset,
+            timestamp: Timestamp,
+    ) -> Price:
+        """Query the historical price from the oracles without using the cached prices.
+
+        May raise:
+        - NoPriceForGivenTimestamp if we can't find a price for the asset in the given
+        timestamp from the external service.
+        """
         special_asset_price = PriceHistorian().get_price_for_special_asset(
             from_asset=from_asset,
             to_asset=to_asset,
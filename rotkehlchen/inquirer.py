@@ -107,7 +107,10 @@ from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.cache import globaldb_get_unique_cache_value, read_curve_pool_tokens
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.history.types import HistoricalPrice, HistoricalPriceOracle
-from rotkehlchen.interfaces import CurrentPriceOracleInterface
+from rotkehlchen.interfaces import (
+    CurrentPriceOracleInterface,
+    MultipleCurrentPriceOracleInterface,
+)
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.oracles.structures import CurrentPriceOracle
 from rotkehlchen.serialization.deserialize import deserialize_evm_address
@@ -767,6 +770,117 @@ class Inquirer:
             coming_from_latest_price=coming_from_latest_price,
         )
 
+    @staticmethod
+    def _get_multiple_query_asset(
+            asset: Asset,
+            manual_price_assets: set[str],
+    ) -> AssetWithOracles | None:
+        """Returns the resolved asset if its usd price would be found by querying the oracles
+        in `_find_usd_price` without any special handling and None otherwise."""
+        if (
+            asset in (A_USD, A_ETH2, A_BSQ, A_KFEE, A_POLYGON_POS_MATIC) or
+            asset.identifier in manual_price_assets
+        ):
+            return None
+
+        try:
+            resolved_asset = asset.resolve()
+        except UnknownAsset:
+            return None
+
+        if isinstance(resolved_asset, FiatAsset) or not isinstance(resolved_asset, AssetWithOracles):  # noqa: E501
+            return None
+
+        if isinstance(resolved_asset, EvmToken) and (
+            resolved_asset.identifier in Inquirer.special_tokens or
+            resolved_asset.protocol in ProtocolsWithPriceLogic or
+            resolved_asset.underlying_tokens is not None
+        ):
+            return None
+
+        return resolved_asset
+
+    @staticmethod
+    def find_usd_prices(
+            assets: Iterable[Asset],
+            ignore_cache: bool = False,
+            errors: dict[Asset, RemoteError] | None = None,
+    ) -> dict[Asset, Price]:
+        """Returns the current usd price of each of the given assets.
+
+        Cached prices are used where possible. Missing prices of the assets that need no
+        special price logic are queried in chunks from the oracles that can query many
+        assets at once, following the oracles order until an oracle without such support
+        is reached. Only the assets still missing a price are then queried one by one
+        with `find_usd_price`. Assets whose price query raised a RemoteError are not
+        included in the result. If `errors` is given the error of each of them is added to it.
+        """
+        instance = Inquirer()
+        assert instance._oracles is not None and instance._oracle_instances is not None, (
+            'Inquirer should never be called before setting the oracles'
+        )
+        prices: dict[Asset, Price] = {}
+        multiple_query_assets: list[AssetWithOracles] = []
+        single_query_assets: list[Asset] = []
+        manual_price_assets = {entry[0] for entry in GlobalDBHandler.get_all_manual_latest_prices()}  # noqa: E501
+        for asset in dict.fromkeys(assets):
+            if ignore_cache is False and (cache := Inquirer.get_cached_current_price_entry(cache_key=(asset, A_USD))) is not None:  # noqa: E501
+                prices[asset] = cache.price
+            elif (resolved_asset := Inquirer._get_multiple_query_asset(asset, manual_price_assets)) is not None:  # noqa: E501
+                multiple_query_assets.append(resolved_asset)
+            else:
+                single_query_assets.append(asset)
+
+        usd = A_USD.resolve_to_asset_with_oracles()
+        for oracle, oracle_instance in zip(instance._oracles, instance._oracle_instances, strict=True):  # noqa: E501
+            if (
+                len(multiple_query_assets) == 0 or
+                not isinstance(oracle_instance, MultipleCurrentPriceOracleInterface)
+            ):
+                break
+
+            if (
+                oracle_instance.rate_limited_in_last(DEFAULT_RATE_LIMIT_WAITING_TIME) is True or
+                (isinstance(oracle_instance, PenalizablePriceOracleMixin) and oracle_instance.is_penalized() is True)  # noqa: E501
+            ):
+                continue
+
+            try:
+                oracle_prices = oracle_instance.query_multiple_current_prices(
+                    from_assets=multiple_query_assets,
+                    to_asset=usd,
+                )
+            except RemoteError as e:
+                log.warning(
+                    f'Current price oracle {oracle_instance} failed to request usd prices '
+                    f'for {len(multiple_query_assets)} assets due to: {e!s}.',
+                )
+                continue
+
+            now = ts_now()
+            for asset, price in oracle_prices.items():
+                if price == ZERO_PRICE:
+                    continue
+
+                prices[asset] = price
+                Inquirer.set_cached_price(
+                    cache_key=(asset, A_USD),
+                    cached_price=CachedPriceEntry(price=price, time=now, oracle=oracle),
+                )
+
+            log.debug(f'Current price oracle {oracle} got {len(oracle_prices)} usd prices')
+            multiple_query_assets = [x for x in multiple_query_assets if x not in prices]
+
+        for asset in single_query_assets + multiple_query_assets:
+            try:
+                prices[asset] = Inquirer.find_usd_price(asset=asset, ignore_cache=ignore_cache)
+            except RemoteError as e:
+                log.error(f'Failed to query the usd price of {asset.identifier} due to {e!s}')
+                if errors is not None:
+                    errors[asset] = e
+
+        return prices
+
     @staticmethod
     def _find_usd_price(
             asset: Asset,
@@ -1,6 +1,7 @@
 import abc
 import json
 import logging
+from collections.abc import Sequence
 from contextlib import suppress
 from json import JSONDecodeError
 from typing import Any, Final
@@ -52,6 +53,24 @@ class CurrentPriceOracleInterface(abc.ABC):
         """
 
 
+class MultipleCurrentPriceOracleInterface(CurrentPriceOracleInterface, abc.ABC):
+    """Oracles that can query the current price of many assets with a single request"""
+
+    @abc.abstractmethod
+    def query_multiple_current_prices(
+            self,
+            from_assets: Sequence[AssetWithOracles],
+            to_asset: AssetWithOracles,
+    ) -> dict[AssetWithOracles, Price]:
+        """Query the current price of each of the from_assets in to_asset.
+
+        Assets for which the oracle has no price are not included in the result.
+
+        May raise:
+        - RemoteError if there is a problem querying the oracle
+        """
+
+
 class HistoricalPriceOracleInterface(CurrentPriceOracleInterface, abc.ABC):
     """Query prices for certain timestamps. Oracle could be rate limited"""
 
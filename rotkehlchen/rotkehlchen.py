@@ -2,15 +2,19 @@
 
 import argparse
 import contextlib
+import functools
 import logging
+import operator
 import os
 import time
 from collections import defaultdict
+from collections.abc import Callable
 from pathlib import Path
 from types import FunctionType
-from typing import TYPE_CHECKING, Any, Literal, Optional, cast, overload
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, cast, overload
 
 import gevent
+from gevent.pool import Pool
 
 from rotkehlchen.accounting.accountant import Accountant
 from rotkehlchen.accounting.structures.balance import Balance, BalanceType
@@ -118,14 +122,48 @@ from rotkehlchen.utils.datadir import maybe_restructure_rotki_data_directory
 from rotkehlchen.utils.misc import combine_dicts
 
 if TYPE_CHECKING:
+    from rotkehlchen.chain.balances import BlockchainBalancesUpdate
     from rotkehlchen.chain.bitcoin.xpub import XpubData
     from rotkehlchen.db.drivers.gevent import DBCursor
+    from rotkehlchen.exchanges.exchange import ExchangeInterface, ExchangeQueryBalances
     from rotkehlchen.exchanges.kraken import KrakenAccountType
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
 MAIN_LOOP_SECS_DELAY = 10
+# max number of balance sources (exchange locations, blockchain, loopring
+# and nfts) that are queried at the same time when taking a balance snapshot
+BALANCES_QUERY_CONCURRENCY = 6
+
+T = TypeVar('T')
+
+
+def _timed_query(
+        query_durations: dict[str, float],
+        source: str,
+        query: Callable[[], T],
+) -> T | Exception:
+    """Runs the query of a balances source and records in query_durations, under the
+    source name, the seconds it took whether it succeeded or not.
+
+    The error of a failed query is returned instead of the result so that the other
+    sources of the balances snapshot are still queried. Use _raise_if_error to get
+    the result."""
+    start = time.monotonic()
+    try:
+        return query()
+    except Exception as e:  # pylint: disable=broad-except
+        return e
+    finally:
+        query_durations[source] = time.monotonic() - start
+
+
+def _raise_if_error(result: T | Exception) -> T:
+    """Raises the error returned by _timed_query or returns the result of the query"""
+    if isinstance(result, Exception):
+        raise result
+    return result
 
 
 class Rotkehlchen:
@@ -170,6 +208,7 @@ class Rotkehlchen:
             perform_assets_updates=True,
             sql_vm_instructions_cb=self.args.sqlite_instructions,
             msg_aggregator=self.msg_aggregator,
+            read_pool_size=self.args.db_read_pool_size,
         )
         if globaldb.used_backup is True:
             self.msg_aggregator.add_warning(
@@ -180,6 +219,7 @@ class Rotkehlchen:
             self.data_dir,
             self.msg_aggregator,
             sql_vm_instructions_cb=args.sqlite_instructions,
+            read_pool_size=args.db_read_pool_size,
         )
         self.cryptocompare = Cryptocompare(database=None)
         self.coingecko = Coingecko(database=None)
@@ -438,6 +478,7 @@ class Rotkehlchen:
             defillama=self.defillama,
             uniswapv2=uniswap_v2_oracle,
             uniswapv3=uniswap_v3_oracle,
+            cache_size=self.args.historical_price_cache_size,
         )
         price_historian.set_oracles_order(settings.historical_price_oracles)
 
@@ -468,6 +509,7 @@ class Rotkehlchen:
             data_directory=self.data_dir,
             beaconchain=self.beaconchain,
             btc_derivation_gap_limit=settings.btc_derivation_gap_limit,
+            balances_concurrency=self.args.chain_balances_concurrency,
         )
         Inquirer().inject_evm_managers([
             (chain.to_chain_id(), self.chains_aggregator.get_chain_manager(chain))
@@ -954,7 +996,7 @@ class Rotkehlchen:
             start_ts: Timestamp,
             end_ts: Timestamp,
     ) -> tuple[int, str]:
-        error_or_empty, events = self.history_querying_manager.get_history(
+        history = self.history_querying_manager.get_history_stream(
             start_ts=start_ts,
             end_ts=end_ts,
             has_premium=has_premium_check(self.premium),
@@ -962,9 +1004,24 @@ class Rotkehlchen:
         report_id = self.accountant.process_history(
             start_ts=start_ts,
             end_ts=end_ts,
-            events=events,
+            events=history.events,
+            total_events=history.total_events,
+            assets_ranges=history.assets_ranges,
         )
-        return report_id, error_or_empty
+        return report_id, history.error_or_empty
+
+    @staticmethod
+    def _query_exchanges_balances(
+            exchanges: list['ExchangeInterface'],
+            ignore_cache: bool,
+            query_durations: dict[str, float],
+    ) -> list['ExchangeQueryBalances | Exception']:
+        """Queries the balances of the given exchanges one after the other"""
+        return [_timed_query(
+            query_durations=query_durations,
+            source=f'{exchange.location!s} {exchange.name}',
+            query=functools.partial(exchange.query_balances, ignore_cache=ignore_cache),
+        ) for exchange in exchanges]
 
     def query_balances(
             self,
@@ -993,10 +1050,69 @@ class Rotkehlchen:
             save_despite_errors=save_despite_errors,
         )
 
+        # Query all the sources of balances concurrently. Their results are merged below
+        # in a fixed order so that the result does not depend on which query ended first.
+        query_durations: dict[str, float] = {}
+        pool = Pool(size=BALANCES_QUERY_CONCURRENCY)
+        # Instances of the same location are queried one after the other since they can
+        # share the rate limits of the exchange.
+        location_exchanges: defaultdict[Location, list[ExchangeInterface]] = defaultdict(list)
+        all_exchanges = list(self.exchange_manager.iterate_exchanges())
+        for exchange in all_exchanges:
+            location_exchanges[exchange.location].append(exchange)
+        exchanges_greenlets = [
+            (exchanges, pool.spawn(
+                self._query_exchanges_balances,
+                exchanges=exchanges,
+                ignore_cache=ignore_cache,
+                query_durations=query_durations,
+            )) for exchanges in location_exchanges.values()
+        ]
+        blockchain_greenlet = pool.spawn(
+            _timed_query,
+            query_durations=query_durations,
+            source='blockchain',
+            query=functools.partial(
+                self.chains_aggregator.query_balances,
+                blockchain=None,
+                ignore_cache=ignore_cache,
+            ),
+        )
+        loopring_greenlet = nfts_greenlet = None
+        if self.chains_aggregator.get_module('loopring'):
+            loopring_greenlet = pool.spawn(
+                _timed_query,
+                query_durations=query_durations,
+                source='loopring',
+                query=self.chains_aggregator.get_loopring_balances,
+            )
+        if (nfts := self.chains_aggregator.get_module('nfts')) is not None:
+            nfts_greenlet = pool.spawn(
+                _timed_query,
+                query_durations=query_durations,
+                source='nfts',
+                query=functools.partial(
+                    nfts.get_db_nft_balances,
+                    filter_query=NFTFilterQuery.make(),
+                ),
+            )
+        pool.join()
+        durations = ', '.join(
+            f'{source}: {duration:.2f}' for source, duration in
+            sorted(query_durations.items(), key=operator.itemgetter(1), reverse=True)
+        )
+        log.debug(
+            f'Queried the balances of {len(query_durations)} sources with concurrency '
+            f'{BALANCES_QUERY_CONCURRENCY}. Seconds per source: {durations}',
+        )
+
         balances: dict[str, dict[Asset, Balance]] = {}
         problem_free = True
-        for exchange in self.exchange_manager.iterate_exchanges():
-            exchange_balances, error_msg = exchange.query_balances(ignore_cache=ignore_cache)
+        exchanges_balances: dict[ExchangeInterface, ExchangeQueryBalances | Exception] = {}
+        for exchanges, greenlet in exchanges_greenlets:
+            exchanges_balances.update(zip(exchanges, greenlet.get(), strict=True))
+        for exchange in all_exchanges:
+            exchange_balances, error_msg = _raise_if_error(exchanges_balances[exchange])
             # If we got an error, disregard that exchange but make sure we don't save data
             if not isinstance(exchange_balances, dict):
                 problem_free = False
@@ -1016,10 +1132,10 @@ class Rotkehlchen:
 
         liabilities: dict[Asset, Balance]
         try:
-            blockchain_result = self.chains_aggregator.query_balances(
-                blockchain=None,
-                ignore_cache=ignore_cache,
-            )  # copies below since if cache is used we end up modifying the balance sheet object
+            blockchain_result: BlockchainBalancesUpdate = _raise_if_error(
+                blockchain_greenlet.get(),
+            )
+            # copies below since if cache is used we end up modifying the balance sheet object
             if len(blockchain_result.totals.assets) != 0:
                 balances[str(Location.BLOCKCHAIN)] = blockchain_result.totals.assets.copy()
             liabilities = blockchain_result.totals.liabilities.copy()
@@ -1041,10 +1157,10 @@ class Rotkehlchen:
             manual_liabilities_as_dict[manual_liability.asset] += manual_liability.value
 
         liabilities = combine_dicts(liabilities, manual_liabilities_as_dict)
-        # retrieve loopring balances if module is activated
-        if self.chains_aggregator.get_module('loopring'):
+        # add loopring balances if module is activated
+        if loopring_greenlet is not None:
             try:
-                loopring_balances = self.chains_aggregator.get_loopring_balances()
+                loopring_balances: dict[Asset, Balance] = _raise_if_error(loopring_greenlet.get())
             except RemoteError as e:
                 problem_free = False
                 self.msg_aggregator.add_message(
@@ -1055,11 +1171,11 @@ class Rotkehlchen:
                 if len(loopring_balances) != 0:
                     balances[str(Location.LOOPRING)] = loopring_balances
 
-        # retrieve nft balances if module is activated
-        nfts = self.chains_aggregator.get_module('nfts')
-        if nfts is not None:
+        # add nft balances if module is activated
+        if nfts_greenlet is not None:
             try:
-                nft_balances = nfts.get_db_nft_balances(filter_query=NFTFilterQuery.make())['entries']  # noqa: E501
+                nfts_result: dict[str, Any] = _raise_if_error(nfts_greenlet.get())
+                nft_balances = nfts_result['entries']
             except RemoteError as e:
                 log.error(
                     f'At balance snapshot NFT balances query failed due to {e!s}. Error '
@@ -1152,6 +1268,7 @@ class Rotkehlchen:
                         write_cursor=write_cursor,
                         data=result_dict,
                         timestamp=timestamp,
+                        query_durations=query_durations,
                     )
                 log.debug('query_balances data saved')
             else:
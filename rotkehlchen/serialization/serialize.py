@@ -1,3 +1,5 @@
+import json
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
 from hexbytes import HexBytes
@@ -71,128 +73,212 @@ from rotkehlchen.types import (
 )
 from rotkehlchen.utils.version_check import VersionCheckResult
 
+STREAMED_LIST_CHUNK_SIZE = 1000  # list entries that are serialized and encoded together
+STREAMED_BUFFER_SIZE = 65536  # minimum characters of each chunk of an encoded result
 
-def _process_entry(entry: Any) -> str | (list[Any] | (dict[str, Any] | Any)):
-    if isinstance(entry, FVal):
-        return str(entry)
-    if isinstance(entry, list):
-        return [_process_entry(x) for x in entry]
-
-    if isinstance(entry, dict | AttributeDict):
-        new_dict = {}
-        for k, v in entry.items():
-            if isinstance(k, Asset) is True:
-                k = k.identifier  # noqa: PLW2901
-            elif isinstance(k, HistoryEventType | HistoryEventSubType | EventCategory | Location | AccountingEventType) is True:  # noqa: E501
-                k = _process_entry(k)  # noqa: PLW2901
-            new_dict[k] = _process_entry(v)
-        return new_dict
-    if isinstance(entry, HexBytes):
-        return entry.to_0x_hex()
-    if isinstance(entry, LocationData):
-        return {
-            'time': entry.time,
-            'location': str(Location.deserialize_from_db(entry.location)),
-            'usd_value': entry.usd_value,
-        }
-    if isinstance(entry, SingleDBAssetBalance):
-        return {
-            'time': entry.time,
-            'category': str(entry.category),
-            'amount': str(entry.amount),
-            'usd_value': str(entry.usd_value),
-        }
-    if isinstance(entry, DBAssetBalance):
-        return {
-            'time': entry.time,
-            'category': str(entry.category),
-            'asset': entry.asset.identifier,
-            'amount': str(entry.amount),
-            'usd_value': str(entry.usd_value),
-        }
-    if isinstance(entry, (
-            AddressbookEntry |
-            AssetBalance |
-            DefiProtocol |
-            MakerdaoVault |
-            XpubData |
-            NodeName |
-            NodeName |
-            SingleBlockchainAccountData |
-            SupportedBlockchain |
-            HistoryEventType |
-            HistoryEventSubType |
-            EventDirection |
-            EvmProduct |
-            DBSettings |
-            TxAccountingTreatment |
-            EventCategoryDetails |
-            CalendarEntry |
-            ReminderEntry |
-            CounterpartyDetails
-    )):
-        return entry.serialize()
-    if isinstance(entry, (
-            Trade |
-            MakerdaoVault |
-            DSRAccountReport |
-            Balance |
-            AaveLendingBalance |
-            AaveBorrowingBalance |
-            CompoundBalance |
-            YearnVaultBalance |
-            LiquidityPool |
-            LiquidityPoolAsset |
-            LiquidityPoolEventsBalance |
-            ManuallyTrackedBalanceWithValue |
-            Trove |
-            DillBalance |
-            NFTResult |
-            ExchangeLocationID |
-            WeightedNode
-    )):
-        return process_result(entry.serialize())
-    if isinstance(entry, (
-            VersionCheckResult |
-            DSRCurrentBalances |
-            VaultEvent |
-            MakerdaoVaultDetails |
-            AaveBalances |
-            DefiBalance |
-            DefiProtocolBalances |
-            BlockchainAccountData |
-            AaveStats
-    )):
-        return process_result(entry._asdict())
-    if isinstance(entry, tuple):
-        return list(entry)
-    if isinstance(entry, Asset):
-        return entry.identifier
-    if isinstance(entry, (
-            TradeType |
-            Location |
-            KrakenAccountType |
-            Location |
-            VaultEventType |
-            CurrentPriceOracle |
-            HistoricalPriceOracle |
-            BalanceType |
-            CostBasisMethod |
-            EvmTokenKind |
-            HistoryBaseEntryType |
-            EventCategory |
-            AccountingEventType |
-            Version |
-            WSMessageType
-    )):
-        return str(entry)
-    if isinstance(entry, ChainID):
-        return entry.to_name()
-
-    # else
+
+def _serialize_location_data(entry: LocationData) -> dict[str, Any]:
+    return {
+        'time': entry.time,
+        'location': str(Location.deserialize_from_db(entry.location)),
+        'usd_value': entry.usd_value,
+    }
+
+
+def _serialize_single_db_asset_balance(entry: SingleDBAssetBalance) -> dict[str, Any]:
+    return {
+        'time': entry.time,
+        'category': str(entry.category),
+        'amount': str(entry.amount),
+        'usd_value': str(entry.usd_value),
+    }
+
+
+def _serialize_db_asset_balance(entry: DBAssetBalance) -> dict[str, Any]:
+    return {
+        'time': entry.time,
+        'category': str(entry.category),
+        'asset': entry.asset.identifier,
+        'amount': str(entry.amount),
+        'usd_value': str(entry.usd_value),
+    }
+
+
+def _process_key(key: Any) -> Any:
+    """Dictionary keys that are assets or enums are turned to strings. Other keys are kept"""
+    if type(key) is str:
+        return key
+    if isinstance(key, Asset):
+        return key.identifier
+    if isinstance(key, HistoryEventType | HistoryEventSubType | EventCategory | Location | AccountingEventType):  # noqa: E501
+        return _process_entry(key)
+    return key
+
+
+def _process_dict(entry: dict | AttributeDict) -> dict[Any, Any]:
+    return {_process_key(k): _process_entry(v) for k, v in entry.items()}
+
+
+def _process_list(entry: list[Any]) -> list[Any]:
+    return [_process_entry(x) for x in entry]
+
+
+# The serializer of each type. Types that are not registered are resolved once to the
+# serializer of their closest registered base class by _get_serializer.
+_SERIALIZERS: dict[type, Callable[[Any], Any]] = {}
+
+
+def _register_serializer(types: Iterable[type], serializer: Callable[[Any], Any]) -> None:
+    """Registers the serializer for the given types. The first registration of a type wins"""
+    for entry_type in types:
+        _SERIALIZERS.setdefault(entry_type, serializer)
+
+
+def _keep_entry(entry: Any) -> Any:
     return entry
 
 
+def _get_serializer(entry_type: type) -> Callable[[Any], Any]:
+    """Finds the serializer of the closest registered base class of the type and registers
+    it for the type so that the lookup happens only once per type"""
+    for base in entry_type.__mro__[1:]:
+        if (serializer := _SERIALIZERS.get(base)) is not None:
+            break
+    else:
+        serializer = _keep_entry
+
+    _SERIALIZERS[entry_type] = serializer
+    return serializer
+
+
+_register_serializer((FVal,), str)
+_register_serializer((list,), _process_list)
+_register_serializer((dict, AttributeDict), _process_dict)
+_register_serializer((HexBytes,), lambda entry: entry.to_0x_hex())
+_register_serializer((LocationData,), _serialize_location_data)
+_register_serializer((SingleDBAssetBalance,), _serialize_single_db_asset_balance)
+_register_serializer((DBAssetBalance,), _serialize_db_asset_balance)
+_register_serializer(
+    (
+        AddressbookEntry,
+        AssetBalance,
+        DefiProtocol,
+        MakerdaoVault,
+        XpubData,
+        NodeName,
+        SingleBlockchainAccountData,
+        SupportedBlockchain,
+        HistoryEventType,
+        HistoryEventSubType,
+        EventDirection,
+        EvmProduct,
+        DBSettings,
+        TxAccountingTreatment,
+        EventCategoryDetails,
+        CalendarEntry,
+        ReminderEntry,
+        CounterpartyDetails,
+    ),
+    lambda entry: entry.serialize(),
+)
+_register_serializer(
+    (
+        Trade,
+        MakerdaoVault,
+        DSRAccountReport,
+        Balance,
+        AaveLendingBalance,
+        AaveBorrowingBalance,
+        CompoundBalance,
+        YearnVaultBalance,
+        LiquidityPool,
+        LiquidityPoolAsset,
+        LiquidityPoolEventsBalance,
+        ManuallyTrackedBalanceWithValue,
+        Trove,
+        DillBalance,
+        NFTResult,
+        ExchangeLocationID,
+        WeightedNode,
+    ),
+    lambda entry: _process_entry(entry.serialize()),
+)
+_register_serializer(
+    (
+        VersionCheckResult,
+        DSRCurrentBalances,
+        VaultEvent,
+        MakerdaoVaultDetails,
+        AaveBalances,
+        DefiBalance,
+        DefiProtocolBalances,
+        BlockchainAccountData,
+        AaveStats,
+    ),
+    lambda entry: _process_entry(entry._asdict()),
+)
+_register_serializer((tuple,), list)
+_register_serializer((Asset,), lambda entry: entry.identifier)
+_register_serializer(
+    (
+        TradeType,
+        Location,
+        KrakenAccountType,
+        VaultEventType,
+        CurrentPriceOracle,
+        HistoricalPriceOracle,
+        BalanceType,
+        CostBasisMethod,
+        EvmTokenKind,
+        HistoryBaseEntryType,
+        EventCategory,
+        AccountingEventType,
+        Version,
+        WSMessageType,
+    ),
+    str,
+)
+_register_serializer((ChainID,), lambda entry: entry.to_name())
+# the JSON types are kept as they are
+_register_serializer((str, int, float, bool, type(None)), _keep_entry)
+
+
+def _process_entry(entry: Any) -> Any:
+    if (serializer := _SERIALIZERS.get(type(entry))) is None:
+        serializer = _get_serializer(type(entry))
+    return serializer(entry)
+
+
+def _encode_key(key: Any) -> str:
+    """Encodes a dictionary key to JSON the way json.dumps does, turning non string keys
+    such as integers to strings"""
+    return json.dumps(key if isinstance(key, str) else json.dumps(key))
+
+
+def _iterencode(entry: Any, chunk_size: int) -> Iterator[str]:
+    """Yields the JSON of the serialized entry in pieces. Dictionaries are encoded key by
+    key so that the lists in them can be streamed and lists longer than chunk_size are
+    serialized and encoded chunk_size entries at a time."""
+    if (serializer := _SERIALIZERS.get(type(entry))) is None:
+        serializer = _get_serializer(type(entry))
+
+    if serializer is _process_dict:
+        yield '{'
+        for idx, (key, value) in enumerate(entry.items()):
+            yield f'{", " if idx != 0 else ""}{_encode_key(_process_key(key))}: '
+            yield from _iterencode(value, chunk_size)
+        yield '}'
+    elif serializer is _process_list and len(entry) > chunk_size:
+        yield '['
+        for idx in range(0, len(entry), chunk_size):
+            if idx != 0:
+                yield ', '
+            yield json.dumps(_process_list(entry[idx:idx + chunk_size]))[1:-1]
+        yield ']'
+    else:
+        yield json.dumps(serializer(entry))
+
+
 def process_result(result: Any) -> dict[Any, Any]:
     """Before sending out a result dictionary via the server we are serializing it.
     Turning:
@@ -208,6 +294,30 @@ def process_result(result: Any) -> dict[Any, Any]:
     return processed_result  # type: ignore
 
 
+def iterencode_result(
+        result: Any,
+        chunk_size: int = STREAMED_LIST_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Serializes the result like process_result and encodes it to JSON in chunks of
+    at least STREAMED_BUFFER_SIZE characters.
+
+    Big lists are serialized and encoded chunk_size entries at a time. So neither a
+    serialized copy of the whole result nor its whole JSON is kept in memory and the chunks
+    can be sent while the rest is encoded. Joining the chunks gives the same JSON as
+    json.dumps(process_result(result)).
+    """
+    buffer: list[str] = []
+    buffered = 0
+    for piece in _iterencode(result, chunk_size):
+        buffer.append(piece)
+        if (buffered := buffered + len(piece)) >= STREAMED_BUFFER_SIZE:
+            yield ''.join(buffer)
+            buffer, buffered = [], 0
+
+    if len(buffer) != 0:
+        yield ''.join(buffer)
+
+
 def process_result_list(result: list[Any]) -> list[Any]:
     """Just like process_result but for lists"""
     processed_result = _process_entry(result)
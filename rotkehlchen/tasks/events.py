@@ -1,6 +1,8 @@
 from typing import TYPE_CHECKING
 
 from rotkehlchen.db.cache import DBCacheStatic
+from rotkehlchen.db.eth2 import DAILY_PERFORMANCE_REFRESH_DAYS, DBEth2
+from rotkehlchen.db.history_events import VALUE_STATS_REFRESH_DAYS, DBHistoryEvents
 from rotkehlchen.utils.misc import ts_now
 
 if TYPE_CHECKING:
@@ -27,3 +29,21 @@ def process_events(
             name=DBCacheStatic.LAST_EVENTS_PROCESSING_TASK_TS,
             value=ts_now(),
         )
+
+
+def refresh_events_stats(database: 'DBHandler') -> None:
+    """Refreshes the oldest dirty days of the daily value stats of the history events
+    and of the daily performance of the eth2 validators.
+
+    Keeps the write transaction short by refreshing a limited number of days per run.
+    The task is scheduled again while dirty days remain.
+    """
+    with database.user_write() as write_cursor:
+        DBHistoryEvents(database).refresh_value_stats(
+            write_cursor=write_cursor,
+            max_days=VALUE_STATS_REFRESH_DAYS,
+        )
+        DBEth2(database).refresh_daily_performance(
+            write_cursor=write_cursor,
+            max_days=DAILY_PERFORMANCE_REFRESH_DAYS,
+        )
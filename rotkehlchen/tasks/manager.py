@@ -69,7 +69,7 @@ from rotkehlchen.utils.misc import ts_now
 
 from ..chain.evm.decoding.aura_finance.constants import CHAIN_ID_TO_BOOSTER_ADDRESSES
 from ..chain.evm.decoding.aura_finance.utils import query_aura_pools
-from .events import process_events
+from .events import process_events, refresh_events_stats
 
 if TYPE_CHECKING:
     from rotkehlchen.chain.aggregator import ChainsAggregator
@@ -173,6 +173,7 @@ class TaskManager:
             self._maybe_query_produced_blocks,
             self._maybe_query_withdrawals,
             self._maybe_run_events_processing,
+            self._maybe_refresh_events_stats,
             self._maybe_detect_withdrawal_exits,
             self._maybe_detect_new_spam_tokens,
             self._maybe_query_monerium,
@@ -675,6 +676,25 @@ class TaskManager:
             database=self.database,
         )]
 
+    def _maybe_refresh_events_stats(self) -> Optional[list[gevent.Greenlet]]:
+        """Schedules the refresh of the history events stats if any day is marked dirty"""
+        with self.database.conn.read_ctx() as cursor:
+            if cursor.execute(
+                'SELECT EXISTS(SELECT 1 FROM history_events_value_stats_dirty) OR '
+                'EXISTS(SELECT 1 FROM eth2_validators_daily_performance_dirty)',
+            ).fetchone()[0] == 0:
+                return None
+
+        task_name = 'Refresh history events stats'
+        log.debug(f'Scheduling task to {task_name}')
+        return [self.greenlet_manager.spawn_and_track(
+            after_seconds=None,
+            task_name=task_name,
+            exception_is_error=True,
+            method=refresh_events_stats,
+            database=self.database,
+        )]
+
     def _maybe_update_yearn_vaults(self) -> Optional[list[gevent.Greenlet]]:
         with self.database.conn.read_ctx() as cursor:
             if len(self.database.get_single_blockchain_addresses(cursor, SupportedBlockchain.ETHEREUM)) == 0:  # noqa: E501
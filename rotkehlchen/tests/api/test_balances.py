@@ -1,5 +1,6 @@
 import random
 from collections import defaultdict
+from collections.abc import Callable
 from contextlib import ExitStack
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
@@ -11,6 +12,7 @@ import requests
 
 from rotkehlchen.accounting.structures.balance import Balance, BalanceSheet, BalanceType
 from rotkehlchen.balances.manual import ManuallyTrackedBalance
+from rotkehlchen.chain.balances import BlockchainBalancesUpdate
 from rotkehlchen.chain.bitcoin import get_bitcoin_addresses_balances
 from rotkehlchen.chain.ethereum.modules.makerdao.vaults import MakerdaoVault
 from rotkehlchen.constants import ONE, ZERO
@@ -561,6 +563,66 @@ def test_balance_snapshot_error_message(
     assert websocket_connection.messages_num() == 0
 
 
+@pytest.mark.parametrize('number_of_eth_accounts', [0])
+@pytest.mark.parametrize('added_exchanges', [(Location.BINANCE, Location.POLONIEX)])
+def test_query_all_balances_concurrently(
+        rotkehlchen_api_server_with_exchanges: 'APIServer',
+) -> None:
+    """Test that the exchanges and the blockchain balances are queried concurrently,
+    that an exchange error still makes the snapshot problematic and that the seconds
+    each source took are saved with the snapshot"""
+    rotki = rotkehlchen_api_server_with_exchanges.rest_api.rotkehlchen
+    binance = try_get_first_exchange(rotki.exchange_manager, Location.BINANCE)
+    poloniex = try_get_first_exchange(rotki.exchange_manager, Location.POLONIEX)
+    assert binance is not None and poloniex is not None
+    running = max_running = 0
+
+    def make_query(result: Any) -> Callable[..., Any]:
+        def query(**kwargs: Any) -> Any:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(running, max_running)
+            gevent.sleep(0.1)
+            running -= 1
+            return result
+        return query
+
+    blockchain_result = BlockchainBalancesUpdate(
+        given_chain=None,
+        per_account=rotki.chains_aggregator.balances,
+        totals=BalanceSheet(assets=defaultdict(Balance, {A_ETH: Balance(ONE, FVal(2000))})),
+    )
+    timestamp = ts_now()
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(binance, 'query_balances', side_effect=make_query(({A_BTC: Balance(ONE, FVal(30000))}, ''))))  # noqa: E501
+        stack.enter_context(patch.object(poloniex, 'query_balances', side_effect=make_query((None, 'poloniex is down'))))  # noqa: E501
+        stack.enter_context(patch.object(rotki.chains_aggregator, 'query_balances', side_effect=make_query(blockchain_result)))  # noqa: E501
+        result = rotki.query_balances(requested_save_data=True, timestamp=timestamp)
+        assert max_running == 3
+        assert set(result['location']) == {'binance', 'blockchain'}
+        with rotki.data.db.conn.read_ctx() as cursor:  # not saved due to the poloniex error
+            assert rotki.data.db.get_last_balance_save_time(cursor) == 0
+
+        result = rotki.query_balances(
+            requested_save_data=True,
+            save_despite_errors=True,
+            timestamp=timestamp,
+        )
+
+    assert result['net_usd'] == FVal(32000)
+    with rotki.data.db.conn.read_ctx() as cursor:
+        durations = dict(cursor.execute(
+            'SELECT source, seconds FROM balances_query_durations WHERE timestamp=?',
+            (timestamp,),
+        ).fetchall())
+    assert set(durations) == {
+        f'binance {binance.name}',
+        f'poloniex {poloniex.name}',
+        'blockchain',
+    }
+    assert all(x >= 0.1 for x in durations.values())
+
+
 @pytest.mark.parametrize('number_of_eth_accounts', [2])
 @pytest.mark.parametrize('btc_accounts', [[UNIT_BTC_ADDRESS1, UNIT_BTC_ADDRESS2]])
 @pytest.mark.parametrize('separate_blockchain_calls', [True, False])
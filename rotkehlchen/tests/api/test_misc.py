@@ -11,7 +11,12 @@ from rotkehlchen.accounting.mixins.event import AccountingEventType
 from rotkehlchen.chain.ethereum.constants import ETHEREUM_ETHERSCAN_NODE_NAME
 from rotkehlchen.chain.ethereum.modules.convex.constants import CPT_CONVEX
 from rotkehlchen.chain.evm.decoding.curve.constants import CPT_CURVE
-from rotkehlchen.constants.misc import DEFAULT_MAX_LOG_BACKUP_FILES, DEFAULT_SQL_VM_INSTRUCTIONS_CB
+from rotkehlchen.constants.misc import (
+    DEFAULT_CHAIN_BALANCES_CONCURRENCY,
+    DEFAULT_HISTORICAL_PRICE_CACHE_SIZE,
+    DEFAULT_MAX_LOG_BACKUP_FILES,
+    DEFAULT_SQL_VM_INSTRUCTIONS_CB,
+)
 from rotkehlchen.fval import FVal
 from rotkehlchen.history.events.structures.evm_event import EvmProduct
 from rotkehlchen.tests.utils.api import (
@@ -47,6 +52,9 @@ def generate_expected_info(
             'max_logfiles_num': 3,
             'max_size_in_mb_all_logs': 300,
             'sqlite_instructions': 5000,
+            'db_read_pool_size': 0,
+            'chain_balances_concurrency': 4,
+            'historical_price_cache_size': 20000,
         },
     }
 
@@ -160,6 +168,30 @@ def test_query_version_when_update_required(rotkehlchen_api_server: 'APIServer')
     )
 
 
+def test_rpc_nodes_stats(rotkehlchen_api_server: 'APIServer') -> None:
+    """Test that the health stats of the active nodes of an evm chain can be queried"""
+    response = requests.get(api_url_for(
+        rotkehlchen_api_server,
+        'rpcnodesstatsresource',
+        blockchain=SupportedBlockchain.ETHEREUM.serialize(),
+    ))
+    result = assert_proper_sync_response_with_result(response)
+    assert result[ETHEREUM_ETHERSCAN_NODE_NAME].keys() == {
+        'calls', 'errors', 'error_rate', 'latency_ms', 'health', 'deprioritized',
+    }
+
+    response = requests.get(api_url_for(
+        rotkehlchen_api_server,
+        'rpcnodesstatsresource',
+        blockchain=SupportedBlockchain.BITCOIN.serialize(),
+    ))
+    assert_error_response(
+        response=response,
+        contained_in_msg='is not allowed in this endpoint',
+        status_code=HTTPStatus.BAD_REQUEST,
+    )
+
+
 @pytest.mark.parametrize('ethereum_manager_connect_at_start', ['DEFAULT'])
 def test_manage_nodes(rotkehlchen_api_server: 'APIServer') -> None:
     """Test that list of nodes can be correctly updated and queried"""
@@ -429,6 +461,12 @@ def test_configuration(rotkehlchen_api_server: 'APIServer') -> None:
     assert result['max_logfiles_num']['value'] == DEFAULT_MAX_LOG_BACKUP_FILES
     assert result['sqlite_instructions']['is_default'] is True
     assert result['sqlite_instructions']['value'] == DEFAULT_SQL_VM_INSTRUCTIONS_CB
+    assert result['db_read_pool_size']['is_default'] is True
+    assert result['db_read_pool_size']['value'] == 0
+    assert result['chain_balances_concurrency']['is_default'] is True
+    assert result['chain_balances_concurrency']['value'] == DEFAULT_CHAIN_BALANCES_CONCURRENCY
+    assert result['historical_price_cache_size']['is_default'] is True
+    assert result['historical_price_cache_size']['value'] == DEFAULT_HISTORICAL_PRICE_CACHE_SIZE
 
 
 def test_query_all_chain_ids(rotkehlchen_api_server: 'APIServer') -> None:
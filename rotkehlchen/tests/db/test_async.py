@@ -1,3 +1,4 @@
+import sqlite3
 from random import randint
 from uuid import uuid4
 
@@ -6,6 +7,7 @@ import pytest
 
 from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.constants.assets import A_ETH
+from rotkehlchen.db.drivers.gevent import DBConnection, DBConnectionType
 from rotkehlchen.db.filtering import HistoryEventFilterQuery
 from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.fval import FVal
@@ -151,3 +153,48 @@ def test_can_disable_callback(database):  # pylint: disable=unused-argument
     This is a regression test since setting to 0 was hitting an assertion before
     """
     assert True  # no need to do anything. Test would fail at fixture setup
+
+
+def test_read_pool(tmp_path):
+    """Test that with a read pool, readers of different greenlets use their own connection
+    while the greenlet that writes keeps seeing its uncommitted changes"""
+    conn = DBConnection(
+        path=tmp_path / 'test.db',
+        connection_type=DBConnectionType.GLOBAL,
+        sql_vm_instructions_cb=0,
+    )
+    conn.execute('CREATE TABLE a(b INTEGER PRIMARY KEY)')
+    conn.enable_read_pool(size=1)
+    assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+    def read_all() -> list[tuple[int]]:
+        with conn.read_ctx() as cursor:
+            return cursor.execute('SELECT b FROM a').fetchall()
+
+    with conn.write_ctx() as write_cursor:
+        write_cursor.execute('INSERT INTO a VALUES (1)')
+        assert read_all() == [(1,)]  # same greenlet reads from the writer connection
+        assert gevent.spawn(read_all).get() == []  # others only see committed data
+    assert gevent.spawn(read_all).get() == [(1,)]
+
+    with conn.read_ctx() as cursor:
+        assert read_all() == [(1,)]  # nested read context reuses the greenlet's connection
+        greenlet = gevent.spawn(read_all)
+        gevent.sleep(0.01)
+        assert not greenlet.ready()  # waits since the only connection is taken
+        cursor.execute('SELECT b FROM a')
+    assert greenlet.get() == [(1,)]
+
+    stats = conn.read_pool_stats()
+    assert stats is not None
+    assert stats['size'] == stats['open_connections'] == 1
+    assert stats['in_use'] == 0
+    assert stats['acquisitions'] == 4
+    assert stats['waits'] == 1
+    assert stats['max_wait_ms'] > 0
+    with pytest.raises(sqlite3.OperationalError), conn.read_ctx() as cursor:
+        cursor.execute('INSERT INTO a VALUES (2)')  # pool connections are read only
+
+    conn.enable_read_pool(size=0)
+    assert conn.read_pool_stats() is None
+    conn.close()
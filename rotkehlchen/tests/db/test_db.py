@@ -13,7 +13,7 @@ from rotkehlchen.accounting.structures.types import ActionType
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.balances.manual import ManuallyTrackedBalance
 from rotkehlchen.chain.accounts import BlockchainAccountData, BlockchainAccounts
-from rotkehlchen.chain.evm.types import string_to_evm_address
+from rotkehlchen.chain.evm.types import NodeName, WeightedNode, string_to_evm_address
 from rotkehlchen.constants import ONE, YEAR_IN_SECONDS, ZERO
 from rotkehlchen.constants.assets import (
     A_1INCH,
@@ -1929,3 +1929,41 @@ def test_address_book_primary_key(database: DBHandler):
         pytest.raises(InputError),
     ):
         db_addressbook.add_addressbook_entries(write_cursor=write_cursor, entries=entries)
+
+
+def test_rpc_nodes_registry(database: DBHandler) -> None:
+    """Test that the rpc nodes are kept in memory per blockchain until they are edited
+    and that every edit changes the version of the nodes of that blockchain only"""
+    blockchain, other_blockchain = SupportedBlockchain.ETHEREUM, SupportedBlockchain.OPTIMISM
+    node = WeightedNode(
+        node_info=NodeName(
+            name='my node',
+            endpoint='https://my.node',
+            owned=True,
+            blockchain=SupportedBlockchain.ETHEREUM,
+        ),
+        weight=ZERO,
+        active=True,
+    )
+    nodes = database.get_rpc_nodes(blockchain)
+    assert database.get_rpc_nodes(blockchain) is nodes  # read from memory
+    version, other_version = database.get_rpc_nodes_version(blockchain), database.get_rpc_nodes_version(other_blockchain)  # noqa: E501
+
+    database.add_rpc_node(node)
+    assert database.get_rpc_nodes_version(blockchain) == version + 1
+    assert database.get_rpc_nodes_version(other_blockchain) == other_version
+    added_node = next(x for x in database.get_rpc_nodes(blockchain, only_active=True) if x.node_info.name == 'my node')  # noqa: E501
+    assert added_node.node_info == node.node_info  # owned nodes are active even with zero weight
+
+    database.update_rpc_node(dataclasses.replace(added_node, active=False))
+    assert database.get_rpc_nodes_version(blockchain) == version + 2
+    assert 'my node' not in {x.node_info.name for x in database.get_rpc_nodes(blockchain, only_active=True)}  # noqa: E501
+    assert 'my node' in {x.node_info.name for x in database.get_rpc_nodes(blockchain)}
+
+    with pytest.raises(InputError):  # failed edits keep the nodes in memory
+        database.delete_rpc_node(identifier=9999, blockchain=blockchain)
+    assert database.get_rpc_nodes_version(blockchain) == version + 2
+
+    database.delete_rpc_node(identifier=added_node.identifier, blockchain=blockchain)
+    assert [x.node_info for x in database.get_rpc_nodes(blockchain)] == [x.node_info for x in nodes]  # noqa: E501
+    assert database.get_rpc_nodes_version(blockchain) == version + 3
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from rotkehlchen.chain.evm.types import EvmAccount
@@ -11,7 +13,10 @@ from rotkehlchen.db.filtering import (
     DBLocationFilter,
     DBTimestampFilter,
     EvmTransactionsFilterQuery,
+    HistoryEventFilterQuery,
 )
+from rotkehlchen.db.history_events import DBHistoryEvents
+from rotkehlchen.db.index_advisor import IndexAdvisor
 from rotkehlchen.tests.utils.database import clean_ignored_assets
 from rotkehlchen.tests.utils.factories import make_evm_address
 from rotkehlchen.types import Location, Timestamp
@@ -115,3 +120,36 @@ def test_ignored_assets(database):
         # Test IN without ignored assets
         result = cursor.execute('SELECT COUNT(*) FROM assets WHERE ' + querystr[0], bindings).fetchone()[0]  # noqa: E501
         assert result == 0
+
+
+def test_index_advisor(database):
+    """Test that the index advisor records the filter shapes of history event queries
+    and flags the ones whose query plan scans the whole history events table"""
+    advisor, dbevents = IndexAdvisor(), DBHistoryEvents(database)
+    with database.conn.write_ctx() as write_cursor:
+        write_cursor.execute('DROP INDEX idx_history_events_location_label')
+
+    with patch('rotkehlchen.db.history_events.INDEX_ADVISOR', advisor), database.conn.read_ctx() as cursor:  # noqa: E501
+        for location, labels in (
+                (Location.KRAKEN, None),
+                (Location.BINANCE, None),  # same shape as the previous query
+                (None, ['0x1', '0x2']),  # no index for location_label anymore
+                (None, ['0x1', '0x2', '0x3']),  # same shape since IN lists are collapsed
+        ):
+            dbevents.get_history_events(
+                cursor=cursor,
+                filter_query=HistoryEventFilterQuery.make(
+                    location=location,
+                    location_labels=labels,
+                ),
+                has_premium=True,
+            )
+
+    assert len(advisor.shapes) == 2
+    location_stats, label_stats = advisor.shapes.values()
+    assert location_stats.count == 2
+    assert location_stats.full_scans == []
+    assert any('idx_history_events_location' in step for step in location_stats.plan)
+    assert label_stats.count == 2
+    assert label_stats.full_scans == ['history_events']
+    assert len(advisor.slowest(limit=1)) == 1
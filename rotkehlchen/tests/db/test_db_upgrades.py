@@ -25,7 +25,7 @@ from rotkehlchen.db.checks import sanity_check_impl
 from rotkehlchen.db.constants import HISTORY_MAPPING_KEY_STATE, HISTORY_MAPPING_STATE_CUSTOMIZED
 from rotkehlchen.db.dbhandler import DBHandler
 from rotkehlchen.db.drivers.gevent import DBConnection, DBConnectionType
-from rotkehlchen.db.schema import DB_SCRIPT_CREATE_TABLES
+from rotkehlchen.db.schema import DB_SCRIPT_CREATE_TABLES, DB_TRIGGERS
 from rotkehlchen.db.settings import ROTKEHLCHEN_DB_VERSION
 from rotkehlchen.db.upgrade_manager import (
     MIN_SUPPORTED_USER_DB_VERSION,
@@ -2709,6 +2709,69 @@ def test_upgrade_db_45_to_46(user_data_dir: 'Path', messages_aggregator):
     db.logout()
 
 
+def test_upgrade_db_46_to_47(user_data_dir: 'Path', messages_aggregator):
+    """Test upgrading the DB from version 46 to version 47"""
+    _use_prepared_db(user_data_dir, 'v45_rotkehlchen.db')
+    db_v46 = _init_db_with_target_version(
+        target_version=46,
+        user_data_dir=user_data_dir,
+        msg_aggregator=messages_aggregator,
+        resume_from_backup=False,
+    )
+    indexes_query = "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_%'"
+    with db_v46.conn.read_ctx() as cursor:
+        assert cursor.execute(indexes_query).fetchall() == []
+        history_events_num = cursor.execute('SELECT COUNT(*) FROM history_events').fetchone()[0]
+    db_v46.logout()
+
+    # Execute upgrade
+    db = _init_db_with_target_version(
+        target_version=47,
+        user_data_dir=user_data_dir,
+        msg_aggregator=messages_aggregator,
+        resume_from_backup=False,
+    )
+    with db.conn.read_ctx() as cursor:
+        assert {x[0] for x in cursor.execute(indexes_query)} == {
+            'idx_history_events_timestamp',
+            'idx_history_events_location',
+            'idx_history_events_asset',
+            'idx_history_events_type',
+            'idx_history_events_location_label',
+            'idx_evm_events_info_tx_hash',
+            'idx_evm_events_info_counterparty',
+            'idx_evm_transactions_timestamp',
+            'idx_evmtx_address_mappings_address',
+        }
+        assert cursor.execute('SELECT COUNT(*) FROM history_events').fetchone()[0] == history_events_num  # noqa: E501
+        assert 'idx_history_events_timestamp' in str(cursor.execute(
+            'EXPLAIN QUERY PLAN SELECT * FROM history_events WHERE timestamp > ? '
+            'ORDER BY timestamp, sequence_index',
+            (1,),
+        ).fetchall())
+        assert {x[0] for x in cursor.execute("SELECT name FROM sqlite_master WHERE type='trigger'")} == DB_TRIGGERS  # noqa: E501
+        assert cursor.execute('SELECT COUNT(*) FROM history_events_value_stats').fetchone()[0] == 0
+        # all the days with events are marked dirty so that their stats get computed
+        assert cursor.execute('SELECT COUNT(*) FROM history_events_value_stats_dirty').fetchone()[0] == cursor.execute(  # noqa: E501
+            'SELECT COUNT(DISTINCT timestamp - timestamp % 86400000) FROM history_events',
+        ).fetchone()[0]
+        assert cursor.execute('SELECT COUNT(*) FROM balances_query_durations').fetchone()[0] == 0
+        # the already derived xpub addresses are cached
+        assert cursor.execute('SELECT COUNT(*) FROM xpub_derived_addresses').fetchone()[0] == cursor.execute(  # noqa: E501
+            'SELECT COUNT(*) FROM xpub_mappings '
+            'WHERE account_index IS NOT NULL AND derived_index IS NOT NULL',
+        ).fetchone()[0]
+        assert cursor.execute('SELECT COUNT(*) FROM eth2_validators_daily_performance').fetchone()[0] == 0  # noqa: E501
+        # all the validator days with staking events are marked dirty
+        assert cursor.execute('SELECT COUNT(*) FROM eth2_validators_daily_performance_dirty').fetchone()[0] == cursor.execute(  # noqa: E501
+            'SELECT COUNT(*) FROM (SELECT DISTINCT S.validator_index, '
+            'E.timestamp - E.timestamp % 86400000 FROM history_events E '
+            'INNER JOIN eth_staking_events_info S ON E.identifier=S.identifier)',
+        ).fetchone()[0]
+
+    db.logout()
+
+
 def test_latest_upgrade_correctness(user_data_dir):
     """
     This is a test that we can only do for the last upgrade.
@@ -2737,7 +2800,7 @@ def test_latest_upgrade_correctness(user_data_dir):
 
     # Execute upgrade
     db = _init_db_with_target_version(
-        target_version=46,
+        target_version=47,
         user_data_dir=user_data_dir,
         msg_aggregator=msg_aggregator,
         resume_from_backup=False,
@@ -2747,6 +2810,7 @@ def test_latest_upgrade_correctness(user_data_dir):
         cursor=cursor,
         db_name=db.conn.connection_type.name.lower(),
         minimized_schema=db.conn.minimized_schema,
+        triggers=DB_TRIGGERS,
     )
     result = cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
     tables_after_upgrade = {x[0] for x in result}
@@ -2759,7 +2823,7 @@ def test_latest_upgrade_correctness(user_data_dir):
     result = cursor.execute("SELECT name FROM sqlite_master WHERE type='view'")
     views_after_creation = {x[0] for x in result}
 
-    assert cursor.execute("SELECT value FROM settings WHERE name='version'").fetchone()[0] == '46'
+    assert cursor.execute("SELECT value FROM settings WHERE name='version'").fetchone()[0] == '47'
     removed_tables = {'asset_movements', 'asset_movement_category'}
     removed_views = set()
     missing_tables = tables_before - tables_after_upgrade
@@ -2769,7 +2833,16 @@ def test_latest_upgrade_correctness(user_data_dir):
     assert tables_after_creation - tables_after_upgrade == set()
     assert views_after_creation - views_after_upgrade == set()
     new_tables = tables_after_upgrade - tables_before
-    assert new_tables == {'cowswap_orders', 'gnosispay_data'}
+    assert new_tables == {
+        'balances_query_durations',
+        'cowswap_orders',
+        'eth2_validators_daily_performance',
+        'eth2_validators_daily_performance_dirty',
+        'gnosispay_data',
+        'history_events_value_stats',
+        'history_events_value_stats_dirty',
+        'xpub_derived_addresses',
+    }
     new_views = views_after_upgrade - views_before
     assert new_views == set()
     db.logout()
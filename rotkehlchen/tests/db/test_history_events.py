@@ -1,4 +1,4 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
 
 import pytest
@@ -12,11 +12,14 @@ from rotkehlchen.constants.limits import FREE_HISTORY_EVENTS_LIMIT
 from rotkehlchen.db.constants import HISTORY_MAPPING_KEY_STATE, HISTORY_MAPPING_STATE_CUSTOMIZED
 from rotkehlchen.db.dbhandler import DBHandler
 from rotkehlchen.db.filtering import (
+    DBFilterKeyset,
     EthDepositEventFilterQuery,
     EvmEventFilterQuery,
     HistoryEventFilterQuery,
+    UserNotesFilterQuery,
 )
 from rotkehlchen.db.history_events import DBHistoryEvents
+from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.fval import FVal
 from rotkehlchen.history.events.structures.asset_movement import AssetMovement
 from rotkehlchen.history.events.structures.base import HistoryBaseEntryType, HistoryEvent
@@ -30,6 +33,9 @@ from rotkehlchen.tests.utils.factories import (
 )
 from rotkehlchen.types import EVMTxHash, Location, Timestamp, TimestampMS, deserialize_evm_tx_hash
 
+if TYPE_CHECKING:
+    from rotkehlchen.db.drivers.gevent import DBCursor
+
 
 def test_get_customized_event_identifiers(database):
     db = DBHistoryEvents(database)
@@ -280,6 +286,67 @@ def test_read_write_customized_events_from_db(database: DBHandler, has_premium:
             )
 
 
+def test_add_history_events_in_bulk(database: 'DBHandler') -> None:
+    """Test that adding events in bulk writes the same rows as adding them one by one. Events
+    that already exist or repeat an earlier event of the list are ignored with their extra rows.
+    """
+    db = DBHistoryEvents(database)
+    tx_hash = make_evm_tx_hash()
+    history = [
+        make_ethereum_event(index=1, tx_hash=tx_hash, counterparty='duplicate'),  # in the DB
+        make_ethereum_event(index=2, tx_hash=tx_hash, counterparty='first'),
+        make_ethereum_event(index=2, tx_hash=tx_hash, counterparty='repeated'),
+        HistoryEvent(
+            event_identifier='TEST1',
+            sequence_index=0,
+            timestamp=TimestampMS(1),
+            location=Location.KRAKEN,
+            event_type=HistoryEventType.STAKING,
+            event_subtype=HistoryEventSubType.REWARD,
+            asset=A_ETH,
+            balance=Balance(ONE),
+        ),
+        EthWithdrawalEvent(
+            validator_index=1000,
+            timestamp=TimestampMS(1683115229000),
+            balance=Balance(amount=ONE),
+            withdrawal_address=make_evm_address(),
+            is_exit=True,
+        ),
+        EthDepositEvent(
+            tx_hash=make_evm_tx_hash(),
+            validator_index=42,
+            sequence_index=1,
+            timestamp=TimestampMS(2),
+            balance=Balance(FVal(32)),
+            depositor=make_evm_address(),
+        ),
+        make_ethereum_event(index=2, tx_hash=tx_hash, counterparty='repeated in another chunk'),
+    ]
+
+    def dump_tables(cursor: 'DBCursor') -> list[list[tuple]]:
+        return [
+            cursor.execute(f'SELECT * FROM {table} ORDER BY identifier').fetchall()
+            for table in ('history_events', 'evm_events_info', 'eth_staking_events_info')
+        ]
+
+    with database.user_write() as write_cursor:
+        db.add_history_event(
+            write_cursor=write_cursor,
+            event=make_ethereum_event(index=1, tx_hash=tx_hash, counterparty='existing'),
+        )
+        for event in history:
+            db.add_history_event(write_cursor=write_cursor, event=event)
+        expected = dump_tables(write_cursor)
+        write_cursor.execute('DELETE FROM history_events WHERE identifier != 1')
+        with patch('rotkehlchen.db.history_events.EVENTS_INSERT_CHUNK_SIZE', 3):
+            db.add_history_events(write_cursor=write_cursor, history=history)
+        assert dump_tables(write_cursor) == expected
+
+    assert [len(rows) for rows in expected] == [5, 3, 2]
+    assert [row[2] for row in expected[1][:2]] == ['existing', 'first']
+
+
 def test_delete_last_event(database):
     """
     Test that if last event in a group is being deleted and it's not an EVM event,
@@ -502,3 +569,172 @@ def test_get_history_events_free_filter(database: 'DBHandler'):
                 for free_event in free_result:
                     assert free_event.identifier is not None
                     assert free_event.identifier > 3, 'Free sub-events should be from the latest 3 event groups'  # noqa: E501
+
+
+@pytest.mark.parametrize('group_by_event_ids', [True, False])
+def test_keyset_pagination(database: 'DBHandler', group_by_event_ids: bool) -> None:
+    """Test that paging through the events with the continuation tokens returns the same
+    events as offset pagination even when many events have the same timestamp and that the
+    count is cached until the events change"""
+    history_events = DBHistoryEvents(database=database)
+    with database.user_write() as write_cursor:
+        history_events.add_history_events(
+            write_cursor=write_cursor,
+            history=[HistoryEvent(
+                event_identifier=f'event_{idx // 3}',
+                sequence_index=idx % 3,
+                timestamp=TimestampMS(1000 * (idx // 12)),
+                location=Location.EXTERNAL,
+                event_type=HistoryEventType.TRADE,
+                event_subtype=HistoryEventSubType.NONE,
+                asset=A_ETH,
+                balance=Balance(ONE),
+            ) for idx in range(60)],
+        )
+
+    def key(entry: Any) -> int:
+        return entry[1].identifier if group_by_event_ids else entry.identifier
+
+    order_by_rules = [('timestamp', False), ('sequence_index', True)]
+    with database.conn.read_ctx() as cursor:
+        offset_result: list[int] = []
+        token_result: list[int] = []
+        token: str | None = None
+        for offset in range(0, 60, 7):
+            filter_query = HistoryEventFilterQuery.make(
+                order_by_rules=order_by_rules,
+                limit=7,
+                offset=offset,
+            )
+            offset_result.extend(key(x) for x in history_events.get_history_events(  # type: ignore[call-overload]
+                cursor=cursor,
+                filter_query=filter_query,
+                has_premium=True,
+                group_by_event_ids=group_by_event_ids,
+            ))
+
+        while True:
+            filter_query = HistoryEventFilterQuery.make(
+                order_by_rules=order_by_rules,
+                limit=7,
+                offset=0,
+            )
+            if token is not None:
+                filter_query.set_keyset(DBFilterKeyset.deserialize(token))
+            result = history_events.get_history_events(  # type: ignore[call-overload]
+                cursor=cursor,
+                filter_query=filter_query,
+                has_premium=True,
+                group_by_event_ids=group_by_event_ids,
+            )
+            token_result.extend(key(x) for x in result)
+            entries = [x[1] for x in result] if group_by_event_ids else result
+            if (token := filter_query.continuation_token(entries)) is None:
+                break
+
+            assert history_events.get_history_events_count(
+                cursor=cursor,
+                query_filter=filter_query,
+                group_by_event_ids=group_by_event_ids,
+            )[0] == (20 if group_by_event_ids else 60)
+
+    assert token_result == offset_result
+    assert len(set(token_result)) == (20 if group_by_event_ids else 60)
+    assert database.count_cache.misses == 1
+    assert database.count_cache.hits > 0
+
+    with database.user_write() as write_cursor:
+        write_cursor.execute('DELETE FROM history_events WHERE event_identifier=?', ('event_0',))
+    with database.conn.read_ctx() as cursor:
+        assert history_events.get_history_events_count(
+            cursor=cursor,
+            query_filter=filter_query,
+            group_by_event_ids=group_by_event_ids,
+        )[0] == (19 if group_by_event_ids else 57)
+
+    # a token can only be used for the same order of the events
+    filter_query = HistoryEventFilterQuery.make(order_by_rules=[('timestamp', True)], limit=7)
+    token = DBFilterKeyset(
+        rules=[*order_by_rules, ('history_events_identifier', True)],
+        values=[1000, 0, 1],
+    ).serialize()
+    with pytest.raises(DeserializationError):
+        filter_query.set_keyset(DBFilterKeyset.deserialize(token))
+    with pytest.raises(DeserializationError):
+        DBFilterKeyset.deserialize('invalid')
+
+    # queries without keyset pagination support have no token and are paginated by offset
+    notes_query = UserNotesFilterQuery.make(order_by_rules=[('last_update_timestamp', True)], limit=1)  # noqa: E501
+    assert notes_query.keyset_key(object()) is None
+    assert notes_query.continuation_token([object()]) is None
+
+
+def test_aggregated_value_stats(database: 'DBHandler') -> None:
+    """Test that the value stats served from the daily aggregates are exact and match the
+    stats summed from the events, both before and after refreshing the dirty days and after
+    writes that bypass DBHistoryEvents"""
+    db = DBHistoryEvents(database)
+    day_ms = 86400000
+    events = [
+        HistoryEvent(
+            event_identifier=f'STAKING_{idx}',
+            sequence_index=0,
+            timestamp=TimestampMS(timestamp),
+            location=location,
+            event_type=HistoryEventType.STAKING,
+            event_subtype=HistoryEventSubType.REWARD,
+            asset=asset,
+            balance=Balance(amount=FVal('0.1'), usd_value=FVal('0.000000000000000001')),
+        ) for idx, (timestamp, location, asset) in enumerate((
+            (day_ms - 1, Location.KRAKEN, A_ETH),
+            (day_ms, Location.KRAKEN, A_ETH),
+            (day_ms + 5000, Location.KRAKEN, A_BTC),
+            (day_ms + 5000, Location.BINANCE, A_ETH),
+            (2 * day_ms + 1000, Location.KRAKEN, A_ETH),
+            (3 * day_ms + 1000, Location.KRAKEN, A_ETH),
+            (3 * day_ms + 2000, Location.KRAKEN, A_ETH),
+        ))
+    ]
+    filters = [
+        HistoryEventFilterQuery.make(),
+        HistoryEventFilterQuery.make(location=Location.KRAKEN, event_types=[HistoryEventType.STAKING]),  # noqa: E501
+        HistoryEventFilterQuery.make(from_ts=Timestamp(86400), to_ts=Timestamp(86400 * 3 + 1), assets=(A_ETH,)),  # noqa: E501
+        HistoryEventFilterQuery.make(from_ts=Timestamp(86399), to_ts=Timestamp(86401)),
+        HistoryEventFilterQuery.make(location_labels=['label']),  # not in the daily stats
+    ]
+
+    def assert_stats(cursor: 'DBCursor') -> None:
+        for filter_query in filters:
+            query, bindings = filter_query.prepare(with_pagination=False, with_order=False)
+            expected = db.get_value_stats(cursor=cursor, query_filters=query, bindings=bindings)
+            assert db.get_aggregated_value_stats(cursor=cursor, filter_query=filter_query) == expected  # noqa: E501
+
+    with database.user_write() as write_cursor:
+        db.add_history_events(write_cursor=write_cursor, history=events)
+        assert_stats(write_cursor)  # all days are dirty and summed from the events
+        assert write_cursor.execute('SELECT COUNT(*) FROM history_events_value_stats_dirty').fetchone()[0] == 4  # noqa: E501
+        db.refresh_value_stats(write_cursor)
+        assert write_cursor.execute('SELECT COUNT(*) FROM history_events_value_stats_dirty').fetchone()[0] == 0  # noqa: E501
+        assert write_cursor.execute(
+            'SELECT amount, usd_value FROM history_events_value_stats WHERE asset=? AND '
+            'location=? AND timestamp=?',
+            (A_ETH.identifier, Location.KRAKEN.serialize_for_db(), 3 * day_ms),
+        ).fetchone() == ('0.2', '0.000000000000000002')
+        assert_stats(write_cursor)
+        assert db.get_aggregated_value_stats(cursor=write_cursor, filter_query=filters[1]) == (
+            FVal('0.000000000000000006'),
+            [(A_BTC.identifier, FVal('0.1'), FVal('0.000000000000000001')), (A_ETH.identifier, FVal('0.5'), FVal('0.000000000000000005'))],  # noqa: E501
+        )
+
+        # writes outside of DBHistoryEvents are tracked by the triggers
+        write_cursor.execute('UPDATE history_events SET usd_value=? WHERE event_identifier=?', ('10', 'STAKING_4'))  # noqa: E501
+        write_cursor.execute('DELETE FROM history_events WHERE event_identifier=?', ('STAKING_5',))
+        write_cursor.execute('UPDATE history_events SET timestamp=? WHERE event_identifier=?', (5 * day_ms, 'STAKING_0'))  # noqa: E501
+        assert {x[0] for x in write_cursor.execute('SELECT timestamp FROM history_events_value_stats_dirty')} == {0, 2 * day_ms, 3 * day_ms, 5 * day_ms}  # noqa: E501
+        assert_stats(write_cursor)
+        db.refresh_value_stats(write_cursor, max_days=2)  # only the oldest dirty days
+        assert {x[0] for x in write_cursor.execute('SELECT timestamp FROM history_events_value_stats_dirty')} == {3 * day_ms, 5 * day_ms}  # noqa: E501
+        assert_stats(write_cursor)
+        db.refresh_value_stats(write_cursor)
+        assert_stats(write_cursor)
+        assert write_cursor.execute('SELECT COUNT(*) FROM history_events_value_stats WHERE timestamp=0').fetchone()[0] == 0  # noqa: E501
@@ -1,7 +1,13 @@
-from rotkehlchen.accounting.pnl import PnlTotals
-from rotkehlchen.db.reports import DBAccountingReports
+from rotkehlchen.accounting.mixins.event import AccountingEventType
+from rotkehlchen.accounting.pnl import PNL, PnlTotals
+from rotkehlchen.accounting.structures.processed_event import ProcessedAccountingEvent
+from rotkehlchen.constants import ONE, ZERO
+from rotkehlchen.constants.assets import A_ETH
+from rotkehlchen.db.filtering import ReportDataFilterQuery
+from rotkehlchen.db.reports import DBAccountingReports, DBReportDataWriter
 from rotkehlchen.db.settings import DBSettings
 from rotkehlchen.tests.utils.constants import A_GBP
+from rotkehlchen.types import Location, Price, Timestamp
 
 
 def test_report_settings(database):
@@ -54,3 +60,57 @@ def test_report_settings(database):
         else:
             value = getattr(settings, setting_name)
         assert returned_settings[x] == value
+
+
+def test_report_data_writer_batches(database):
+    """Test that processed events are buffered and written to the DB in batches"""
+    dbreport = DBAccountingReports(database)
+    report_id = dbreport.add_report(
+        first_processed_timestamp=Timestamp(1),
+        start_ts=Timestamp(0),
+        end_ts=Timestamp(10),
+        settings=DBSettings(),
+    )
+    writer = DBReportDataWriter(
+        database=database,
+        report_id=report_id,
+        ts_converter=str,
+        batch_size=2,
+    )
+    for idx in range(5):
+        writer.add(ProcessedAccountingEvent(
+            event_type=AccountingEventType.TRANSACTION_EVENT,
+            notes=f'Event {idx}',
+            location=Location.ETHEREUM,
+            timestamp=Timestamp(idx + 1),
+            asset=A_ETH,
+            free_amount=ONE,
+            taxable_amount=ZERO,
+            price=Price(ONE),
+            pnl=PNL(),
+            cost_basis=None,
+            index=idx,
+        ))
+
+    assert writer.flushes == 2
+    assert len(writer.pending) == 1
+    writer.flush()
+    assert writer.flushes == 3
+    writer.flush()  # nothing pending so this should not count
+    assert writer.flushes == 3
+
+    events, _ = dbreport.get_report_data(
+        filter_=ReportDataFilterQuery.make(report_id=report_id),
+        with_limit=False,
+    )
+    assert [x.notes for x in events] == [f'Event {idx}' for idx in range(5)]
+    dbreport.add_report_overview(
+        report_id=report_id,
+        last_processed_timestamp=Timestamp(5),
+        processed_actions=5,
+        total_actions=5,
+        pnls=PnlTotals(),
+        events_db_writes=writer.flushes,
+    )
+    report = dbreport.get_reports(report_id=report_id, with_limit=False)[0][0]
+    assert report['events_db_writes'] == 3
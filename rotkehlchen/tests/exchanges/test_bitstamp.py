@@ -213,9 +213,13 @@ def test_query_balances_skips_inquirer_error(mock_bitstamp):
 
     with (
         patch(
-            'rotkehlchen.exchanges.bitstamp.Inquirer.find_usd_price',
+            'rotkehlchen.inquirer.Inquirer.find_usd_price',
             side_effect=RemoteError('test'),
         ),
+        patch(  # leave the price to the single asset query that fails
+            'rotkehlchen.inquirer.Inquirer._get_multiple_query_asset',
+            return_value=None,
+        ),
         patch.object(mock_bitstamp, '_api_query', side_effect=mock_api_query_response),
     ):
         assert mock_bitstamp.query_balances() == ({}, '')
@@ -0,0 +1,51 @@
+import logging
+import random
+import time
+
+import pytest
+
+from rotkehlchen.constants.assets import A_BTC, A_ETH, A_EUR, A_USD
+from rotkehlchen.fval import FVal
+from rotkehlchen.history.types import HistoricalPrice, HistoricalPriceOracle
+from rotkehlchen.types import Price, Timestamp
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.skipif(True, reason='This is for benchmarking only. Comment out to run')
+def test_get_historical_prices_benchmark(globaldb):
+    """Times a batch of 100k historical price lookups and checks a sample of them
+    against the single lookups. Run with --log-cli-level=INFO to see the timing."""
+    assets, start_ts, num_prices = (A_BTC, A_ETH, A_EUR), Timestamp(1600000000), 24 * 365
+    globaldb.add_historical_prices([
+        HistoricalPrice(
+            from_asset=asset,
+            to_asset=A_USD,
+            source=HistoricalPriceOracle.COINGECKO,
+            timestamp=Timestamp(start_ts + idx * 3600),
+            price=Price(FVal(idx + asset_idx)),
+        ) for asset_idx, asset in enumerate(assets) for idx in range(0, num_prices, 2)
+    ])  # a price every two hours, so with a distance of an hour some lookups find nothing
+    rng = random.Random(42)
+    query_data = []
+    for _ in range(100_000):
+        timestamp = start_ts + rng.randrange(num_prices * 3600)
+        if timestamp % 3600 == 0:
+            timestamp += 1  # avoid ties between two prices at the same distance
+        query_data.append((rng.choice(assets), A_USD, Timestamp(timestamp)))
+
+    start = time.perf_counter()
+    result = globaldb.get_historical_prices(query_data=query_data, max_seconds_distance=3600)
+    logger.info(
+        f'{len(query_data)} historical price lookups took '
+        f'{time.perf_counter() - start:.2f} seconds',
+    )
+
+    assert len(result) == len(query_data)
+    for entry, price in list(zip(query_data, result, strict=True))[:500]:
+        assert price == globaldb.get_historical_price(
+            from_asset=entry[0],
+            to_asset=entry[1],
+            timestamp=entry[2],
+            max_seconds_distance=3600,
+        )
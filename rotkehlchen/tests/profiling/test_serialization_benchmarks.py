@@ -0,0 +1,106 @@
+import json
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from rotkehlchen.accounting.structures.balance import BalanceType
+from rotkehlchen.constants.assets import A_BTC, A_ETH
+from rotkehlchen.db.utils import SingleDBAssetBalance
+from rotkehlchen.fval import FVal
+from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
+from rotkehlchen.serialization.serialize import iterencode_result, process_result
+from rotkehlchen.types import Location, Timestamp
+
+logger = logging.getLogger(__name__)
+
+
+def _history_events_payload(entries: int) -> dict[str, Any]:
+    return {'result': {
+        'entries': [{
+            'entry': {
+                'identifier': idx,
+                'event_identifier': f'event_{idx}',
+                'sequence_index': 0,
+                'timestamp': 1700000000000 + idx * 1000,
+                'location': Location.KRAKEN,
+                'asset': A_ETH if idx % 2 == 0 else A_BTC,
+                'amount': FVal(idx) / 1000,
+                'usd_value': FVal(idx) / 10,
+                'event_type': HistoryEventType.STAKING,
+                'event_subtype': HistoryEventSubType.REWARD,
+                'notes': f'Gain {idx} ETH from staking',
+            },
+            'customized': False,
+            'has_details': False,
+            'hidden': False,
+        } for idx in range(entries)],
+        'entries_found': entries,
+        'entries_limit': -1,
+    }, 'message': ''}
+
+
+def _pnl_report_payload(entries: int) -> dict[str, Any]:
+    return {'result': {
+        'entries': [{
+            'type': 'trade',
+            'notes': f'Sell {idx} ETH',
+            'location': Location.BINANCE,
+            'timestamp': 1700000000 + idx,
+            'asset': A_ETH,
+            'free_amount': FVal(idx) / 100,
+            'taxable_amount': FVal(idx) / 200,
+            'price': FVal('2000.5'),
+            'pnl_taxable': FVal(idx) / 3,
+            'pnl_free': FVal(0),
+            'cost_basis': None,
+        } for idx in range(entries)],
+        'entries_found': entries,
+        'entries_limit': -1,
+    }, 'message': ''}
+
+
+def _timed_balances_payload(entries: int) -> dict[str, Any]:
+    return {'result': [SingleDBAssetBalance(
+        category=BalanceType.ASSET,
+        time=Timestamp(1700000000 + idx * 3600),
+        amount=FVal(idx) / 7,
+        usd_value=FVal(idx) * 3,
+    ) for idx in range(entries)], 'message': ''}
+
+
+@pytest.mark.skipif(True, reason='This is for benchmarking only. Comment out to run')
+@pytest.mark.parametrize('make_payload', [
+    _history_events_payload,
+    _pnl_report_payload,
+    _timed_balances_payload,
+])
+@pytest.mark.parametrize('entries', [10_000, 100_000])
+def test_serialization_benchmark(
+        make_payload: Callable[[int], dict[str, Any]],
+        entries: int,
+) -> None:
+    """Times serializing and encoding API responses of the given number of entries at once
+    and as streamed chunks. Run with --log-cli-level=INFO to see the timings."""
+    payload = make_payload(entries)
+    start = time.perf_counter()
+    full = json.dumps(process_result(payload))
+    full_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    first_chunk_duration = None
+    chunks = []
+    for chunk in iterencode_result(payload):
+        if first_chunk_duration is None:
+            first_chunk_duration = time.perf_counter() - start
+        chunks.append(chunk)
+    streamed_duration = time.perf_counter() - start
+
+    assert ''.join(chunks) == full
+    logger.info(
+        f'{make_payload.__name__} with {entries} entries: whole response in '
+        f'{full_duration:.3f}s, streamed in {streamed_duration:.3f}s with the first '
+        f'of {len(chunks)} chunks after {first_chunk_duration:.3f}s',
+    )
@@ -1,4 +1,7 @@
 
+import sqlite3
+from unittest.mock import patch
+
 import pytest
 
 from rotkehlchen.assets.asset import Asset
@@ -141,6 +144,74 @@ def test_get_historical_price(globaldb, historical_price_test_data):  # pylint:
     assert price_entry is None
 
 
+def test_historical_price_index(globaldb, historical_price_test_data):  # pylint: disable=unused-argument
+    """Test that prefetched prices give the same results as the DB queries"""
+    lookups = [  # (from_asset, source, timestamp, max_seconds_distance)
+        (A_ETH, HistoricalPriceOracle.CRYPTOCOMPARE, 1511627623, 3600),
+        (A_ETH, HistoricalPriceOracle.CRYPTOCOMPARE, 1511627623, 10),
+        (A_ETH, HistoricalPriceOracle.COINGECKO, 1618481099, 3600),
+        (A_ETH, HistoricalPriceOracle.MANUAL, 1511627623, 3600),
+        (A_BTC, HistoricalPriceOracle.CRYPTOCOMPARE, 1428994442, 3600),
+        (A_BAL, HistoricalPriceOracle.COINGECKO, 1618481099, 3600),
+    ]
+    expected = [globaldb.get_historical_price(
+        from_asset=from_asset,
+        to_asset=A_EUR,
+        timestamp=timestamp,
+        max_seconds_distance=distance,
+        source=source,
+    ) for from_asset, source, timestamp, distance in lookups]
+    assert expected[0] is not None and expected[2] is not None and expected[3] is None
+
+    price_index = globaldb.load_historical_price_index(
+        to_asset=A_EUR,
+        assets_ranges={asset: (Timestamp(1400000000), Timestamp(1700000000)) for asset in (A_ETH, A_BTC, A_BAL)},  # noqa: E501
+    )
+    for (from_asset, source, timestamp, distance), expected_entry in zip(lookups, expected, strict=True):  # noqa: E501
+        assert globaldb.get_historical_price(
+            from_asset=from_asset,
+            to_asset=A_EUR,
+            timestamp=timestamp,
+            max_seconds_distance=distance,
+            source=source,
+        ) == expected_entry
+    assert price_index.hits == 3 and price_index.misses == 3
+
+    # prices added while the index is loaded are seen by the lookups
+    new_entry = HistoricalPrice(
+        from_asset=A_BAL,
+        to_asset=A_EUR,
+        source=HistoricalPriceOracle.COINGECKO,
+        timestamp=Timestamp(1618481000),
+        price=Price(FVal('15.5')),
+    )
+    globaldb.add_historical_prices([new_entry])
+    assert globaldb.get_historical_price(
+        from_asset=A_BAL,
+        to_asset=A_EUR,
+        timestamp=1618481099,
+        max_seconds_distance=3600,
+        source=HistoricalPriceOracle.COINGECKO,
+    ) == new_entry
+
+    # prices that fail to be written to the DB are not added to the index
+    failing_entry = new_entry._replace(timestamp=Timestamp(1618481050))
+    with patch.object(HistoricalPrice, 'serialize_for_db', side_effect=sqlite3.IntegrityError):
+        globaldb.add_historical_prices([failing_entry])
+    assert globaldb.get_historical_price(
+        from_asset=A_BAL,
+        to_asset=A_EUR,
+        timestamp=1618481050,
+        max_seconds_distance=10,
+        source=HistoricalPriceOracle.COINGECKO,
+    ) is None
+
+    # a pair that was not loaded is still queried from the DB
+    assert not price_index.covers(A_ETH, A_USD, 1618481099, 1618481099)
+    globaldb.clear_historical_price_index()
+    assert globaldb._historical_price_index is None
+
+
 @pytest.mark.parametrize('should_mock_price_queries', [False])
 def test_matic_pol_hardforked_price(price_historian: PriceHistorian):
     """Test that we return price of POL for MATIC after hardfork"""
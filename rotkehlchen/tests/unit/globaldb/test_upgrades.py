@@ -913,6 +913,31 @@ def test_upgrade_v9_v10(globaldb: GlobalDBHandler, messages_aggregator):
                 assert result[0] == first_asset
 
 
+@pytest.mark.parametrize('reload_user_assets', [False])
+def test_upgrade_v10_v11(globaldb: GlobalDBHandler, messages_aggregator):
+    """Test upgrade from v10 to v11 which adds the price history index by pair and timestamp"""
+    index_query = "SELECT COUNT(*) FROM sqlite_master WHERE type='index' AND name='idx_price_history_pair_timestamp'"  # noqa: E501
+    with globaldb.conn.write_ctx() as write_cursor:  # bring the latest DB back to v10
+        write_cursor.execute('DROP INDEX idx_price_history_pair_timestamp')
+        write_cursor.execute(
+            'INSERT OR REPLACE INTO settings(name, value) VALUES(?, ?)',
+            ('version', '10'),
+        )
+
+    with ExitStack() as stack:
+        patch_for_globaldb_upgrade_to(stack, 11)
+        maybe_upgrade_globaldb(
+            connection=globaldb.conn,
+            global_dir=globaldb._data_directory / GLOBALDIR_NAME,  # type: ignore
+            db_filename=GLOBALDB_NAME,
+            msg_aggregator=messages_aggregator,
+        )
+
+    assert globaldb.get_setting_value('version', 0) == 11
+    with globaldb.conn.read_ctx() as cursor:
+        assert cursor.execute(index_query).fetchone()[0] == 1
+
+
 @pytest.mark.parametrize('custom_globaldb', ['v2_global.db'])
 @pytest.mark.parametrize('target_globaldb_version', [2])
 @pytest.mark.parametrize('reload_user_assets', [False])
@@ -27,3 +27,34 @@ def test_arg_sql_vm_instructions_cb(argparser):
     assert args.sqlite_instructions == 200
     args = argparser.parse_args(['--sqlite-instructions', '0'])
     assert args.sqlite_instructions == 0
+
+
+def test_arg_db_read_pool_size(argparser):
+    with pytest.raises(SystemExit):
+        argparser.parse_args(['--db-read-pool-size', '-1'])
+
+    args = argparser.parse_args(['--data-dir', 'foo'])
+    assert args.db_read_pool_size == 0
+    args = argparser.parse_args(['--db-read-pool-size', '4'])
+    assert args.db_read_pool_size == 4
+
+
+def test_arg_chain_balances_concurrency(argparser):
+    for value in ('0', '-1'):
+        with pytest.raises(SystemExit):
+            argparser.parse_args(['--chain-balances-concurrency', value])
+
+    args = argparser.parse_args(['--data-dir', 'foo'])
+    assert args.chain_balances_concurrency == 4
+    args = argparser.parse_args(['--chain-balances-concurrency', '1'])
+    assert args.chain_balances_concurrency == 1
+
+
+def test_arg_historical_price_cache_size(argparser):
+    with pytest.raises(SystemExit):
+        argparser.parse_args(['--historical-price-cache-size', '-1'])
+
+    args = argparser.parse_args(['--data-dir', 'foo'])
+    assert args.historical_price_cache_size == 20000
+    args = argparser.parse_args(['--historical-price-cache-size', '0'])
+    assert args.historical_price_cache_size == 0
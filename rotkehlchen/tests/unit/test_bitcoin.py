@@ -2,6 +2,7 @@ import re
 from contextlib import nullcontext
 from unittest.mock import MagicMock, patch
 
+import gevent
 import pytest
 
 from rotkehlchen.chain.bitcoin import get_bitcoin_addresses_balances
@@ -16,7 +17,7 @@ from rotkehlchen.chain.bitcoin.utils import (
     scriptpubkey_to_p2pkh_address,
     scriptpubkey_to_p2sh_address,
 )
-from rotkehlchen.chain.bitcoin.xpub import XpubData
+from rotkehlchen.chain.bitcoin.xpub import XpubData, _derive_addresses_from_xpub_data
 from rotkehlchen.chain.constants import NON_BITCOIN_CHAINS, SupportedBlockchain
 from rotkehlchen.errors.misc import RemoteError, XPUBError
 from rotkehlchen.fval import FVal
@@ -280,6 +281,76 @@ def test_zpub_to_addresses():
         assert child.address() == expected_addresses[i]
 
 
+def test_derive_child_addresses():
+    """Test that deriving the addresses of many children at once gives the same
+    addresses as deriving each child for all the kinds of xpubs"""
+    for xpub, xpub_type, path in (
+        ('xpub68V4ZQQ62mea7ZUKn2urQu47Bdn2Wr7SxrBxBDDwE3kjytj361YBGSKDT4WoBrE5htrSB8eAMe59NPnKrcAbiv2veN5GQUmfdjRddD1Hxrk', None, 'm'),  # noqa: E501
+        ('ypub6WkRUvNhspMCJLiLgeP7oL1pzrJ6wA2tpwsKtXnbmpdAGmHHcC6FeZeF4VurGU14dSjGpF2xLavPhgvCQeXd6JxYgSfbaD1wSUi2XmEsx33', None, 'm'),  # noqa: E501
+        ('zpub6quTRdxqWmerHdiWVKZdLMp9FY641F1F171gfT2RS4D1FyHnutwFSMiab58Nbsdu4fXBaFwpy5xyGnKZ8d6xn2j4r4yNmQ3Yp3yDDxQUo3q', None, 'm'),  # noqa: E501
+        ('xpub6BgBgsespWvERF3LHQu6CnqdvfEvtMcQjYrcRzx53QJjSxarj2afYWcLteoGVky7D3UKDP9QyrLprQ3VCECoY49yfdDEHGCtMMj92pReUsQ', XpubType.P2TR, 'm/86/0/0'),  # noqa: E501
+    ):
+        root = HDKey.from_xpub(xpub=xpub, xpub_type=xpub_type, path=path).derive_child(0)
+        indices = [0, 1, 2, 7, 100]
+        assert root.derive_child_addresses(indices) == [
+            root.derive_child(idx).address() for idx in indices
+        ]
+        assert root.derive_child_addresses([]) == []
+
+
+def test_derive_addresses_from_xpub_data_with_cache():
+    """Test that the receiving and change addresses of an xpub are checked concurrently
+    and that the derived addresses are kept so that checking again derives nothing"""
+    root = HDKey.from_xpub(xpub='xpub68V4ZQQ62mea7ZUKn2urQu47Bdn2Wr7SxrBxBDDwE3kjytj361YBGSKDT4WoBrE5htrSB8eAMe59NPnKrcAbiv2veN5GQUmfdjRddD1Hxrk', path='m')  # noqa: E501
+    used_addresses = {root.derive_path(path).address() for path in ('m/0/0', 'm/0/1', 'm/1/0')}
+    running = max_running = 0
+
+    def mock_have_transactions(addresses: list[BTCAddress]) -> dict[BTCAddress, tuple[bool, FVal]]:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(running, max_running)
+        gevent.sleep(0.01)
+        running -= 1
+        return {x: (x in used_addresses, FVal(1 if x in used_addresses else 0)) for x in addresses}
+
+    derived_addresses: dict[tuple[int, int], BTCAddress] = {}
+    with patch('rotkehlchen.chain.bitcoin.xpub.have_bitcoin_transactions', side_effect=mock_have_transactions):  # noqa: E501
+        result = _derive_addresses_from_xpub_data(
+            xpub_data=XpubData(xpub=root, blockchain=SupportedBlockchain.BITCOIN),
+            start_receiving_index=0,
+            start_change_index=0,
+            gap_limit=5,
+            derived_addresses=derived_addresses,
+        )
+        assert used_addresses <= {x.address for x in result}
+        assert max_running == 2
+        # the two checked batches of each account and the next one that was derived meanwhile
+        assert set(derived_addresses) == {(acc, idx) for acc in (0, 1) for idx in range(15)}
+        assert derived_addresses[1, 7] == root.derive_path('m/1/7').address()
+
+        with patch.object(HDKey, 'derive_child_addresses', side_effect=AssertionError('derived')):
+            assert _derive_addresses_from_xpub_data(
+                xpub_data=XpubData(xpub=root, blockchain=SupportedBlockchain.BITCOIN),
+                start_receiving_index=0,
+                start_change_index=0,
+                gap_limit=5,
+                derived_addresses=derived_addresses,
+            ) == result
+
+    # any error of the greenlets checking the addresses is raised to the caller
+    with (
+        patch('rotkehlchen.chain.bitcoin.xpub.have_bitcoin_transactions', side_effect=KeyError('unexpected')),  # noqa: E501
+        pytest.raises(KeyError, match='unexpected'),
+    ):
+        _derive_addresses_from_xpub_data(
+            xpub_data=XpubData(xpub=root, blockchain=SupportedBlockchain.BITCOIN),
+            start_receiving_index=0,
+            start_change_index=0,
+            gap_limit=5,
+            derived_addresses=derived_addresses,
+        )
+
+
 def test_from_bad_xpub():
     with pytest.raises(XPUBError):
         HDKey.from_xpub('ddodod')
@@ -3,6 +3,7 @@ from contextlib import ExitStack
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
+import gevent
 import pytest
 
 from rotkehlchen.assets.asset import Asset
@@ -14,6 +15,7 @@ from rotkehlchen.chain.evm.types import NodeName, WeightedNode, string_to_evm_ad
 from rotkehlchen.chain.gnosis.constants import GNOSIS_ETHERSCAN_NODE
 from rotkehlchen.constants import ONE
 from rotkehlchen.db.cache import DBCacheDynamic
+from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.tests.utils.blockchain import setup_evm_addresses_activity_mock
 from rotkehlchen.tests.utils.factories import make_evm_address
 from rotkehlchen.tests.utils.polygon_pos import ALCHEMY_RPC_ENDPOINT
@@ -61,6 +63,56 @@ def test_module_deactivation(blockchain):
         assert module_name not in blockchain.eth_modules
 
 
+@pytest.mark.parametrize('ethereum_accounts', [[make_evm_address()]])
+@pytest.mark.parametrize('optimism_accounts', [[make_evm_address()]])
+@pytest.mark.parametrize('base_accounts', [[make_evm_address()]])
+def test_query_balances_concurrently(blockchain: 'ChainsAggregator') -> None:
+    """Test that querying all balances runs the chains concurrently up to the limit,
+    records the duration of each chain and raises the error of a failed chain only
+    after all the other chains have been queried"""
+    running = max_running = 0
+    queried: list[SupportedBlockchain] = []
+
+    def make_query(chain: SupportedBlockchain, fail: bool):
+        def query(**kwargs):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(running, max_running)
+            gevent.sleep(0.1)
+            running -= 1
+            queried.append(chain)
+            if fail:
+                raise RemoteError(f'{chain} is down')
+        return query
+
+    expected_chains = [
+        chain for chain in SupportedBlockchain
+        if not chain.is_evm() or chain in {SupportedBlockchain.ETHEREUM, SupportedBlockchain.OPTIMISM, SupportedBlockchain.BASE}  # noqa: E501
+    ]
+    for fail_chain in (None, SupportedBlockchain.OPTIMISM):
+        queried.clear()
+        blockchain.balances_concurrency = 3
+        with ExitStack() as stack:
+            for chain in SupportedBlockchain:
+                stack.enter_context(patch.object(
+                    blockchain,
+                    f'query_{chain.get_key()}_balances',
+                    side_effect=make_query(chain, fail=chain == fail_chain),
+                ))
+
+            if fail_chain is None:
+                blockchain.query_balances(ignore_cache=True)
+            else:
+                with pytest.raises(RemoteError):
+                    blockchain.query_balances(ignore_cache=True)
+
+        assert max_running == 3
+        assert len(queried) == len(expected_chains)
+        assert set(queried) == set(expected_chains)
+        assert set(blockchain.balances_query_durations) == set(expected_chains)
+        assert all(x >= 0.1 for x in blockchain.balances_query_durations.values())
+
+
 @pytest.mark.parametrize('ethereum_accounts', [[]])
 def test_detect_evm_accounts(blockchain: 'ChainsAggregator') -> None:
     """
@@ -0,0 +1,120 @@
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from rotkehlchen.accounting.structures.balance import Balance
+from rotkehlchen.constants import ONE
+from rotkehlchen.constants.assets import A_ETH
+from rotkehlchen.data_import.importers.cointracking import CointrackingImporter
+from rotkehlchen.data_import.importers.constants import COINTRACKING_EVENT_PREFIX
+from rotkehlchen.data_import.importers.rotki_events import RotkiGenericEventsImporter
+from rotkehlchen.data_import.utils import detect_duplicate_event
+from rotkehlchen.db.cache import DBCacheDynamic
+from rotkehlchen.db.filtering import HistoryEventFilterQuery
+from rotkehlchen.db.history_events import DBHistoryEvents
+from rotkehlchen.errors.misc import InputError
+from rotkehlchen.fval import FVal
+from rotkehlchen.history.events.structures.base import HistoryEvent
+from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
+from rotkehlchen.types import AssetAmount, Location, TimestampMS
+
+if TYPE_CHECKING:
+    from rotkehlchen.db.dbhandler import DBHandler
+
+
+def test_detect_duplicate_event(database: 'DBHandler') -> None:
+    """Test that duplicate events are detected both against the events saved in the DB
+    and the ones buffered by the importer without the importer having to flush them"""
+    def make_event(timestamp: int, location: Location = Location.BINANCE) -> HistoryEvent:
+        return HistoryEvent(
+            event_identifier=f'{COINTRACKING_EVENT_PREFIX}_{timestamp}_{location!s}',
+            sequence_index=0,
+            timestamp=TimestampMS(timestamp),
+            location=location,
+            event_type=HistoryEventType.STAKING,
+            event_subtype=HistoryEventSubType.REWARD,
+            asset=A_ETH,
+            balance=Balance(ONE),
+        )
+
+    importer = CointrackingImporter(database)
+    with database.user_write() as write_cursor:
+        DBHistoryEvents(database).add_history_events(
+            write_cursor=write_cursor,
+            history=[make_event(1000), make_event(2000, location=Location.KRAKEN)],
+        )
+
+        def is_duplicate(timestamp: int, amount: FVal = ONE) -> bool:
+            return detect_duplicate_event(
+                event_type=HistoryEventType.STAKING,
+                event_subtype=HistoryEventSubType.REWARD,
+                amount=AssetAmount(amount),
+                asset=A_ETH,
+                timestamp_ms=TimestampMS(timestamp),
+                location=Location.BINANCE,
+                event_prefix=COINTRACKING_EVENT_PREFIX,
+                importer=importer,
+                cursor=write_cursor,
+            )
+
+        assert is_duplicate(1000) is True
+        assert is_duplicate(1000, amount=FVal(2)) is False
+        assert is_duplicate(2000) is False  # the saved event is of another location
+        importer.add_history_events(write_cursor, [make_event(2000)])
+        assert is_duplicate(2000) is True
+        assert len(importer._history_events) == 1  # was not flushed to detect the duplicate
+
+
+def test_chunked_import_resumes(database: 'DBHandler', tmp_path: Path) -> None:
+    """Test that a CSV import commits its entries in chunks of whole rows and that an
+    interrupted import of the same file continues after the last committed row"""
+    filepath = tmp_path / 'events.csv'
+    filepath.write_text('Type,Location,Currency,Amount,Fee,Fee Currency,Description,Timestamp\n' + ''.join(  # noqa: E501
+        f'Staking,kraken,ETH,1,{"0.1" if row % 2 == 0 else ""},{"ETH" if row % 2 == 0 else ""},,{row * 1000}\n'  # noqa: E501
+        for row in range(1, 11)
+    ))
+    importer = RotkiGenericEventsImporter(database)
+    consume_event = importer._consume_rotki_event
+
+    def interrupt_at_row_7(cursor, csv_row, sequence_index):
+        if csv_row['Timestamp'] == '7000':
+            raise InputError('Interrupted')
+        consume_event(cursor, csv_row, sequence_index)
+
+    def get_events() -> list:
+        with database.conn.read_ctx() as cursor:
+            return DBHistoryEvents(database).get_history_events(
+                cursor=cursor,
+                filter_query=HistoryEventFilterQuery.make(),
+                has_premium=True,
+            )
+
+    def get_checkpoint() -> int | None:
+        assert importer._file_hash is not None
+        with database.conn.read_ctx() as cursor:
+            return database.get_dynamic_cache(
+                cursor=cursor,
+                name=DBCacheDynamic.CSV_IMPORT_CHECKPOINT,
+                source=importer.name,
+                file_hash=importer._file_hash,
+            )
+
+    with (
+        patch('rotkehlchen.data_import.utils.ITEMS_PER_DB_WRITE', 3),
+        patch.object(importer, '_consume_rotki_event', side_effect=interrupt_at_row_7),
+    ):
+        assert importer.import_csv(filepath) == (False, 'Interrupted')
+
+    # rows 1-4 make 6 events that were committed in two chunks. Rows 5 and 6 were still
+    # buffered when the import was interrupted so they were not committed.
+    assert len(get_events()) == 6
+    assert get_checkpoint() == 4
+
+    with patch('rotkehlchen.data_import.utils.ITEMS_PER_DB_WRITE', 3):
+        assert importer.import_csv(filepath) == (True, '')
+
+    events = get_events()
+    assert len(events) == 15  # 10 staking rewards and 5 fees
+    assert sorted({event.timestamp for event in events}) == [row * 1000 for row in range(1, 11)]
+    assert importer.imported_entries == importer.total_entries == 10
+    assert get_checkpoint() is None
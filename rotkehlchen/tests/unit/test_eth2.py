@@ -26,6 +26,7 @@ from rotkehlchen.db.filtering import Eth2DailyStatsFilterQuery, HistoryEventFilt
 from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.externalapis.beaconchain.service import BeaconChain
 from rotkehlchen.fval import FVal
+from rotkehlchen.history.events.structures.base import HistoryBaseEntryType
 from rotkehlchen.history.events.structures.eth2 import (
     EthBlockEvent,
     EthDepositEvent,
@@ -884,6 +885,126 @@ def test_eth_validators_performance_recent(eth2, database, ethereum_accounts):
     }
 
 
+def test_validators_daily_performance(database):
+    """Test that only the validator days touched by writes to the staking events get their
+    daily performance recomputed and that the partial days of a range are summed from the
+    events while the whole days are read from the daily performance"""
+    dbevents, dbeth2 = DBHistoryEvents(database), DBEth2(database)
+    day_ms = DAY_IN_SECONDS * 1000
+    day_ts = TimestampMS(1666656000000)  # 2022-10-25 00:00 UTC
+    with database.user_write() as write_cursor:
+        dbevents.add_history_events(write_cursor, [
+            EthWithdrawalEvent(
+                validator_index=1,
+                timestamp=TimestampMS(day_ts + 1000),
+                balance=Balance(FVal('0.1')),
+                withdrawal_address=ADDR1,
+                is_exit=False,
+            ), EthWithdrawalEvent(
+                validator_index=1,
+                timestamp=TimestampMS(day_ts + day_ms + 1000),
+                balance=Balance(FVal('0.2')),
+                withdrawal_address=ADDR1,
+                is_exit=False,
+            ), EthWithdrawalEvent(
+                validator_index=2,
+                timestamp=TimestampMS(day_ts + 2000),
+                balance=Balance(FVal('32.5')),
+                withdrawal_address=ADDR2,
+                is_exit=True,
+            ), EthBlockEvent(
+                validator_index=2,
+                timestamp=TimestampMS(day_ts + 3000),
+                balance=Balance(FVal('0.3')),
+                fee_recipient=ADDR2,
+                block_number=1,
+                is_mev_reward=False,
+            ), EthBlockEvent(
+                validator_index=2,
+                timestamp=TimestampMS(day_ts + day_ms + 3000),
+                balance=Balance(FVal('0.6')),
+                fee_recipient=ADDR1,
+                block_number=2,
+                is_mev_reward=False,
+            ),
+        ])
+        # a capped refresh only processes the oldest dirty days
+        dbeth2.refresh_daily_performance(write_cursor, max_days=1)
+        assert set(write_cursor.execute(
+            'SELECT validator_index, timestamp FROM eth2_validators_daily_performance_dirty',
+        )) == {(1, day_ts + day_ms), (2, day_ts + day_ms)}
+        dbeth2.refresh_daily_performance(write_cursor)
+        performance_query = 'SELECT * FROM eth2_validators_daily_performance ORDER BY validator_index, timestamp'  # noqa: E501
+        assert write_cursor.execute(performance_query).fetchall() == [
+            (1, day_ts, ADDR1, '0.1', '0', '0'),
+            (1, day_ts + day_ms, ADDR1, '0.2', '0', '0'),
+            (2, day_ts, ADDR2, '0', '0.5', '0.3'),
+            (2, day_ts + day_ms, ADDR1, '0', '0', '0.6'),
+        ]
+
+        # change a row that is not touched below to see that it is not recomputed
+        write_cursor.execute(
+            "UPDATE eth2_validators_daily_performance SET withdrawals='7' "
+            'WHERE validator_index=1 AND timestamp=?',
+            (day_ts + day_ms,),
+        )
+        dbevents.add_history_events(write_cursor, [EthWithdrawalEvent(
+            validator_index=1,
+            timestamp=TimestampMS(day_ts + 5000),
+            balance=Balance(FVal('0.4')),
+            withdrawal_address=ADDR1,
+            is_exit=False,
+            event_identifier='EW_1_second_withdrawal',  # the default one is per validator day
+        )])
+        write_cursor.execute(
+            'DELETE FROM history_events WHERE entry_type=? AND timestamp=?',
+            (HistoryBaseEntryType.ETH_BLOCK_EVENT.serialize_for_db(), day_ts + 3000),
+        )
+        assert set(write_cursor.execute(
+            'SELECT validator_index, timestamp FROM eth2_validators_daily_performance_dirty',
+        )) == {(1, day_ts), (2, day_ts)}
+        # the not yet refreshed validator days are read from the events
+        whole_days_profit = {1: [FVal('7.5'), ZERO, ZERO], 2: [ZERO, FVal('0.5'), ZERO]}
+        assert dbeth2.get_validators_profit(
+            cursor=write_cursor,
+            from_ts=Timestamp(day_ts // 1000),
+            to_ts=Timestamp(day_ts // 1000 + 2 * DAY_IN_SECONDS),
+            validator_indices=None,
+            tracked_addresses={ADDR2},
+        ) == whole_days_profit
+        dbeth2.refresh_daily_performance(write_cursor)
+        assert write_cursor.execute(performance_query).fetchall() == [
+            (1, day_ts, ADDR1, '0.5', '0', '0'),
+            (1, day_ts + day_ms, ADDR1, '7', '0', '0'),
+            (2, day_ts, ADDR2, '0', '0.5', '0'),
+            (2, day_ts + day_ms, ADDR1, '0', '0', '0.6'),
+        ]
+        assert dbeth2.get_validators_profit(
+            cursor=write_cursor,
+            from_ts=Timestamp(day_ts // 1000),
+            to_ts=Timestamp(day_ts // 1000 + 2 * DAY_IN_SECONDS),
+            validator_indices=None,
+            tracked_addresses={ADDR2},
+        ) == whole_days_profit
+
+    with database.conn.read_ctx() as cursor:
+        # the first day is partial and the second whole, so it is read from the daily performance
+        assert dbeth2.get_validators_profit(
+            cursor=cursor,
+            from_ts=Timestamp(day_ts // 1000 + 2),
+            to_ts=Timestamp(day_ts // 1000 + 2 * DAY_IN_SECONDS + 10),
+            validator_indices=None,
+            tracked_addresses={ADDR2},
+        ) == {1: [FVal('7.4'), ZERO, ZERO], 2: [ZERO, FVal('0.5'), ZERO]}
+        assert dbeth2.get_validators_profit(  # all within a partial day
+            cursor=cursor,
+            from_ts=Timestamp(day_ts // 1000 + 2),
+            to_ts=Timestamp(day_ts // 1000 + 10),
+            validator_indices={1},
+            tracked_addresses={ADDR2},
+        ) == {1: [FVal('0.4'), ZERO, ZERO]}
+
+
 def test_combine_block_with_tx_events(eth2, database):
     """Small unit test to see the logic of the DB query to detect and modify eth2
     mev reward events works"""
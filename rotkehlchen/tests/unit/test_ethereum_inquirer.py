@@ -10,11 +10,17 @@ from rotkehlchen.chain.evm.constants import ZERO_ADDRESS
 from rotkehlchen.chain.evm.decoding.constants import ERC20_OR_ERC721_TRANSFER
 from rotkehlchen.chain.evm.decoding.kyber.constants import KYBER_AGGREGATOR_SWAPPED
 from rotkehlchen.chain.evm.decoding.thegraph.constants import GRAPH_DELEGATION_TRANSFER_ABI
+from rotkehlchen.chain.evm.node_health import (
+    ERROR_RATE_HALF_LIFE,
+    NodesHealthTracker,
+    WeightedNodesSampler,
+)
 from rotkehlchen.chain.evm.node_inquirer import _query_web3_get_logs
 from rotkehlchen.chain.evm.structures import EvmTxReceipt, EvmTxReceiptLog
-from rotkehlchen.chain.evm.types import WeightedNode, string_to_evm_address
+from rotkehlchen.chain.evm.types import NodeName, WeightedNode, string_to_evm_address
 from rotkehlchen.db.evmtx import DBEvmTx
 from rotkehlchen.errors.misc import EventNotInABI, RemoteError
+from rotkehlchen.fval import FVal
 from rotkehlchen.tests.utils.checks import assert_serialized_dicts_equal
 from rotkehlchen.tests.utils.ethereum import (
     ETHEREUM_NODES_PARAMETERS_WITH_PRUNED_AND_NOT_ARCHIVED,
@@ -158,6 +164,72 @@ def test_get_transaction_by_hash(ethereum_inquirer, call_order, ethereum_manager
     assert result == expected_tx
 
 
+def test_nodes_health_call_order():
+    """Test that erroring nodes go last in the call order, that slow nodes come first
+    less often and that erroring nodes are probed again once their errors decay"""
+    nodes = [
+        WeightedNode(
+            node_info=NodeName(name=name, endpoint=f'https://{name}.io', owned=False, blockchain=SupportedBlockchain.ETHEREUM),  # noqa: E501
+            active=True,
+            weight=FVal('0.3333'),
+        ) for name in ('fast', 'slow', 'bad')
+    ]
+    tracker = NodesHealthTracker()
+    for _ in range(10):
+        tracker.record_success('fast', latency=0.1)
+        tracker.record_success('slow', latency=5)
+        tracker.record_failure('bad')
+
+    first_nodes = [tracker.order(nodes)[0].node_info.name for _ in range(200)]
+    assert first_nodes.count('fast') > first_nodes.count('slow') > 0
+    assert all(tracker.order(nodes)[-1].node_info.name == 'bad' for _ in range(50))
+    stats = tracker.serialize(['fast', 'slow', 'bad', 'unknown'])
+    assert stats['bad']['deprioritized'] is True
+    assert stats['bad']['errors'] == stats['bad']['calls'] == 10
+    assert stats['fast']['errors'] == 0
+    assert stats['fast']['latency_ms'] < stats['slow']['latency_ms']
+    assert stats['unknown']['calls'] == 0
+
+    now = tracker.nodes['bad'].last_update + 5 * ERROR_RATE_HALF_LIFE
+    with patch('rotkehlchen.chain.evm.node_health.time.monotonic', return_value=now):
+        assert tracker.serialize(['bad'])['bad']['deprioritized'] is False
+        assert any(tracker.order(nodes)[-1].node_info.name != 'bad' for _ in range(50))
+
+
+def test_nodes_order_follows_weights():
+    """Test that the nodes are ordered with probabilities proportional to their weights,
+    both for the first node and for the following ones, and that zero weight nodes go last"""
+    nodes = WeightedNodesSampler([
+        WeightedNode(
+            node_info=NodeName(name=name, endpoint=f'https://{name}.io', owned=False, blockchain=SupportedBlockchain.ETHEREUM),  # noqa: E501
+            active=True,
+            weight=FVal(weight),
+        ) for name, weight in (('heavy', '0.7'), ('light', '0.3'), ('zero', '0'), ('zero2', '0'))
+    ])
+    tracker = NodesHealthTracker()
+    orders = [[node.node_info.name for node in tracker.order(nodes)] for _ in range(2000)]
+    assert 0.65 < sum(order[0] == 'heavy' for order in orders) / len(orders) < 0.75
+    assert all(set(order[:2]) == {'heavy', 'light'} for order in orders)
+    assert 0.4 < sum(order[2] == 'zero' for order in orders) / len(orders) < 0.6
+
+
+def test_query_records_nodes_health(ethereum_inquirer):
+    """Test that the calls to the nodes are recorded in their health stats"""
+    call_order = [ethereum_inquirer.etherscan_node]
+
+    def failing_method(web3):
+        raise RemoteError('node is down')
+
+    with pytest.raises(RemoteError):
+        ethereum_inquirer._query(method=failing_method, call_order=call_order)
+    ethereum_inquirer._query(method=lambda web3: 42, call_order=call_order)
+
+    stats = ethereum_inquirer.get_nodes_health()[ETHEREUM_ETHERSCAN_NODE_NAME]
+    assert stats['calls'] == 2
+    assert stats['errors'] == 1
+    assert stats['latency_ms'] is not None
+
+
 @pytest.mark.parametrize('ethereum_manager_connect_at_start', ['DEFAULT'])
 def test_use_open_nodes(ethereum_inquirer, database):
     """Test that we can connect to and use the open nodes (except from etherscan)
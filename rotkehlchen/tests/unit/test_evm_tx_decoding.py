@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
+import gevent
 import pytest
 
 from rotkehlchen.accounting.structures.balance import Balance
@@ -8,6 +9,8 @@ from rotkehlchen.assets.asset import Asset
 from rotkehlchen.chain.ethereum.modules.gitcoin.constants import GITCOIN_GRANTS_OLD1
 from rotkehlchen.chain.evm.constants import GENESIS_HASH
 from rotkehlchen.chain.evm.decoding.constants import CPT_GAS
+from rotkehlchen.chain.evm.decoding.decoder import EventRulesIndex
+from rotkehlchen.chain.evm.decoding.utils import RULE_ADDRESSES_ATTRIBUTE, RULE_TOPICS_ATTRIBUTE
 from rotkehlchen.chain.evm.l2_with_l1_fees.types import L2WithL1FeesTransaction
 from rotkehlchen.chain.evm.types import EvmAccount, string_to_evm_address
 from rotkehlchen.constants.assets import A_ETH, A_SAI
@@ -16,6 +19,7 @@ from rotkehlchen.db.evmtx import DBEvmTx
 from rotkehlchen.db.filtering import EvmEventFilterQuery, EvmTransactionsFilterQuery
 from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.db.l2withl1feestx import DBL2WithL1FeesTx
+from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.fval import FVal
 from rotkehlchen.history.events.structures.base import (
     HistoryBaseEntry,
@@ -195,6 +199,147 @@ def test_tx_decode(ethereum_transaction_decoder, database):
         assert write_cursor.execute('SELECT COUNT(*) from evm_tx_mappings').fetchone()[0] == 0
 
 
+@pytest.mark.parametrize('use_custom_database', ['ethtxs.db'])
+def test_event_rules_calls_per_log(ethereum_transaction_decoder, database):
+    """Test that the topic index calls fewer event rules for the logs that reach the generic
+    event rules than trying all the rules in order, without changing the decoded events"""
+    decoder = ethereum_transaction_decoder
+    dbevmtx = DBEvmTx(database)
+    with database.conn.read_ctx() as cursor:
+        transactions = dbevmtx.get_evm_transactions(
+            cursor=cursor,
+            filter_=EvmTransactionsFilterQuery.make(
+                accounts=[EvmAccount(string_to_evm_address('0x2B888954421b424C5D3D9Ce9bB67c9bD47537d12'))],
+                chain_id=ChainID.ETHEREUM,
+            ),
+            has_premium=True,
+        )
+        receipts = [dbevmtx.get_receipt(cursor, tx.tx_hash, ChainID.ETHEREUM) for tx in transactions]  # noqa: E501
+
+    rule_calls = logs = candidates = 0
+
+    def count_calls(rule):
+        def counted_rule(**kwargs):
+            nonlocal rule_calls
+            rule_calls += 1
+            return rule(**kwargs)
+        return counted_rule
+
+    def count_logs(**kwargs):
+        nonlocal logs, candidates
+        logs += 1
+        if len(kwargs['tx_log'].topics) != 0:
+            candidates += len(decoder.event_rules_index.get_candidates(kwargs['tx_log']))
+        return original_try_all_rules(**kwargs)
+
+    def decode_all() -> tuple[int, int, int, list[list[str | None]]]:
+        nonlocal rule_calls, logs, candidates
+        rule_calls = logs = candidates = 0
+        all_notes = []
+        for tx, receipt in zip(transactions, receipts, strict=True):
+            events, _, _ = decoder._get_or_decode_transaction_events(tx, receipt, ignore_cache=True)  # noqa: E501
+            all_notes.append([event.notes for event in events])
+        return rule_calls, logs, candidates, all_notes
+
+    original_try_all_rules = decoder.try_all_rules
+    counted_rules = [count_calls(rule) for rule in decoder.rules.event_rules]
+    with patch.object(decoder, 'try_all_rules', side_effect=count_logs):
+        # the wrappers have no topic declarations so all the rules are tried as before
+        decoder.event_rules_index = EventRulesIndex(counted_rules)
+        calls_before, logs_before, candidates_before, notes_before = decode_all()
+        for counted_rule, rule in zip(counted_rules, decoder.rules.event_rules, strict=True):
+            for attribute in (RULE_TOPICS_ATTRIBUTE, RULE_ADDRESSES_ATTRIBUTE):
+                if hasattr(rule, attribute):
+                    setattr(counted_rule, attribute, getattr(rule, attribute))
+        decoder.event_rules_index = EventRulesIndex(counted_rules)
+        calls_after, logs_after, candidates_after, notes_after = decode_all()
+
+    assert logs_before == logs_after != 0
+    assert calls_before <= candidates_before <= logs_before * len(counted_rules)
+    assert calls_after <= candidates_after < candidates_before
+    assert calls_after < calls_before
+    assert notes_after == notes_before
+
+
+@pytest.mark.parametrize('use_custom_database', ['ethtxs.db'])
+def test_decode_transactions_in_chunks(ethereum_transaction_decoder, database):
+    """Test that undecoded transactions are bulk loaded as get_receipt would load them,
+    that a chunk is decoded without holding the write lock, that decoders can save the
+    pending events of the chunk to find them in the DB and that a failure while decoding
+    a chunk keeps the events of the saved chunks"""
+    decoder = ethereum_transaction_decoder
+    dbevmtx = DBEvmTx(database)
+    hashes = dbevmtx.get_transaction_hashes_not_decoded(chain_id=ChainID.ETHEREUM, limit=None)
+    assert len(hashes) > 4
+    with database.conn.read_ctx() as cursor:
+        loaded = dbevmtx.get_transactions_and_receipts(
+            cursor=cursor,
+            tx_hashes=hashes,
+            chain_id=ChainID.ETHEREUM,
+        )
+        assert list(loaded) == hashes
+        for tx_hash, (tx, receipt) in loaded.items():
+            assert tx.tx_hash == tx_hash
+            assert receipt == dbevmtx.get_receipt(cursor, tx_hash, ChainID.ETHEREUM)
+
+    original_decode = decoder._decode_transaction_events
+
+    def fail_at_fifth(transaction, tx_receipt):
+        if transaction.tx_hash == hashes[1]:  # the chunk's first transaction is pending
+            assert database.conn.transaction_lock.locked() is False
+            assert database.conn.savepoint_greenlet_id is None
+            not_decoded = dbevmtx.get_transaction_hashes_not_decoded(chain_id=ChainID.ETHEREUM, limit=None)  # noqa: E501
+            assert hashes[0] in not_decoded
+            decoder.base.save_pending_events()
+            assert dbevmtx.get_transaction_hashes_not_decoded(chain_id=ChainID.ETHEREUM, limit=None) == not_decoded[1:]  # noqa: E501
+        elif transaction.tx_hash == hashes[4]:
+            raise RemoteError('boom')
+        return original_decode(transaction=transaction, tx_receipt=tx_receipt)
+
+    with (
+        patch.object(decoder, '_decode_transaction_events', side_effect=fail_at_fifth),
+        pytest.raises(RemoteError),
+    ):
+        decoder._decode_transaction_hashes_in_chunks(tx_hashes=hashes, chunk_size=2)
+
+    # the first two chunks were saved and the failing one stays undecoded
+    assert dbevmtx.get_transaction_hashes_not_decoded(chain_id=ChainID.ETHEREUM, limit=None) == hashes[4:]  # noqa: E501
+    decoder.get_and_decode_undecoded_transactions()
+    assert dbevmtx.get_transaction_hashes_not_decoded(chain_id=ChainID.ETHEREUM, limit=None) == []
+    with database.conn.read_ctx() as cursor:
+        assert cursor.execute(
+            'SELECT COUNT(*) FROM evm_tx_mappings WHERE value=?', (EVMTX_DECODED,),
+        ).fetchone()[0] == len(hashes)
+
+
+@pytest.mark.parametrize('ethereum_accounts', [['0x9531C059098e3d194fF87FebB587aB07B30B1306', '0xc37b40ABdB939635068d3c5f13E7faF686F03B65']])  # noqa: E501
+def test_receipts_saved_when_query_interrupted(
+        database: 'DBHandler',
+        eth_transactions: 'EthereumTransactions',
+        ethereum_accounts: list[ChecksumEvmAddress],
+) -> None:
+    """Test that the receipts are queried concurrently and that the ones already queried
+    are saved even if the query of the missing receipts stops due to an error"""
+    evmhash_eth, evmhash_eth_yabir, _ = _add_transactions_to_db(database, ethereum_accounts)
+
+    def query_receipt(tx_hash):
+        if tx_hash == evmhash_eth_yabir:
+            gevent.sleep(0.1)  # let the other receipt be queried first
+            raise ValueError('boom')
+        return {'transactionHash': tx_hash.hex()}
+
+    with (
+        patch('rotkehlchen.chain.evm.transactions.RECEIPTS_WRITE_CHUNK_SIZE', 2),
+        patch.object(eth_transactions.evm_inquirer, 'get_transaction_receipt', side_effect=query_receipt),  # noqa: E501
+        patch.object(eth_transactions.dbevmtx, 'add_or_ignore_receipt_data') as add_receipt,
+        pytest.raises(ValueError, match='boom'),
+    ):
+        eth_transactions.get_receipts_for_transactions_missing_them()
+
+    assert add_receipt.call_count == 1
+    assert add_receipt.call_args.kwargs['data'] == {'transactionHash': evmhash_eth.hex()}
+
+
 @pytest.mark.vcr(filter_query_parameters=['apikey'])
 @pytest.mark.parametrize('ethereum_accounts', [['0x9531C059098e3d194fF87FebB587aB07B30B1306', '0xc37b40ABdB939635068d3c5f13E7faF686F03B65']])  # noqa: E501
 @pytest.mark.parametrize('optimism_accounts', [['0x9531C059098e3d194fF87FebB587aB07B30B1306']])
@@ -1,3 +1,6 @@
+from unittest.mock import MagicMock, patch
+
+import gevent
 import pytest
 
 from rotkehlchen.accounting.mixins.event import AccountingEventType
@@ -6,14 +9,23 @@ from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.chain.ethereum.modules.eth2.structures import ValidatorDailyStats
 from rotkehlchen.constants import ZERO
 from rotkehlchen.constants.assets import A_ETH, A_ETH2
+from rotkehlchen.db.filtering import HistoryEventFilterQuery
+from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.fval import FVal
 from rotkehlchen.history.events.structures.base import HistoryEvent
 from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
+from rotkehlchen.history.manager import (
+    STEPS_PER_CEX,
+    count_window_rows,
+    history_sort_key,
+    sort_within_timestamp,
+    windowed_db_source,
+)
 from rotkehlchen.history.types import HistoricalPriceOracle
 from rotkehlchen.tests.utils.accounting import accounting_history_process, check_pnls_and_csv
 from rotkehlchen.tests.utils.history import prices
 from rotkehlchen.tests.utils.messages import no_message_errors
-from rotkehlchen.types import Location
+from rotkehlchen.types import Location, Timestamp, TimestampMS
 
 
 @pytest.mark.parametrize(('value', 'result'), [
@@ -92,3 +104,118 @@ def test_pnl_processing_with_eth2_staking_setting(accountant, db_settings):
             AccountingEventType.STAKING: PNL(taxable=FVal('20.55537445038'), free=ZERO),
         })
     check_pnls_and_csv(accountant, expected_pnls, None)
+
+
+def test_windowed_history_events_source(database):
+    """Test that reading the history events in small windows through the streaming
+    helpers returns the same events in the same order as sorting the whole history,
+    also when whole windows of rows fail to deserialize"""
+    dbevents = DBHistoryEvents(database)
+    events = []
+    for idx, (timestamp, sequence_index) in enumerate((
+            (1000500, 3), (1000100, 5), (1000900, 0),  # same second, out of key order in DB
+            (1000000, 1), (1000000, 2), (1000000, 4),  # more events than the window in a ts
+            (1000000, 6), (1002000, 0), (1003000, 1), (1003000, 0),
+    )):
+        events.append(HistoryEvent(
+            event_identifier=f'event_{idx}',
+            sequence_index=sequence_index,
+            timestamp=TimestampMS(timestamp),
+            location=Location.KRAKEN,
+            asset=A_ETH,
+            balance=Balance(amount=FVal(idx + 1)),
+            event_type=HistoryEventType.RECEIVE,
+            event_subtype=HistoryEventSubType.NONE,
+        ))
+    with database.user_write() as write_cursor:
+        dbevents.add_history_events(write_cursor=write_cursor, history=events)
+
+        # make some events fail to deserialize, filling whole windows and a whole timestamp
+        write_cursor.execute(
+            "UPDATE history_events SET type='invalid' WHERE event_identifier IN "
+            "('event_1', 'event_4', 'event_5', 'event_6', 'event_7')",
+        )
+
+    def query_window(from_ts: Timestamp, offset: int, limit: int) -> tuple[list, int]:
+        filter_query = HistoryEventFilterQuery.make(
+            order_by_rules=[('timestamp', True), ('sequence_index', True), ('identifier', True)],
+            limit=limit,
+            offset=offset,
+            from_ts=from_ts,
+        )
+        with database.conn.read_ctx() as cursor:
+            entries = dbevents.get_history_events(
+                cursor=cursor,
+                filter_query=filter_query,
+                has_premium=True,
+            )
+            return entries, count_window_rows(
+                cursor=cursor,
+                table='history_events',
+                filter_query=filter_query,
+                entries_num=len(entries),
+            )
+
+    with database.conn.read_ctx() as cursor:
+        expected = sorted(
+            dbevents.get_history_events(
+                cursor=cursor,
+                filter_query=HistoryEventFilterQuery.make(),
+                has_premium=True,
+            ),
+            key=history_sort_key,
+        )
+
+    assert len(expected) == len(events) - 5
+    for window in (1, 2, 3, 20):
+        streamed = list(sort_within_timestamp(windowed_db_source(
+            query_window=query_window,
+            window=window,
+        )))
+        assert streamed == expected
+
+
+def test_sync_exchanges_history_concurrently(history_querying_manager):
+    """Test that the history of different exchange locations is queried concurrently,
+    that instances of the same location are queried one after the other and that an
+    exchange failing does not stop the rest nor mess up the progress steps"""
+    calls = []
+
+    def make_exchange(name, location, error=None):
+        def query_history(start_ts, end_ts, fail_callback, new_step_data):
+            calls.append((name, 'start'))
+            new_step_cb, exchange_name = new_step_data
+            for idx in range(7):  # more steps than STEPS_PER_CEX should not be counted
+                new_step_cb(f'{exchange_name} step {idx}')
+                gevent.sleep(0.01)
+                if error is not None:
+                    raise error
+            calls.append((name, 'end'))
+
+        exchange = MagicMock()
+        exchange.name = name
+        exchange.location = location
+        exchange.query_history_with_callbacks.side_effect = query_history
+        return exchange
+
+    exchanges = [
+        make_exchange('kraken1', Location.KRAKEN),
+        make_exchange('binance1', Location.BINANCE, error=ValueError('boom')),
+        make_exchange('kraken2', Location.KRAKEN),
+    ]
+    with (
+        patch.object(history_querying_manager.exchange_manager, 'iterate_exchanges', return_value=iter(exchanges)),  # noqa: E501
+        patch('rotkehlchen.history.manager.EVM_CHAINS_WITH_TRANSACTIONS', ()),
+    ):
+        empty_or_error, step, _ = history_querying_manager._sync_history(
+            end_ts=Timestamp(1),
+            has_premium=False,
+            total_steps=len(exchanges) * STEPS_PER_CEX + 1,
+        )
+
+    assert 'Failed to query binance1 history due to boom' in empty_or_error
+    assert step == len(exchanges) * STEPS_PER_CEX + 1
+    assert history_querying_manager.progress == 100
+    assert calls.index(('binance1', 'start')) < calls.index(('kraken1', 'end'))
+    assert calls.index(('kraken1', 'end')) < calls.index(('kraken2', 'start'))
+    assert ('kraken2', 'end') in calls
@@ -781,6 +781,57 @@ def test_cache_is_hit_for_collection(inquirer: Inquirer):
     assert oracle_query.call_count == 1
 
 
+@pytest.mark.parametrize('should_mock_current_price_queries', [False])
+def test_find_usd_prices(inquirer: Inquirer):
+    """Test that the batch price query asks coingecko for many ids per query in chunks,
+    only asks the next oracle for the still missing prices and caches the results"""
+    coingecko_prices = {'bitcoin': 30000, 'ethereum': 2000}
+
+    def mock_coingecko_query(module, subpath=None, options=None):  # pylint: disable=unused-argument
+        assert module == 'simple/price' and options is not None
+        return {x: {'usd': coingecko_prices[x]} for x in options['ids'].split(',') if x in coingecko_prices}  # noqa: E501
+
+    def mock_cryptocompare_query(url, params):
+        assert url == 'https://min-api.cryptocompare.com/data/pricemulti'
+        assert params == {'fsyms': 'LINK', 'tsyms': 'USD'}
+        return {'LINK': {'USD': 10}}
+
+    inquirer.set_oracles_order(oracles=[CurrentPriceOracle.COINGECKO, CurrentPriceOracle.CRYPTOCOMPARE])  # noqa: E501
+    with (
+        patch('rotkehlchen.externalapis.coingecko.SIMPLE_PRICE_IDS_PER_QUERY', 2),
+        patch.object(inquirer._coingecko, '_query', side_effect=mock_coingecko_query) as coingecko_query,  # noqa: E501
+        patch.object(inquirer._cryptocompare, '_api_query', side_effect=mock_cryptocompare_query) as cryptocompare_query,  # noqa: E501
+        patch.object(Inquirer, '_query_oracle_instances', wraps=inquirer._query_oracle_instances) as oracle_query,  # noqa: E501
+    ):
+        prices = inquirer.find_usd_prices([A_BTC, A_ETH, A_LINK, A_KFEE, A_BTC])
+        assert prices == {
+            A_BTC: Price(FVal(30000)),
+            A_ETH: Price(FVal(2000)),
+            A_LINK: Price(FVal(10)),
+            A_KFEE: Price(FVal('0.01')),
+        }
+        assert [x.kwargs['options']['ids'] for x in coingecko_query.call_args_list] == ['bitcoin,ethereum', 'chainlink']  # noqa: E501
+        assert cryptocompare_query.call_count == 1
+        assert oracle_query.call_count == 0  # no asset needed the one by one query
+
+        eth_cache = inquirer.get_cached_current_price_entry(cache_key=(A_ETH, A_USD))
+        assert eth_cache is not None and eth_cache.oracle == CurrentPriceOracle.COINGECKO
+        link_cache = inquirer.get_cached_current_price_entry(cache_key=(A_LINK, A_USD))
+        assert link_cache is not None and link_cache.oracle == CurrentPriceOracle.CRYPTOCOMPARE
+        assert inquirer.find_usd_prices([A_BTC, A_ETH, A_LINK]) == {
+            A_BTC: Price(FVal(30000)),
+            A_ETH: Price(FVal(2000)),
+            A_LINK: Price(FVal(10)),
+        }
+        assert coingecko_query.call_count == 2  # served from the cache
+        assert cryptocompare_query.call_count == 1
+
+    errors: dict[Asset, RemoteError] = {}  # the failed price queries are left out and reported
+    with patch.object(Inquirer, 'find_usd_price', side_effect=RemoteError('boom')):
+        assert inquirer.find_usd_prices([A_KFEE], ignore_cache=True, errors=errors) == {}
+    assert list(errors) == [A_KFEE] and str(errors[A_KFEE]) == 'boom'
+
+
 @pytest.mark.parametrize('should_mock_current_price_queries', [False])
 @requires_env([TestEnvironment.NIGHTLY])
 def test_usd_price(inquirer: Inquirer, globaldb: GlobalDBHandler):
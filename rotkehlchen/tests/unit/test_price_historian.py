@@ -1,3 +1,5 @@
+import random
+from http import HTTPStatus
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
@@ -5,15 +7,16 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from rotkehlchen.chain.ethereum.oracles.uniswap import UniswapV2Oracle, UniswapV3Oracle
-from rotkehlchen.constants.assets import A_BTC, A_USD
+from rotkehlchen.constants.assets import A_BTC, A_ETH, A_EUR, A_USD
 from rotkehlchen.constants.timing import DAY_IN_SECONDS
+from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.errors.price import NoPriceForGivenTimestamp, PriceQueryUnsupportedAsset
 from rotkehlchen.externalapis.coingecko import Coingecko
 from rotkehlchen.externalapis.cryptocompare import Cryptocompare
 from rotkehlchen.externalapis.defillama import Defillama
 from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.manual_price_oracles import ManualPriceOracle
-from rotkehlchen.history.price import PriceHistorian
+from rotkehlchen.history.price import MISSING_PRICE_CACHE_SECS, PriceHistorian
 from rotkehlchen.history.types import (
     DEFAULT_HISTORICAL_PRICE_ORACLES_ORDER,
     HistoricalPrice,
@@ -187,6 +190,52 @@ def test_token_to_fiat_via_second_oracle(fake_price_historian):
         assert oracle_instance.query_historical_price.call_count == 1
 
 
+def test_cached_prices(fake_price_historian):
+    """Test that found prices are cached per hour and that missing prices are cached
+    for a while unless the oracles were rate limited"""
+    price_historian = fake_price_historian
+    oracle_instance = price_historian._oracle_instances[1]
+    oracle_instance.query_historical_price.return_value = Price(FVal('30000'))
+    timestamp = Timestamp(1611594000)  # start of an hour
+
+    for query_ts in (timestamp, timestamp + 1799, timestamp + 3599):
+        assert price_historian.query_historical_price(
+            from_asset=A_BTC,
+            to_asset=A_USD,
+            timestamp=query_ts,
+        ) == Price(FVal('30000'))
+    assert oracle_instance.query_historical_price.call_count == 1
+
+    price_historian.query_historical_price(from_asset=A_BTC, to_asset=A_USD, timestamp=timestamp + 3600)  # noqa: E501
+    assert oracle_instance.query_historical_price.call_count == 2
+    price_historian.remove_cached_prices(from_asset=A_USD, to_asset=A_BTC)
+    price_historian.query_historical_price(from_asset=A_BTC, to_asset=A_USD, timestamp=timestamp)
+    assert oracle_instance.query_historical_price.call_count == 3
+
+    oracle_instances = [x for x in price_historian._oracle_instances if not isinstance(x, ManualPriceOracle)]  # noqa: E501
+
+    def query_eth_price(now: int, error: Exception) -> None:
+        for instance in oracle_instances:
+            instance.query_historical_price.side_effect = error
+        with (
+            patch('rotkehlchen.history.price.ts_now', return_value=now),
+            pytest.raises(NoPriceForGivenTimestamp),
+        ):
+            price_historian.query_historical_price(from_asset=A_ETH, to_asset=A_USD, timestamp=timestamp)  # noqa: E501
+
+    rate_limited = RemoteError('Too many requests', error_code=HTTPStatus.TOO_MANY_REQUESTS)
+    no_price = NoPriceForGivenTimestamp(from_asset=A_ETH, to_asset=A_USD, time=timestamp)
+    oracle_instance.query_historical_price.reset_mock()
+    for _ in range(2):  # rate limited so not cached
+        query_eth_price(now=timestamp, error=rate_limited)
+    assert oracle_instance.query_historical_price.call_count == 2
+    for _ in range(2):
+        query_eth_price(now=timestamp, error=no_price)
+    assert oracle_instance.query_historical_price.call_count == 3
+    query_eth_price(now=timestamp + MISSING_PRICE_CACHE_SECS, error=no_price)  # expired
+    assert oracle_instance.query_historical_price.call_count == 4
+
+
 def test_manual_oracle_correctly_returns_price(globaldb, fake_price_historian):
     """Test that the manual oracle correctly returns price for asset"""
     price_historian = fake_price_historian
@@ -273,3 +322,38 @@ def test_get_historical_prices(globaldb):
         max_seconds_distance=DAY_IN_SECONDS,
     )
     assert [price1, price2, price3, None, price4] == [x.price if x is not None else None for x in result]  # noqa: E501
+
+
+def test_get_historical_prices_in_chunks(globaldb):
+    """Test that a batch of historical price lookups spanning many query chunks
+    returns the same as the single lookups"""
+    assets, start_ts, num_prices = (A_BTC, A_ETH, A_EUR), Timestamp(1600000000), 24 * 7
+    globaldb.add_historical_prices([
+        HistoricalPrice(
+            from_asset=asset,
+            to_asset=A_USD,
+            source=HistoricalPriceOracle.COINGECKO,
+            timestamp=Timestamp(start_ts + idx * 3600),
+            price=Price(FVal(idx + asset_idx)),
+        ) for asset_idx, asset in enumerate(assets) for idx in range(0, num_prices, 2)
+    ])  # a price every two hours, so with a distance of an hour some lookups find nothing
+    rng = random.Random(42)
+    query_data = []
+    for _ in range(300):
+        timestamp = start_ts + rng.randrange(num_prices * 3600)
+        if timestamp % 3600 == 0:
+            timestamp += 1  # avoid ties between two prices at the same distance
+        query_data.append((rng.choice(assets), A_USD, Timestamp(timestamp)))
+
+    with patch('rotkehlchen.globaldb.handler.PRICE_QUERIES_CHUNK_SIZE', 7):
+        result = globaldb.get_historical_prices(query_data=query_data, max_seconds_distance=3600)
+
+    assert len(result) == len(query_data)
+    assert 0 < sum(x is None for x in result) < len(result)
+    for entry, price in zip(query_data, result, strict=True):
+        assert price == globaldb.get_historical_price(
+            from_asset=entry[0],
+            to_asset=entry[1],
+            timestamp=entry[2],
+            max_seconds_distance=3600,
+        )
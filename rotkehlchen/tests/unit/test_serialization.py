@@ -1,9 +1,15 @@
+import json
+from collections import defaultdict
+from unittest.mock import patch
+
 import pytest
+from hexbytes import HexBytes
 
 from rotkehlchen.accounting.structures.balance import BalanceType
 from rotkehlchen.balances.manual import ManuallyTrackedBalance, add_manually_tracked_balances
 from rotkehlchen.constants import ONE
 from rotkehlchen.constants.assets import A_BTC, A_ETH
+from rotkehlchen.db.utils import LocationData
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.externalapis.utils import read_hash
 from rotkehlchen.fval import FVal
@@ -12,6 +18,7 @@ from rotkehlchen.serialization.deserialize import (
     deserialize_evm_transaction,
     deserialize_int_from_hex_or_int,
 )
+from rotkehlchen.serialization.serialize import iterencode_result, process_result
 from rotkehlchen.types import (
     ChainID,
     EvmTransaction,
@@ -41,6 +48,53 @@ def test_rlk_jsondumps():
     )
 
 
+def test_process_result():
+    """Test that entries are serialized by the serializer of their closest registered type
+    and that dictionary keys of assets and enums are turned to strings"""
+    class SubFVal(FVal):
+        pass
+
+    data = {
+        A_BTC: [FVal('1.5'), SubFVal('2'), (1, 2)],
+        Location.KRAKEN: {'a': TradeType.BUY, 1: None, 'c': HexBytes('0x01')},
+        'd': defaultdict(int, {A_ETH: 1}),
+        'e': ChainID.ETHEREUM,
+        'f': LocationData(time=Timestamp(1), location='A', usd_value='1'),
+    }
+    assert process_result(data) == {
+        'BTC': ['1.5', '2', [1, 2]],
+        'kraken': {'a': 'buy', 1: None, 'c': '0x01'},
+        'd': {'ETH': 1},
+        'e': 'ethereum',
+        'f': {'time': 1, 'location': 'external', 'usd_value': '1'},
+    }
+
+
+def test_iterencode_result():
+    """Test that the chunks of a streamed result make the same JSON as the processed result"""
+    data = {
+        'result': {
+            'entries': [
+                {'amount': FVal(x), 'asset': A_ETH, 'location': Location.KRAKEN}
+                for x in range(5)
+            ],
+            'entries_found': 5,
+            A_BTC: [FVal('0.1')] * 3,
+            2: (),
+        },
+        'message': '',
+    }
+    expected = json.dumps(process_result(data))
+    for chunk_size in (1, 2, 5, 10):
+        assert ''.join(iterencode_result(data, chunk_size=chunk_size)) == expected
+
+    with patch('rotkehlchen.serialization.serialize.STREAMED_BUFFER_SIZE', 50):
+        chunks = list(iterencode_result(data, chunk_size=2))
+    assert len(chunks) > 1
+    assert ''.join(chunks) == expected
+    assert ''.join(iterencode_result([])) == '[]'
+
+
 def test_deserialize_trade_type():
     assert TradeType.deserialize('buy') == TradeType.BUY
     assert TradeType.deserialize('LIMIT_BUY') == TradeType.BUY
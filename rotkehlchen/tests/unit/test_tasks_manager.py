@@ -27,6 +27,8 @@ from rotkehlchen.db.utils import LocationData
 from rotkehlchen.errors.api import PremiumAuthenticationError
 from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.globaldb.handler import GlobalDBHandler
+from rotkehlchen.history.events.structures.base import HistoryEvent
+from rotkehlchen.history.events.structures.eth2 import EthWithdrawalEvent
 from rotkehlchen.history.events.structures.evm_event import EvmEvent
 from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
 from rotkehlchen.premium.premium import (
@@ -649,6 +651,67 @@ def test_maybe_detect_new_spam_tokens(
         assert deserialize_timestamp(cursor.fetchone()[0]) - ts_now() < 2  # saved timestamp should be recent  # noqa: E501
 
 
+@pytest.mark.parametrize('max_tasks_num', [5])
+def test_maybe_refresh_events_stats(task_manager: TaskManager, database: 'DBHandler') -> None:
+    """Test that the task refreshing the dirty days of the history events value stats
+    refreshes a limited number of days per run and is scheduled until none is left"""
+    with database.user_write() as write_cursor:
+        DBHistoryEvents(database).add_history_events(write_cursor=write_cursor, history=[
+            HistoryEvent(
+                event_identifier=f'STAKING_{day}',
+                sequence_index=0,
+                timestamp=TimestampMS(day * 86400000 + 1000),
+                location=Location.KRAKEN,
+                event_type=HistoryEventType.STAKING,
+                event_subtype=HistoryEventSubType.REWARD,
+                asset=A_DAI,
+                balance=Balance(amount=ONE, usd_value=ONE),
+            ) for day in range(3)
+        ])
+
+    task_manager.potential_tasks = [task_manager._maybe_refresh_events_stats]
+    with patch('rotkehlchen.tasks.events.VALUE_STATS_REFRESH_DAYS', 2):
+        for dirty_days_left in (1, 0):
+            task_manager.schedule()
+            gevent.joinall(task_manager.running_greenlets[task_manager._maybe_refresh_events_stats])
+            with database.conn.read_ctx() as cursor:
+                assert cursor.execute('SELECT COUNT(*) FROM history_events_value_stats_dirty').fetchone()[0] == dirty_days_left  # noqa: E501
+
+    assert task_manager._maybe_refresh_events_stats() is None
+    with database.conn.read_ctx() as cursor:
+        assert cursor.execute('SELECT COUNT(*) FROM history_events_value_stats').fetchone()[0] == 3
+
+
+def test_maybe_refresh_events_stats_validators_performance(
+        task_manager: TaskManager,
+        database: 'DBHandler',
+) -> None:
+    """Test that the task also refreshes the dirty validator days of the eth2 daily
+    performance a limited number of days per run"""
+    with database.user_write() as write_cursor:
+        DBHistoryEvents(database).add_history_events(write_cursor=write_cursor, history=[
+            EthWithdrawalEvent(
+                validator_index=1,
+                timestamp=TimestampMS(day * 86400000 + 1000),
+                balance=Balance(amount=ONE),
+                withdrawal_address=make_evm_address(),
+                is_exit=False,
+            ) for day in range(3)
+        ])
+
+    task_manager.potential_tasks = [task_manager._maybe_refresh_events_stats]
+    with patch('rotkehlchen.tasks.events.DAILY_PERFORMANCE_REFRESH_DAYS', 2):
+        for dirty_days_left in (1, 0):
+            task_manager.schedule()
+            gevent.joinall(task_manager.running_greenlets[task_manager._maybe_refresh_events_stats])
+            with database.conn.read_ctx() as cursor:
+                assert cursor.execute('SELECT COUNT(*) FROM eth2_validators_daily_performance_dirty').fetchone()[0] == dirty_days_left  # noqa: E501
+
+    assert task_manager._maybe_refresh_events_stats() is None
+    with database.conn.read_ctx() as cursor:
+        assert cursor.execute('SELECT COUNT(*) FROM eth2_validators_daily_performance').fetchone()[0] == 3  # noqa: E501
+
+
 @pytest.mark.parametrize('max_tasks_num', [5])
 @pytest.mark.parametrize('number_of_eth_accounts', [0])
 def test_tasks_dont_schedule_if_no_eth_address(task_manager: TaskManager) -> None:
@@ -1,6 +1,9 @@
 from typing import NamedTuple
 
 from rotkehlchen.constants.misc import (
+    DEFAULT_CHAIN_BALANCES_CONCURRENCY,
+    DEFAULT_DB_READ_POOL_SIZE,
+    DEFAULT_HISTORICAL_PRICE_CACHE_SIZE,
     DEFAULT_MAX_LOG_BACKUP_FILES,
     DEFAULT_MAX_LOG_SIZE_IN_MB,
     DEFAULT_SQL_VM_INSTRUCTIONS_CB,
@@ -17,6 +20,9 @@ class ConfigurationArgs(NamedTuple):
     max_size_in_mb_all_logs: int = DEFAULT_MAX_LOG_SIZE_IN_MB
     max_logfiles_num: int = DEFAULT_MAX_LOG_BACKUP_FILES
     sqlite_instructions: int = DEFAULT_SQL_VM_INSTRUCTIONS_CB
+    db_read_pool_size: int = DEFAULT_DB_READ_POOL_SIZE
+    chain_balances_concurrency: int = DEFAULT_CHAIN_BALANCES_CONCURRENCY
+    historical_price_cache_size: int = DEFAULT_HISTORICAL_PRICE_CACHE_SIZE
     disable_task_manager: bool = False
 
 
@@ -34,6 +40,9 @@ def default_args(
         max_size_in_mb_all_logs=max_size_in_mb_all_logs,
         max_logfiles_num=DEFAULT_MAX_LOG_BACKUP_FILES,
         sqlite_instructions=DEFAULT_SQL_VM_INSTRUCTIONS_CB,
+        db_read_pool_size=DEFAULT_DB_READ_POOL_SIZE,
+        chain_balances_concurrency=DEFAULT_CHAIN_BALANCES_CONCURRENCY,
+        historical_price_cache_size=DEFAULT_HISTORICAL_PRICE_CACHE_SIZE,
         logfile=None,
         logtarget=None,
         disable_task_manager=False,
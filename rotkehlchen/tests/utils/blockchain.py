@@ -718,6 +718,7 @@ def maybe_modify_rpc_nodes(
             write_cursor.execute(  # Delete all but etherscan endpoint
                 "DELETE FROM rpc_nodes WHERE blockchain=? and endpoint!=''",
                 (blockchain.value,))
+        database.invalidate_rpc_nodes(blockchain)
         for entry in nodes_to_connect_to:
             if entry.node_info.endpoint != '':  # don't re-add etherscan
                 database.add_rpc_node(entry)